@@ -24,6 +24,7 @@ from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.utils import detect_available_port
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class UIStartListener(EventListener):
@@ -62,6 +63,8 @@ async def main_async(client_config_map: ClientConfigAdapter):
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
 
+    # Start fetching trading pairs for auto-complete, using the pairs catalog persisted by previous runs
+    TradingPairFetcher.get_instance(client_config_map, catalog_path=TradingPairFetcher.default_catalog_path())
     hb = HummingbotApplication.main_application(client_config_map)
 
     # The listener needs to have a named variable for keeping reference, since the event listener system
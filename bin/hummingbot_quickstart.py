@@ -31,6 +31,7 @@ from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.management.console import start_management_console
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -93,6 +94,8 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
 
+    # Start fetching trading pairs for auto-complete, using the pairs catalog persisted by previous runs
+    TradingPairFetcher.get_instance(client_config_map, catalog_path=TradingPairFetcher.default_catalog_path())
     hb = HummingbotApplication.main_application(client_config_map=client_config_map)
     # Todo: validate strategy and config_file_name before assinging
 
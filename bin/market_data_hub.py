@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+import logging
+from typing import List
+
+import path_util  # noqa: F401
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.market_data_hub.market_data_hub import MarketDataHub
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Shares the market data of the exchanges with the bots running in this host.")
+        self.add_argument("--socket-path", "-s",
+                          type=str,
+                          required=False,
+                          help="Unix socket the hub listens on. Defaults to data/market_data_hub.sock")
+        self.add_argument("--order-books", "-o",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="Order books to share, as connector:PAIR1,PAIR2 (e.g. binance:BTC-USDT,ETH-USDT).")
+        self.add_argument("--candles", "-c",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="Candles to share, as connector:PAIR:interval:max_records "
+                               "(e.g. binance:BTC-USDT:1m:500).")
+
+
+def order_book_data_source(connector_name: str, trading_pairs: List[str]) -> OrderBookTrackerDataSource:
+    conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
+    connector_config = AllConnectorSettings.get_connector_config_keys(connector_name)
+    api_keys = {key: "" for key in connector_config.__fields__.keys() if key != "connector"}
+    init_params = conn_setting.conn_init_parameters(
+        trading_pairs=trading_pairs,
+        trading_required=False,
+        api_keys=api_keys,
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+    )
+    connector = get_connector_class(connector_name)(**init_params)
+    return connector._orderbook_ds
+
+
+async def run_hub(args: argparse.Namespace):
+    hub = MarketDataHub(socket_path=args.socket_path)
+    for order_books_spec in args.order_books:
+        connector_name, trading_pairs = order_books_spec.split(":")
+        trading_pairs = trading_pairs.split(",")
+        hub.add_order_book_data_source(connector_name, order_book_data_source(connector_name, trading_pairs))
+    for candles_spec in args.candles:
+        connector_name, trading_pair, interval, max_records = candles_spec.split(":")
+        candles = CandlesFactory.get_candle(CandlesConfig(
+            connector=connector_name, trading_pair=trading_pair, interval=interval, max_records=int(max_records)))
+        hub.add_candles_feed(connector_name, candles)
+
+    await hub.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await hub.stop()
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run_hub(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
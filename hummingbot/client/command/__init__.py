@@ -8,6 +8,7 @@ from .gateway_command import GatewayCommand
 from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .import_command import ImportCommand
+from .latency_command import LatencyCommand
 from .mqtt_command import MQTTCommand
 from .order_book_command import OrderBookCommand
 from .previous_strategy_command import PreviousCommand
@@ -29,6 +30,7 @@ __all__ = [
     HelpCommand,
     HistoryCommand,
     ImportCommand,
+    LatencyCommand,
     OrderBookCommand,
     PreviousCommand,
     RateCommand,
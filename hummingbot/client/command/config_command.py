@@ -62,6 +62,10 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_events",
                              "mqtt_external_events",
                              "mqtt_autostart",
+                             "mqtt_batch_mode",
+                             "mqtt_batch_interval",
+                             "mqtt_batch_max_queue_size",
+                             "mqtt_batch_overflow_policy",
                              "instance_id",
                              "send_error_logs",
                              "ethereum_chain_name",
@@ -84,6 +88,14 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "order_latency_tracking",
+                             "order_latency_tracking_enabled",
+                             "order_latency_metrics_port",
+                             "event_loop_monitor",
+                             "event_loop_monitor_enabled",
+                             "slow_callback_threshold",
+                             "stack_sampling_enabled",
+                             "stack_sampling_interval",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
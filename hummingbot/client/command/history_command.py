@@ -3,16 +3,19 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import Session
 
 from hummingbot.client.command.gateway_command import GatewayCommand
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import FillAggregates, PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregate import TradeFillAggregate
 from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
@@ -42,16 +45,19 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            # the aggregates are only checkpointed for the session start, the start of a days window always moves
+            market_aggregates, market_trades = self._get_market_aggregates_from_session(
                 int(start_time * 1e3),
                 session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
+                config_file_path=self.strategy_file_name,
+                checkpoint=days <= 0)
+            if not market_aggregates:
                 self.notify("\n  No past trades to report.")
                 return
             if verbose:
                 self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(
+                self.history_report_from_aggregates(start_time, market_aggregates, market_trades, precision))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -70,12 +76,28 @@ class HistoryCommand:
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        market_trades: Dict[Tuple[str, str], List[TradeFill]] = {}
+        for trade in trades:
+            market_trades.setdefault((trade.market, trade.symbol), []).append(trade)
+        market_aggregates = {market_info: FillAggregates.from_trades(cur_trades)
+                             for market_info, cur_trades in market_trades.items()}
+        return await self.history_report_from_aggregates(
+            start_time, market_aggregates, market_trades, precision, display_report)
+
+    async def history_report_from_aggregates(self,  # type: HummingbotApplication
+                                             start_time: float,
+                                             market_aggregates: Dict[Tuple[str, str], FillAggregates],
+                                             market_trades: Dict[Tuple[str, str], List[TradeFill]],
+                                             precision: Optional[int] = None,
+                                             display_report: bool = True) -> Decimal:
+        """
+        :param market_aggregates: the fill aggregates of each (market, trading pair)
+        :param market_trades: the fills of the markets with derivative positions, to pair their open and close orders
+        """
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), aggregates in market_aggregates.items():
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +106,8 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await PerformanceMetrics.create_from_aggregates(
+                symbol, aggregates, cur_balances, market_trades.get((market, symbol)))
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -209,13 +232,95 @@ class HistoryCommand:
         start_time = self.init_time
 
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            market_aggregates, market_trades = self._get_market_aggregates_from_session(
                 int(start_time * 1e3),
                 session=session,
                 config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report_from_aggregates(
+            start_time, market_aggregates, market_trades, display_report=False)
         return avg_return
 
+    def _get_market_aggregates_from_session(
+            self,  # type: HummingbotApplication
+            start_timestamp: int,
+            session: Session,
+            config_file_path: str,
+            checkpoint: bool = True,
+    ) -> Tuple[Dict[Tuple[str, str], FillAggregates], Dict[Tuple[str, str], List[TradeFill]]]:
+        """
+        Aggregates the fills of each (market, trading pair) since start_timestamp, along with the fills of the markets
+        with derivative positions.
+        With checkpoint, the aggregates are stored in the database and only the fills added since the last
+        checkpoint are aggregated. The aggregates are rebuilt if fills were added before the checkpoint.
+        """
+        fill_filters = [TradeFill.timestamp >= start_timestamp,
+                        TradeFill.config_file_path.like(f"%{config_file_path}%")]
+        records: Dict[Tuple[str, str], TradeFillAggregate] = {}
+        checkpoint_timestamp = start_timestamp - 1
+        is_checkpoint_valid = True
+        if checkpoint:
+            records = {(record.market, record.symbol): record
+                       for record in TradeFillAggregate.get_records(session, config_file_path, start_timestamp)}
+        if records:
+            checkpoint_timestamp = max(record.checkpoint_timestamp for record in records.values())
+            aggregated_fills = (session
+                                .query(func.count(TradeFill.exchange_trade_id))
+                                .filter(*fill_filters, TradeFill.timestamp <= checkpoint_timestamp)
+                                .scalar())
+            is_checkpoint_valid = aggregated_fills == sum(record.num_fills for record in records.values())
+            if not is_checkpoint_valid:
+                checkpoint_timestamp = start_timestamp - 1
+        market_aggregates = {market_info: FillAggregates.from_record(record)
+                             for market_info, record in records.items() if is_checkpoint_valid}
+
+        new_fills = (session
+                     .query(TradeFill.market,
+                            TradeFill.symbol,
+                            TradeFill.timestamp,
+                            TradeFill.trade_type,
+                            TradeFill.price,
+                            TradeFill.amount,
+                            TradeFill.trade_fee,
+                            TradeFill.position)
+                     .filter(*fill_filters, TradeFill.timestamp > checkpoint_timestamp)
+                     .order_by(TradeFill.timestamp.asc())
+                     .all())
+        market_new_fills = {}
+        for fill in new_fills:
+            market_new_fills.setdefault((fill.market, fill.symbol), []).append(fill)
+        for market_info, fills in market_new_fills.items():
+            market_aggregates.setdefault(market_info, FillAggregates()).add_trades(fills)
+
+        if checkpoint and (new_fills or not is_checkpoint_valid):
+            if new_fills:
+                checkpoint_timestamp = new_fills[-1].timestamp
+            for market_info, record in records.items():
+                if market_info not in market_aggregates:
+                    session.delete(record)
+            for (market, symbol), aggregates in market_aggregates.items():
+                record = records.get((market, symbol))
+                if record is None:
+                    record = TradeFillAggregate(config_file_path=config_file_path,
+                                                start_timestamp=start_timestamp,
+                                                market=market,
+                                                symbol=symbol)
+                    session.add(record)
+                aggregates.update_record(record)
+                record.checkpoint_timestamp = checkpoint_timestamp
+            session.commit()
+
+        market_trades = {}
+        for (market, symbol), aggregates in market_aggregates.items():
+            if aggregates.num_position_fills > 0:
+                market_trades[(market, symbol)] = (session
+                                                   .query(TradeFill)
+                                                   .filter(*fill_filters,
+                                                           TradeFill.market == market,
+                                                           TradeFill.symbol == symbol)
+                                                   .order_by(TradeFill.timestamp.asc())
+                                                   .all())
+        return market_aggregates, market_trades
+
     def list_trades(self,  # type: HummingbotApplication
                     start_time: float):
         if threading.current_thread() != threading.main_thread():
@@ -0,0 +1,68 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.order_latency_tracker import OrderLatencyTracker
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class LatencyCommand:
+    def latency(self,  # type: HummingbotApplication
+                option: Optional[str] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.latency, option)
+            return
+        if option == "start":
+            self.start_latency_tracking()
+            self.notify("\nOrders latency tracking started.")
+        elif option == "stop":
+            self.stop_latency_tracking()
+            self.notify("\nOrders latency tracking stopped.")
+        elif option == "reset":
+            OrderLatencyTracker.get_instance().reset()
+            self.notify("\nOrders latency statistics cleared.")
+        else:
+            self.show_latency()
+
+    def start_latency_tracking(self,  # type: HummingbotApplication
+                               ):
+        latency_tracker = OrderLatencyTracker.get_instance()
+        latency_tracker.start()
+        metrics_port = self.client_config_map.order_latency_tracking.order_latency_metrics_port
+        if metrics_port > 0:
+            safe_ensure_future(latency_tracker.start_metrics_server(port=metrics_port), loop=self.ev_loop)
+
+    def stop_latency_tracking(self,  # type: HummingbotApplication
+                              ):
+        latency_tracker = OrderLatencyTracker.get_instance()
+        latency_tracker.stop()
+        safe_ensure_future(latency_tracker.stop_metrics_server(), loop=self.ev_loop)
+
+    def show_latency(self,  # type: HummingbotApplication
+                     ):
+        latency_tracker = OrderLatencyTracker.get_instance()
+        stats = latency_tracker.stats()
+        if len(stats) == 0:
+            if latency_tracker.enabled:
+                self.notify("\nNo orders latency recorded yet.")
+            else:
+                self.notify("\nOrders latency tracking is disabled. Enable it with `latency start`.")
+            return
+        columns = ["Exchange", "Request", "Stage", "Count", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)",
+                   "Elapsed p50 (ms)"]
+        data = [
+            [stat.connector_name, stat.request_type, stat.stage, stat.count,
+             round(stat.stage_p50 * 1e3, 2), round(stat.stage_p90 * 1e3, 2), round(stat.stage_p99 * 1e3, 2),
+             round(stat.stage_max * 1e3, 2), round(stat.elapsed_p50 * 1e3, 2)]
+            for stat in stats
+        ]
+        df = pd.DataFrame(data=data, columns=columns)
+        lines = ["    " + line for line in format_df_for_printout(
+            df, table_format=self.client_config_map.tables_format).split("\n")]
+        self.notify("\nTime spent in each stage of the orders lifecycle (since the previous stage):\n" +
+                    "\n".join(lines))
@@ -43,6 +43,11 @@ def using_exchange(exchange: str) -> Callable:
     return using_exchange_pointer(exchange)
 
 
+class MQTTBatchOverflowPolicyEnum(str, ClientConfigEnum):
+    drop_oldest = "drop_oldest"
+    coalesce = "coalesce"
+
+
 class MQTTBridgeConfigMap(BaseClientModel):
     mqtt_host: str = Field(
         default="localhost",
@@ -135,10 +140,51 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_batch_mode: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable batched publishing of events and logs from a background worker"
+            ),
+        ),
+    )
+    mqtt_batch_interval: float = Field(
+        default=0.5,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval between batched events and logs messages (in seconds)"
+            ),
+        ),
+    )
+    mqtt_batch_max_queue_size: int = Field(
+        default=10000,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of events and logs waiting to be published in batch mode"
+            ),
+        ),
+    )
+    mqtt_batch_overflow_policy: MQTTBatchOverflowPolicyEnum = Field(
+        default=MQTTBatchOverflowPolicyEnum.drop_oldest,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What to do when the batch mode queue is full? "
+                f"({'/'.join(list(MQTTBatchOverflowPolicyEnum))})"
+            ),
+        ),
+    )
 
     class Config:
         title = "mqtt_bridge"
 
+    @validator("mqtt_batch_overflow_policy", pre=True)
+    def validate_mqtt_batch_overflow_policy(cls, v: Union[str, MQTTBatchOverflowPolicyEnum]):
+        if isinstance(v, str) and v not in MQTTBatchOverflowPolicyEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(MQTTBatchOverflowPolicyEnum))}.")
+        return v
+
 
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
@@ -172,6 +218,69 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class OrderLatencyTrackingConfigMap(BaseClientModel):
+    order_latency_tracking_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the orders lifecycle latency tracking"
+            ),
+        ),
+    )
+    order_latency_metrics_port: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the local port serving the latency metrics in the Prometheus text format (0 to disable)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "order_latency_tracking"
+
+
+class EventLoopMonitorConfigMap(BaseClientModel):
+    event_loop_monitor_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the event loop health monitor (tick lag, slow callbacks)"
+            ),
+        ),
+    )
+    slow_callback_threshold: float = Field(
+        default=0.1,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the duration (in seconds) above which a callback blocking the event loop is reported"
+            ),
+        ),
+    )
+    stack_sampling_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the sampling of the event loop stack to attribute the blocking time to modules"
+            ),
+        ),
+    )
+    stack_sampling_interval: float = Field(
+        default=0.01,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval (in seconds) between two samples of the event loop stack"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "event_loop_monitor"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -1066,6 +1175,8 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    order_latency_tracking: OrderLatencyTrackingConfigMap = Field(default=OrderLatencyTrackingConfigMap())
+    event_loop_monitor: EventLoopMonitorConfigMap = Field(default=EventLoopMonitorConfigMap())
 
     class Config:
         title = "client_config_map"
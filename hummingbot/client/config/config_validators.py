@@ -81,12 +81,12 @@ def validate_market_trading_pair(market: str, value: str) -> Optional[str]:
     """
     from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
     trading_pair_fetcher: TradingPairFetcher = TradingPairFetcher.get_instance()
-    if trading_pair_fetcher.ready:
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, [])
-        if len(trading_pairs) == 0:
-            return None
-        elif value not in trading_pairs:
-            return f"{value} is not an active market on {market}."
+    # Cataloged pairs are used before the background refresh completes
+    trading_pairs = trading_pair_fetcher.trading_pairs.get(market, [])
+    if len(trading_pairs) == 0:
+        return None
+    elif value not in trading_pairs:
+        return f"{value} is not an active market on {market}."
 
 
 def validate_bool(value: str) -> Optional[str]:
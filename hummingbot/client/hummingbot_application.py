@@ -32,6 +32,7 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
@@ -123,6 +124,10 @@ class HummingbotApplication(*commands):
         )
 
         self._init_gateway_monitor()
+        if self.client_config_map.order_latency_tracking.order_latency_tracking_enabled:
+            self.start_latency_tracking()
+        if self.client_config_map.event_loop_monitor.event_loop_monitor_enabled:
+            self._init_event_loop_monitor()
         # MQTT Bridge
         if self.client_config_map.mqtt_bridge.mqtt_autostart:
             self.mqtt_start()
@@ -175,6 +180,14 @@ class HummingbotApplication(*commands):
         except RuntimeError:
             pass
 
+    def _init_event_loop_monitor(self):
+        monitor_config = self.client_config_map.event_loop_monitor
+        event_loop_monitor = EventLoopMonitor.get_instance()
+        event_loop_monitor.slow_callback_threshold = monitor_config.slow_callback_threshold
+        event_loop_monitor.stack_sampling_enabled = monitor_config.stack_sampling_enabled
+        event_loop_monitor.stack_sampling_interval = monitor_config.stack_sampling_interval
+        event_loop_monitor.start(loop=self.ev_loop)
+
     def notify(self, msg: str):
         self.app.log(msg)
         for notifier in self.notifiers:
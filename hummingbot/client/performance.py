@@ -1,20 +1,156 @@
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
-from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregate import TradeFillAggregate
 
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+def _to_decimal(value: float) -> Decimal:
+    # 15 significant digits drop the float rounding noise of the vectorized sums
+    return Decimal(f"{value:.15g}")
+
+
+@dataclass
+class FillAggregates:
+    """
+    Sums of the fills of a market, the volumes following the sign convention of PerformanceMetrics. The sums are
+    computed over columnar arrays of the fills, and can be extended with the fills added since, so that the
+    performance of a market does not need to walk all of its fills again.
+    """
+    num_fills: int = 0
+    num_buys: int = 0
+    num_sells: int = 0
+    num_position_fills: int = 0
+
+    b_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+
+    # fees charged as a percent of the trade, in the quote asset, None if no fill had a percent fee
+    percent_fees_quote: Optional[Decimal] = None
+    flat_fees: Dict[str, Decimal] = field(default_factory=dict)
+
+    start_price: Decimal = s_decimal_nan
+    last_price: Decimal = s_decimal_nan
+
+    @classmethod
+    def from_trades(cls, trades: List[Any]) -> "FillAggregates":
+        aggregates = FillAggregates()
+        aggregates.add_trades(trades)
+        return aggregates
+
+    @classmethod
+    def from_record(cls, record: TradeFillAggregate) -> "FillAggregates":
+        return FillAggregates(
+            num_fills=record.num_fills,
+            num_buys=record.num_buys,
+            num_sells=record.num_sells,
+            num_position_fills=record.num_position_fills,
+            b_vol_base=Decimal(record.b_vol_base),
+            b_vol_quote=Decimal(record.b_vol_quote),
+            s_vol_base=Decimal(record.s_vol_base),
+            s_vol_quote=Decimal(record.s_vol_quote),
+            percent_fees_quote=(Decimal(record.percent_fees_quote)
+                                if record.percent_fees_quote is not None else None),
+            flat_fees={token: Decimal(amount) for token, amount in record.flat_fees.items()},
+            start_price=Decimal(record.start_price),
+            last_price=Decimal(record.last_price),
+        )
+
+    def update_record(self, record: TradeFillAggregate):
+        record.num_fills = self.num_fills
+        record.num_buys = self.num_buys
+        record.num_sells = self.num_sells
+        record.num_position_fills = self.num_position_fills
+        record.b_vol_base = str(self.b_vol_base)
+        record.b_vol_quote = str(self.b_vol_quote)
+        record.s_vol_base = str(self.s_vol_base)
+        record.s_vol_quote = str(self.s_vol_quote)
+        record.percent_fees_quote = str(self.percent_fees_quote) if self.percent_fees_quote is not None else None
+        record.flat_fees = {token: str(amount) for token, amount in self.flat_fees.items()}
+        record.start_price = str(self.start_price)
+        record.last_price = str(self.last_price)
+
+    def add_trades(self, trades: List[Any]):
+        """
+        Adds fills to the sums. The fills can be TradeFill or Trade objects, or rows of TradeFill columns, and are
+        expected in ascending timestamp order.
+        """
+        if len(trades) == 0:
+            return
+        buy = TradeType.BUY.name.upper()
+        sell = TradeType.SELL.name.upper()
+        deducted_fee_type = DeductedFromReturnsTradeFee.type_descriptor_for_json()
+        nil_position = PositionAction.NIL.value
+        sides = []
+        amounts = []
+        prices = []
+        fee_percents = []
+        deducted_fees = []
+        has_percent_fee = False
+        for trade in trades:
+            trade_type = trade.trade_type.upper()
+            sides.append(1 if trade_type == buy else -1 if trade_type == sell else 0)
+            amounts.append(trade.amount)
+            prices.append(trade.price)
+            trade_fee = trade.trade_fee
+            if isinstance(trade_fee, dict):
+                fee_percent = trade_fee.get("percent")
+                fee_type = trade_fee.get("fee_type")
+                flat_fees = [(flat_fee["token"], flat_fee["amount"]) for flat_fee in trade_fee.get("flat_fees", [])]
+            else:  # assume this is a TradeFeeBase
+                fee_percent = trade_fee.percent
+                fee_type = trade_fee.type_descriptor_for_json()
+                flat_fees = [(flat_fee.token, flat_fee.amount) for flat_fee in trade_fee.flat_fees]
+            if fee_percent is not None:
+                has_percent_fee = True
+                fee_percents.append(fee_percent)
+            else:
+                fee_percents.append(0)
+            deducted_fees.append(fee_type == deducted_fee_type)
+            for token, amount in flat_fees:
+                self.flat_fees[token] = self.flat_fees.get(token, s_decimal_0) + Decimal(amount)
+            position = getattr(trade, "position", None)
+            if position is not None and position != nil_position:
+                self.num_position_fills += 1
+
+        sides = np.array(sides, dtype=np.int8)
+        # converting the Decimal values one by one is much faster than letting numpy convert the objects
+        amounts = np.array(list(map(float, amounts)), dtype=np.float64)
+        quote_amounts = amounts * np.array(list(map(float, prices)), dtype=np.float64)
+        is_buy = sides == 1
+        is_sell = sides == -1
+        percent_fees = quote_amounts * np.array(list(map(float, fee_percents)), dtype=np.float64)
+
+        self.num_fills += len(sides)
+        self.num_buys += int(np.count_nonzero(is_buy))
+        self.num_sells += int(np.count_nonzero(is_sell))
+        self.b_vol_base += _to_decimal(amounts[is_buy].sum())
+        self.b_vol_quote -= _to_decimal(quote_amounts[is_buy].sum())
+        self.s_vol_base -= _to_decimal(amounts[is_sell].sum())
+        self.s_vol_quote += _to_decimal(
+            quote_amounts[is_sell].sum() - percent_fees[np.array(deducted_fees, dtype=bool)].sum())
+        if has_percent_fee:
+            self.percent_fees_quote = (self.percent_fees_quote or s_decimal_0) + _to_decimal(percent_fees.sum())
+        if self.start_price.is_nan():
+            self.start_price = Decimal(str(trades[0].price))
+        self.last_price = Decimal(str(trades[-1].price))
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
@@ -71,6 +207,20 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_aggregates(cls,
+                                     trading_pair: str,
+                                     aggregates: FillAggregates,
+                                     current_balances: Dict[str, Decimal],
+                                     trades: Optional[List[Any]] = None) -> 'PerformanceMetrics':
+        """
+        :param trades: the fills the aggregates were computed from, only needed to pair the open and close orders of
+        derivative positions
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_aggregates(trading_pair, aggregates, current_balances, trades)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -181,20 +331,16 @@ class PerformanceMetrics:
             and PositionAction.NIL.value not in [t.position for t in trades]
         )
 
-    def _preprocess_trades_and_group_by_type(self, trades: List[Any]) -> Tuple[List[Any], List[Any]]:
-        buys = []
-        sells = []
-        for trade in trades:
-            if trade.trade_type.upper() == TradeType.BUY.name.upper():
-                buys.append(trade)
-                self.b_vol_base += Decimal(str(trade.amount))
-                self.b_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price)) * Decimal("-1")
-            elif trade.trade_type.upper() == TradeType.SELL.name.upper():
-                sells.append(trade)
-                self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
-                self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
+    def _group_by_type(self, trades: List[Any]) -> Tuple[List[Any], List[Any]]:
+        buys = [trade for trade in trades if trade.trade_type.upper() == TradeType.BUY.name.upper()]
+        sells = [trade for trade in trades if trade.trade_type.upper() == TradeType.SELL.name.upper()]
+        return buys, sells
 
-            self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
+    def _set_volumes(self, aggregates: FillAggregates):
+        self.b_vol_base = aggregates.b_vol_base
+        self.s_vol_base = aggregates.s_vol_base
+        self.b_vol_quote = aggregates.b_vol_quote
+        self.s_vol_quote = aggregates.s_vol_quote
 
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
@@ -206,8 +352,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -225,28 +369,13 @@ class PerformanceMetrics:
         return impact
 
     async def _calculate_fees(self, quote: str, trades: List[Any]):
-        for trade in trades:
-            fee_percent = None
-            trade_price = None
-            trade_amount = None
-            if self._is_trade_fill(trade):
-                if trade.trade_fee.get("percent") is not None:
-                    trade_price = Decimal(str(trade.price))
-                    trade_amount = Decimal(str(trade.amount))
-                    fee_percent = Decimal(str(trade.trade_fee["percent"]))
-                flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
-                             for flat_fee in trade.trade_fee.get("flat_fees", [])]
-            else:  # assume this is Trade object
-                if trade.trade_fee.percent is not None:
-                    trade_price = Decimal(trade.price)
-                    trade_amount = Decimal(trade.amount)
-                    fee_percent = Decimal(trade.trade_fee.percent)
-                flat_fees = trade.trade_fee.flat_fees
+        await self._calculate_fees_from_aggregates(quote, FillAggregates.from_trades(trades))
 
-            if fee_percent is not None:
-                self.fees[quote] += trade_price * trade_amount * fee_percent
-            for flat_fee in flat_fees:
-                self.fees[flat_fee.token] += flat_fee.amount
+    async def _calculate_fees_from_aggregates(self, quote: str, aggregates: FillAggregates):
+        if aggregates.percent_fees_quote is not None:
+            self.fees[quote] += aggregates.percent_fees_quote
+        for fee_token, fee_amount in aggregates.flat_fees.items():
+            self.fees[fee_token] += fee_amount
 
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
@@ -294,12 +423,19 @@ class PerformanceMetrics:
         :param trades: the list of TradeFill or Trade object
         :param current_balances: current user account balance
         """
-
+        await self._initialize_metrics_from_aggregates(
+            trading_pair, FillAggregates.from_trades(trades), current_balances, trades)
+
+    async def _initialize_metrics_from_aggregates(self,
+                                                  trading_pair: str,
+                                                  aggregates: FillAggregates,
+                                                  current_balances: Dict[str, Decimal],
+                                                  trades: Optional[List[Any]] = None):
         base, quote = split_hb_trading_pair(trading_pair)
-        buys, sells = self._preprocess_trades_and_group_by_type(trades)
+        self._set_volumes(aggregates)
 
-        self.num_buys = len(buys)
-        self.num_sells = len(sells)
+        self.num_buys = aggregates.num_buys
+        self.num_sells = aggregates.num_sells
         self.num_trades = self.num_buys + self.num_sells
 
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
@@ -307,10 +443,10 @@ class PerformanceMetrics:
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = aggregates.start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = aggregates.last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +454,14 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
+        # only derivative positions need the fills themselves, to pair their open and close orders
+        if trades and aggregates.num_position_fills > 0:
+            buys, sells = self._group_by_type(trades)
+        else:
+            buys, sells = [], []
         self._calculate_trade_pnl(buys, sells)
 
-        await self._calculate_fees(quote, trades)
+        await self._calculate_fees_from_aggregates(quote, aggregates)
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -49,6 +49,7 @@ class HummingbotCompleter(Completer):
         self._derivative_exchange_completer = WordCompleter(AllConnectorSettings.get_derivative_names(), ignore_case=True)
         self._connect_option_completer = WordCompleter(CONNECT_OPTIONS, ignore_case=True)
         self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
+        self._latency_completer = WordCompleter(["start", "stop", "reset"], ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
         self._history_completer = WordCompleter(["--days", "--verbose", "--precision"], ignore_case=True)
         self._gateway_completer = WordCompleter(["balance", "config", "connect", "connector-tokens", "generate-certs", "test-connection", "list", "approve-tokens"], ignore_case=True)
@@ -133,7 +134,8 @@ class HummingbotCompleter(Completer):
             if exchange in self.prompt_text:
                 market = exchange
                 break
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
+        # Cataloged pairs are available before the background refresh completes
+        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if market else []
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
     @property
@@ -204,6 +206,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return "export" in text_before_cursor
 
+    def _complete_latency_options(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("latency ")
+
     def _complete_balance_options(self, document: Document) -> bool:
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("balance ")
@@ -371,6 +377,10 @@ class HummingbotCompleter(Completer):
             for c in self._export_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_latency_options(document):
+            for c in self._latency_completer.get_completions(document, complete_event):
+                yield c
+
         elif self._complete_balance_limit_exchanges(document):
             for c in self._connect_option_completer.get_completions(document, complete_event):
                 yield c
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import List, Optional, Set, Tuple
+from typing import Optional
 
 import pandas as pd
 import psutil
@@ -8,7 +8,6 @@ import tabulate
 
 from hummingbot.client.config.config_data_types import ClientConfigEnum
 from hummingbot.client.performance import PerformanceMetrics
-from hummingbot.model.trade_fill import TradeFill
 
 s_decimal_0 = Decimal("0")
 
@@ -67,28 +66,28 @@ async def start_trade_monitor(trade_monitor):
             if hb.strategy_task is not None and not hb.strategy_task.done():
                 if all(market.ready for market in hb.markets.values()):
                     with hb.trade_fill_db.get_new_session() as session:
-                        trades: List[TradeFill] = hb._get_trades_from_session(
+                        market_aggregates, market_trades = hb._get_market_aggregates_from_session(
                             int(hb.init_time * 1e3),
                             session=session,
                             config_file_path=hb.strategy_file_name)
-                        if len(trades) > 0:
-                            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                            for market, symbol in market_info:
-                                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-                                cur_balances = await hb.get_current_balances(market)
-                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
-                                return_pcts.append(perf.return_pct)
-                                pnls.append(perf.total_pnl)
-                            avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
-                            quote_assets = set(t.symbol.split("-")[1] for t in trades)
-                            if len(quote_assets) == 1:
-                                total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
-                            else:
-                                total_pnls = "N/A"
-                            trade_monitor.log(f"Trades: {len(trades)}, Total P&L: {total_pnls}, "
-                                              f"Return %: {avg_return:.2%}")
-                            return_pcts.clear()
-                            pnls.clear()
+                    if len(market_aggregates) > 0:
+                        for (market, symbol), aggregates in market_aggregates.items():
+                            cur_balances = await hb.get_current_balances(market)
+                            perf = await PerformanceMetrics.create_from_aggregates(
+                                symbol, aggregates, cur_balances, market_trades.get((market, symbol)))
+                            return_pcts.append(perf.return_pct)
+                            pnls.append(perf.total_pnl)
+                        avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+                        quote_assets = set(symbol.split("-")[1] for _, symbol in market_aggregates)
+                        if len(quote_assets) == 1:
+                            total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
+                        else:
+                            total_pnls = "N/A"
+                        num_trades = sum(aggregates.num_fills for aggregates in market_aggregates.values())
+                        trade_monitor.log(f"Trades: {num_trades}, Total P&L: {total_pnls}, "
+                                          f"Return %: {avg_return:.2%}")
+                        return_pcts.clear()
+                        pnls.clear()
             await _sleep(2)  # sleeping for longer to manage resources
         except asyncio.CancelledError:
             raise
@@ -2,14 +2,113 @@ import typing
 from collections import defaultdict
 from copy import copy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
 
 
+class BudgetEvaluationContext:
+    def __init__(self, exchange: "ExchangeBase"):
+        """
+        Snapshot of the exchange data the budget checks depend on, shared by the order candidates evaluated together.
+
+        The balances, fees, prices, collateral tokens and quantized amounts are fetched from the exchange the first
+        time a candidate needs them, and reused for the following candidates. The context can be passed in place of
+        the exchange to the `OrderCandidate` methods, and delegates everything else to the exchange.
+
+        A context must not outlive the tick it was created in, since it does not see the balance and price updates
+        happening after it cached them.
+
+        :param exchange: The exchange the data is fetched from.
+        """
+        self._exchange = exchange
+        self._balances: Dict[Tuple[str, bool], Decimal] = {}
+        self._fees: Dict[Tuple, TradeFeeBase] = {}
+        self._prices: Dict[Tuple[str, Any, Any], Decimal] = {}
+        self._collateral_tokens: Dict[Tuple[str, bool], str] = {}
+        self._quantized_amounts: Dict[Tuple[str, Decimal], Decimal] = {}
+
+    def __getattr__(self, item: str):
+        return getattr(self._exchange, item)
+
+    @property
+    def name(self) -> str:
+        return self._exchange.name
+
+    def get_balance(self, currency: str) -> Decimal:
+        return self._get_cached_balance(currency, from_total_balances=True)
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self._get_cached_balance(currency, from_total_balances=False)
+
+    def get_price(self, trading_pair: str, is_buy: bool) -> Decimal:
+        key = (trading_pair, is_buy, None)
+        price = self._prices.get(key)
+        if price is None:
+            price = self._prices[key] = self._exchange.get_price(trading_pair, is_buy)
+        return price
+
+    def get_price_by_type(self, trading_pair: str, price_type: PriceType) -> Decimal:
+        key = (trading_pair, None, price_type)
+        price = self._prices.get(key)
+        if price is None:
+            price = self._prices[key] = self._exchange.get_price_by_type(trading_pair, price_type)
+        return price
+
+    def get_buy_collateral_token(self, trading_pair: str) -> str:
+        return self._get_cached_collateral_token(trading_pair, is_buy=True)
+
+    def get_sell_collateral_token(self, trading_pair: str) -> str:
+        return self._get_cached_collateral_token(trading_pair, is_buy=False)
+
+    def quantize_order_amount(self, trading_pair: str, amount: Decimal) -> Decimal:
+        key = (trading_pair, amount)
+        quantized_amount = self._quantized_amounts.get(key)
+        if quantized_amount is None:
+            quantized_amount = self._quantized_amounts[key] = self._exchange.quantize_order_amount(
+                trading_pair, amount
+            )
+        return quantized_amount
+
+    def get_fee(self, order_candidate: OrderCandidate) -> TradeFeeBase:
+        """
+        Returns the fee of the order candidate, built from the exchange fee schema once per distinct set of
+        fee parameters (see `OrderCandidate.fee_cache_key`).
+        """
+        key = order_candidate.fee_cache_key()
+        fee = self._fees.get(key)
+        if fee is None:
+            fee = self._fees[key] = order_candidate._get_fee(self._exchange)
+        return fee
+
+    def _get_cached_balance(self, currency: str, from_total_balances: bool) -> Decimal:
+        key = (currency, from_total_balances)
+        balance = self._balances.get(key)
+        if balance is None:
+            balance = self._balances[key] = (
+                self._exchange.get_balance(currency)
+                if from_total_balances
+                else self._exchange.get_available_balance(currency)
+            )
+        return balance
+
+    def _get_cached_collateral_token(self, trading_pair: str, is_buy: bool) -> str:
+        key = (trading_pair, is_buy)
+        token = self._collateral_tokens.get(key)
+        if token is None:
+            token = self._collateral_tokens[key] = (
+                self._exchange.get_buy_collateral_token(trading_pair)
+                if is_buy
+                else self._exchange.get_sell_collateral_token(trading_pair)
+            )
+        return token
+
+
 class BudgetChecker:
     def __init__(self, exchange: "ExchangeBase"):
         """
@@ -17,6 +116,8 @@ class BudgetChecker:
 
         Mainly used to determine if sufficient balance is available to place a set of strategy-proposed orders.
         The strategy can size a list of proposed order candidates by calling the `adjust_candidates` method.
+        The candidates of the list are evaluated together, sharing a `BudgetEvaluationContext` that fetches the
+        balances, fees and prices from the exchange only once.
 
         For a more fine-grained control, the strategy can call `adjust_candidate_and_lock_available_collateral`
         for each one of the orders it intends to place. On each call, the `BudgetChecker` locks in the collateral
@@ -35,8 +136,17 @@ class BudgetChecker:
         """
         self._locked_collateral.clear()
 
+    def evaluation_context(self) -> BudgetEvaluationContext:
+        """
+        Creates a context to share the exchange data between the checks of the current tick.
+        """
+        return BudgetEvaluationContext(self._exchange)
+
     def adjust_candidates(
-        self, order_candidates: List[OrderCandidate], all_or_none: bool = True
+        self,
+        order_candidates: List[OrderCandidate],
+        all_or_none: bool = True,
+        context: Optional[BudgetEvaluationContext] = None,
     ) -> List[OrderCandidate]:
         """
         Fills in the collateral and returns fields of the order candidates.
@@ -45,20 +155,36 @@ class BudgetChecker:
         See the doc string for `adjust_candidate` to learn more about how the adjusted order
         amount is derived.
 
+        The collateral entries of all the candidates are populated first. If the balances cover the collateral of
+        all the candidates together, none of them needs to be adjusted. Otherwise, the candidates are adjusted one
+        after the other, locking the collateral of the previous ones.
+
         :param order_candidates: A list of candidate orders to check and adjust.
         :param all_or_none: Should the order amount be set to zero on insufficient balance.
+        :param context: The evaluation context to use, if the caller shares one between several checks.
         :return: The list of adjusted order candidates.
         """
+        context = context or self.evaluation_context()
         self.reset_locked_collateral()
-        adjusted_candidates = [
-            self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
-            for order_candidate in order_candidates
+        populated_candidates = [
+            self.populate_collateral_entries(order_candidate, context) for order_candidate in order_candidates
         ]
+        if self._balances_cover_all_candidates(populated_candidates, context):
+            adjusted_candidates = populated_candidates
+        else:
+            adjusted_candidates = []
+            for order_candidate in populated_candidates:
+                adjusted_candidate = self._adjust_populated_candidate(order_candidate, all_or_none, context)
+                self._lock_available_collateral(adjusted_candidate)
+                adjusted_candidates.append(adjusted_candidate)
         self.reset_locked_collateral()
         return adjusted_candidates
 
     def adjust_candidate_and_lock_available_collateral(
-        self, order_candidate: OrderCandidate, all_or_none: bool = True
+        self,
+        order_candidate: OrderCandidate,
+        all_or_none: bool = True,
+        context: Optional[BudgetEvaluationContext] = None,
     ) -> OrderCandidate:
         """
         Fills in the collateral and returns fields of the order candidates.
@@ -73,14 +199,18 @@ class BudgetChecker:
 
         :param order_candidate: The candidate order to check and adjust.
         :param all_or_none: Should the order amount be set to zero on insufficient balance.
+        :param context: The evaluation context to use, if the caller shares one between several checks.
         :return: The adjusted order candidate.
         """
-        adjusted_candidate = self.adjust_candidate(order_candidate, all_or_none)
+        adjusted_candidate = self.adjust_candidate(order_candidate, all_or_none, context)
         self._lock_available_collateral(adjusted_candidate)
         return adjusted_candidate
 
     def adjust_candidate(
-        self, order_candidate: OrderCandidate, all_or_none: bool = True
+        self,
+        order_candidate: OrderCandidate,
+        all_or_none: bool = True,
+        context: Optional[BudgetEvaluationContext] = None,
     ) -> OrderCandidate:
         """
         Fills in the collateral and returns fields of the order candidates.
@@ -92,19 +222,16 @@ class BudgetChecker:
 
         :param order_candidate: The candidate order to be checked and adjusted.
         :param all_or_none: Should the order amount be set to zero on insufficient balance.
+        :param context: The evaluation context to use, if the caller shares one between several checks.
         :return: The adjusted order candidate.
         """
-        order_candidate = self.populate_collateral_entries(order_candidate)
-        available_balances = self._get_available_balances(order_candidate)
-        order_candidate.adjust_from_balances(available_balances)
-        if order_candidate.resized:
-            if all_or_none:
-                order_candidate.set_to_zero()
-            else:
-                order_candidate = self._quantize_adjusted_order(order_candidate)
-        return order_candidate
+        context = context or self.evaluation_context()
+        order_candidate = self.populate_collateral_entries(order_candidate, context)
+        return self._adjust_populated_candidate(order_candidate, all_or_none, context)
 
-    def populate_collateral_entries(self, order_candidate: OrderCandidate) -> OrderCandidate:
+    def populate_collateral_entries(
+        self, order_candidate: OrderCandidate, context: Optional[BudgetEvaluationContext] = None
+    ) -> OrderCandidate:
         """
         Populates the collateral and returns fields of the order candidates.
 
@@ -113,18 +240,56 @@ class BudgetChecker:
         configurations.
 
         :param order_candidate: The candidate order to check and adjust.
+        :param context: The evaluation context to use, if the caller shares one between several checks.
         :return: The adjusted order candidate.
         """
         order_candidate = copy(order_candidate)
-        order_candidate.populate_collateral_entries(self._exchange)
+        if context is None:
+            order_candidate.populate_collateral_entries(self._exchange)
+        else:
+            order_candidate.populate_collateral_entries(context, context.get_fee(order_candidate))
+        return order_candidate
+
+    def _adjust_populated_candidate(
+        self, order_candidate: OrderCandidate, all_or_none: bool, context: BudgetEvaluationContext
+    ) -> OrderCandidate:
+        available_balances = self._get_available_balances(order_candidate, context)
+        order_candidate.adjust_from_balances(available_balances)
+        if order_candidate.resized:
+            if all_or_none:
+                order_candidate.set_to_zero()
+            else:
+                order_candidate = self._quantize_adjusted_order(order_candidate, context)
         return order_candidate
 
-    def _get_available_balances(self, order_candidate: OrderCandidate) -> Dict[str, Decimal]:
+    def _balances_cover_all_candidates(
+        self, order_candidates: List[OrderCandidate], context: BudgetEvaluationContext
+    ) -> bool:
+        required_collateral: Dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+        for order_candidate in order_candidates:
+            for token, amount in order_candidate.collateral_dict.items():
+                required_collateral[token] += amount
+        for order_candidate in order_candidates:
+            balance_fn = (
+                context.get_available_balance
+                if not order_candidate.from_total_balances
+                else context.get_balance
+            )
+            for token in order_candidate.collateral_dict:
+                required_amount = required_collateral[token]
+                if required_amount.is_nan() or balance_fn(token) < required_amount:
+                    return False
+        return True
+
+    def _get_available_balances(
+        self, order_candidate: OrderCandidate, context: Optional[BudgetEvaluationContext] = None
+    ) -> Dict[str, Decimal]:
         available_balances = {}
+        balance_source = context or self._exchange
         balance_fn = (
-            self._exchange.get_available_balance
+            balance_source.get_available_balance
             if not order_candidate.from_total_balances
-            else self._exchange.get_balance
+            else balance_source.get_balance
         )
 
         if order_candidate.order_collateral is not None:
@@ -145,14 +310,16 @@ class BudgetChecker:
 
         return available_balances
 
-    def _quantize_adjusted_order(self, order_candidate: OrderCandidate) -> OrderCandidate:
+    def _quantize_adjusted_order(
+        self, order_candidate: OrderCandidate, context: Optional[BudgetEvaluationContext] = None
+    ) -> OrderCandidate:
         trading_pair = order_candidate.trading_pair
         adjusted_amount = order_candidate.amount
-        quantized_amount = self._exchange.quantize_order_amount(trading_pair, adjusted_amount)
+        quantized_amount = (context or self._exchange).quantize_order_amount(trading_pair, adjusted_amount)
 
         if adjusted_amount != quantized_amount:
             order_candidate.amount = quantized_amount
-            order_candidate = self.populate_collateral_entries(order_candidate)
+            order_candidate = self.populate_collateral_entries(order_candidate, context)
 
         return order_candidate
 
@@ -3,7 +3,8 @@ import logging
 from collections import defaultdict
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -20,7 +21,9 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.utils import order_latency_tracker
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.order_latency_tracker import OrderLatencyTracker
 from hummingbot.logger.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -29,6 +32,29 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class _CachedOrdersTTLCache(TTLCache):
+    """
+    TTLCache that notifies when an order is evicted, either because its TTL expired or because the cache is full.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, on_evict: Callable[[InFlightOrder], None]):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_evict = on_evict
+
+    def expire(self, *args, **kwargs):
+        expired = super().expire(*args, **kwargs)
+        # Older cachetools versions do not report the expired items. The tracker indexes validate their entries on
+        # lookup, so this only delays the release of the stale index entries.
+        for _, order in expired or []:
+            self._on_evict(order)
+        return expired
+
+    def popitem(self):
+        client_order_id, order = super().popitem()
+        self._on_evict(order)
+        return client_order_id, order
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -55,9 +81,18 @@ class ClientOrderTracker:
         self._connector: ConnectorBase = connector
         self._lost_order_count_limit = lost_order_count_limit
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
-        self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        self._cached_orders: TTLCache = _CachedOrdersTTLCache(
+            maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL, on_evict=self._unindex_order
+        )
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Secondary indexes, updated on every order state transition to allow O(1) lookups from user stream events
+        self._fillable_orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._fillable_orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._active_order_indexed_states: Dict[str, OrderState] = {}
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -74,49 +109,46 @@ class ClientOrderTracker:
         """
         Returns orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return dict(self._cached_orders.items())
 
     @property
     def all_orders(self) -> Dict[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return {**self._in_flight_orders, **self._cached_orders}
 
     @property
     def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
         """
-        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
+        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders.
+        Use `fetch_fillable_order` or `iter_fillable_orders` to avoid building a new dictionary.
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return {order.client_order_id: order for order in self.iter_fillable_orders()}
 
     @property
     def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
+        Use `fetch_fillable_order_by_exchange_order_id` to avoid building a new dictionary.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return {order.exchange_order_id: order for order in self.iter_fillable_orders()}
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
         """
-        Returns all orders that could receive status updates
+        Returns all orders that could receive status updates.
+        Use `fetch_updatable_order` or `iter_updatable_orders` to avoid building a new dictionary.
         """
-        return {**self.active_orders, **self.lost_orders}
+        return {**self._in_flight_orders, **self._lost_orders}
 
     @property
     def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
+        Use `fetch_updatable_order_by_exchange_order_id` to avoid building a new dictionary.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return {order.exchange_order_id: order for order in self.iter_updatable_orders()}
 
     @property
     def current_timestamp(self) -> int:
@@ -142,11 +174,17 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._reindex_active_order_state(order)
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
+            self._unindex_active_order(order)
+            self._cached_orders[client_order_id] = order
+            self._index_order(order)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -162,6 +200,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -169,17 +208,84 @@ class ClientOrderTracker:
     def fetch_cached_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._cached_orders.get(client_order_id, None)
 
+    def fetch_fillable_order(self, client_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Returns the active, cached or lost order with the specified client order ID (same as
+        `all_fillable_orders.get(client_order_id)` without building the merged dictionary)
+        """
+        return (
+            self._in_flight_orders.get(client_order_id)
+            or self._lost_orders.get(client_order_id)
+            or self._cached_orders.get(client_order_id)
+        )
+
+    def fetch_updatable_order(self, client_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Returns the active or lost order with the specified client order ID (same as
+        `all_updatable_orders.get(client_order_id)` without building the merged dictionary)
+        """
+        return self._in_flight_orders.get(client_order_id) or self._lost_orders.get(client_order_id)
+
+    def fetch_fillable_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Returns the active, cached or lost order with the specified exchange order ID using the tracker index
+        """
+        order = self._fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None and len(self._fillable_orders_without_exchange_order_id) > 0:
+            # The exchange order ID might have been assigned to the order directly, outside the tracker
+            self._index_orders_without_exchange_order_id()
+            order = self._fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        if order is not None and (order.exchange_order_id != exchange_order_id or not self._is_fillable(order)):
+            order = None
+        return order
+
+    def fetch_updatable_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Returns the active or lost order with the specified exchange order ID using the tracker index
+        """
+        order = self.fetch_fillable_order_by_exchange_order_id(exchange_order_id)
+        if order is not None and not self._is_updatable(order):
+            order = None
+        return order
+
+    def iter_fillable_orders(self) -> Iterator[InFlightOrder]:
+        """
+        Iterates over the active, cached and lost orders without copying them.
+        The tracker must not be modified while iterating.
+        """
+        return chain(self._in_flight_orders.values(), self._cached_orders.values(), self._lost_orders.values())
+
+    def iter_updatable_orders(self) -> Iterator[InFlightOrder]:
+        """
+        Iterates over the active and lost orders without copying them.
+        The tracker must not be modified while iterating.
+        """
+        return chain(self._in_flight_orders.values(), self._lost_orders.values())
+
+    def active_orders_by_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read-only view of the active orders for the trading pair, mapped by client order ID
+        """
+        return MappingProxyType(self._active_orders_by_trading_pair.get(trading_pair, {}))
+
+    def active_orders_by_state(self, state: OrderState) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read-only view of the active orders in the specified state, mapped by client order ID.
+        The index is updated with the order updates processed by the tracker.
+        """
+        return MappingProxyType(self._active_orders_by_state.get(state, {}))
+
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if client_order_id is not None:
+            found_order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self.fetch_fillable_order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and found_order.client_order_id in self._lost_orders:
+                found_order = None
 
         return found_order
 
@@ -191,9 +297,9 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            found_order = self.fetch_fillable_order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and found_order.client_order_id not in self._lost_orders:
+                found_order = None
 
         return found_order
 
@@ -203,13 +309,18 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self.fetch_fillable_order(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
             if updated:
+                self._index_order(tracked_order)
+                latency_tracker = OrderLatencyTracker.get_instance()
+                if latency_tracker.enabled and previous_executed_amount_base == Decimal("0"):
+                    latency_tracker.record_order_stage(
+                        order_latency_tracker.CREATE_REQUEST, client_order_id, order_latency_tracker.FIRST_FILL)
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
                     prev_executed_amount_base=previous_executed_amount_base,
@@ -249,6 +360,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._index_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -291,6 +403,11 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._index_order(tracked_order)
+                self._reindex_active_order_state(tracked_order)
+                latency_tracker = OrderLatencyTracker.get_instance()
+                if latency_tracker.enabled:
+                    self._record_latency_stage(latency_tracker, tracked_order, previous_state)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -301,9 +418,95 @@ class ClientOrderTracker:
                 if order_update.new_state in [OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED]:
                     # If the order officially reaches a final state after being lost it should be removed from the lost list
                     del self._lost_orders[lost_order.client_order_id]
+                    self._unindex_order(lost_order)
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    @staticmethod
+    def _record_latency_stage(
+            latency_tracker: OrderLatencyTracker, tracked_order: InFlightOrder, previous_state: OrderState):
+        client_order_id = tracked_order.client_order_id
+        if (previous_state == OrderState.PENDING_CREATE and
+                tracked_order.current_state not in [
+                    OrderState.PENDING_CREATE, OrderState.CANCELED, OrderState.FAILED, OrderState.PENDING_CANCEL]):
+            latency_tracker.record_order_stage(
+                order_latency_tracker.CREATE_REQUEST, client_order_id, order_latency_tracker.ACKNOWLEDGED)
+        if tracked_order.is_filled:
+            latency_tracker.record_order_stage(
+                order_latency_tracker.CREATE_REQUEST, client_order_id, order_latency_tracker.FILLED)
+        elif tracked_order.is_failure:
+            latency_tracker.record_order_stage(
+                order_latency_tracker.CREATE_REQUEST, client_order_id, order_latency_tracker.FAILED)
+        elif tracked_order.is_cancelled:
+            latency_tracker.record_order_stage(
+                order_latency_tracker.CANCEL_REQUEST, client_order_id, order_latency_tracker.CANCEL_CONFIRMED)
+        if tracked_order.is_done:
+            latency_tracker.discard_trace(order_latency_tracker.CREATE_REQUEST, client_order_id)
+            latency_tracker.discard_trace(order_latency_tracker.CANCEL_REQUEST, client_order_id)
+
+    def _is_fillable(self, order: InFlightOrder) -> bool:
+        client_order_id = order.client_order_id
+        return (
+            self._in_flight_orders.get(client_order_id) is order
+            or self._lost_orders.get(client_order_id) is order
+            or self._cached_orders.get(client_order_id) is order
+        )
+
+    def _is_updatable(self, order: InFlightOrder) -> bool:
+        client_order_id = order.client_order_id
+        return (
+            self._in_flight_orders.get(client_order_id) is order
+            or self._lost_orders.get(client_order_id) is order
+        )
+
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is not None:
+            self._fillable_orders_by_exchange_order_id[order.exchange_order_id] = order
+            self._fillable_orders_without_exchange_order_id.pop(order.client_order_id, None)
+        else:
+            self._fillable_orders_without_exchange_order_id[order.client_order_id] = order
+
+    def _unindex_order(self, order: InFlightOrder):
+        if self._is_fillable(order):
+            return
+        if self._fillable_orders_without_exchange_order_id.get(order.client_order_id) is order:
+            del self._fillable_orders_without_exchange_order_id[order.client_order_id]
+        if (order.exchange_order_id is not None
+                and self._fillable_orders_by_exchange_order_id.get(order.exchange_order_id) is order):
+            del self._fillable_orders_by_exchange_order_id[order.exchange_order_id]
+
+    def _index_orders_without_exchange_order_id(self):
+        for order in list(self._fillable_orders_without_exchange_order_id.values()):
+            if not self._is_fillable(order):
+                del self._fillable_orders_without_exchange_order_id[order.client_order_id]
+            elif order.exchange_order_id is not None:
+                self._index_order(order)
+
+    def _reindex_active_order_state(self, order: InFlightOrder):
+        client_order_id = order.client_order_id
+        if self._in_flight_orders.get(client_order_id) is not order:
+            return
+        previous_state = self._active_order_indexed_states.get(client_order_id)
+        if previous_state != order.current_state:
+            if previous_state is not None:
+                self._active_orders_by_state[previous_state].pop(client_order_id, None)
+            self._active_orders_by_state[order.current_state][client_order_id] = order
+            self._active_order_indexed_states[client_order_id] = order.current_state
+
+    def _unindex_active_order(self, order: InFlightOrder):
+        client_order_id = order.client_order_id
+        orders_for_pair = self._active_orders_by_trading_pair.get(order.trading_pair)
+        if orders_for_pair is not None:
+            orders_for_pair.pop(client_order_id, None)
+            if len(orders_for_pair) == 0:
+                del self._active_orders_by_trading_pair[order.trading_pair]
+        indexed_state = self._active_order_indexed_states.pop(client_order_id, None)
+        if indexed_state is not None:
+            orders_in_state = self._active_orders_by_state[indexed_state]
+            orders_in_state.pop(client_order_id, None)
+            if len(orders_in_state) == 0:
+                del self._active_orders_by_state[indexed_state]
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -60,6 +60,27 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
         )
         return funding_info
 
+    async def get_funding_infos(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        all_symbols_info: List[Dict[str, Any]] = await self._connector._api_get(
+            path_url=CONSTANTS.MARK_PRICE_URL,
+            limit_id=CONSTANTS.ALL_MARK_PRICES_LIMIT_ID)
+        symbol_map = await self._connector.trading_pair_symbol_map()
+        funding_infos = {}
+        for symbol_info in all_symbols_info:
+            trading_pair = symbol_map.get(symbol_info["symbol"])
+            if trading_pair in trading_pairs:
+                funding_infos[trading_pair] = FundingInfo(
+                    trading_pair=trading_pair,
+                    index_price=Decimal(symbol_info["indexPrice"]),
+                    mark_price=Decimal(symbol_info["markPrice"]),
+                    next_funding_utc_timestamp=int(float(symbol_info["nextFundingTime"]) * 1e-3),
+                    rate=Decimal(symbol_info["lastFundingRate"]),
+                )
+        missing_trading_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in funding_infos]
+        if len(missing_trading_pairs) > 0:
+            funding_infos.update(await super().get_funding_infos(missing_trading_pairs))
+        return funding_infos
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
 
@@ -42,6 +42,9 @@ CHANGE_POSITION_MODE_URL = "v1/positionSide/dual"
 
 POST_POSITION_MODE_LIMIT_ID = f"POST{CHANGE_POSITION_MODE_URL}"
 GET_POSITION_MODE_LIMIT_ID = f"GET{CHANGE_POSITION_MODE_URL}"
+# Requests without symbol, returning the data of all the markets
+ALL_MARK_PRICES_LIMIT_ID = f"{MARK_PRICE_URL}_all"
+INCOME_HISTORY_MAX_LIMIT = 1000
 
 # Private API v2 Endpoints
 ACCOUNT_INFO_URL = "v2/account"
@@ -125,6 +128,8 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5)]),
     RateLimit(limit_id=MARK_PRICE_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE, weight=1,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
+    RateLimit(limit_id=ALL_MARK_PRICES_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE, weight=10,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=10)]),
 ]
 
 ORDER_NOT_EXIST_ERROR_CODE = -2013
@@ -115,6 +115,10 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     def funding_fee_poll_interval(self) -> int:
         return 600
 
+    @property
+    def supports_bulk_funding_payments(self) -> bool:
+        return True
+
     def supported_order_types(self) -> List[OrderType]:
         """
         :return a list of OrderType supported by this connector
@@ -385,7 +389,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
         if event_type == "ORDER_TRADE_UPDATE":
             order_message = event_message.get("o")
             client_order_id = order_message.get("c", None)
-            tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.fetch_fillable_order(client_order_id)
             if tracked_order is not None:
                 trade_id: str = str(order_message["t"])
 
@@ -420,7 +424,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                     )
                     self._order_tracker.process_trade_update(trade_update)
 
-            tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
             if tracked_order is not None:
                 order_update: OrderUpdate = OrderUpdate(
                     trading_pair=tracked_order.trading_pair,
@@ -802,3 +806,36 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
         else:
             timestamp, funding_rate, payment = 0, Decimal("-1"), Decimal("-1")
         return timestamp, funding_rate, payment
+
+    async def _fetch_funding_payments_since(self, start_time: float) -> Dict[str, Tuple[int, Decimal, Decimal]]:
+        payments_response = await self._api_get(
+            path_url=CONSTANTS.GET_INCOME_HISTORY_URL,
+            params={
+                "incomeType": "FUNDING_FEE",
+                "startTime": int(start_time * 1e3),
+                "limit": CONSTANTS.INCOME_HISTORY_MAX_LIMIT,
+            },
+            is_auth_required=True,
+        )
+        payments = [payment for payment in payments_response if Decimal(payment["income"]) != Decimal("0")]
+        if len(payments) == 0:
+            return {}
+
+        funding_info_response = await self._api_get(
+            path_url=CONSTANTS.MARK_PRICE_URL,
+            limit_id=CONSTANTS.ALL_MARK_PRICES_LIMIT_ID,
+        )
+        funding_rates = {
+            symbol_info["symbol"]: Decimal(symbol_info["lastFundingRate"]) for symbol_info in funding_info_response
+        }
+        last_payments = {}
+        symbol_map = await self.trading_pair_symbol_map()
+        for payment in payments:
+            trading_pair = symbol_map.get(payment["symbol"])
+            if trading_pair is None:
+                continue
+            timestamp = payment["time"]
+            if trading_pair not in last_payments or timestamp > last_payments[trading_pair][0]:
+                funding_rate = funding_rates.get(payment["symbol"], Decimal("-1"))
+                last_payments[trading_pair] = (timestamp, funding_rate, Decimal(payment["income"]))
+        return last_payments
@@ -694,7 +694,7 @@ class BitgetPerpetualDerivative(PerpetualDerivativePyBase):
         """
         order_status = CONSTANTS.ORDER_STATE[order_msg["status"]]
         client_order_id = str(order_msg["clOrdId"])
-        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        updatable_order = self._order_tracker.fetch_updatable_order(client_order_id)
 
         if updatable_order is not None:
             new_order_update: OrderUpdate = OrderUpdate(
@@ -736,7 +736,7 @@ class BitgetPerpetualDerivative(PerpetualDerivativePyBase):
         """
 
         client_order_id = str(trade_msg["clOrdId"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.fetch_fillable_order(client_order_id)
 
         if fillable_order is not None and "tradeId" in trade_msg:
             trade_update = self._parse_websocket_trade_update(trade_msg=trade_msg, tracked_order=fillable_order)
@@ -380,7 +380,7 @@ class BitmartPerpetualDerivative(PerpetualDerivativePyBase):
         if CONSTANTS.WS_ORDERS_CHANNEL in event_group and bool(event_data):
             order_message = event_data[0].get("order")
             client_order_id = order_message.get("client_order_id", None)
-            tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.fetch_fillable_order(client_order_id)
             position_side = order_message.get("side")
             position_action = self.side_mapping.inv[position_side][0]
             if tracked_order is not None:
@@ -411,7 +411,7 @@ class BitmartPerpetualDerivative(PerpetualDerivativePyBase):
                     )
                     self._order_tracker.process_trade_update(trade_update)
 
-            tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+            tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
             if tracked_order is not None:
                 deal_size = Decimal(order_message["deal_size"])
                 size = Decimal(order_message["size"])
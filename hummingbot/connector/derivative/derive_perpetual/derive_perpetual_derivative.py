@@ -668,7 +668,7 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
         Example Trade:
         """
         exchange_order_id = str(trade.get("order_id", ""))
-        tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        tracked_order = self._order_tracker.fetch_fillable_order_by_exchange_order_id(exchange_order_id)
 
         if tracked_order is None:
             all_orders = self._order_tracker.all_fillable_orders
@@ -716,7 +716,7 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
         Example Order:
         """
         client_order_id = str(order_msg.get("label", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
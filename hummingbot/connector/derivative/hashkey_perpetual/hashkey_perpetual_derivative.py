@@ -368,7 +368,7 @@ class HashkeyPerpetualDerivative(PerpetualDerivativePyBase):
                     if event_type == "contractExecutionReport":
                         execution_type = event_message.get("X")
                         client_order_id = event_message.get("c")
-                        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        updatable_order = self._order_tracker.fetch_updatable_order(client_order_id)
                         if updatable_order is not None:
                             if execution_type in ["PARTIALLY_FILLED", "FILLED"]:
                                 fee = TradeFeeBase.new_perpetual_fee(
@@ -559,7 +559,7 @@ class KucoinPerpetualDerivative(PerpetualDerivativePyBase):
                 elif endpoint == CONSTANTS.WS_SUBSCRIPTION_ORDERS_ENDPOINT_NAME:
                     order_event_type = payload["type"]
                     client_order_id: Optional[str] = payload.get("clientOid")
-                    updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    updatable_order = self._order_tracker.fetch_updatable_order(client_order_id)
                     event_timestamp = payload["ts"] * 1e-9
                     if order_event_type == "match":
                         self._process_trade_event_message(payload)
@@ -641,7 +641,7 @@ class KucoinPerpetualDerivative(PerpetualDerivativePyBase):
         :param trade_msg: The trade event message payload
         """
         client_order_id = str(trade_msg.get("clientOid"))
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.fetch_fillable_order(client_order_id)
         if fillable_order is not None:
             trade_update = self._parse_trade_update(trade_msg=trade_msg, tracked_order=fillable_order)
             self._order_tracker.process_trade_update(trade_update)
@@ -701,7 +701,7 @@ class KucoinPerpetualDerivative(PerpetualDerivativePyBase):
         ordered_canceled = order_msg["cancelExist"]
         is_active = order_msg["isActive"]
         client_order_id = str(order_msg["clientOid"])
-        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        updatable_order = self._order_tracker.fetch_updatable_order(client_order_id)
         new_state = updatable_order.current_state
         if ordered_canceled:
             new_state = OrderState.CANCELED
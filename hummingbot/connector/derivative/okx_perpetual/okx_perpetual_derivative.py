@@ -681,7 +681,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         """
 
         client_order_id = str(trade_msg["clOrdId"])
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.fetch_fillable_order(client_order_id)
 
         if fillable_order is not None:
             trade_update = self._parse_trade_update(trade_msg=trade_msg, tracked_order=fillable_order)
@@ -703,7 +703,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         fill_fee_currency = order_msg.get("fillFeeCcy")
         fill_fee = -Decimal(order_msg.get("fillFee", "0"))
 
-        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        updatable_order = self._order_tracker.fetch_updatable_order(client_order_id)
         if updatable_order is not None:
             new_order_update: OrderUpdate = OrderUpdate(
                 trading_pair=updatable_order.trading_pair,
@@ -714,7 +714,7 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
             )
             self._order_tracker.process_order_update(new_order_update)
 
-        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        fillable_order = self._order_tracker.fetch_fillable_order(client_order_id)
         if fillable_order is not None and order_status in [OrderState.PARTIALLY_FILLED, OrderState.FILLED]:
             fill_base_amount = abs(self._format_size_to_amount(fillable_order.trading_pair, (Decimal(str(order_msg["fillSz"])))))
             fee = TradeFeeBase.new_perpetual_fee(
@@ -7,6 +7,7 @@ from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrde
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
+from hummingbot.core.web_assistant.connections.json_decoder import RawMessageRouter
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
@@ -34,6 +35,12 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._diff_messages_queue_key = CONSTANTS.DIFF_EVENT_TYPE
         self._domain = domain
         self._api_factory = api_factory
+        self._raw_message_router = RawMessageRouter(
+            channel_field="e",
+            routes={
+                CONSTANTS.DIFF_EVENT_TYPE: self._diff_messages_queue_key,
+                CONSTANTS.TRADE_EVENT_TYPE: self._trade_messages_queue_key,
+            })
 
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
@@ -105,7 +112,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def _connected_websocket_assistant(self) -> WSAssistant:
         ws: WSAssistant = await self._api_factory.get_ws_assistant()
         await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
-                         ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
+                         ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL,
+                         raw_messages=True)
         return ws
 
     async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
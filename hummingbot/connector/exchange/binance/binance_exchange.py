@@ -307,7 +307,7 @@ class BinanceExchange(ExchangePyBase):
                         client_order_id = event_message.get("C")
 
                     if execution_type == "TRADE":
-                        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+                        tracked_order = self._order_tracker.fetch_fillable_order(client_order_id)
                         if tracked_order is not None:
                             fee = TradeFeeBase.new_spot_fee(
                                 fee_schema=self.trade_fee_schema(),
@@ -328,7 +328,7 @@ class BinanceExchange(ExchangePyBase):
                             )
                             self._order_tracker.process_trade_update(trade_update)
 
-                    tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
                     if tracked_order is not None:
                         order_update = OrderUpdate(
                             trading_pair=tracked_order.trading_pair,
@@ -325,7 +325,7 @@ class BingXExchange(ExchangePyBase):
                     client_order_id = data.get('C')
                     # exchange_order_id = data.get('i')
 
-                    tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+                    tracked_order = self._order_tracker.fetch_fillable_order(client_order_id)
                     # tracked_order = self._order_tracker.fetch_order(exchange_order_id=str(exchange_order_id))
                     if tracked_order is not None:
                         if execution_type in ["PARTIALLY_FILLED", "FILLED"]:
@@ -359,7 +359,7 @@ class BingXExchange(ExchangePyBase):
                             )
                             self._order_tracker.process_trade_update(trade_update)
 
-                    tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
                     if tracked_order is not None:
                         new_state = CONSTANTS.ORDER_STATE[data["X"]]
                         if new_state == OrderState.PENDING_CREATE:
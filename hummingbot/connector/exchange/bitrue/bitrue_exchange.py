@@ -334,7 +334,7 @@ class BitrueExchange(ExchangePyBase):
                     client_order_id = event_message.get("C")
 
                     if order_status in (2, 3):
-                        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+                        tracked_order = self._order_tracker.fetch_fillable_order(client_order_id)
                         if tracked_order is not None:
                             fee = TradeFeeBase.new_spot_fee(
                                 fee_schema=self.trade_fee_schema(),
@@ -357,7 +357,7 @@ class BitrueExchange(ExchangePyBase):
                             )
                             self._order_tracker.process_trade_update(trade_update)
 
-                    tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
                     if tracked_order is not None and event_message["X"] != 0:
                         order_update = OrderUpdate(
                             trading_pair=tracked_order.trading_pair,
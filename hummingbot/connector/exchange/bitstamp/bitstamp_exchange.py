@@ -326,7 +326,7 @@ class BitstampExchange(ExchangePyBase):
 
             if event == CONSTANTS.USER_TRADE:
                 client_order_id = str(event_data.get("client_order_id"))
-                order: InFlightOrder = self._order_tracker.all_fillable_orders.get(client_order_id)
+                order: InFlightOrder = self._order_tracker.fetch_fillable_order(client_order_id)
                 if order is None:
                     self.logger().debug(f"Received event for unknown order ID: {event_message}")
                     return
@@ -361,7 +361,7 @@ class BitstampExchange(ExchangePyBase):
                 amount = Decimal(event_data["amount"])
                 price = Decimal(event_data["price"])
 
-                buy_order: InFlightOrder = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(buy_order_id)
+                buy_order: InFlightOrder = self._order_tracker.fetch_fillable_order_by_exchange_order_id(buy_order_id)
                 if buy_order:
                     buy_trade_update = TradeUpdate(
                         trade_id=f"{buy_order_id}-{sell_order_id}",
@@ -379,7 +379,7 @@ class BitstampExchange(ExchangePyBase):
                     )
                     self._order_tracker.process_trade_update(buy_trade_update)
 
-                sell_order: InFlightOrder = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(sell_order_id)
+                sell_order: InFlightOrder = self._order_tracker.fetch_fillable_order_by_exchange_order_id(sell_order_id)
                 if sell_order:
                     sell_trade_update = TradeUpdate(
                         trade_id=f"{buy_order_id}-{sell_order_id}",
@@ -404,7 +404,7 @@ class BitstampExchange(ExchangePyBase):
         try:
             event_data = event_message.get("data", {})
             client_order_id = str(event_data.get("client_order_id"))
-            order: InFlightOrder = self._order_tracker.all_fillable_orders.get(client_order_id)
+            order: InFlightOrder = self._order_tracker.fetch_fillable_order(client_order_id)
             if order is None:
                 self.logger().debug(f"Received event for unknown order ID: {event_message}")
                 return
@@ -870,8 +870,8 @@ class CoinbaseAdvancedTradeExchange(ExchangePyBase):
 
             self.logger().debug(f"_user_stream_event_listener: {event_message.client_order_id} {event_message.status}")
 
-            fillable_order: InFlightOrder = self._order_tracker.all_fillable_orders.get(event_message.client_order_id)
-            updatable_order: InFlightOrder = self._order_tracker.all_updatable_orders.get(
+            fillable_order: InFlightOrder = self._order_tracker.fetch_fillable_order(event_message.client_order_id)
+            updatable_order: InFlightOrder = self._order_tracker.fetch_updatable_order(
                 event_message.client_order_id)
             state = event_message.status
             if state not in ["QUEUED", "CANCEL_QUEUED"]:
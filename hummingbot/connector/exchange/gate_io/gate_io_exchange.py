@@ -434,7 +434,7 @@ class GateIoExchange(ExchangePyBase):
         https://www.gate.io/docs/apiv4/en/#list-orders
         """
         client_order_id = str(order_msg.get("text", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -477,7 +477,7 @@ class GateIoExchange(ExchangePyBase):
         https://www.gate.io/docs/apiv4/en/#retrieve-market-trades
         """
         client_order_id = client_order_id or str(trade["text"])
-        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.fetch_fillable_order(client_order_id)
         if tracked_order is None:
             self.logger().debug(f"Ignoring trade message with id {client_order_id}: not in in_flight_orders.")
         else:
@@ -345,7 +345,7 @@ class HtxExchange(ExchangePyBase):
     async def _process_order_update(self, msg: Dict[str, Any]):
         client_order_id = msg["clientOrderId"]
         order_status = msg["orderStatus"]
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.fetch_updatable_order(client_order_id)
         if tracked_order is not None:
             order_update = OrderUpdate(
                 trading_pair=tracked_order.trading_pair,
@@ -357,7 +357,7 @@ class HtxExchange(ExchangePyBase):
 
     async def _process_trade_event(self, trade_event: Dict[str, Any]):
         client_order_id = trade_event["clientOrderId"]
-        tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
+        tracked_order = self._order_tracker.fetch_fillable_order(client_order_id)
 
         if tracked_order:
             fee = TradeFeeBase.new_spot_fee(
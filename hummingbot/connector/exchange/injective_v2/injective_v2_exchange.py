@@ -522,7 +522,7 @@ class InjectiveV2Exchange(ExchangePyBase):
         tracked_orders_to_cancel = []
 
         for order in orders_to_cancel:
-            tracked_order = self._order_tracker.all_updatable_orders.get(order.client_order_id)
+            tracked_order = self._order_tracker.fetch_updatable_order(order.client_order_id)
             if tracked_order is not None:
                 tracked_orders_to_cancel.append(tracked_order)
             else:
@@ -638,7 +638,7 @@ class InjectiveV2Exchange(ExchangePyBase):
                     self._order_tracker.process_trade_update(trade_update)
                 elif channel == "order":
                     order_update = event_data
-                    tracked_order = self._order_tracker.all_updatable_orders.get(order_update.client_order_id)
+                    tracked_order = self._order_tracker.fetch_updatable_order(order_update.client_order_id)
                     if tracked_order is not None:
                         is_partial_fill = order_update.new_state == OrderState.FILLED and not tracked_order.is_filled
                         if not is_partial_fill:
@@ -254,8 +254,8 @@ class KucoinExchange(ExchangePyBase):
                     order_event_type = execution_data["type"]
                     client_order_id: Optional[str] = execution_data.get("clientOid")
 
-                    fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-                    updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                    fillable_order = self._order_tracker.fetch_fillable_order(client_order_id)
+                    updatable_order = self._order_tracker.fetch_updatable_order(client_order_id)
 
                     event_timestamp = execution_data["ts"] * 1e-9
 
@@ -7,6 +7,7 @@ from hummingbot.core.data_type.in_flight_order import OrderState
 CLIENT_ID_PREFIX = "93027a12dac34fBC"
 MAX_ID_LEN = 32
 SECONDS_TO_WAIT_TO_RECEIVE_MESSAGE = 30 * 0.8
+MAX_ORDERS_PER_BATCH_REQUEST = 20
 
 DEFAULT_DOMAIN = ""
 
@@ -24,6 +25,7 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_ORDERS_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
@@ -75,6 +77,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_TICKERS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=20, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_ORDERS_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
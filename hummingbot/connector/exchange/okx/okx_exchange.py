@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -96,6 +96,14 @@ class OkxExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -185,6 +193,67 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        exchange_order_id = await self._api_request(
+            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+        )
+        data = exchange_order_id["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
+
+    async def _place_batch_order_create(
+            self, orders_to_create: List[InFlightOrder]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders_to_create
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+        )
+        orders_results = {order_result["clOrdId"]: order_result for order_result in response.get("data", [])}
+
+        results = []
+        for order in orders_to_create:
+            order_result = orders_results.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {response}"))
+            elif order_result["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {order_result['sMsg']}"))
+            else:
+                results.append((str(order_result["ordId"]), self.current_timestamp))
+        return results
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         data = {
             "clOrdId": order_id,
             "tdMode": "cash",
@@ -198,18 +267,7 @@ class OkxExchange(ExchangePyBase):
         else:
             # Specify that the the order quantity for market orders is denominated in base currency
             data["tgtCcy"] = "base_ccy"
-
-        exchange_order_id = await self._api_request(
-            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
-            method=RESTMethod.POST,
-            data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
-        )
-        data = exchange_order_id["data"][0]
-        if data["sCode"] != "0":
-            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
-        return str(data["ordId"]), self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -224,19 +282,45 @@ class OkxExchange(ExchangePyBase):
             data=params,
             is_auth_required=True,
         )
-        if cancel_result["data"][0]["sCode"] == "0":
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51400":
-            # Cancelation failed because the order does not exist
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51401":
-            # Cancelation failed because order has been cancelled
+        if self._is_order_cancelation_successful(cancelation_result=cancel_result["data"][0]):
             final_result = True
         else:
             raise IOError(f"Error cancelling order {order_id}: {cancel_result}")
 
         return final_result
 
+    async def _place_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "instId": order.trading_pair,
+            }
+            for order in orders_to_cancel
+        ]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        cancelation_results = {
+            cancelation_result["clOrdId"]: cancelation_result for cancelation_result in response.get("data", [])
+        }
+
+        results = []
+        for order in orders_to_cancel:
+            cancelation_result = cancelation_results.get(order.client_order_id)
+            if cancelation_result is not None and self._is_order_cancelation_successful(cancelation_result):
+                results.append(True)
+            else:
+                results.append(IOError(f"Error cancelling order {order.client_order_id}: {cancelation_result or response}"))
+        return results
+
+    @staticmethod
+    def _is_order_cancelation_successful(cancelation_result: Dict[str, Any]) -> bool:
+        # 51400: cancelation failed because the order does not exist
+        # 51401: cancelation failed because the order has been cancelled
+        return cancelation_result["sCode"] in ["0", "51400", "51401"]
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
@@ -399,8 +483,8 @@ class OkxExchange(ExchangePyBase):
                         order_status = CONSTANTS.ORDER_STATE[data["state"]]
                         client_order_id = data["clOrdId"]
                         trade_id = data["tradeId"]
-                        fillable_order = self._order_tracker.all_fillable_orders.get(client_order_id)
-                        updatable_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+                        fillable_order = self._order_tracker.fetch_fillable_order(client_order_id)
+                        updatable_order = self._order_tracker.fetch_updatable_order(client_order_id)
 
                         if (fillable_order is not None
                                 and order_status in [OrderState.PARTIALLY_FILLED, OrderState.FILLED]
@@ -457,7 +457,7 @@ class TegroExchange(ExchangePyBase):
 
     async def _process_order_message(self, raw_msg: Dict[str, Any], fetch_trades = False):
         client_order_id = f"{raw_msg['order_id']}"
-        tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(client_order_id)
+        tracked_order = self._order_tracker.fetch_fillable_order_by_exchange_order_id(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
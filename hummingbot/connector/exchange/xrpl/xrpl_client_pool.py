@@ -0,0 +1,276 @@
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import websockets
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.clients.utils import request_to_websocket, websocket_to_response
+from xrpl.models import Request
+from xrpl.models.response import Response
+
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.logger import HummingbotLogger
+
+# Errors returned by a node that is unable to serve the requests at the moment. The request is retried on another node.
+NODE_UNAVAILABLE_ERRORS = {"tooBusy", "noNetwork", "noCurrent", "noClosed", "slowDown", "amendmentBlocked"}
+
+
+class XRPLNodeConnection:
+    """
+    Persistent websocket connection to an XRPL node, shared by concurrent requests.
+
+    Each request is sent with an id unique to the connection, and a reader task resolves the pending request with the
+    matching response. The messages that are not responses to a pending request (e.g. stream updates) are dropped, so
+    the connection never accumulates messages nobody reads.
+
+    The connection also keeps the health statistics of the node: the moving average of the response latency, and the
+    consecutive failures. The pool uses them to rank the connections.
+    """
+    LATENCY_SMOOTHING = 0.2
+    DEFAULT_LATENCY = 1.0
+    FAILURE_COOLDOWN = 5.0
+    MAX_FAILURE_COOLDOWN = 300.0
+    MAX_MESSAGE_SIZE = 2**23
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, url: str, open_timeout: float = 10.0):
+        self.url = url
+        self._open_timeout = open_timeout
+        self._websocket = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._in_flight_requests = 0
+        self._request_ids = itertools.count(1)
+        self._open_lock = asyncio.Lock()
+        self.latency: Optional[float] = None
+        self.request_count = 0
+        self.failure_count = 0
+        self.consecutive_failures = 0
+        self.last_failure_time = 0.0
+
+    @property
+    def in_flight_requests(self) -> int:
+        return self._in_flight_requests
+
+    def is_open(self) -> bool:
+        return self._websocket is not None and self._reader_task is not None and not self._reader_task.done()
+
+    def is_cooling_down(self, now: Optional[float] = None) -> bool:
+        """
+        A node is left aside for a cooldown period after a failure. The period doubles with each consecutive failure.
+        """
+        if self.consecutive_failures == 0:
+            return False
+        now = time.time() if now is None else now
+        cooldown = min(self.FAILURE_COOLDOWN * 2 ** (self.consecutive_failures - 1), self.MAX_FAILURE_COOLDOWN)
+        return now - self.last_failure_time < cooldown
+
+    def score(self, now: Optional[float] = None) -> float:
+        """
+        The expected response time of a new request on the connection, lower is better. The nodes in cooldown rank
+        after all the healthy ones, but remain usable when no healthy node is left.
+        """
+        latency = self.latency if self.latency is not None else self.DEFAULT_LATENCY
+        score = latency * (1 + self.in_flight_requests)
+        if self.is_cooling_down(now):
+            score += self.MAX_FAILURE_COOLDOWN * self.consecutive_failures
+        return score
+
+    def record_success(self, latency: float):
+        self.request_count += 1
+        self.consecutive_failures = 0
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.LATENCY_SMOOTHING * (latency - self.latency)
+
+    def record_failure(self):
+        self.request_count += 1
+        self.failure_count += 1
+        self.consecutive_failures += 1
+        self.last_failure_time = time.time()
+
+    async def open(self):
+        if self.is_open():
+            return
+        async with self._open_lock:
+            if self.is_open():
+                return
+            self._websocket = await websockets.connect(
+                self.url, max_size=self.MAX_MESSAGE_SIZE, open_timeout=self._open_timeout)
+            self._reader_task = safe_ensure_future(self._read_messages(self._websocket))
+
+    async def close(self):
+        websocket, reader_task = self._websocket, self._reader_task
+        self._websocket = None
+        self._reader_task = None
+        if reader_task is not None:
+            reader_task.cancel()
+        if websocket is not None:
+            await websocket.close()
+        self._fail_pending_requests(ConnectionError(f"Connection to {self.url} closed."))
+
+    async def request(self, request: Request, timeout: float) -> Response:
+        # Counted before connecting, so that the requests started meanwhile see the load of the connection
+        self._in_flight_requests += 1
+        request_id = f"hb_{next(self._request_ids)}"
+        try:
+            await self.open()
+            request_dict = request_to_websocket(request)
+            request_dict["id"] = request_id
+            response_future = asyncio.get_event_loop().create_future()
+            self._pending_requests[request_id] = response_future
+            await self._websocket.send(json.dumps(request_dict))
+            response_dict = await asyncio.wait_for(response_future, timeout)
+        finally:
+            self._in_flight_requests -= 1
+            self._pending_requests.pop(request_id, None)
+        response_dict["id"] = request.id
+        return websocket_to_response(response_dict)
+
+    async def _read_messages(self, websocket):
+        try:
+            async for message in websocket:
+                response = json.loads(message)
+                response_future = self._pending_requests.get(response.get("id"))
+                if response_future is not None and not response_future.done():
+                    response_future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().debug(f"Connection to {self.url} lost: {e}")
+        finally:
+            if self._websocket is websocket:
+                self._websocket = None
+            self._fail_pending_requests(ConnectionError(f"Connection to {self.url} lost."))
+
+    def _fail_pending_requests(self, error: Exception):
+        for response_future in self._pending_requests.values():
+            if not response_future.done():
+                response_future.set_exception(error)
+
+
+class XRPLClientPool(AsyncClient):
+    """
+    XRPL client sending the requests over a pool of persistent websocket connections to one or more nodes.
+
+    Concurrent requests are multiplexed on the connections by request id instead of being serialized, and each request
+    goes to the connection with the best health score. A request failing because of a connection error, a timeout or
+    an unavailable node is retried on the next best connection, so the failover doesn't need any locking or client
+    refresh from the callers.
+
+    The pool implements the xrpl-py client interface, and can be used by the xrpl-py helpers expecting a client.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(
+        self,
+        node_urls: List[str],
+        connections_per_node: int = 1,
+        request_timeout: float = 30.0,
+        max_attempts: Optional[int] = None,
+    ):
+        """
+        :param node_urls: the websocket urls of the nodes, by order of preference when their health is the same
+        :param connections_per_node: the number of persistent connections opened to each node
+        :param request_timeout: the default time to wait for a response before trying another connection
+        :param max_attempts: the number of connections a request is tried on, by default one attempt per connection
+        """
+        urls = list(dict.fromkeys(url for url in node_urls if url))
+        # a pool without node is allowed, for the connectors created without configuration (e.g. for backtesting),
+        # its requests fail
+        super().__init__(urls[0] if urls else "")
+        self._connections = [XRPLNodeConnection(url) for url in urls for _ in range(connections_per_node)]
+        self._request_timeout = request_timeout
+        self._max_attempts = max_attempts or len(self._connections)
+
+    @property
+    def connections(self) -> List[XRPLNodeConnection]:
+        return self._connections
+
+    def is_open(self) -> bool:
+        return any(connection.is_open() for connection in self._connections)
+
+    async def open(self):
+        """
+        Opens the connections that are not open yet. Fails only if no node can be reached.
+        """
+        connections = [connection for connection in self._connections if not connection.is_open()]
+        results = await safe_gather(*[connection.open() for connection in connections], return_exceptions=True)
+        errors = []
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                connection.record_failure()
+                errors.append(result)
+                self.logger().debug(f"Unable to connect to XRPL node {connection.url}: {result}")
+        if not self.is_open():
+            raise ConnectionError(f"Unable to connect to any XRPL node: {errors[0] if errors else ''}")
+
+    async def close(self):
+        await safe_gather(*[connection.close() for connection in self._connections], return_exceptions=True)
+
+    def health_status(self) -> List[Dict[str, Any]]:
+        now = time.time()
+        return [
+            {
+                "url": connection.url,
+                "open": connection.is_open(),
+                "latency": connection.latency,
+                "in_flight_requests": connection.in_flight_requests,
+                "requests": connection.request_count,
+                "failures": connection.failure_count,
+                "cooling_down": connection.is_cooling_down(now),
+            }
+            for connection in self._connections
+        ]
+
+    async def _request_impl(self, request: Request, *, timeout: Optional[float] = None) -> Response:
+        if len(self._connections) == 0:
+            raise ConnectionError("No XRPL node url is configured.")
+        timeout = timeout or self._request_timeout
+        tried_connections: Set[XRPLNodeConnection] = set()
+        last_error: Optional[Exception] = None
+        for _ in range(self._max_attempts):
+            connection = self._best_connection(tried_connections)
+            tried_connections.add(connection)
+            start = time.perf_counter()
+            try:
+                response = await connection.request(request, timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                connection.record_failure()
+                last_error = e
+                self.logger().debug(f"Request {request.method} failed on XRPL node {connection.url}: {e!r}")
+                continue
+            if not response.is_successful() and response.result.get("error") in NODE_UNAVAILABLE_ERRORS:
+                connection.record_failure()
+                last_error = ConnectionError(f"XRPL node {connection.url} unavailable: {response.result['error']}")
+                continue
+            connection.record_success(time.perf_counter() - start)
+            return response
+        raise last_error
+
+    def _best_connection(self, excluded: Set[XRPLNodeConnection]) -> XRPLNodeConnection:
+        candidates = [connection for connection in self._connections if connection not in excluded]
+        if len(candidates) == 0:
+            candidates = self._connections
+        now = time.time()
+        return min(candidates, key=lambda connection: connection.score(now))
@@ -99,9 +99,6 @@ REQUEST_RETRY_INTERVAL = 2
 # Request Orderbook Interval
 REQUEST_ORDERBOOK_INTERVAL = 3
 
-# Client refresh interval
-CLIENT_REFRESH_INTERVAL = 60
-
 # Markets list
 MARKETS = {
     "XRP-USD": {
@@ -42,6 +42,8 @@ from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS, xrpl
 from hummingbot.connector.exchange.xrpl.xrpl_api_order_book_data_source import XRPLAPIOrderBookDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_api_user_stream_data_source import XRPLAPIUserStreamDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_auth import XRPLAuth
+from hummingbot.connector.exchange.xrpl.xrpl_client_pool import XRPLClientPool
+from hummingbot.connector.exchange.xrpl.xrpl_transaction_index import XRPLAccountTransactionIndex
 from hummingbot.connector.exchange.xrpl.xrpl_utils import (
     XRPLMarket,
     _wait_for_final_transaction_outcome,
@@ -87,7 +89,11 @@ class XrplExchange(ExchangePyBase):
         self._wss_second_node_url = wss_second_node_url
         self._wss_third_node_url = wss_third_node_url
         # self._xrpl_place_order_client = AsyncWebsocketClient(self._wss_node_url)
-        self._xrpl_query_client = AsyncWebsocketClient(self._wss_second_node_url)
+        # Queries are multiplexed over persistent connections to all the nodes, the second node being preferred
+        self._xrpl_query_client = XRPLClientPool(
+            [self._wss_second_node_url, self._wss_node_url, self._wss_third_node_url],
+            request_timeout=CONSTANTS.REQUEST_TIMEOUT,
+        )
         self._xrpl_order_book_data_client = AsyncWebsocketClient(self._wss_second_node_url)
         self._xrpl_user_stream_client = AsyncWebsocketClient(self._wss_third_node_url)
         self._trading_required = trading_required
@@ -95,12 +101,15 @@ class XrplExchange(ExchangePyBase):
         self._auth: XRPLAuth = self.authenticator
         self._trading_pair_symbol_map: Optional[Mapping[str, str]] = None
         self._trading_pair_fee_rules: Dict[str, Dict[str, Any]] = {}
-        self._xrpl_query_client_lock = asyncio.Lock()
         self._xrpl_place_order_client_lock = asyncio.Lock()
         self._xrpl_fetch_trades_client_lock = asyncio.Lock()
+        self._account_transaction_index = XRPLAccountTransactionIndex(
+            fetch_transactions=self._fetch_account_transactions_from_ledger,
+            get_account=lambda: self._auth.get_account(),
+        )
+        self._account_transaction_index_refreshed = False
         self._nonce_creator = NonceCreator.for_microseconds()
         self._custom_markets = custom_markets or {}
-        self._last_clients_refresh_time = 0
 
         super().__init__(client_config_map)
 
@@ -812,13 +821,36 @@ class XrplExchange(ExchangePyBase):
                 self.logger().error("Unexpected error in user stream listener loop.", exc_info=True)
                 await self._sleep(5.0)
 
+    async def _update_orders_fills(self, orders: List[InFlightOrder]):
+        # Refresh the account transactions index once for all the orders, each order then only reads its transactions
+        ledger_indexes = self._orders_ledger_indexes(orders)
+        if len(ledger_indexes) > 0:
+            await self._account_transaction_index.refresh(min(ledger_indexes) - CONSTANTS.LEDGER_OFFSET)
+            tracked_orders = (list(self._order_tracker.all_fillable_orders.values())
+                              + list(self._order_tracker.lost_orders.values()))
+            tracked_ledger_indexes = self._orders_ledger_indexes(tracked_orders)
+            if len(tracked_ledger_indexes) > 0:
+                # The transactions older than the oldest tracked order are not needed anymore
+                self._account_transaction_index.prune(min(tracked_ledger_indexes) - CONSTANTS.LEDGER_OFFSET)
+        self._account_transaction_index_refreshed = True
+        try:
+            await super()._update_orders_fills(orders)
+        finally:
+            self._account_transaction_index_refreshed = False
+
+    @staticmethod
+    def _orders_ledger_indexes(orders: List[InFlightOrder]) -> List[int]:
+        return [int(order.exchange_order_id.split("-")[1]) for order in orders if order.exchange_order_id is not None]
+
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         if order.exchange_order_id is None:
             return []
 
-        _, ledger_index = order.exchange_order_id.split("-")
+        sequence, ledger_index = order.exchange_order_id.split("-")
 
-        transactions = await self._fetch_account_transactions(ledger_index, is_forward=True)
+        if not self._account_transaction_index_refreshed:
+            await self._account_transaction_index.refresh(int(ledger_index) - CONSTANTS.LEDGER_OFFSET)
+        transactions = self._account_transaction_index.transactions_for_sequence(int(sequence))
 
         trade_fills = []
 
@@ -1213,19 +1245,25 @@ class XrplExchange(ExchangePyBase):
 
             return order_update
 
-    async def _fetch_account_transactions(self, ledger_index: int, is_forward: bool = False) -> list:
+    async def _fetch_account_transactions_from_ledger(self, ledger_index_min: int) -> list:
+        return await self._fetch_account_transactions(ledger_index_min, is_forward=True, ledger_offset=0)
+
+    async def _fetch_account_transactions(
+        self, ledger_index: int, is_forward: bool = False, ledger_offset: int = CONSTANTS.LEDGER_OFFSET
+    ) -> list:
         """
         Fetches account transactions from the XRPL ledger.
 
         :param ledger_index: The ledger index to start fetching transactions from.
         :param is_forward: If True, fetches transactions in forward order, otherwise in reverse order.
+        :param ledger_offset: The number of ledgers before `ledger_index` to include.
         :return: A list of transactions.
         """
         try:
             async with self._xrpl_fetch_trades_client_lock:
                 request = AccountTx(
                     account=self._auth.get_account(),
-                    ledger_index_min=int(ledger_index) - CONSTANTS.LEDGER_OFFSET,
+                    ledger_index_min=int(ledger_index) - ledger_offset,
                     forward=is_forward,
                 )
 
@@ -1259,36 +1297,14 @@ class XrplExchange(ExchangePyBase):
         await self._client_health_check()
         account_address = self._auth.get_account()
 
-        account_info = await self.request_with_retry(
-            self._xrpl_query_client,
-            AccountInfo(account=account_address, ledger_index="validated"),
-            5,
-            self._xrpl_query_client_lock,
-            0.3,
-        )
-
-        objects = await self.request_with_retry(
-            self._xrpl_query_client,
-            AccountObjects(
-                account=account_address,
-            ),
-            5,
-            self._xrpl_query_client_lock,
-            0.3,
+        account_info, objects, account_lines = await safe_gather(
+            self._xrpl_query_client.request(AccountInfo(account=account_address, ledger_index="validated")),
+            self._xrpl_query_client.request(AccountObjects(account=account_address)),
+            self._xrpl_query_client.request(AccountLines(account=account_address)),
         )
 
         open_offers = [x for x in objects.result.get("account_objects", []) if x.get("LedgerEntryType") == "Offer"]
 
-        account_lines = await self.request_with_retry(
-            self._xrpl_query_client,
-            AccountLines(
-                account=account_address,
-            ),
-            5,
-            self._xrpl_query_client_lock,
-            0.3,
-        )
-
         if account_lines is not None:
             balances = account_lines.result.get("lines", [])
         else:
@@ -1476,14 +1492,12 @@ class XrplExchange(ExchangePyBase):
     async def _make_network_check_request(self):
         await self._xrpl_query_client.open()
 
-    async def _client_health_check(self):
-        # Clear client memory to prevent memory leak
-        if time.time() - self._last_clients_refresh_time > CONSTANTS.CLIENT_REFRESH_INTERVAL:
-            async with self._xrpl_query_client_lock:
-                await self._xrpl_query_client.close()
-
-            self._last_clients_refresh_time = time.time()
+    async def stop_network(self):
+        await super().stop_network()
+        await self._xrpl_query_client.close()
 
+    async def _client_health_check(self):
+        # Reconnects the pool connections that were closed, the pool fails over to the other nodes in the meantime
         await self._xrpl_query_client.open()
 
     async def _make_trading_rules_request(self) -> Dict[str, Any]:
@@ -1491,20 +1505,30 @@ class XrplExchange(ExchangePyBase):
         zeroTransferRate = 1000000000
         trading_rules_info = {}
 
+        # The issuers of all the trading pairs are queried concurrently, once each
+        currencies = {
+            trading_pair: self.get_currencies_from_trading_pair(trading_pair) for trading_pair in self._trading_pairs
+        }
+        issuers = list(dict.fromkeys(
+            currency.issuer
+            for pair_currencies in currencies.values()
+            for currency in pair_currencies
+            if currency.currency != XRP().currency
+        ))
+        issuer_infos = await safe_gather(*[
+            self._xrpl_query_client.request(AccountInfo(account=issuer, ledger_index="validated"))
+            for issuer in issuers
+        ])
+        issuer_info_by_account = dict(zip(issuers, issuer_infos))
+
         for trading_pair in self._trading_pairs:
-            base_currency, quote_currency = self.get_currencies_from_trading_pair(trading_pair)
+            base_currency, quote_currency = currencies[trading_pair]
 
             if base_currency.currency == XRP().currency:
                 baseTickSize = 6
                 baseTransferRate = 0
             else:
-                base_info = await self.request_with_retry(
-                    self._xrpl_query_client,
-                    AccountInfo(account=base_currency.issuer, ledger_index="validated"),
-                    3,
-                    self._xrpl_query_client_lock,
-                    1,
-                )
+                base_info = issuer_info_by_account[base_currency.issuer]
 
                 if base_info.status == ResponseStatus.ERROR:
                     error_message = base_info.result.get("error_message")
@@ -1518,13 +1542,7 @@ class XrplExchange(ExchangePyBase):
                 quoteTickSize = 6
                 quoteTransferRate = 0
             else:
-                quote_info = await self.request_with_retry(
-                    self._xrpl_query_client,
-                    AccountInfo(account=quote_currency.issuer, ledger_index="validated"),
-                    3,
-                    self._xrpl_query_client_lock,
-                    1,
-                )
+                quote_info = issuer_info_by_account[quote_currency.issuer]
 
                 if quote_info.status == ResponseStatus.ERROR:
                     error_message = quote_info.result.get("error_message")
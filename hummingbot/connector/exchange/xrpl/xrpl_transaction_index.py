@@ -0,0 +1,160 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from xrpl.utils import get_order_book_changes
+
+
+class XRPLAccountTransactionIndex:
+    """
+    Index of the transactions of the account, shared by the fill and status reconciliation of all the orders.
+
+    The index fetches the account transactions from the first ledger an order needs, and then only the transactions
+    of the ledgers validated since the previous refresh. The transactions are indexed by hash and by the sequences of
+    the account orders they affect: the order created by the transaction itself, and the account offers it crossed.
+    Looking up the transactions of an order is then a dictionary read.
+    """
+
+    def __init__(
+        self,
+        fetch_transactions: Callable[[int], Awaitable[List[Dict[str, Any]]]],
+        get_account: Callable[[], str],
+    ):
+        """
+        :param fetch_transactions: coroutine function returning the account transactions, oldest first, from the
+            ledger index it is called with (inclusive)
+        :param get_account: function returning the address of the account
+        """
+        self._fetch_transactions = fetch_transactions
+        self._get_account = get_account
+        self._transactions: Dict[str, Dict[str, Any]] = {}
+        self._transaction_ledgers: Dict[str, int] = {}
+        self._transaction_sequences: Dict[str, Set[int]] = {}
+        self._hashes_by_sequence: Dict[int, Dict[str, None]] = {}
+        self._first_ledger_index: Optional[int] = None
+        self._last_ledger_index: Optional[int] = None
+        self._refresh_count = 0
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def first_ledger_index(self) -> Optional[int]:
+        return self._first_ledger_index
+
+    @property
+    def last_ledger_index(self) -> Optional[int]:
+        return self._last_ledger_index
+
+    @property
+    def refresh_count(self) -> int:
+        return self._refresh_count
+
+    def covers(self, ledger_index: int) -> bool:
+        return self._first_ledger_index is not None and self._first_ledger_index <= ledger_index
+
+    async def refresh(self, ledger_index_min: int):
+        """
+        Fetches the account transactions missing from the index.
+
+        If the index doesn't cover `ledger_index_min` yet, the transactions are fetched from that ledger. Otherwise,
+        only the transactions from the last ledger indexed are fetched. Concurrent refreshes are merged: a caller
+        waiting for another refresh to finish doesn't fetch again if that refresh covered its ledger.
+
+        :param ledger_index_min: the oldest ledger the caller needs the transactions of
+        """
+        refresh_count = self._refresh_count
+        async with self._refresh_lock:
+            if refresh_count != self._refresh_count and self.covers(ledger_index_min):
+                return
+            if self.covers(ledger_index_min) and self._last_ledger_index is not None:
+                # Start from the last ledger fetched again, in case the previous page ended in the middle of it
+                transactions = await self._fetch_transactions(max(self._last_ledger_index, ledger_index_min))
+            else:
+                transactions = await self._fetch_transactions(ledger_index_min)
+                if len(transactions) > 0:
+                    self._first_ledger_index = (
+                        ledger_index_min if self._first_ledger_index is None
+                        else min(self._first_ledger_index, ledger_index_min)
+                    )
+            self.add_transactions(transactions)
+            self._refresh_count += 1
+
+    def add_transactions(self, transactions: List[Dict[str, Any]]):
+        """
+        Adds the transactions to the index. A transaction already indexed is replaced by the new version.
+        """
+        account = self._get_account()
+        for transaction in transactions:
+            if not isinstance(transaction, dict):
+                continue
+            tx = self._get_tx(transaction)
+            if not isinstance(tx, dict):
+                continue
+            tx_hash = tx.get("hash") or transaction.get("hash")
+            if tx_hash is None:
+                continue
+            self._remove_transaction(tx_hash)
+
+            ledger_index = transaction.get("ledger_index", tx.get("ledger_index"))
+            sequences = set()
+            if tx.get("Sequence") is not None:
+                sequences.add(int(tx["Sequence"]))
+            meta = transaction.get("meta")
+            offer_changes = get_order_book_changes(meta) if isinstance(meta, dict) and "AffectedNodes" in meta else []
+            for offer_change in offer_changes:
+                if offer_change.get("maker_account") == account:
+                    for change in offer_change.get("offer_changes", []):
+                        sequences.add(int(change.get("sequence")))
+
+            self._transactions[tx_hash] = transaction
+            self._transaction_sequences[tx_hash] = sequences
+            for sequence in sequences:
+                self._hashes_by_sequence.setdefault(sequence, {})[tx_hash] = None
+            if ledger_index is not None:
+                ledger_index = int(ledger_index)
+                self._transaction_ledgers[tx_hash] = ledger_index
+                if self._last_ledger_index is None or ledger_index > self._last_ledger_index:
+                    self._last_ledger_index = ledger_index
+
+    def transactions_for_sequence(self, sequence: int) -> List[Dict[str, Any]]:
+        """
+        Returns the indexed transactions that created or crossed the account order with the given sequence.
+        """
+        return [self._transactions[tx_hash] for tx_hash in self._hashes_by_sequence.get(int(sequence), {})]
+
+    def transaction_by_hash(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        return self._transactions.get(tx_hash)
+
+    def prune(self, ledger_index_min: int):
+        """
+        Drops the transactions of the ledgers older than `ledger_index_min`.
+        """
+        old_hashes = [tx_hash for tx_hash, ledger_index in self._transaction_ledgers.items()
+                      if ledger_index < ledger_index_min]
+        for tx_hash in old_hashes:
+            self._remove_transaction(tx_hash)
+        if self._first_ledger_index is not None:
+            self._first_ledger_index = max(self._first_ledger_index, ledger_index_min)
+
+    def clear(self):
+        self._transactions.clear()
+        self._transaction_ledgers.clear()
+        self._transaction_sequences.clear()
+        self._hashes_by_sequence.clear()
+        self._first_ledger_index = None
+        self._last_ledger_index = None
+
+    def _remove_transaction(self, tx_hash: str):
+        self._transactions.pop(tx_hash, None)
+        self._transaction_ledgers.pop(tx_hash, None)
+        for sequence in self._transaction_sequences.pop(tx_hash, ()):
+            hashes = self._hashes_by_sequence.get(sequence)
+            if hashes is not None:
+                hashes.pop(tx_hash, None)
+                if len(hashes) == 0:
+                    del self._hashes_by_sequence[sequence]
+
+    @staticmethod
+    def _get_tx(transaction: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        for key in ("tx", "transaction", "tx_json"):
+            if key in transaction:
+                return transaction[key]
+        return None
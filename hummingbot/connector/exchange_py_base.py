@@ -4,7 +4,7 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -20,6 +20,7 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -28,6 +29,7 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.order_latency_tracker import CANCEL_REQUEST, CREATE_REQUEST, OrderLatencyTracker
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -45,6 +47,7 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    LOST_ORDERS_RECOVERY_CONCURRENCY = 5
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,6 +63,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._lost_orders_recovery_start_time: Optional[float] = None
+        self._lost_orders_recovery_orders_count = 0
+        self._lost_orders_recovery_metrics: Dict[str, float] = {
+            "recoveries": 0,
+            "recovered_orders": 0,
+            "last_recovery_duration": 0.0,
+            "last_recovery_orders": 0,
+            "max_recovery_duration": 0.0,
+        }
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -149,6 +161,22 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        Returns the maximum number of orders the exchange accepts in a single batch creation request, or 0 if the
+        connector does not implement `_place_batch_order_create`
+        """
+        return 0
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        Returns the maximum number of orders the exchange accepts in a single batch cancelation request, or 0 if the
+        connector does not implement `_place_batch_order_cancel`
+        """
+        return 0
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -187,6 +215,16 @@ class ExchangePyBase(ExchangeBase, ABC):
     def name_cap(self) -> str:
         return self.name.capitalize()
 
+    @property
+    def lost_orders_recovery_metrics(self) -> Dict[str, float]:
+        """
+        Returns the statistics of the lost orders recoveries (the time elapsed since lost orders are detected until all
+        of them are no longer alive in the exchange)
+        """
+        metrics = self._lost_orders_recovery_metrics.copy()
+        metrics["orders_in_recovery"] = len(self._order_tracker.lost_orders)
+        return metrics
+
     @property
     def tracking_states(self) -> Dict[str, any]:
         """
@@ -280,6 +318,9 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        latency_tracker = OrderLatencyTracker.get_instance()
+        if latency_tracker.enabled:
+            latency_tracker.start_trace(self.name, CREATE_REQUEST, order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
             order_id=order_id,
@@ -310,6 +351,9 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        latency_tracker = OrderLatencyTracker.get_instance()
+        if latency_tracker.enabled:
+            latency_tracker.start_trace(self.name, CREATE_REQUEST, order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
             order_id=order_id,
@@ -357,6 +401,48 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_create(
+            self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Issues a batch order creation. If the exchange has a batch creation endpoint the orders are grouped by trading
+        pair and sent in batches of at most `batch_order_create_max_size` orders. Otherwise the orders are created
+        one by one.
+
+        :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
+            order IDs can be blanc.
+
+        :return: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
+            generated order IDs.
+        """
+        if self.batch_order_create_max_size <= 0:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
+            )
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues a batch order cancelation. If the exchange has a batch cancelation endpoint the orders are grouped by
+        trading pair and sent in batches of at most `batch_order_cancel_max_size` orders. Otherwise the orders are
+        canceled one by one.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        if self.batch_order_cancel_max_size <= 0:
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        else:
+            safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -366,20 +452,24 @@ class ExchangePyBase(ExchangeBase, ABC):
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
-                for cr in cancellation_results:
-                    if isinstance(cr, Exception):
-                        continue
-                    client_order_id = cr
-                    if client_order_id is not None:
-                        order_id_set.remove(client_order_id)
-                        successful_cancellations.append(CancellationResult(client_order_id, True))
+                if self.batch_order_cancel_max_size > 0:
+                    cancellation_results = await self._execute_batch_cancel(
+                        orders_to_cancel=[o.to_limit_order() for o in incomplete_orders])
+                    cancelled_order_ids = [cr.order_id for cr in cancellation_results if cr.success]
+                else:
+                    tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
+                    cancellation_results = await safe_gather(*tasks, return_exceptions=True)
+                    cancelled_order_ids = [
+                        cr for cr in cancellation_results if not isinstance(cr, Exception) and cr is not None
+                    ]
+                for client_order_id in cancelled_order_ids:
+                    order_id_set.remove(client_order_id)
+                    successful_cancellations.append(CancellationResult(client_order_id, True))
         except Exception:
             self.logger().network(
                 "Unexpected error cancelling orders.",
@@ -407,6 +497,53 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        latency_tracker = OrderLatencyTracker.get_instance()
+        # The rate limiter and REST stages of the request are attributed to the order through the task context
+        trace_token = latency_tracker.activate_trace(CREATE_REQUEST, order_id) if latency_tracker.enabled else None
+        order = self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            latency_tracker.deactivate_trace(trace_token)
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+        finally:
+            latency_tracker.deactivate_trace(trace_token)
+
+    def _start_tracking_and_validate_order(self,
+                                           trade_type: TradeType,
+                                           order_id: str,
+                                           trading_pair: str,
+                                           amount: Decimal,
+                                           order_type: OrderType,
+                                           price: Optional[Decimal] = None,
+                                           **kwargs) -> Optional[InFlightOrder]:
+        """
+        Quantizes the order price and amount, starts tracking the order and checks it against the trading rules
+
+        :return: the tracked order, or None if the order is not valid (the order is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,37 +570,23 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            return None
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -487,6 +610,72 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return exchange_order_id
 
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        inflight_orders_to_create = []
+        for order in orders_to_create:
+            is_limit_order = isinstance(order, LimitOrder)
+            inflight_order = self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity if is_limit_order else order.amount,
+                order_type=OrderType.LIMIT if is_limit_order else OrderType.MARKET,
+                price=order.price if is_limit_order else s_decimal_NaN,
+                position_action=order.position,
+            )
+            if inflight_order is not None:
+                inflight_orders_to_create.append(inflight_order)
+
+        batches = self._split_orders_in_batches(
+            orders=inflight_orders_to_create, max_batch_size=self.batch_order_create_max_size)
+        await safe_gather(
+            *[self._execute_batch_inflight_order_create(inflight_orders_to_create=batch) for batch in batches]
+        )
+
+    async def _execute_batch_inflight_order_create(self, inflight_orders_to_create: List[InFlightOrder]):
+        try:
+            place_order_results = await self._place_batch_order_create(orders_to_create=inflight_orders_to_create)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            place_order_results = [ex] * len(inflight_orders_to_create)
+
+        for order, place_order_result in zip(inflight_orders_to_create, place_order_results):
+            if isinstance(place_order_result, Exception):
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=place_order_result,
+                )
+            else:
+                exchange_order_id, update_timestamp = place_order_result
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    @staticmethod
+    def _split_orders_in_batches(orders: List[InFlightOrder], max_batch_size: int) -> List[List[InFlightOrder]]:
+        """
+        Groups the orders by trading pair, and splits each group in batches of at most `max_batch_size` orders
+        """
+        orders_by_trading_pair: Dict[str, List[InFlightOrder]] = {}
+        for order in orders:
+            orders_by_trading_pair.setdefault(order.trading_pair, []).append(order)
+        return [
+            trading_pair_orders[index:index + max_batch_size]
+            for trading_pair_orders in orders_by_trading_pair.values()
+            for index in range(0, len(trading_pair_orders), max_batch_size)
+        ]
+
     def _on_order_failure(
         self,
         order_id: str,
@@ -539,20 +728,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._update_order_after_cancelation(order=order)
         return cancelled
 
+    def _update_order_after_cancelation(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -563,7 +755,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         result = None
         tracked_order = self._order_tracker.fetch_tracked_order(order_id)
         if tracked_order is not None:
-            result = await self._execute_order_cancel(order=tracked_order)
+            latency_tracker = OrderLatencyTracker.get_instance()
+            trace_token = None
+            if latency_tracker.enabled:
+                latency_tracker.start_trace(self.name, CANCEL_REQUEST, order_id)
+                trace_token = latency_tracker.activate_trace(CANCEL_REQUEST, order_id, stage=None)
+            try:
+                result = await self._execute_order_cancel(order=tracked_order)
+            finally:
+                latency_tracker.deactivate_trace(trace_token)
 
         return result
 
@@ -640,6 +840,28 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_order_create(
+            self, orders_to_create: List[InFlightOrder]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Sends the orders (all for the same trading pair) in a single batch creation request. Only required if
+        `batch_order_create_max_size` is greater than 0.
+
+        :return: for each order, in the same order, the exchange order id and the update timestamp, or the exception
+            describing why the exchange rejected it
+        """
+        raise NotImplementedError
+
+    async def _place_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Sends the cancelation of the orders (all for the same trading pair) in a single batch request. Only required if
+        `batch_order_cancel_max_size` is greater than 0.
+
+        :return: for each order, in the same order, True if the order was canceled, or the exception describing why
+            the exchange rejected the cancelation
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -815,8 +1037,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
+                self._register_lost_orders_recovery_progress()
                 await self._cancel_lost_orders()
                 await self._update_lost_orders_status()
+                self._register_lost_orders_recovery_progress()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -934,12 +1158,26 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._update_order_status(),
         )
 
+    def _take_in_flight_orders_snapshot(self) -> Dict[str, InFlightOrder]:
+        """
+        Copy-on-write snapshot of the in-flight orders: the copy taken in the previous snapshot is reused for the
+        orders that have not been updated since then, so only the updated orders are copied.
+        """
+        previous_snapshot = self._in_flight_orders_snapshot or {}
+        snapshot = {}
+        for client_order_id, order in self.in_flight_orders.items():
+            order_copy = previous_snapshot.get(client_order_id)
+            if order_copy is None or order_copy.revision != order.revision:
+                order_copy = copy.copy(order)
+            snapshot[client_order_id] = order_copy
+        return snapshot
+
     async def _update_all_balances(self):
         try:
             await self._update_balances()
             if not self.real_time_balance_update:
                 # This is only required for exchanges that do not provide balance update notifications through websocket
-                self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
+                self._in_flight_orders_snapshot = self._take_in_flight_orders_snapshot()
                 self._in_flight_orders_snapshot_timestamp = self.current_timestamp
         except asyncio.CancelledError:
             raise
@@ -1006,9 +1244,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_lost_orders(self):
-        orders_to_update = self._order_tracker.lost_orders.copy()
-        await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_lost_order
+        await self._run_lost_orders_recovery_step(
+            orders=list(self._order_tracker.lost_orders.values()),
+            step=lambda orders: self._update_orders_with_error_handler(
+                orders=orders, error_handler=self._handle_update_error_for_lost_order
+            ),
         )
 
     async def _update_order_status(self):
@@ -1016,12 +1256,129 @@ class ExchangePyBase(ExchangeBase, ABC):
         await self._update_orders()
 
     async def _update_lost_orders_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
+        await self._run_lost_orders_recovery_step(
+            orders=list(self._order_tracker.lost_orders.values()),
+            step=lambda orders: self._update_orders_fills(orders=orders),
+        )
         await self._update_lost_orders()
 
     async def _cancel_lost_orders(self):
-        for _, lost_order in self._order_tracker.lost_orders.items():
-            await self._execute_order_cancel(order=lost_order)
+        lost_orders = list(self._order_tracker.lost_orders.values())
+        if len(lost_orders) == 0:
+            return
+        if self._is_batch_order_cancel_supported():
+            await self._execute_batch_cancel(orders_to_cancel=[order.to_limit_order() for order in lost_orders])
+        else:
+            await self._run_lost_orders_recovery_step(orders=lost_orders, step=self._execute_orders_cancel)
+
+    def _is_batch_order_cancel_supported(self) -> bool:
+        """
+        Returns True if the connector cancels orders through a batch cancelation endpoint
+        """
+        return (self.batch_order_cancel_max_size > 0
+                or type(self).batch_order_cancel is not ExchangePyBase.batch_order_cancel)
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        """
+        Cancels the orders and waits for the results. If the exchange has a batch cancelation endpoint the orders are
+        canceled in batches of at most `batch_order_cancel_max_size` orders per trading pair. Otherwise they are
+        canceled one by one with bounded concurrency.
+        """
+        results = []
+        tracked_orders_to_cancel = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_updatable_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        if self.batch_order_cancel_max_size > 0:
+            batches = self._split_orders_in_batches(
+                orders=tracked_orders_to_cancel, max_batch_size=self.batch_order_cancel_max_size)
+            batches_results = await safe_gather(
+                *[self._execute_batch_order_cancel(orders_to_cancel=batch) for batch in batches]
+            )
+            for batch_results in batches_results:
+                results.extend(batch_results)
+            return results
+
+        cancelled_order_ids = set()
+
+        async def _cancel_orders(orders: List[InFlightOrder]):
+            cancelled_order_ids.update(await self._execute_orders_cancel(orders=orders))
+
+        await self._run_lost_orders_recovery_step(orders=tracked_orders_to_cancel, step=_cancel_orders)
+        results.extend(
+            CancellationResult(order_id=order.client_order_id, success=order.client_order_id in cancelled_order_ids)
+            for order in tracked_orders_to_cancel
+        )
+        return results
+
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancellationResult]:
+        try:
+            cancel_results = await self._place_batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            cancel_results = [ex] * len(orders_to_cancel)
+
+        cancelation_results = []
+        for order, cancel_result in zip(orders_to_cancel, cancel_results):
+            success = False
+            if isinstance(cancel_result, Exception):
+                if self._is_order_not_found_during_cancelation_error(cancelation_exception=cancel_result):
+                    self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                    await self._order_tracker.process_order_not_found(order.client_order_id)
+                else:
+                    self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=cancel_result)
+            elif cancel_result:
+                success = True
+                self._update_order_after_cancelation(order=order)
+            cancelation_results.append(CancellationResult(order_id=order.client_order_id, success=success))
+        return cancelation_results
+
+    async def _execute_orders_cancel(self, orders: List[InFlightOrder]) -> List[str]:
+        cancelled_order_ids = []
+        for order in orders:
+            client_order_id = await self._execute_order_cancel(order=order)
+            if client_order_id is not None:
+                cancelled_order_ids.append(client_order_id)
+        return cancelled_order_ids
+
+    async def _run_lost_orders_recovery_step(
+            self,
+            orders: List[InFlightOrder],
+            step: Callable[[List[InFlightOrder]], Awaitable[Any]]):
+        """
+        Distributes the orders in up to `LOST_ORDERS_RECOVERY_CONCURRENCY` groups and runs the step for each group
+        concurrently. The requests performed by each step are still subject to the throttler rate limits.
+        """
+        concurrency = max(1, min(self.LOST_ORDERS_RECOVERY_CONCURRENCY, len(orders)))
+        order_groups = [orders[index::concurrency] for index in range(concurrency)]
+        await safe_gather(*[step(order_group) for order_group in order_groups if len(order_group) > 0])
+
+    def _register_lost_orders_recovery_progress(self):
+        lost_orders_count = len(self._order_tracker.lost_orders)
+        if self._lost_orders_recovery_start_time is None:
+            if lost_orders_count > 0:
+                self._lost_orders_recovery_start_time = self._time()
+                self._lost_orders_recovery_orders_count = lost_orders_count
+        elif lost_orders_count > 0:
+            self._lost_orders_recovery_orders_count = max(self._lost_orders_recovery_orders_count, lost_orders_count)
+        else:
+            recovery_duration = self._time() - self._lost_orders_recovery_start_time
+            metrics = self._lost_orders_recovery_metrics
+            metrics["recoveries"] += 1
+            metrics["recovered_orders"] += self._lost_orders_recovery_orders_count
+            metrics["last_recovery_duration"] = recovery_duration
+            metrics["last_recovery_orders"] = self._lost_orders_recovery_orders_count
+            metrics["max_recovery_duration"] = max(metrics["max_recovery_duration"], recovery_duration)
+            self.logger().info(
+                f"Recovered {self._lost_orders_recovery_orders_count} lost orders in {recovery_duration:.2f} seconds."
+            )
+            self._lost_orders_recovery_start_time = None
+            self._lost_orders_recovery_orders_count = 0
 
     # Methods tied to specific API data formats
     #
@@ -11,6 +11,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeFeeBase, TradeUpdate
@@ -18,7 +19,6 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -234,7 +234,6 @@ class GatewayAMMBase(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -243,14 +242,34 @@ class GatewayAMMBase(ConnectorBase):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
+        Retrieves a quote price, from the shared gateway quote cache when a recent quote for a similar amount exists.
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
         :param amount: The amount required (in base token unit)
-        :param ignore_shim: Ignore the price shim, and return the real price on the network
+        :param ignore_shim: Ignore the price shim, and return the real price on the network. The real price is always
+        fetched from the gateway.
         :return: The quote price.
         """
+        if ignore_shim:
+            return await self._fetch_quote_price(trading_pair, is_buy, amount, ignore_shim=True)
+        return await GatewayQuoteCache.get_instance().get_quote(
+            self.connector_name,
+            self.chain,
+            self.network,
+            trading_pair,
+            is_buy,
+            amount,
+            lambda: self._fetch_quote_price(trading_pair, is_buy, amount),
+        )
+
+    async def _fetch_quote_price(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            ignore_shim: bool = False
+    ) -> Optional[Decimal]:
         pool_id = None
 
         try:
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from decimal import ROUND_FLOOR, Decimal
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Union
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+AmountBucket = Union[Decimal, int]
+
+
+class GatewayQuoteCacheKey(NamedTuple):
+    connector_name: str
+    chain: str
+    network: str
+    trading_pair: str
+    is_buy: bool
+    amount_bucket: AmountBucket
+
+
+@dataclass
+class GatewayQuoteCacheEntry:
+    price: Decimal
+    timestamp: float
+
+
+class GatewayQuoteCache:
+    """
+    Short lived cache of the quote prices of the gateway AMM connectors, shared by all the connectors.
+
+    Gateway quotes are slow and rate limited, and the strategies often ask for the same quote several times per cycle
+    (e.g. the quote price and the order price of the same side). The quotes are kept for `ttl` seconds, keyed by
+    connector, chain, network, trading pair, side and amount bucket. The amount buckets are relative: with an
+    `amount_bucket_pct` of 1, the buckets are 1% wide and the amounts falling in the same bucket share the same quote.
+    With a bucket size of 0, only the quotes for the exact same amount are shared.
+
+    Concurrent requests for the same key wait for the quote already being fetched instead of asking the gateway again.
+    Failed quotes (None) are not cached.
+    """
+    DEFAULT_TTL = 5.0
+    MAX_ENTRIES = 1000
+
+    _shared_instance: Optional["GatewayQuoteCache"] = None
+
+    @classmethod
+    def get_instance(cls) -> "GatewayQuoteCache":
+        if cls._shared_instance is None:
+            cls._shared_instance = GatewayQuoteCache()
+        return cls._shared_instance
+
+    def __init__(self, ttl: float = DEFAULT_TTL, amount_bucket_pct: Decimal = Decimal("0")):
+        self._ttl = ttl
+        self._amount_bucket_pct = Decimal("0")
+        self._bucket_log_base: Optional[Decimal] = None
+        self._entries: Dict[GatewayQuoteCacheKey, GatewayQuoteCacheEntry] = {}
+        self._in_flight_quotes: Dict[GatewayQuoteCacheKey, asyncio.Future] = {}
+        self.amount_bucket_pct = amount_bucket_pct
+        self.reset_stats()
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl: float):
+        self._ttl = float(ttl)
+
+    @property
+    def amount_bucket_pct(self) -> Decimal:
+        return self._amount_bucket_pct
+
+    @amount_bucket_pct.setter
+    def amount_bucket_pct(self, amount_bucket_pct: Decimal):
+        self._amount_bucket_pct = Decimal(str(amount_bucket_pct))
+        self._bucket_log_base = (
+            (Decimal("1") + self._amount_bucket_pct / Decimal("100")).ln() if self._amount_bucket_pct > 0 else None
+        )
+        self._entries.clear()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def in_flight_hits(self) -> int:
+        return self._in_flight_hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The share of the quote requests served without a new gateway call, from the cache or from a request in flight.
+        """
+        requests = self._hits + self._in_flight_hits + self._misses
+        return (self._hits + self._in_flight_hits) / requests if requests > 0 else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self._hits,
+            "in_flight_hits": self._in_flight_hits,
+            "misses": self._misses,
+            "hit_rate": self.hit_rate,
+            "entries": len(self._entries),
+        }
+
+    def reset_stats(self):
+        self._hits = 0
+        self._in_flight_hits = 0
+        self._misses = 0
+
+    def clear(self):
+        self._entries.clear()
+
+    def amount_bucket(self, amount: Decimal) -> AmountBucket:
+        amount = Decimal(str(amount))
+        if self._bucket_log_base is None or amount <= 0:
+            return amount.normalize()
+        return int((amount.ln() / self._bucket_log_base).to_integral_value(rounding=ROUND_FLOOR))
+
+    async def get_quote(
+        self,
+        connector_name: str,
+        chain: str,
+        network: str,
+        trading_pair: str,
+        is_buy: bool,
+        amount: Decimal,
+        fetch_quote: Callable[[], Awaitable[Optional[Decimal]]],
+    ) -> Optional[Decimal]:
+        """
+        Returns the cached quote for the key, or the quote being fetched for it, or fetches a new quote.
+
+        :param fetch_quote: coroutine function returning the quote price from the gateway
+        """
+        key = GatewayQuoteCacheKey(connector_name, chain, network, trading_pair, is_buy, self.amount_bucket(amount))
+        now = self._time()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry.timestamp < self._ttl:
+            self._hits += 1
+            return entry.price
+
+        quote_future = self._in_flight_quotes.get(key)
+        if quote_future is not None:
+            self._in_flight_hits += 1
+            # Shielded, so that a cancelled caller doesn't cancel the quote the other callers wait for
+            return await asyncio.shield(quote_future)
+
+        self._misses += 1
+        quote_future = safe_ensure_future(fetch_quote())
+        self._in_flight_quotes[key] = quote_future
+        quote_future.add_done_callback(lambda future: self._on_quote_fetched(key, future, now))
+        return await asyncio.shield(quote_future)
+
+    def _on_quote_fetched(self, key: GatewayQuoteCacheKey, quote_future: asyncio.Future, request_timestamp: float):
+        if self._in_flight_quotes.get(key) is quote_future:
+            del self._in_flight_quotes[key]
+        if quote_future.cancelled() or quote_future.exception() is not None:
+            return
+        price = quote_future.result()
+        if price is not None and self._ttl > 0:
+            self._store(key, GatewayQuoteCacheEntry(price=price, timestamp=request_timestamp))
+
+    def _store(self, key: GatewayQuoteCacheKey, entry: GatewayQuoteCacheEntry):
+        if len(self._entries) >= self.MAX_ENTRIES:
+            now = self._time()
+            expired_keys = [k for k, e in self._entries.items() if e.timestamp + self._ttl <= now]
+            for expired_key in expired_keys:
+                del self._entries[expired_key]
+            if len(self._entries) >= self.MAX_ENTRIES:
+                del self._entries[min(self._entries, key=lambda k: self._entries[k].timestamp)]
+        self._entries[key] = entry
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
@@ -27,10 +27,12 @@ if TYPE_CHECKING:
 
 class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     VALID_POSITION_ACTIONS = [PositionAction.OPEN, PositionAction.CLOSE]
+    FUNDING_PAYMENT_REQUESTS_MAX_CONCURRENCY = 5
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
         self._last_funding_fee_payment_ts: Dict[str, float] = {}
+        self._last_funding_payments_poll_time: Optional[float] = None
 
         self._perpetual_trading = PerpetualTrading(self.trading_pairs)
         self._funding_info_listener_task: Optional[asyncio.Task] = None
@@ -45,6 +47,14 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def funding_fee_poll_interval(self) -> int:
         raise NotImplementedError
 
+    @property
+    def supports_bulk_funding_payments(self) -> bool:
+        """
+        Connectors with an account wide income history endpoint return True and implement
+        `_fetch_funding_payments_since`, to fetch the funding payments of all the trading pairs with a single request.
+        """
+        return False
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         """
@@ -202,6 +212,16 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         """
         raise NotImplementedError
 
+    async def _fetch_funding_payments_since(self, start_time: float) -> Dict[str, Tuple[float, Decimal, Decimal]]:
+        """
+        Returns the latest funding payment of each trading pair paid since `start_time` (in seconds). Only used when
+        `supports_bulk_funding_payments` is True.
+
+        :return: a dictionary mapping each trading pair with a payment to a tuple of the payment timestamp, funding
+            rate and payment amount
+        """
+        raise NotImplementedError
+
     def _stop_network(self):
         self._funding_fee_poll_notifier = asyncio.Event()
         self._perpetual_trading.stop()
@@ -209,6 +229,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             self._funding_info_listener_task.cancel()
             self._funding_info_listener_task = None
         self._last_funding_fee_payment_ts.clear()
+        self._last_funding_payments_poll_time = None
         super()._stop_network()
 
     async def _create_order(
@@ -367,9 +388,9 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         )
 
     async def _init_funding_info(self):
+        funding_infos = await self._orderbook_ds.get_funding_infos(self.trading_pairs)
         for trading_pair in self.trading_pairs:
-            funding_info = await self._orderbook_ds.get_funding_info(trading_pair)
-            self._perpetual_trading.initialize_funding_info(funding_info)
+            self._perpetual_trading.initialize_funding_info(funding_infos[trading_pair])
 
     async def _funding_payment_polling_loop(self):
         """
@@ -385,17 +406,56 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
 
     async def _update_all_funding_payments(self, fire_event_on_new: bool):
         try:
-            tasks = []
-            for trading_pair in self.trading_pairs:
-                tasks.append(
-                    asyncio.create_task(
-                        self._update_funding_payment(trading_pair=trading_pair, fire_event_on_new=fire_event_on_new)
+            if self.supports_bulk_funding_payments:
+                await self._update_funding_payments_in_bulk(fire_event_on_new=fire_event_on_new)
+            else:
+                # Limit the burst of requests sent for connectors with many trading pairs
+                requests_semaphore = asyncio.Semaphore(self.FUNDING_PAYMENT_REQUESTS_MAX_CONCURRENCY)
+                tasks = []
+                for trading_pair in self.trading_pairs:
+                    tasks.append(
+                        asyncio.create_task(
+                            self._update_funding_payment_with_semaphore(
+                                semaphore=requests_semaphore,
+                                trading_pair=trading_pair,
+                                fire_event_on_new=fire_event_on_new,
+                            )
+                        )
                     )
-                )
-            await safe_gather(*tasks)
+                await safe_gather(*tasks)
         except asyncio.CancelledError:
             raise
 
+    async def _update_funding_payment_with_semaphore(
+        self, semaphore: asyncio.Semaphore, trading_pair: str, fire_event_on_new: bool
+    ) -> bool:
+        async with semaphore:
+            return await self._update_funding_payment(trading_pair=trading_pair, fire_event_on_new=fire_event_on_new)
+
+    async def _update_funding_payments_in_bulk(self, fire_event_on_new: bool) -> bool:
+        poll_time = self._time()
+        # The window overlaps the previous one to account for clock differences with the exchange. Payments already
+        # processed are filtered out by their timestamp.
+        start_time = (self._last_funding_payments_poll_time or poll_time) - self.funding_fee_poll_interval
+        try:
+            funding_payments = await self._fetch_funding_payments_since(start_time=start_time)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                "Unexpected error while fetching funding payments.",
+                exc_info=True,
+                app_warning_msg="Could not fetch funding payments. Check network connection."
+            )
+            return False
+        self._last_funding_payments_poll_time = poll_time
+        for trading_pair in self.trading_pairs:
+            timestamp, funding_rate, payment_amount = funding_payments.get(
+                trading_pair, (0, Decimal("-1"), Decimal("-1"))
+            )
+            self._emit_funding_payment_event(trading_pair, timestamp, funding_rate, payment_amount, fire_event_on_new)
+        return True
+
     async def _update_funding_payment(self, trading_pair: str, fire_event_on_new: bool) -> bool:
         fetch_success = True
         timestamp = funding_rate = payment_amount = 0
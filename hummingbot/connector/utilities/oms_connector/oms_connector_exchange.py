@@ -305,12 +305,12 @@ class OMSExchange(ExchangePyBase):
                 if endpoint == CONSTANTS.WS_ACC_POS_EVENT:
                     self._process_account_position_event(payload)
                 elif endpoint == CONSTANTS.WS_ORDER_STATE_EVENT:
-                    order = self._order_tracker.all_updatable_orders.get(str(payload[CONSTANTS.CLIENT_ORDER_ID_FIELD]))
+                    order = self._order_tracker.fetch_updatable_order(str(payload[CONSTANTS.CLIENT_ORDER_ID_FIELD]))
                     if order is not None:
                         order_update = self._create_order_update(order_msg=payload, order=order)
                         self._order_tracker.process_order_update(order_update)
                 elif endpoint == CONSTANTS.WS_ORDER_TRADE_EVENT:
-                    order = self._order_tracker.all_fillable_orders.get(str(payload[CONSTANTS.CLIENT_ORDER_ID_FIELD]))
+                    order = self._order_tracker.fetch_fillable_order(str(payload[CONSTANTS.CLIENT_ORDER_ID_FIELD]))
                     if order is not None:
                         trade_update = self._create_trade_update(trade_event=payload, order=order)
                         self._order_tracker.process_trade_update(trade_update)
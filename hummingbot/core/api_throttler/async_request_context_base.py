@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import List, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.utils.order_latency_tracker import RATE_LIMIT_ACQUIRED, OrderLatencyTracker
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -87,6 +88,10 @@ class AsyncRequestContextBase(ABC):
             for limit, weight in self._related_limits:
                 self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
 
+        latency_tracker = OrderLatencyTracker.get_instance()
+        if latency_tracker.enabled:
+            latency_tracker.record_stage(RATE_LIMIT_ACQUIRED)
+
     async def __aenter__(self):
         await self.acquire()
 
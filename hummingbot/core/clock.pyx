@@ -8,6 +8,7 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -90,6 +91,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start_time
+            object loop_monitor = EventLoopMonitor.get_instance()
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -111,6 +114,7 @@ cdef class Clock:
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                tick_start_time = time.time()
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
@@ -122,6 +126,9 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+
+                if loop_monitor.enabled:
+                    loop_monitor.record_tick(tick_start_time - next_tick_time, time.time() - tick_start_time)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
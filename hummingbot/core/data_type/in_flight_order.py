@@ -89,6 +89,37 @@ class TradeUpdate(NamedTuple):
 
 
 class InFlightOrder:
+    """
+    Tracks the state of an order placed by a connector.
+
+    The instances use `__slots__` to reduce their memory footprint, and the events used to wait for order state
+    changes are only created when they are accessed.
+    """
+    __slots__ = (
+        "client_order_id",
+        "creation_timestamp",
+        "trading_pair",
+        "order_type",
+        "trade_type",
+        "price",
+        "amount",
+        "exchange_order_id",
+        "current_state",
+        "leverage",
+        "position",
+        "executed_amount_base",
+        "executed_amount_quote",
+        "last_update_timestamp",
+        "order_fills",
+        "revision",
+        "_is_completely_filled",
+        "_is_processed_by_exchange",
+        "_exchange_order_id_update_event",
+        "_completely_filled_event",
+        "_processed_by_exchange_event",
+        "__weakref__",
+    )
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(
@@ -124,11 +155,14 @@ class InFlightOrder:
 
         self.order_fills: Dict[str, TradeUpdate] = {}  # Dict[trade_id, TradeUpdate]
 
-        self.exchange_order_id_update_event = asyncio.Event()
-        if self.exchange_order_id:
-            self.exchange_order_id_update_event.set()
-        self.completely_filled_event = asyncio.Event()
-        self.processed_by_exchange_event = asyncio.Event()
+        # Incremented every time the order is updated, to allow reusing copies of the order while it doesn't change
+        self.revision: int = 0
+
+        self._is_completely_filled = False
+        self._is_processed_by_exchange = False
+        self._exchange_order_id_update_event: Optional[asyncio.Event] = None
+        self._completely_filled_event: Optional[asyncio.Event] = None
+        self._processed_by_exchange_event: Optional[asyncio.Event] = None
         self.check_processed_by_exchange_condition()
 
     @classmethod
@@ -161,6 +195,42 @@ class InFlightOrder:
     def __eq__(self, other: object) -> bool:
         return type(self) is type(other) and self.attributes == other.attributes
 
+    @property
+    def exchange_order_id_update_event(self) -> asyncio.Event:
+        if self._exchange_order_id_update_event is None:
+            self._exchange_order_id_update_event = asyncio.Event()
+            if self.exchange_order_id:
+                self._exchange_order_id_update_event.set()
+        return self._exchange_order_id_update_event
+
+    @exchange_order_id_update_event.setter
+    def exchange_order_id_update_event(self, event: asyncio.Event):
+        self._exchange_order_id_update_event = event
+
+    @property
+    def completely_filled_event(self) -> asyncio.Event:
+        if self._completely_filled_event is None:
+            self._completely_filled_event = asyncio.Event()
+            if self._is_completely_filled:
+                self._completely_filled_event.set()
+        return self._completely_filled_event
+
+    @completely_filled_event.setter
+    def completely_filled_event(self, event: asyncio.Event):
+        self._completely_filled_event = event
+
+    @property
+    def processed_by_exchange_event(self) -> asyncio.Event:
+        if self._processed_by_exchange_event is None:
+            self._processed_by_exchange_event = asyncio.Event()
+            if self._is_processed_by_exchange:
+                self._processed_by_exchange_event.set()
+        return self._processed_by_exchange_event
+
+    @processed_by_exchange_event.setter
+    def processed_by_exchange_event(self, event: asyncio.Event):
+        self._processed_by_exchange_event = event
+
     @property
     def base_asset(self):
         return self.trading_pair.split("-")[0]
@@ -298,7 +368,9 @@ class InFlightOrder:
 
     def update_exchange_order_id(self, exchange_order_id: str):
         self.exchange_order_id = exchange_order_id
-        self.exchange_order_id_update_event.set()
+        self.revision += 1
+        if self._exchange_order_id_update_event is not None:
+            self._exchange_order_id_update_event.set()
 
     async def get_exchange_order_id(self):
         if self.exchange_order_id is None:
@@ -348,6 +420,7 @@ class InFlightOrder:
 
         if updated:
             self.last_update_timestamp = order_update.update_timestamp
+            self.revision += 1
 
         return updated
 
@@ -369,20 +442,25 @@ class InFlightOrder:
         self.executed_amount_quote += trade_update.fill_quote_amount
 
         self.last_update_timestamp = trade_update.fill_timestamp
+        self.revision += 1
         self.check_filled_condition()
 
         return True
 
     def check_filled_condition(self):
         if (abs(self.amount) - self.executed_amount_base).quantize(Decimal('1e-8')) <= 0:
-            self.completely_filled_event.set()
+            self._is_completely_filled = True
+            if self._completely_filled_event is not None:
+                self._completely_filled_event.set()
 
     async def wait_until_completely_filled(self):
         await self.completely_filled_event.wait()
 
     def check_processed_by_exchange_condition(self):
         if self.current_state.value > OrderState.PENDING_CREATE.value:
-            self.processed_by_exchange_event.set()
+            self._is_processed_by_exchange = True
+            if self._processed_by_exchange_event is not None:
+                self._processed_by_exchange_event.set()
 
     async def wait_until_processed_by_exchange(self):
         await self.processed_by_exchange_event.wait()
@@ -396,6 +474,8 @@ class InFlightOrder:
 
 
 class PerpetualDerivativeInFlightOrder(InFlightOrder):
+    __slots__ = ()
+
     def build_order_created_message(self) -> str:
         return (
             f"Created {self.order_type.name.upper()} {self.trade_type.name.upper()} order "
@@ -226,13 +226,18 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t update_id
+            Py_ssize_t i
+
+        # Indexing the typed buffers row by row avoids creating a Python row object per level.
+        for i in range(bids_array.shape[0]):
+            update_id = <int64_t>bids_array[i, 2]
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
+        for i in range(asks_array.shape[0]):
+            update_id = <int64_t>asks_array[i, 2]
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -253,13 +258,18 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t update_id
+            Py_ssize_t i
+
+        # Indexing the typed buffers row by row avoids creating a Python row object per level.
+        for i in range(bids_array.shape[0]):
+            update_id = <int64_t>bids_array[i, 2]
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
+        for i in range(asks_array.shape[0]):
+            update_id = <int64_t>asks_array[i, 2]
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
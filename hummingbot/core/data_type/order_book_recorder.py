@@ -0,0 +1,398 @@
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+INDEX_FILE_NAME = "index.jsonl"
+LEVEL_COLUMNS = 3  # price, amount, update_id, as expected by OrderBook.apply_numpy_diffs
+
+
+@dataclass
+class OrderBookRecordingSegment:
+    """
+    Columns of a recorded segment. There is one row per event in the event columns, and the levels of the diffs and
+    snapshots are stored, in the order of the events, in the bids and asks arrays of shape (n, 3).
+    """
+    trading_pair: str
+    timestamp: np.ndarray
+    type: np.ndarray
+    update_id: np.ndarray
+    bid_count: np.ndarray
+    ask_count: np.ndarray
+    trade_price: np.ndarray
+    trade_amount: np.ndarray
+    trade_type: np.ndarray
+    trade_id: np.ndarray
+    bids: np.ndarray
+    asks: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @property
+    def bid_offsets(self) -> np.ndarray:
+        return np.concatenate(([0], np.cumsum(self.bid_count)))
+
+    @property
+    def ask_offsets(self) -> np.ndarray:
+        return np.concatenate(([0], np.cumsum(self.ask_count)))
+
+
+class _SegmentBuffer:
+    def __init__(self, opened_at: float):
+        self.opened_at = opened_at
+        self.timestamp: List[float] = []
+        self.type: List[int] = []
+        self.update_id: List[int] = []
+        self.bid_count: List[int] = []
+        self.ask_count: List[int] = []
+        self.trade_price: List[float] = []
+        self.trade_amount: List[float] = []
+        self.trade_type: List[int] = []
+        self.trade_id: List[int] = []
+        self.bids: List[np.ndarray] = []
+        self.asks: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def append(self, timestamp: float, message_type: OrderBookMessageType, update_id: int,
+               bids: Optional[np.ndarray] = None, asks: Optional[np.ndarray] = None,
+               trade: Optional[OrderBookTradeEvent] = None):
+        self.timestamp.append(timestamp)
+        self.type.append(message_type.value)
+        self.update_id.append(update_id)
+        bids = bids if bids is not None else np.empty((0, LEVEL_COLUMNS))
+        asks = asks if asks is not None else np.empty((0, LEVEL_COLUMNS))
+        self.bid_count.append(len(bids))
+        self.ask_count.append(len(asks))
+        self.bids.append(bids)
+        self.asks.append(asks)
+        if trade is not None:
+            self.trade_price.append(float(trade.price))
+            self.trade_amount.append(float(trade.amount))
+            self.trade_type.append(trade.type.value)
+            self.trade_id.append(_numeric_trade_id(trade.trade_id))
+        else:
+            self.trade_price.append(np.nan)
+            self.trade_amount.append(np.nan)
+            self.trade_type.append(0)
+            self.trade_id.append(-1)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {
+            "timestamp": np.array(self.timestamp, dtype=np.float64),
+            "type": np.array(self.type, dtype=np.int8),
+            "update_id": np.array(self.update_id, dtype=np.int64),
+            "bid_count": np.array(self.bid_count, dtype=np.int32),
+            "ask_count": np.array(self.ask_count, dtype=np.int32),
+            "trade_price": np.array(self.trade_price, dtype=np.float64),
+            "trade_amount": np.array(self.trade_amount, dtype=np.float64),
+            "trade_type": np.array(self.trade_type, dtype=np.int8),
+            "trade_id": np.array(self.trade_id, dtype=np.int64),
+            "bids": np.concatenate(self.bids).astype(np.float64, copy=False),
+            "asks": np.concatenate(self.asks).astype(np.float64, copy=False),
+        }
+
+
+def _numeric_trade_id(trade_id: Optional[str]) -> int:
+    try:
+        return int(trade_id)
+    except (TypeError, ValueError):
+        return -1
+
+
+def rows_to_array(rows: List[OrderBookRow]) -> np.ndarray:
+    """
+    Converts order book rows to a float64 array of shape (n, 3), the format of OrderBook.apply_numpy_diffs.
+    """
+    return np.array([(row.price, row.amount, row.update_id) for row in rows], dtype=np.float64).reshape(-1, 3)
+
+
+class OrderBookRecorder:
+    """
+    Records the order book diffs, snapshots and trades of an OrderBookTracker in compact binary columnar segments.
+
+    The events of each trading pair are buffered in columns and written as an immutable NumPy .npz segment every
+    `segment_max_events` events or `segment_max_age` seconds. The segments are only ever added, and each one is listed
+    in an append-only JSON lines index with its trading pair, time range and event counts, so the OrderBookReplaySource
+    can select the segments of a time range without opening the others.
+
+    The snapshots are recorded as the full content of the order book once the snapshot is applied, so that replaying
+    the snapshots and the diffs rebuilds exactly the same book.
+    """
+    SEGMENT_MAX_EVENTS = 10000
+    SEGMENT_MAX_AGE = 60.0
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 directory: str,
+                 segment_max_events: int = SEGMENT_MAX_EVENTS,
+                 segment_max_age: float = SEGMENT_MAX_AGE,
+                 compress: bool = False):
+        """
+        :param directory: the directory of the segments and of their index, created if it doesn't exist
+        :param segment_max_events: the number of events of a trading pair that triggers writing a segment
+        :param segment_max_age: the age in seconds of the oldest buffered event that triggers writing a segment
+        :param compress: whether the segments are zip compressed, smaller but slower to write and to load
+        """
+        self._directory = directory
+        self._segment_max_events = segment_max_events
+        self._segment_max_age = segment_max_age
+        self._compress = compress
+        self._buffers: Dict[str, _SegmentBuffer] = {}
+        self._segment_counts: Dict[str, int] = defaultdict(int)
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def record_diff(self, message: OrderBookMessage):
+        self._append(message.trading_pair, message.timestamp, OrderBookMessageType.DIFF, message.update_id,
+                     bids=rows_to_array(message.bids), asks=rows_to_array(message.asks))
+
+    def record_order_book(self, trading_pair: str, timestamp: float, order_book: OrderBook):
+        """
+        Records the current content of the order book as a snapshot.
+        """
+        bids = rows_to_array(list(order_book.bid_entries()))
+        asks = rows_to_array(list(order_book.ask_entries()))
+        self._append(trading_pair, timestamp, OrderBookMessageType.SNAPSHOT, order_book.snapshot_uid,
+                     bids=bids, asks=asks)
+
+    def record_trade(self, trade: OrderBookTradeEvent):
+        self._append(trade.trading_pair, trade.timestamp, OrderBookMessageType.TRADE, -1, trade=trade)
+
+    def flush(self, trading_pair: Optional[str] = None):
+        """
+        Writes the buffered events of the trading pair, or of all the trading pairs, to new segments.
+        """
+        trading_pairs = [trading_pair] if trading_pair is not None else list(self._buffers)
+        for pair in trading_pairs:
+            buffer = self._buffers.pop(pair, None)
+            if buffer is not None and len(buffer) > 0:
+                self._write_segment(pair, buffer)
+
+    def _append(self, trading_pair: str, timestamp: float, message_type: OrderBookMessageType, update_id: int,
+                bids: Optional[np.ndarray] = None, asks: Optional[np.ndarray] = None,
+                trade: Optional[OrderBookTradeEvent] = None):
+        now = self._time()
+        buffer = self._buffers.get(trading_pair)
+        if buffer is None:
+            buffer = _SegmentBuffer(opened_at=now)
+            self._buffers[trading_pair] = buffer
+        buffer.append(timestamp, message_type, update_id, bids=bids, asks=asks, trade=trade)
+        if len(buffer) >= self._segment_max_events or now - buffer.opened_at >= self._segment_max_age:
+            self.flush(trading_pair)
+
+    def _write_segment(self, trading_pair: str, buffer: _SegmentBuffer):
+        columns = buffer.columns()
+        sequence = self._segment_counts[trading_pair]
+        self._segment_counts[trading_pair] += 1
+        pair_directory = os.path.join(self._directory, trading_pair)
+        os.makedirs(pair_directory, exist_ok=True)
+        file_name = f"{int(columns['timestamp'][0] * 1e3):013d}_{os.getpid()}_{sequence:06d}.npz"
+        file_path = os.path.join(pair_directory, file_name)
+        temporary_path = f"{file_path}.tmp"
+        try:
+            with open(temporary_path, "wb") as segment_file:
+                if self._compress:
+                    np.savez_compressed(segment_file, **columns)
+                else:
+                    np.savez(segment_file, **columns)
+            os.replace(temporary_path, file_path)
+            snapshot_timestamps = columns["timestamp"][columns["type"] == OrderBookMessageType.SNAPSHOT.value]
+            index_entry = {
+                "trading_pair": trading_pair,
+                "file": os.path.join(trading_pair, file_name),
+                "start_timestamp": float(columns["timestamp"].min()),
+                "end_timestamp": float(columns["timestamp"].max()),
+                "first_snapshot_timestamp": float(snapshot_timestamps[0]) if len(snapshot_timestamps) > 0 else None,
+                "events": len(buffer),
+                "snapshots": len(snapshot_timestamps),
+                "trades": int(np.count_nonzero(columns["type"] == OrderBookMessageType.TRADE.value)),
+            }
+            with open(os.path.join(self._directory, INDEX_FILE_NAME), "a") as index_file:
+                index_file.write(json.dumps(index_entry) + "\n")
+        except Exception:
+            self.logger().error(f"Error writing the order book recording segment {file_path}.", exc_info=True)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+class OrderBookReplaySource:
+    """
+    Reads the segments written by the OrderBookRecorder and replays them into an OrderBook at full speed, through
+    OrderBook.apply_numpy_snapshot, OrderBook.apply_numpy_diffs and OrderBook.apply_trade.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._index: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.reload_index()
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._index)
+
+    def reload_index(self):
+        self._index.clear()
+        index_path = os.path.join(self._directory, INDEX_FILE_NAME)
+        if os.path.exists(index_path):
+            with open(index_path) as index_file:
+                for line in index_file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._index[entry["trading_pair"]].append(entry)
+        for entries in self._index.values():
+            entries.sort(key=lambda entry: (entry["start_timestamp"], entry["file"]))
+
+    def segments_info(self, trading_pair: str) -> List[Dict[str, Any]]:
+        return list(self._index.get(trading_pair, []))
+
+    def load_segment(self, trading_pair: str, segment_info: Dict[str, Any]) -> OrderBookRecordingSegment:
+        with np.load(os.path.join(self._directory, segment_info["file"])) as columns:
+            return OrderBookRecordingSegment(trading_pair=trading_pair, **{name: columns[name] for name in columns.files})
+
+    def iter_segments(self,
+                      trading_pair: str,
+                      start_timestamp: Optional[float] = None,
+                      end_timestamp: Optional[float] = None) -> Iterator[OrderBookRecordingSegment]:
+        """
+        Yields the segments of the trading pair overlapping the time range, in chronological order.
+        """
+        for segment_info in self._index.get(trading_pair, []):
+            if start_timestamp is not None and segment_info["end_timestamp"] < start_timestamp:
+                continue
+            if end_timestamp is not None and segment_info["start_timestamp"] > end_timestamp:
+                break
+            yield self.load_segment(trading_pair, segment_info)
+
+    def replay(self,
+               trading_pair: str,
+               order_book: OrderBook,
+               start_timestamp: Optional[float] = None,
+               end_timestamp: Optional[float] = None,
+               on_event: Optional[Callable[[float, OrderBookMessageType], None]] = None) -> int:
+        """
+        Rebuilds the order book of the trading pair from the last snapshot recorded at or before the start timestamp
+        (the first snapshot without start timestamp), then applies the diffs and trades up to the end timestamp.
+
+        :param order_book: the order book to apply the events to
+        :param on_event: optional callback called with the timestamp and the type of each event once applied
+        :return: the number of events applied
+        """
+        applied_events = 0
+        for timestamp, event_type in self.iter_replay(trading_pair, order_book, start_timestamp, end_timestamp):
+            applied_events += 1
+            if on_event is not None:
+                on_event(timestamp, event_type)
+        return applied_events
+
+    def iter_replay(self,
+                    trading_pair: str,
+                    order_book: OrderBook,
+                    start_timestamp: Optional[float] = None,
+                    end_timestamp: Optional[float] = None) -> Iterator[Tuple[float, OrderBookMessageType]]:
+        """
+        Same as replay, as a generator yielding the timestamp and the type of each event once applied, so that the
+        consumer can act on the order book between two events.
+        """
+        segments_info = self._index.get(trading_pair, [])
+        first_segment_position = self._replay_start_segment_position(segments_info, start_timestamp)
+        if first_segment_position is None:
+            return
+        snapshot_found = False
+        for segment_info in segments_info[first_segment_position:]:
+            if end_timestamp is not None and segment_info["start_timestamp"] > end_timestamp:
+                break
+            segment = self.load_segment(trading_pair, segment_info)
+            first_event = 0
+            if not snapshot_found:
+                first_event = self._replay_start_event(segment, start_timestamp)
+                snapshot_found = True
+            yield from self._replay_segment(segment, order_book, first_event, end_timestamp)
+
+    @staticmethod
+    def _replay_start_segment_position(segments_info: List[Dict[str, Any]],
+                                       start_timestamp: Optional[float]) -> Optional[int]:
+        start_position = None
+        for position, segment_info in enumerate(segments_info):
+            first_snapshot_timestamp = segment_info["first_snapshot_timestamp"]
+            if first_snapshot_timestamp is None:
+                continue
+            if start_timestamp is None:
+                return position
+            if first_snapshot_timestamp > start_timestamp:
+                break
+            start_position = position
+        return start_position
+
+    @staticmethod
+    def _replay_start_event(segment: OrderBookRecordingSegment, start_timestamp: Optional[float]) -> int:
+        snapshot_events = np.flatnonzero(segment.type == OrderBookMessageType.SNAPSHOT.value)
+        if start_timestamp is not None:
+            snapshot_events = snapshot_events[segment.timestamp[snapshot_events] <= start_timestamp]
+        return int(snapshot_events[-1] if start_timestamp is not None else snapshot_events[0])
+
+    @staticmethod
+    def _replay_segment(segment: OrderBookRecordingSegment,
+                        order_book: OrderBook,
+                        first_event: int,
+                        end_timestamp: Optional[float]) -> Iterator[Tuple[float, OrderBookMessageType]]:
+        bid_offsets = segment.bid_offsets.tolist()
+        ask_offsets = segment.ask_offsets.tolist()
+        last_event = len(segment)
+        if end_timestamp is not None:
+            # the events are replayed in the order they were recorded, up to the first one after the end
+            later_events = np.flatnonzero(segment.timestamp[first_event:] > end_timestamp)
+            if len(later_events) > 0:
+                last_event = first_event + int(later_events[0])
+        diff_type = OrderBookMessageType.DIFF.value
+        snapshot_type = OrderBookMessageType.SNAPSHOT.value
+        message_types = {message_type.value: message_type for message_type in OrderBookMessageType}
+        trade_types = {trade_type.value: trade_type for trade_type in TradeType}
+        timestamps = segment.timestamp.tolist()
+        types = segment.type.tolist()
+        for event in range(first_event, last_event):
+            event_type = types[event]
+            timestamp = timestamps[event]
+            if event_type == diff_type:
+                order_book.apply_numpy_diffs(segment.bids[bid_offsets[event]:bid_offsets[event + 1]],
+                                             segment.asks[ask_offsets[event]:ask_offsets[event + 1]])
+            elif event_type == snapshot_type:
+                order_book.apply_numpy_snapshot(segment.bids[bid_offsets[event]:bid_offsets[event + 1]],
+                                                segment.asks[ask_offsets[event]:ask_offsets[event + 1]])
+            else:
+                trade_id = int(segment.trade_id[event])
+                order_book.apply_trade(OrderBookTradeEvent(
+                    trading_pair=segment.trading_pair,
+                    timestamp=timestamp,
+                    type=trade_types[int(segment.trade_type[event])],
+                    price=float(segment.trade_price[event]),
+                    amount=float(segment.trade_amount[event]),
+                    trade_id=str(trade_id) if trade_id >= 0 else None,
+                ))
+            yield timestamp, message_types[event_type]
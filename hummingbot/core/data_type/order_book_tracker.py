@@ -10,9 +10,10 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +24,8 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 20
+    SNAPSHOT_REQUEST_RETRY_INTERVAL: float = 5.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -36,6 +39,7 @@ class OrderBookTracker:
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_initialized_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +49,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._recorder: Optional[OrderBookRecorder] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -64,10 +69,37 @@ class OrderBookTracker:
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    def set_recorder(self, recorder: Optional[OrderBookRecorder]):
+        """
+        Sets the recorder of the order book diffs, snapshots and trades, or removes it with None. The order books
+        already initialized are recorded right away, so that the recording starts with their snapshots.
+        """
+        if self._recorder is not None:
+            self._recorder.flush()
+        self._recorder = recorder
+        if recorder is not None:
+            for trading_pair, order_book in self._order_books.items():
+                recorder.record_order_book(trading_pair, time.time(), order_book)
+
     @property
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs whose order book is already initialized and being tracked
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_book_initialized_events and self._order_book_initialized_events[
+            trading_pair].is_set()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,16 +170,22 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for order_book_initialized in self._order_book_initialized_events.values():
+            order_book_initialized.clear()
+        if self._recorder is not None:
+            self._recorder.flush()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_initialized_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
         fall-back mechanism for when the web socket update channel fails.
         '''
-        await self._order_books_initialized.wait()
         while True:
             try:
                 outdateds = [t_pair for t_pair, o_book in self._order_books.items()
@@ -174,17 +212,42 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. The snapshots are requested concurrently (the requests are still subject to the
+        connector throttler rate limits), and each order book starts being tracked as soon as its snapshot arrives.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        snapshot_requests_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        await safe_gather(*[
+            self._init_order_book(trading_pair=trading_pair, snapshot_requests_semaphore=snapshot_requests_semaphore)
+            for trading_pair in self._trading_pairs
+        ])
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, snapshot_requests_semaphore: asyncio.Semaphore):
+        while True:
+            try:
+                async with snapshot_requests_semaphore:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing the order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not initialize the order book for {trading_pair}. "
+                                    f"Retrying after {self.SNAPSHOT_REQUEST_RETRY_INTERVAL:.0f} seconds."
+                )
+                await self._sleep(delay=self.SNAPSHOT_REQUEST_RETRY_INTERVAL)
+
+        self._order_books[trading_pair] = order_book
+        if self._recorder is not None:
+            self._recorder.record_order_book(trading_pair, time.time(), order_book)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_initialized_events[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self.ready_trading_pairs)}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -238,7 +301,6 @@ class OrderBookTracker:
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -274,6 +336,8 @@ class OrderBookTracker:
                 if message.type is OrderBookMessageType.DIFF:
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
                     past_diffs_window.append(message)
+                    if self._recorder is not None:
+                        self._recorder.record_diff(message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -285,6 +349,8 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self._recorder is not None:
+                        self._recorder.record_order_book(trading_pair, message.timestamp, order_book)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -299,7 +365,6 @@ class OrderBookTracker:
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -310,7 +375,7 @@ class OrderBookTracker:
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
+                trade_event = OrderBookTradeEvent(
                     trading_pair=trade_message.trading_pair,
                     timestamp=trade_message.timestamp,
                     price=float(trade_message.content["price"]),
@@ -318,7 +383,10 @@ class OrderBookTracker:
                     trade_id=trade_message.trade_id,
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                )
+                order_book.apply_trade(trade_event)
+                if self._recorder is not None:
+                    self._recorder.record_trade(trade_event)
 
                 messages_accepted += 1
 
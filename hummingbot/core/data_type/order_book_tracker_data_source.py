@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.web_assistant.connections.json_decoder import RawMessageRouter
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
@@ -24,6 +25,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        # Data sources connecting their websockets in raw messages mode set a router to only decode relevant messages
+        self._raw_message_router: Optional[RawMessageRouter] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -232,7 +235,11 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
-            if data is not None:  # data will be None when the websocket is disconnected
+            if data is not None and self._raw_message_router is not None:
+                channel, data = self._raw_message_router.decode(data)
+                if channel is not None:
+                    self._message_queue[channel].put_nowait(data)
+            elif data is not None:  # data will be None when the websocket is disconnected
                 channel: str = self._channel_originating_message(event_message=data)
                 valid_channels = self._get_messages_queue_keys()
                 if channel in valid_channels:
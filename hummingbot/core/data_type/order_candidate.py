@@ -2,7 +2,7 @@ import typing
 from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
@@ -70,15 +70,22 @@ class OrderCandidate:
     def set_to_zero(self):
         self._scale_order(scaler=Decimal("0"))
 
-    def populate_collateral_entries(self, exchange: 'ExchangeBase'):
+    def populate_collateral_entries(self, exchange: 'ExchangeBase', fee: Optional[TradeFeeBase] = None):
         self._populate_order_collateral_entry(exchange)
-        fee = self._get_fee(exchange)
+        if fee is None:
+            fee = self._get_fee(exchange)
         self._populate_percent_fee_collateral_entry(exchange, fee)
         self._populate_fixed_fee_collateral_entries(fee)
         self._populate_potential_returns_entry(exchange)
         self._populate_percent_fee_value(exchange, fee)
         self._apply_fee_impact_on_potential_returns(exchange, fee)
 
+    def fee_cache_key(self) -> Tuple:
+        """
+        The order parameters the fee of the candidate depends on. Candidates with the same key share the same fee.
+        """
+        return self.__class__, self.trading_pair, self.is_maker, self.order_type, self.order_side
+
     def adjust_from_balances(self, available_balances: Dict[str, Decimal]):
         if not self.is_zero_order:
             self._adjust_for_order_collateral(available_balances)
@@ -272,6 +279,9 @@ class PerpetualOrderCandidate(OrderCandidate):
     leverage: Decimal = Decimal("1")
     position_close: bool = False
 
+    def fee_cache_key(self) -> Tuple:
+        return super().fee_cache_key() + (self.position_close,)
+
     def _get_order_collateral_token(self, exchange: 'ExchangeBase') -> Optional[str]:
         if self.position_close:
             oc_token = None  # the contract is the collateral
@@ -4,9 +4,12 @@ from typing import Any, Dict, List
 
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 
 
 class PerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, ABC):
+    FUNDING_INFO_REQUESTS_MAX_CONCURRENCY = 5
+
     def __init__(self, trading_pairs: List[str]):
         super().__init__(trading_pairs)
         self._funding_info_messages_queue_key = "funding_info"
@@ -18,6 +21,22 @@ class PerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, ABC):
         """
         raise NotImplementedError
 
+    async def get_funding_infos(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        """
+        Return the funding information for several trading pairs.
+        Data sources with an endpoint serving the funding information of all the markets override this method to get
+        it with a single request. By default the trading pairs are requested one by one, with a limited number of
+        concurrent requests.
+        """
+        requests_semaphore = asyncio.Semaphore(self.FUNDING_INFO_REQUESTS_MAX_CONCURRENCY)
+
+        async def get_pair_funding_info(trading_pair: str) -> FundingInfo:
+            async with requests_semaphore:
+                return await self.get_funding_info(trading_pair)
+
+        funding_infos = await safe_gather(*[get_pair_funding_info(trading_pair) for trading_pair in trading_pairs])
+        return {trading_pair: funding_info for trading_pair, funding_info in zip(trading_pairs, funding_infos)}
+
     async def listen_for_funding_info(self, output: asyncio.Queue):
         """
         Reads the funding info events queue and updates the local funding info information.
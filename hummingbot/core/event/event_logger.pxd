@@ -4,9 +4,20 @@ from .event_listener cimport EventListener
 cdef class EventLogger(EventListener):
     cdef:
         str _event_source
-        object _logged_events
+        object _capacity
+        object _time_window
+        bint _is_bounded
+        bint _track_aggregates
+        double _last_timestamp
+        dict _logged_events
         object _generic_logged_events
         object _order_filled_logged_events
         dict _waiting
         dict _wait_returns
+        dict _event_counts
+        dict _filled_volumes
+        dict _fee_totals
     cdef c_call(self, object event_object)
+    cdef c_log_event(self, object event_type, object event_object)
+    cdef c_trim_events(self, object events)
+    cdef c_aggregate_event(self, object event_type, object event_object)
@@ -1,38 +1,124 @@
 import asyncio
 from collections import deque
+from decimal import Decimal
 
 from async_timeout import timeout
 from typing import (
+    Dict,
     List,
     Optional,
+    Tuple,
 )
 
+from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
 
+s_decimal_0 = Decimal("0")
+
+
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    """
+    Keeps the events it receives, indexed by event class.
+
+    By default the logger keeps the 50 most recent events, and all the order filled events. In bounded mode, set by
+    a capacity and/or a time window, the logger keeps at most `capacity` events of each class, and the events of each
+    class whose timestamp is within `time_window` seconds of the most recent event timestamp received. Events without
+    a timestamp are only bounded by the capacity.
+
+    With `track_aggregates`, the logger also maintains running aggregates as the events arrive (number of events of
+    each class, filled volumes and fee totals of the order filled events) that cover every event received, including
+    the ones no longer kept.
+    """
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 capacity: Optional[int] = None,
+                 time_window: Optional[float] = None,
+                 track_aggregates: bool = False):
         super().__init__()
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"The capacity of the event logger must be positive ({capacity}).")
+        if time_window is not None and time_window <= 0:
+            raise ValueError(f"The time window of the event logger must be positive ({time_window}).")
         self._event_source = event_source
+        self._capacity = capacity
+        self._time_window = time_window
+        self._is_bounded = capacity is not None or time_window is not None
+        self._track_aggregates = track_aggregates
+        self._last_timestamp = float("-inf")
         # We limit the amount of events we keep reference to the most recent ones
         # But we keep all references to order fill events, because they are required for PnL calculation
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
+        self._order_filled_logged_events = deque(maxlen=capacity)
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
         self._waiting = {}
         self._wait_returns = {}
+        self._event_counts = {}
+        self._filled_volumes = {}
+        self._fee_totals = {}
 
     @property
     def event_log(self) -> List[any]:
-        return list(self._generic_logged_events) + list(self._order_filled_logged_events)
+        if not self._is_bounded:
+            return list(self._generic_logged_events) + list(self._order_filled_logged_events)
+        event_log = []
+        for events in self._logged_events.values():
+            self.c_trim_events(events)
+            event_log.extend(events)
+        return event_log
 
     @property
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def capacity(self) -> Optional[int]:
+        return self._capacity
+
+    @property
+    def time_window(self) -> Optional[float]:
+        return self._time_window
+
+    @property
+    def fee_totals(self) -> Dict[str, Decimal]:
+        """
+        The fees of all the order filled events received, by token. Percent fees are counted in the quote asset.
+        """
+        self._check_aggregates_tracked()
+        return dict(self._fee_totals)
+
+    def get_events(self, event_class: type) -> List[any]:
+        """
+        Returns the events of a class that are kept, in the order they were received.
+        """
+        events = self._logged_events.get(event_class)
+        if events is None:
+            return [event for event in self._generic_logged_events if type(event) is event_class]
+        self.c_trim_events(events)
+        return list(events)
+
+    def event_count(self, event_class: type) -> int:
+        """
+        Returns the number of events of a class received, including the ones no longer kept.
+        """
+        self._check_aggregates_tracked()
+        return self._event_counts.get(event_class, 0)
+
+    def filled_volume(self, trading_pair: str, trade_type: TradeType) -> Tuple[Decimal, Decimal]:
+        """
+        Returns the base and quote amounts of all the order filled events received for a trading pair and side.
+        """
+        self._check_aggregates_tracked()
+        return tuple(self._filled_volumes.get((trading_pair, trade_type), (s_decimal_0, s_decimal_0)))
+
     def clear(self):
         self._generic_logged_events.clear()
-        self._order_filled_logged_events.clear()
+        for events in self._logged_events.values():
+            events.clear()
+        self._last_timestamp = float("-inf")
+        self._event_counts.clear()
+        self._filled_volumes.clear()
+        self._fee_totals.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -50,9 +136,15 @@ cdef class EventLogger(EventListener):
     def __call__(self, event_object):
         self.c_call(event_object)
 
+    def _check_aggregates_tracked(self):
+        if not self._track_aggregates:
+            raise RuntimeError("The event logger does not track aggregates, create it with track_aggregates=True.")
+
     cdef c_call(self, object event_object):
-        self._logged_events.get(type(event_object), self._generic_logged_events).append(event_object)
         event_object_type = type(event_object)
+        self.c_log_event(event_object_type, event_object)
+        if self._track_aggregates:
+            self.c_aggregate_event(event_object_type, event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
@@ -61,3 +153,47 @@ cdef class EventLogger(EventListener):
                 self._wait_returns[notifier] = event_object
         for notifier in should_notify:
             notifier.set()
+
+    cdef c_log_event(self, object event_type, object event_object):
+        if not self._is_bounded:
+            self._logged_events.get(event_type, self._generic_logged_events).append(event_object)
+            return
+        events = self._logged_events.get(event_type)
+        if events is None:
+            events = deque(maxlen=self._capacity)
+            self._logged_events[event_type] = events
+        events.append(event_object)
+        if self._time_window is not None:
+            timestamp = getattr(event_object, "timestamp", None)
+            if timestamp is not None and timestamp > self._last_timestamp:
+                self._last_timestamp = timestamp
+            self.c_trim_events(events)
+
+    cdef c_trim_events(self, object events):
+        cdef:
+            double oldest_timestamp
+        if self._time_window is None:
+            return
+        oldest_timestamp = self._last_timestamp - self._time_window
+        while len(events) > 0 and getattr(events[0], "timestamp", oldest_timestamp) < oldest_timestamp:
+            events.popleft()
+
+    cdef c_aggregate_event(self, object event_type, object event_object):
+        self._event_counts[event_type] = self._event_counts.get(event_type, 0) + 1
+        if event_type is not OrderFilledEvent:
+            return
+        quote_amount = event_object.price * event_object.amount
+        key = (event_object.trading_pair, event_object.trade_type)
+        filled_volume = self._filled_volumes.get(key)
+        if filled_volume is None:
+            self._filled_volumes[key] = [event_object.amount, quote_amount]
+        else:
+            filled_volume[0] += event_object.amount
+            filled_volume[1] += quote_amount
+
+        trade_fee = event_object.trade_fee
+        if trade_fee.percent:
+            quote = event_object.trading_pair.split("-")[1]
+            self._fee_totals[quote] = self._fee_totals.get(quote, s_decimal_0) + quote_amount * trade_fee.percent
+        for flat_fee in trade_fee.flat_fees:
+            self._fee_totals[flat_fee.token] = self._fee_totals.get(flat_fee.token, s_decimal_0) + flat_fee.amount
@@ -10,6 +10,7 @@ from aiohttp import ContentTypeError
 
 from hummingbot.client.config.security import Security
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.web_assistant.connections.http_session_registry import HTTPSessionRegistry
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -78,16 +79,17 @@ class GatewayHttpClient:
     @classmethod
     def _http_client(cls, client_config_map: "ClientConfigAdapter", re_init: bool = False) -> aiohttp.ClientSession:
         """
-        :returns Shared client session instance
+        :returns Shared client session instance, taken from the process HTTP sessions registry
         """
-        if cls._shared_client is None or re_init:
+        session_registry = HTTPSessionRegistry.get_instance()
+        gateway_host = f"{client_config_map.gateway.gateway_api_host}:{client_config_map.gateway.gateway_api_port}"
+        if cls._shared_client is None or re_init or not session_registry.has_session(gateway_host):
             cert_path = client_config_map.certs_path
             ssl_ctx = ssl.create_default_context(cafile=f"{cert_path}/ca_cert.pem")
             ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
                                     keyfile=f"{cert_path}/client_key.pem",
                                     password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
-            cls._shared_client = aiohttp.ClientSession(connector=conn)
+            cls._shared_client = session_registry.get_session(gateway_host, ssl_context=ssl_ctx, recreate=True)
         return cls._shared_client
 
     @classmethod
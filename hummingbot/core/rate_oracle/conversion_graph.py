@@ -0,0 +1,155 @@
+from collections import deque
+from decimal import Decimal
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
+
+# A conversion step: the price entry to use, and whether the price has to be inverted
+ConversionStep = Tuple[str, bool]
+
+
+class ConversionGraph(dict):
+    """
+    Dictionary of trading pair prices that also maintains the token conversion graph the prices define.
+
+    Each price entry is an edge between its base and quote tokens, usable in both directions. The conversion route
+    between two tokens is found once with a breadth-first search limited to `max_hops` steps, and cached. The
+    following lookups only multiply the current prices along the cached route, so price updates don't invalidate the
+    routes. Only the addition or the removal of a trading pair changes the graph, and clears the cached routes.
+
+    The lookups follow the same rules as `hummingbot.core.rate_oracle.utils.find_rate`: a price entry for the pair
+    itself is used first, the wrapped tokens are unwrapped, and a token always converts to itself with a rate of 1.
+    """
+
+    def __init__(self, prices: Optional[Mapping[str, Decimal]] = None, max_hops: int = 2):
+        super().__init__()
+        self._max_hops = max_hops
+        self._edges: Dict[str, Dict[str, ConversionStep]] = {}
+        self._routes: Dict[Tuple[str, str], Optional[List[ConversionStep]]] = {}
+        if prices is not None:
+            self.update(prices)
+
+    @property
+    def max_hops(self) -> int:
+        return self._max_hops
+
+    @max_hops.setter
+    def max_hops(self, max_hops: int):
+        self._max_hops = max_hops
+        self._routes.clear()
+
+    def __setitem__(self, pair: str, price: Decimal):
+        if pair not in self:
+            self._add_edge(pair)
+        super().__setitem__(pair, price)
+
+    def __delitem__(self, pair: str):
+        super().__delitem__(pair)
+        self._rebuild()
+
+    def update(self, *args, **kwargs):
+        new_prices = dict(*args, **kwargs)
+        for pair in new_prices:
+            if pair not in self:
+                self._add_edge(pair)
+        super().update(new_prices)
+
+    def pop(self, pair: str, *args):
+        price = super().pop(pair, *args)
+        self._rebuild()
+        return price
+
+    def popitem(self):
+        item = super().popitem()
+        self._rebuild()
+        return item
+
+    def setdefault(self, pair: str, default: Optional[Decimal] = None):
+        if pair not in self:
+            self[pair] = default
+        return self[pair]
+
+    def clear(self):
+        super().clear()
+        self._edges.clear()
+        self._routes.clear()
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the conversion rate for a trading pair, directly or through the intermediate tokens of the graph.
+
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return: The conversion rate, or None if there is no route between the tokens of the pair
+        """
+        price = self.get(pair)
+        if price is not None:
+            return price
+        route = self.route(pair)
+        if route is None:
+            return None
+        rate = Decimal("1")
+        for step_pair, inverted in route:
+            step_price = dict.__getitem__(self, step_pair)
+            rate = rate / step_price if inverted else rate * step_price
+        return rate
+
+    def route(self, pair: str) -> Optional[List[ConversionStep]]:
+        """
+        Returns the conversion steps from the base to the quote token of the pair, or None if there is no route.
+        """
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        key = (unwrap_token_symbol(base), unwrap_token_symbol(quote))
+        if key in self._routes:
+            return self._routes[key]
+        route = self._find_route(*key)
+        self._routes[key] = route
+        return route
+
+    def _find_route(self, base: str, quote: str) -> Optional[List[ConversionStep]]:
+        if base == quote:
+            return []
+        if base not in self._edges or quote not in self._edges:
+            return None
+        previous_steps: Dict[str, Tuple[str, ConversionStep]] = {base: (base, ("", False))}
+        tokens_to_visit = deque([(base, 0)])
+        while len(tokens_to_visit) > 0:
+            token, hops = tokens_to_visit.popleft()
+            if hops == self._max_hops:
+                continue
+            for next_token, step in self._edges[token].items():
+                if next_token in previous_steps:
+                    continue
+                previous_steps[next_token] = (token, step)
+                if next_token == quote:
+                    return self._unwind_route(previous_steps, base, quote)
+                tokens_to_visit.append((next_token, hops + 1))
+        return None
+
+    @staticmethod
+    def _unwind_route(
+        previous_steps: Dict[str, Tuple[str, ConversionStep]], base: str, quote: str
+    ) -> List[ConversionStep]:
+        route = []
+        token = quote
+        while token != base:
+            token, step = previous_steps[token]
+            route.append(step)
+        route.reverse()
+        return route
+
+    def _add_edge(self, pair: str):
+        try:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+        except ValueError:
+            return
+        # Keep the first price entry linking two tokens, like the reverse pair lookup of find_rate
+        self._edges.setdefault(base, {}).setdefault(quote, (pair, False))
+        self._edges.setdefault(quote, {}).setdefault(base, (pair, True))
+        self._routes.clear()
+
+    def _rebuild(self):
+        self._edges.clear()
+        self._routes.clear()
+        for pair in self.keys():
+            self._add_edge(pair)
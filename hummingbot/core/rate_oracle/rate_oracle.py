@@ -7,6 +7,7 @@ import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.rate_oracle.conversion_graph import ConversionGraph
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 from hummingbot.core.rate_oracle.sources.binance_us_rate_source import BinanceUSRateSource
@@ -47,6 +48,9 @@ class RateOracle(NetworkBase):
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
     The find_rate is then used on these prices to find a rate on a given pair.
+
+    The stored prices are kept in a `ConversionGraph`, updated incrementally with each batch of new prices, so that
+    `get_pair_rate` finds the conversion route of a pair once and then only multiplies the prices along it.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -63,10 +67,12 @@ class RateOracle(NetworkBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
+    def __init__(
+        self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None, max_hops: int = 2
+    ):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        self._conversion_graph = ConversionGraph(max_hops=max_hops)
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -107,7 +113,18 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
-            self._prices = {}
+            self._conversion_graph.clear()
+
+    @property
+    def max_hops(self) -> int:
+        """
+        Maximum number of price entries used to convert a token into another one
+        """
+        return self._conversion_graph.max_hops
+
+    @max_hops.setter
+    def max_hops(self, max_hops: int):
+        self._conversion_graph.max_hops = max_hops
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -116,6 +133,14 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def _prices(self) -> ConversionGraph:
+        return self._conversion_graph
+
+    @_prices.setter
+    def _prices(self, prices: Dict[str, Decimal]):
+        self._conversion_graph = ConversionGraph(prices, max_hops=self._conversion_graph.max_hops)
+
     async def start_network(self):
         await self.stop_network()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
@@ -167,7 +192,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._conversion_graph.rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -199,15 +224,15 @@ class RateOracle(NetworkBase):
         """
         Update keys in self._prices with new prices
         """
-        self._prices[pair] = price
+        self._conversion_graph[pair] = price
 
     async def _fetch_price_loop(self):
         while True:
             try:
                 new_prices = await self._source.get_prices(quote_token=self._quote_token)
-                self._prices.update(new_prices)
+                self._conversion_graph.update(new_prices)
 
-                if self._prices:
+                if self._conversion_graph:
                     self._ready_event.set()
             except asyncio.CancelledError:
                 raise
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.logger import HummingbotLogger
+
+elm_logger = None
+
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, float("inf"))
+
+
+class LatencyHistogram:
+    """
+    Cumulative latency histogram with fixed buckets, plus a window of the latest samples for the percentiles.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS, max_samples: int = 1000):
+        self.buckets = buckets
+        self.counts: List[int] = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self._samples.append(value)
+
+    def percentiles(self, percentiles: Tuple[int, ...] = (50, 99)) -> List[float]:
+        if len(self._samples) == 0:
+            return [0.0] * len(percentiles)
+        samples = np.fromiter(self._samples, dtype=float, count=len(self._samples))
+        return [float(value) for value in np.percentile(samples, percentiles)]
+
+
+class SlowCallback(NamedTuple):
+    timestamp: float
+    duration: float
+    description: str
+    stack: Optional[str]
+
+
+class EventLoopMonitor:
+    """
+    Monitors the health of the event loop all the bot components share.
+
+    - The clock reports how late each tick starts compared to the wall time, and how long the tick takes.
+    - A probe task measures how late the loop wakes it up, which is the latency every other task suffers.
+    - The callbacks run by the loop are timed, and those running longer than `slow_callback_threshold` are logged with
+      the coroutine they belong to.
+    - Optionally, a thread samples the stack of the loop thread while a callback runs, to attribute the blocking time
+      to the modules doing the work and to capture the stack of the slow callbacks.
+
+    The monitor is disabled by default, and the clock only checks the `enabled` flag in that case.
+    """
+    PROBE_INTERVAL = 0.25
+    SUMMARY_LOG_INTERVAL = 900.0
+    MAX_SLOW_CALLBACKS = 100
+    STACK_LIMIT = 20
+
+    _shared_instance: Optional["EventLoopMonitor"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global elm_logger
+        if elm_logger is None:
+            elm_logger = logging.getLogger(__name__)
+        return elm_logger
+
+    @classmethod
+    def get_instance(cls) -> "EventLoopMonitor":
+        if cls._shared_instance is None:
+            cls._shared_instance = EventLoopMonitor()
+        return cls._shared_instance
+
+    def __init__(self,
+                 slow_callback_threshold: float = 0.1,
+                 stack_sampling_enabled: bool = False,
+                 stack_sampling_interval: float = 0.01,
+                 probe_interval: float = PROBE_INTERVAL):
+        self.enabled = False
+        self.slow_callback_threshold = slow_callback_threshold
+        self.stack_sampling_enabled = stack_sampling_enabled
+        self.stack_sampling_interval = stack_sampling_interval
+        self._probe_interval = probe_interval
+        self.tick_lag = LatencyHistogram()
+        self.tick_duration = LatencyHistogram()
+        self.loop_lag = LatencyHistogram()
+        self.callback_duration = LatencyHistogram()
+        self.slow_callbacks: Deque[SlowCallback] = deque(maxlen=self.MAX_SLOW_CALLBACKS)
+        self.blocking_time_by_module: Dict[str, float] = {}
+        self._original_handle_run = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._sampling_thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+        self._callback_start: Optional[float] = None
+        self._callback_stack: Optional[str] = None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        if self.enabled:
+            return
+        loop = loop or asyncio.get_event_loop()
+        self.enabled = True
+        self._loop_thread_id = threading.get_ident()
+        self._install_callback_timer()
+        self._probe_task = loop.create_task(self._probe_loop())
+        if self.stack_sampling_enabled:
+            self._sampling_thread = threading.Thread(
+                target=self._sample_stacks, name="event_loop_stack_sampler", daemon=True)
+            self._sampling_thread.start()
+
+    def stop(self):
+        self.enabled = False
+        self._uninstall_callback_timer()
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        # The sampling thread exits on its own once the monitor is disabled
+        self._sampling_thread = None
+
+    def reset(self):
+        self.tick_lag = LatencyHistogram()
+        self.tick_duration = LatencyHistogram()
+        self.loop_lag = LatencyHistogram()
+        self.callback_duration = LatencyHistogram()
+        self.slow_callbacks.clear()
+        self.blocking_time_by_module.clear()
+
+    def record_tick(self, lag: float, duration: float):
+        """
+        Called by the clock after each tick.
+
+        :param lag: time between the scheduled tick time and the moment the clock woke up
+        :param duration: time spent running the tick of all the clock iterators
+        """
+        self.tick_lag.add(max(lag, 0.0))
+        self.tick_duration.add(duration)
+        if duration > self.slow_callback_threshold:
+            self._record_slow_callback(duration, "Clock tick")
+
+    def format_status(self) -> str:
+        lines = ["  Event loop health:"]
+        for name, histogram in (("Clock tick lag", self.tick_lag),
+                                ("Clock tick duration", self.tick_duration),
+                                ("Loop wake-up lag", self.loop_lag),
+                                ("Callback duration", self.callback_duration)):
+            p50, p99 = histogram.percentiles()
+            lines.append(f"    {name}: p50 {p50 * 1e3:.2f} ms, p99 {p99 * 1e3:.2f} ms, max {histogram.max * 1e3:.2f} ms "
+                         f"({histogram.count} samples)")
+        if len(self.slow_callbacks) > 0:
+            lines.append(f"    Slow callbacks (over {self.slow_callback_threshold * 1e3:.0f} ms, latest first):")
+            for slow_callback in list(reversed(self.slow_callbacks))[:5]:
+                lines.append(f"      {time.strftime('%H:%M:%S', time.localtime(slow_callback.timestamp))} "
+                             f"{slow_callback.duration * 1e3:.1f} ms - {slow_callback.description}")
+        if len(self.blocking_time_by_module) > 0:
+            lines.append("    Blocking time by module:")
+            top_modules = sorted(list(self.blocking_time_by_module.items()), key=lambda item: item[1], reverse=True)[:5]
+            for module, blocking_time in top_modules:
+                lines.append(f"      {module}: {blocking_time:.2f} s")
+        return "\n".join(lines)
+
+    async def _probe_loop(self):
+        next_summary_time = time.perf_counter() + self.SUMMARY_LOG_INTERVAL
+        while True:
+            expected_time = time.perf_counter() + self._probe_interval
+            await asyncio.sleep(self._probe_interval)
+            now = time.perf_counter()
+            self.loop_lag.add(max(now - expected_time, 0.0))
+            if now >= next_summary_time:
+                next_summary_time = now + self.SUMMARY_LOG_INTERVAL
+                self.logger().info(f"\n{self.format_status()}")
+
+    def _install_callback_timer(self):
+        if self._original_handle_run is not None:
+            return
+        original_run = asyncio.events.Handle._run
+        monitor = self
+
+        def timed_run(handle):
+            if threading.get_ident() != monitor._loop_thread_id:
+                return original_run(handle)
+            start = time.perf_counter()
+            monitor._callback_start = start
+            monitor._callback_stack = None
+            try:
+                return original_run(handle)
+            finally:
+                duration = time.perf_counter() - start
+                monitor._callback_start = None
+                monitor.callback_duration.add(duration)
+                if duration > monitor.slow_callback_threshold:
+                    monitor._record_slow_callback(duration, monitor._describe_callback(handle), monitor._callback_stack)
+
+        self._original_handle_run = original_run
+        asyncio.events.Handle._run = timed_run
+
+    def _uninstall_callback_timer(self):
+        if self._original_handle_run is not None:
+            asyncio.events.Handle._run = self._original_handle_run
+            self._original_handle_run = None
+
+    def _record_slow_callback(self, duration: float, description: str, stack: Optional[str] = None):
+        self.slow_callbacks.append(SlowCallback(timestamp=time.time(), duration=duration, description=description,
+                                                stack=stack))
+        message = f"Event loop blocked for {duration * 1e3:.1f} ms by {description}."
+        if stack is not None:
+            message += f" Stack:\n{stack}"
+        self.logger().warning(message)
+
+    @staticmethod
+    def _describe_callback(handle: asyncio.Handle) -> str:
+        callback = handle._callback
+        task = getattr(callback, "__self__", None)
+        if isinstance(task, asyncio.Task):
+            coro = task.get_coro()
+            description = f"task {task.get_name()} running {getattr(coro, '__qualname__', repr(coro))}"
+            frame = getattr(coro, "cr_frame", None)
+            if frame is not None:
+                description += f" (suspended at {frame.f_code.co_filename}:{frame.f_lineno})"
+            return description
+        return f"callback {getattr(callback, '__qualname__', repr(callback))}"
+
+    def _sample_stacks(self):
+        while self.enabled:
+            time.sleep(self.stack_sampling_interval)
+            callback_start = self._callback_start
+            if callback_start is None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            module = frame.f_globals.get("__name__", "<unknown>")
+            self.blocking_time_by_module[module] = (
+                self.blocking_time_by_module.get(module, 0.0) + self.stack_sampling_interval)
+            if (self._callback_stack is None
+                    and time.perf_counter() - callback_start > self.slow_callback_threshold):
+                self._callback_stack = "".join(traceback.format_stack(frame, limit=self.STACK_LIMIT))
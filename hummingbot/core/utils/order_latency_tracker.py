@@ -0,0 +1,249 @@
+import logging
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar, Token
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from aiohttp import web
+
+from hummingbot.logger import HummingbotLogger
+
+olt_logger = None
+
+CREATE_REQUEST = "create"
+CANCEL_REQUEST = "cancel"
+
+# Lifecycle stages, in the order they usually happen
+REQUESTED = "requested"
+TASK_STARTED = "task_started"
+RATE_LIMIT_ACQUIRED = "rate_limit_acquired"
+REQUEST_SIGNED = "request_signed"
+RESPONSE_RECEIVED = "response_received"
+ACKNOWLEDGED = "acknowledged"
+FIRST_FILL = "first_fill"
+FILLED = "filled"
+CANCEL_CONFIRMED = "cancel_confirmed"
+FAILED = "failed"
+
+TERMINAL_STAGES = frozenset([FILLED, CANCEL_CONFIRMED, FAILED])
+
+
+class OrderLatencyTrace:
+    __slots__ = ("connector_name", "request_type", "client_order_id", "start_time", "last_time", "stages")
+
+    def __init__(self, connector_name: str, request_type: str, client_order_id: str, start_time: float):
+        self.connector_name = connector_name
+        self.request_type = request_type
+        self.client_order_id = client_order_id
+        self.start_time = start_time
+        self.last_time = start_time
+        self.stages: List[Tuple[str, float]] = [(REQUESTED, start_time)]
+
+
+class OrderLatencyStats(NamedTuple):
+    """
+    Latency percentiles of a lifecycle stage, in seconds.
+
+    - stage_*: time since the previous stage of the same request
+    - elapsed_p50: median time since the request was issued
+    """
+    connector_name: str
+    request_type: str
+    stage: str
+    count: int
+    stage_p50: float
+    stage_p90: float
+    stage_p99: float
+    stage_max: float
+    elapsed_p50: float
+
+
+_current_trace: ContextVar[Optional[OrderLatencyTrace]] = ContextVar("order_latency_trace", default=None)
+
+
+class OrderLatencyTracker:
+    """
+    Timestamps the stages of the orders lifecycle (creation request, rate limit wait, request signing, HTTP round
+    trip, acknowledgement and fills) per client order ID, and aggregates the time spent in each stage per connector and
+    request type.
+
+    The stages happening inside the order creation or cancelation task (rate limiter, signing, HTTP request) are
+    attributed to the order through a context variable, so the throttler and the REST assistant don't need to know
+    the order they are working for. The tracker is disabled by default, and the instrumented code only checks the
+    `enabled` flag in that case.
+    """
+    MAX_ACTIVE_TRACES = 1000
+    MAX_SAMPLES = 1000
+    PERCENTILES = (50, 90, 99)
+
+    _shared_instance: Optional["OrderLatencyTracker"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global olt_logger
+        if olt_logger is None:
+            olt_logger = logging.getLogger(__name__)
+        return olt_logger
+
+    @classmethod
+    def get_instance(cls) -> "OrderLatencyTracker":
+        if cls._shared_instance is None:
+            cls._shared_instance = OrderLatencyTracker()
+        return cls._shared_instance
+
+    def __init__(self, max_active_traces: int = MAX_ACTIVE_TRACES, max_samples: int = MAX_SAMPLES):
+        self.enabled = False
+        self._max_active_traces = max_active_traces
+        self._max_samples = max_samples
+        self._traces: "OrderedDict[Tuple[str, str], OrderLatencyTrace]" = OrderedDict()
+        self._stage_samples: Dict[Tuple[str, str, str], Deque[float]] = {}
+        self._elapsed_samples: Dict[Tuple[str, str, str], Deque[float]] = {}
+        self._metrics_runner: Optional[web.AppRunner] = None
+
+    def start(self):
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        self._traces.clear()
+
+    def reset(self):
+        self._traces.clear()
+        self._stage_samples.clear()
+        self._elapsed_samples.clear()
+
+    def start_trace(self, connector_name: str, request_type: str, client_order_id: str) -> OrderLatencyTrace:
+        trace = OrderLatencyTrace(
+            connector_name=connector_name,
+            request_type=request_type,
+            client_order_id=client_order_id,
+            start_time=time.perf_counter(),
+        )
+        key = (request_type, client_order_id)
+        self._traces[key] = trace
+        self._traces.move_to_end(key)
+        if len(self._traces) > self._max_active_traces:
+            self._traces.popitem(last=False)
+        return trace
+
+    def activate_trace(
+            self, request_type: str, client_order_id: str, stage: Optional[str] = TASK_STARTED) -> Optional[Token]:
+        """
+        Makes the request trace the current one for the running task, so that the stages recorded with `record_stage`
+        are attributed to it.
+
+        :param stage: the stage to record when the trace is activated, if any
+        :return: the token to restore the previous trace with `deactivate_trace`, or None if the request is not traced
+        """
+        trace = self._traces.get((request_type, client_order_id))
+        if trace is None:
+            return None
+        if stage is not None:
+            self._record(trace, stage)
+        return _current_trace.set(trace)
+
+    @staticmethod
+    def deactivate_trace(token: Optional[Token]):
+        if token is not None:
+            _current_trace.reset(token)
+
+    def record_stage(self, stage: str):
+        """
+        Records a stage of the request being processed by the current task, if it is traced.
+        """
+        trace = _current_trace.get()
+        if trace is not None:
+            self._record(trace, stage)
+
+    def record_order_stage(self, request_type: str, client_order_id: str, stage: str):
+        """
+        Records a stage of a request processed outside its own task (e.g. a state change from the user stream).
+        """
+        trace = self._traces.get((request_type, client_order_id))
+        if trace is not None:
+            self._record(trace, stage)
+
+    def discard_trace(self, request_type: str, client_order_id: str):
+        self._traces.pop((request_type, client_order_id), None)
+
+    def stats(self) -> List[OrderLatencyStats]:
+        stats = []
+        for key, stage_samples in self._stage_samples.items():
+            if len(stage_samples) == 0:
+                continue
+            stage_array = np.fromiter(stage_samples, dtype=float, count=len(stage_samples))
+            p50, p90, p99 = np.percentile(stage_array, self.PERCENTILES)
+            elapsed_samples = self._elapsed_samples[key]
+            elapsed_p50 = float(np.percentile(np.fromiter(elapsed_samples, dtype=float, count=len(elapsed_samples)), 50))
+            connector_name, request_type, stage = key
+            stats.append(OrderLatencyStats(
+                connector_name=connector_name,
+                request_type=request_type,
+                stage=stage,
+                count=len(stage_samples),
+                stage_p50=float(p50),
+                stage_p90=float(p90),
+                stage_p99=float(p99),
+                stage_max=float(stage_array.max()),
+                elapsed_p50=elapsed_p50,
+            ))
+        return stats
+
+    def prometheus_text(self) -> str:
+        """
+        Renders the stages latencies in the Prometheus text exposition format, as a summary per stage.
+        """
+        lines = [
+            "# HELP hummingbot_order_stage_latency_seconds Time spent in each stage of the orders lifecycle.",
+            "# TYPE hummingbot_order_stage_latency_seconds summary",
+        ]
+        for key, stage_samples in self._stage_samples.items():
+            if len(stage_samples) == 0:
+                continue
+            connector_name, request_type, stage = key
+            labels = f'connector="{connector_name}",request="{request_type}",stage="{stage}"'
+            stage_array = np.fromiter(stage_samples, dtype=float, count=len(stage_samples))
+            for percentile, value in zip(self.PERCENTILES, np.percentile(stage_array, self.PERCENTILES)):
+                lines.append(
+                    f'hummingbot_order_stage_latency_seconds{{{labels},quantile="{percentile / 100}"}} {value:.6f}')
+            lines.append(f"hummingbot_order_stage_latency_seconds_sum{{{labels}}} {stage_array.sum():.6f}")
+            lines.append(f"hummingbot_order_stage_latency_seconds_count{{{labels}}} {len(stage_array)}")
+        return "\n".join(lines) + "\n"
+
+    async def start_metrics_server(self, host: str = "127.0.0.1", port: int = 9091):
+        """
+        Serves the latency metrics at http://<host>:<port>/metrics in the Prometheus text format.
+        """
+        if self._metrics_runner is not None:
+            return
+
+        async def metrics_handler(_):
+            return web.Response(text=self.prometheus_text(), content_type="text/plain", charset="utf-8")
+
+        app = web.Application()
+        app.router.add_get("/metrics", metrics_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        self._metrics_runner = runner
+        self.logger().info(f"Serving the orders latency metrics at http://{host}:{port}/metrics")
+
+    async def stop_metrics_server(self):
+        if self._metrics_runner is not None:
+            runner, self._metrics_runner = self._metrics_runner, None
+            await runner.cleanup()
+
+    def _record(self, trace: OrderLatencyTrace, stage: str):
+        now = time.perf_counter()
+        key = (trace.connector_name, trace.request_type, stage)
+        stage_samples = self._stage_samples.get(key)
+        if stage_samples is None:
+            stage_samples = self._stage_samples[key] = deque(maxlen=self._max_samples)
+            self._elapsed_samples[key] = deque(maxlen=self._max_samples)
+        stage_samples.append(now - trace.last_time)
+        self._elapsed_samples[key].append(now - trace.start_time)
+        trace.last_time = now
+        trace.stages.append((stage, now))
+        if stage in TERMINAL_STAGES:
+            self._traces.pop((trace.request_type, trace.client_order_id), None)
@@ -1,18 +1,37 @@
+import asyncio
+import json
 import logging
+import os
+import tempfile
+import time
+from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
 from ...client.config.security import Security
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
+
+TRADING_PAIRS_CATALOG_FILE_NAME = "trading_pairs_catalog.json"
 
 
 class TradingPairFetcher:
+    """
+    Collects the trading pairs offered by each connector, used for autocompletion and trading pair validation.
+
+    When a catalog path is configured, fetched pairs are persisted to an on-disk catalog. At startup the catalog is
+    loaded immediately, and only the connectors whose entries are missing or older than `CATALOG_TTL` are refreshed
+    in the background. At most `MAX_CONCURRENT_FETCHES` connectors are queried at the same time.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    CATALOG_TTL = 60 * 60 * 24  # seconds
+    MAX_CONCURRENT_FETCHES = 8
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -20,64 +39,146 @@ class TradingPairFetcher:
         return cls._tpf_logger
 
     @classmethod
-    def get_instance(cls, client_config_map: Optional["ClientConfigAdapter"] = None) -> "TradingPairFetcher":
+    def get_instance(
+            cls,
+            client_config_map: Optional["ClientConfigAdapter"] = None,
+            catalog_path: Optional[Path] = None,
+    ) -> "TradingPairFetcher":
         if cls._sf_shared_instance is None:
             client_config_map = client_config_map or cls._get_client_config_map()
-            cls._sf_shared_instance = TradingPairFetcher(client_config_map)
+            cls._sf_shared_instance = TradingPairFetcher(client_config_map, catalog_path=catalog_path)
         return cls._sf_shared_instance
 
-    def __init__(self, client_config_map: ClientConfigAdapter):
+    @staticmethod
+    def default_catalog_path() -> Path:
+        return Path(data_path()) / TRADING_PAIRS_CATALOG_FILE_NAME
+
+    def __init__(self, client_config_map: ClientConfigAdapter, catalog_path: Optional[Path] = None):
+        """
+        :param client_config_map: the client configuration
+        :param catalog_path: the file used to persist the fetched trading pairs. No catalog is used if not specified
+        """
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
+        self._catalog_path: Optional[Path] = catalog_path
+        self._catalog_timestamps: Dict[str, float] = {}
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        self._fetch_lock = asyncio.Lock()
+        self._load_catalog()
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
-    def _fetch_pairs_from_connector_setting(
+    async def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
-        connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        async with self._fetch_semaphore:
+            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+            # data source module for them.
+            try:
+                connector = connector_setting.non_trading_connector_instance_with_default_configuration()
+            except ModuleNotFoundError:
+                return
+            except Exception:
+                self.logger().exception(f"An error occurred when fetching trading pairs for {connector_name}."
+                                        "Please check the logs")
+                return
+            await self.call_fetch_pairs(connector.all_trading_pairs(), connector_name)
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         await Security.wait_til_decryption_done()
+        # Serialized, so that a refresh requested after connecting a new exchange does not overlap the startup one
+        async with self._fetch_lock:
+            fetch_tasks = [
+                self._fetch_pairs_from_connector_setting(connector_setting=source_setting, connector_name=name)
+                for name, source_setting in self._connector_settings_to_fetch().items()
+                if not self._is_catalog_entry_fresh(name)
+            ]
+            if len(fetch_tasks) > 0:
+                await safe_gather(*fetch_tasks, return_exceptions=True)
+                self._save_catalog()
+        self.ready = True
+
+    def _connector_settings_to_fetch(self) -> Dict[str, ConnectorSetting]:
+        """
+        Returns the connector settings to fetch the trading pairs from, mapped by the name the pairs are stored with
+        (paper trade connectors use the pairs of their parent connector).
+        """
         connector_settings = self._all_connector_settings()
+        settings_to_fetch = {}
         for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                elif not self.fetch_pairs_from_all_exchanges:
-                    if conn_setting.connector_connected():
-                        self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
+                    settings_to_fetch[conn_setting.name] = connector_settings[conn_setting.parent_name]
+                elif self.fetch_pairs_from_all_exchanges or conn_setting.connector_connected():
+                    settings_to_fetch[conn_setting.name] = conn_setting
             except Exception:
                 self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
                                         "Please check the logs")
-        self.ready = True
+        return settings_to_fetch
 
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            self._catalog_timestamps[exchange_name] = self._time()
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep the cataloged pairs (if any), this is st. the bot won't stop working
+            self.trading_pairs.setdefault(exchange_name, [])
+
+    def _is_catalog_entry_fresh(self, exchange_name: str) -> bool:
+        timestamp = self._catalog_timestamps.get(exchange_name)
+        return timestamp is not None and self._time() - timestamp < self.CATALOG_TTL
+
+    def _load_catalog(self):
+        if self._catalog_path is None or not self._catalog_path.exists():
+            return
+        try:
+            with open(self._catalog_path, "r") as catalog_file:
+                catalog = json.load(catalog_file)
+            # Entries of connectors that are no longer connected are not offered for autocompletion
+            connector_names = self._connector_settings_to_fetch().keys()
+            for exchange_name, entry in catalog.items():
+                if exchange_name in connector_names:
+                    self.trading_pairs[exchange_name] = list(entry["trading_pairs"])
+                    self._catalog_timestamps[exchange_name] = float(entry["timestamp"])
+        except Exception:
+            self.logger().warning(f"Could not load the trading pairs catalog from {self._catalog_path}. "
+                                  f"Trading pairs will be fetched from the exchanges.", exc_info=True)
+            self.trading_pairs.clear()
+            self._catalog_timestamps.clear()
+
+    def _save_catalog(self):
+        if self._catalog_path is None:
+            return
+        catalog = {
+            exchange_name: {
+                "timestamp": timestamp,
+                "trading_pairs": list(self.trading_pairs.get(exchange_name, [])),
+            }
+            for exchange_name, timestamp in self._catalog_timestamps.items()
+        }
+        try:
+            self._catalog_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    mode="w", dir=self._catalog_path.parent, prefix=f"{self._catalog_path.name}.", suffix=".tmp",
+                    delete=False) as catalog_file:
+                json.dump(catalog, catalog_file)
+            os.replace(catalog_file.name, self._catalog_path)
+        except Exception:
+            self.logger().warning(f"Could not save the trading pairs catalog to {self._catalog_path}.", exc_info=True)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
 
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
     @staticmethod
     def _get_client_config_map() -> "ClientConfigAdapter":
         from hummingbot.client.hummingbot_application import HummingbotApplication
@@ -2,6 +2,10 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.http_session_registry import (
+    WEBSOCKETS_SESSION_KEY,
+    HTTPSessionRegistry,
+)
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -16,17 +20,19 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    The sessions are taken from the process-wide `HTTPSessionRegistry`, so that all the factories reuse the same
+    connections pools.
     """
 
-    def __init__(self):
+    def __init__(self, session_registry: Optional[HTTPSessionRegistry] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._session_registry = session_registry or HTTPSessionRegistry.get_instance()
 
     async def get_rest_connection(self) -> RESTConnection:
-        shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(session_registry=self._session_registry)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
@@ -35,5 +41,4 @@ class ConnectionsFactory:
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
-        return self._shared_client
+        return self._session_registry.get_session(WEBSOCKETS_SESSION_KEY)
@@ -0,0 +1,199 @@
+import asyncio
+import ssl
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+DEFAULT_SESSION_KEY = "*"
+WEBSOCKETS_SESSION_KEY = "websockets"
+
+
+class HTTPSessionConfig(NamedTuple):
+    """
+    Configuration of the connections pool of a host.
+
+    - limit: maximum number of simultaneous connections (0 means no limit)
+    - limit_per_host: maximum number of simultaneous connections to the same endpoint (0 means no limit)
+    - keepalive_timeout: seconds an idle connection is kept open to be reused by the next request
+    - ttl_dns_cache: seconds the resolved addresses are cached
+    """
+    limit: int = 0
+    limit_per_host: int = 100
+    keepalive_timeout: float = 60.0
+    ttl_dns_cache: int = 300
+
+
+class HTTPSessionMetrics:
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    @property
+    def connections_reuse_ratio(self) -> float:
+        total_connections = self.connections_created + self.connections_reused
+        return self.connections_reused / total_connections if total_connections > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connections_reuse_ratio": self.connections_reuse_ratio,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+
+class HTTPSessionRegistry:
+    """
+    Process-wide registry of the aiohttp sessions used for HTTP requests.
+
+    Sessions are shared by all the components of the process and are keyed by host, so that all the requests to a host
+    draw from the same connections pool (keeping the TCP and TLS connections alive between requests) and the pool
+    limits can be configured per host. Hosts without a specific configuration share the default session.
+    Sessions are bound to the event loop they were created in, and are recreated if used from a different loop.
+    """
+    _shared_instance: Optional["HTTPSessionRegistry"] = None
+
+    @classmethod
+    def get_instance(cls) -> "HTTPSessionRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = HTTPSessionRegistry()
+        return cls._shared_instance
+
+    def __init__(self, default_config: Optional[HTTPSessionConfig] = None):
+        self._default_config = default_config or HTTPSessionConfig()
+        # Websocket connections are long lived, they use their own session to never hold the REST connections slots
+        self._host_configs: Dict[str, HTTPSessionConfig] = {
+            WEBSOCKETS_SESSION_KEY: HTTPSessionConfig(limit=0, limit_per_host=0),
+        }
+        self._dedicated_hosts: Set[str] = set()
+        self._sessions: Dict[str, Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]] = {}
+        self._metrics: Dict[str, HTTPSessionMetrics] = {}
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the requests and connections reuse metrics of each session, keyed by host
+        """
+        return {key: metrics.to_dict() for key, metrics in self._metrics.items()}
+
+    def configure_host(self, host: str, config: HTTPSessionConfig):
+        """
+        Sets the connections pool configuration for a host. Requests to the host will use their own session, created
+        with the new configuration the next time a session is requested.
+        """
+        self._host_configs[host] = config
+        self._discard_session(host)
+
+    def has_session(self, url: Optional[str] = None) -> bool:
+        key = self._session_key(url)
+        return key in self._sessions and self._is_session_usable(*self._sessions[key])
+
+    def get_session(
+            self,
+            url: Optional[str] = None,
+            ssl_context: Optional[ssl.SSLContext] = None,
+            recreate: bool = False) -> aiohttp.ClientSession:
+        """
+        Returns the session to use for requests to the URL host.
+
+        :param url: the URL (or host) the session will be used for. The default session is returned if not specified
+        :param ssl_context: SSL context for the connections of a new session (e.g. to use client certificates).
+            Providing an SSL context gives the host its own session
+        :param recreate: closes the current session of the host and creates a new one
+        """
+        if ssl_context is not None:
+            self._dedicated_hosts.add(self._host(url))
+        key = self._session_key(url)
+        session_and_loop = self._sessions.get(key)
+        if session_and_loop is not None and (recreate or not self._is_session_usable(*session_and_loop)):
+            self._discard_session(key)
+            session_and_loop = None
+        if session_and_loop is None:
+            session = self._create_session(key=key, ssl_context=ssl_context)
+            session_and_loop = (session, asyncio.get_event_loop())
+            self._sessions[key] = session_and_loop
+        return session_and_loop[0]
+
+    async def close(self):
+        sessions = [session for session, _ in self._sessions.values()]
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def _session_key(self, url: Optional[str]) -> str:
+        host = self._host(url)
+        if host in self._host_configs or host in self._dedicated_hosts:
+            return host
+        return DEFAULT_SESSION_KEY
+
+    @staticmethod
+    def _host(url: Optional[str]) -> str:
+        if url is None:
+            return DEFAULT_SESSION_KEY
+        return urlsplit(url).netloc if "//" in url else url
+
+    def _create_session(self, key: str, ssl_context: Optional[ssl.SSLContext]) -> aiohttp.ClientSession:
+        config = self._host_configs.get(key, self._default_config)
+        connector_kwargs = {}
+        if ssl_context is not None:
+            connector_kwargs["ssl"] = ssl_context
+        connector = aiohttp.TCPConnector(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            keepalive_timeout=config.keepalive_timeout,
+            ttl_dns_cache=config.ttl_dns_cache,
+            **connector_kwargs,
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config(key)])
+
+    def _trace_config(self, key: str) -> aiohttp.TraceConfig:
+        metrics = self._metrics.setdefault(key, HTTPSessionMetrics())
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(*_):
+            metrics.requests += 1
+
+        async def on_connection_create_end(*_):
+            metrics.connections_created += 1
+
+        async def on_connection_reuseconn(*_):
+            metrics.connections_reused += 1
+
+        async def on_dns_cache_hit(*_):
+            metrics.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(*_):
+            metrics.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    @staticmethod
+    def _is_session_usable(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop) -> bool:
+        if session.closed or loop.is_closed():
+            return False
+        try:
+            return asyncio.get_event_loop() is loop
+        except RuntimeError:
+            return False
+
+    def _discard_session(self, key: str):
+        session_and_loop = self._sessions.pop(key, None)
+        if session_and_loop is None:
+            return
+        session, loop = session_and_loop
+        # A session can only be closed from its own event loop
+        if not session.closed and loop.is_running():
+            loop.create_task(session.close())
@@ -0,0 +1,93 @@
+import json
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecoder = Callable[[Union[str, bytes]], Any]
+
+
+def _fast_json_loads(data: Union[str, bytes]) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson rejects a few documents the standard library accepts (e.g. integers above 64 bits or NaN values)
+        return json.loads(data)
+
+
+DEFAULT_JSON_DECODER: JSONDecoder = _fast_json_loads if orjson is not None else json.loads
+_json_decoder: JSONDecoder = DEFAULT_JSON_DECODER
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Decodes a JSON document with the configured decoder. Decoding errors are raised as `ValueError`.
+    """
+    return _json_decoder(data)
+
+
+def get_json_decoder() -> JSONDecoder:
+    return _json_decoder
+
+
+def set_json_decoder(decoder: Optional[JSONDecoder]):
+    """
+    Configures the decoder used for all the websocket messages and REST responses.
+    The fastest available decoder (orjson when installed, the standard library otherwise) is used by default.
+
+    :param decoder: the function used to decode JSON documents. If None the default decoder is restored
+    """
+    global _json_decoder
+    _json_decoder = decoder or DEFAULT_JSON_DECODER
+
+
+class RawMessageRouter:
+    """
+    Routes raw (not decoded) websocket messages by the value of their channel field with a cheap substring check, so
+    that only the messages of relevant channels are decoded. Messages that don't match any route are dropped without
+    being parsed.
+
+    Only the first `scan_length` characters of each message are checked, so the channel field must be one that the
+    exchange sends at the beginning of its messages (e.g. the "e" event type field of Binance streams).
+    """
+
+    def __init__(self, channel_field: str, routes: Dict[str, Hashable], scan_length: int = 128):
+        """
+        :param channel_field: the name of the message field identifying the channel
+        :param routes: maps each channel value to the key of its destination (e.g. the name of a messages queue)
+        :param scan_length: number of characters at the start of the messages where the channel field is searched
+        """
+        markers = []
+        for channel, key in routes.items():
+            for separator in (":", ": "):
+                marker = f'"{channel_field}"{separator}"{channel}"'
+                markers.append((marker, marker.encode("utf-8"), key))
+        self._markers: Tuple[Tuple[str, bytes, Hashable], ...] = tuple(markers)
+        self._scan_length = scan_length
+        self.dropped_messages = 0
+
+    def route(self, raw_message: Union[str, bytes]) -> Optional[Hashable]:
+        """
+        :param raw_message: the message as received from the websocket
+        :return: the key of the matching route, or None if the message should be dropped
+        """
+        head = raw_message[:self._scan_length]
+        is_bytes = isinstance(head, bytes)
+        for marker, bytes_marker, key in self._markers:
+            if (bytes_marker if is_bytes else marker) in head:
+                return key
+        self.dropped_messages += 1
+        return None
+
+    def decode(self, raw_message: Union[str, bytes]) -> Tuple[Optional[Hashable], Optional[Any]]:
+        """
+        Routes the message and decodes it only if it matched a route.
+
+        :return: a tuple with the route key and the decoded message, or (None, None) if the message was dropped
+        """
+        key = self.route(raw_message)
+        if key is None:
+            return None, None
+        return key, json_loads(raw_message)
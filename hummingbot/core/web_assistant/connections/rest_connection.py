@@ -1,13 +1,26 @@
+from typing import Optional
+
 import aiohttp
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.http_session_registry import HTTPSessionRegistry
 
 
 class RESTConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        aiohttp_client_session: Optional[aiohttp.ClientSession] = None,
+        session_registry: Optional[HTTPSessionRegistry] = None,
+    ):
+        """
+        :param aiohttp_client_session: the session used for all the requests
+        :param session_registry: if no session is provided, the session of each request host is taken from the registry
+        """
         self._client_session = aiohttp_client_session
+        self._session_registry = session_registry
 
     async def call(self, request: RESTRequest) -> RESTResponse:
-        aiohttp_resp = await self._client_session.request(
+        client_session = self._client_session or self._session_registry.get_session(request.url)
+        aiohttp_resp = await client_session.request(
             method=request.method.value,
             url=request.url,
             params=request.params,
@@ -1,12 +1,12 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoder import json_loads
 
 
 class WSConnection:
@@ -18,6 +18,7 @@ class WSConnection:
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
+        self._raw_messages = False
 
     @property
     def last_recv_time(self) -> float:
@@ -33,8 +34,13 @@ class WSConnection:
         ping_timeout: float = 10,
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
-        max_msg_size: Optional[int] = None
+        max_msg_size: Optional[int] = None,
+        raw_messages: bool = False,
     ):
+        """
+        :param raw_messages: if True the received messages are not decoded, and responses contain the text or bytes
+            received
+        """
         self._ensure_not_connected()
         self._connection = await self._client_session.ws_connect(
             ws_url,
@@ -44,6 +50,7 @@ class WSConnection:
             max_msg_size=max_msg_size,
         )
         self._message_timeout = message_timeout
+        self._raw_messages = raw_messages
         self._connected = True
 
     async def disconnect(self):
@@ -141,14 +148,13 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
-        if msg.type == aiohttp.WSMsgType.BINARY:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
+        if msg.type == aiohttp.WSMsgType.BINARY or self._raw_messages:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = json_loads(msg.data)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.utils.order_latency_tracker import REQUEST_SIGNED, RESPONSE_RECEIVED, OrderLatencyTracker
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -105,7 +106,12 @@ class RESTAssistant:
         request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
+        latency_tracker = OrderLatencyTracker.get_instance()
+        if latency_tracker.enabled:
+            latency_tracker.record_stage(REQUEST_SIGNED)
         resp = await wait_for(self._connection.call(request), timeout)
+        if latency_tracker.enabled:
+            latency_tracker.record_stage(RESPONSE_RECEIVED)
         resp = await self._post_process_response(resp)
         return resp
 
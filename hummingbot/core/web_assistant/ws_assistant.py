@@ -40,6 +40,7 @@ class WSAssistant:
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
         max_msg_size: Optional[int] = None,
+        raw_messages: bool = False,
     ):
         max_msg_size = max_msg_size if max_msg_size else self._connection._MAX_MSG_SIZE
         await self._connection.connect(
@@ -47,7 +48,8 @@ class WSAssistant:
             ws_headers=ws_headers,
             ping_timeout=ping_timeout,
             message_timeout=message_timeout,
-            max_msg_size=max_msg_size)
+            max_msg_size=max_msg_size,
+            raw_messages=raw_messages)
 
     async def disconnect(self):
         await self._connection.disconnect()
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
@@ -107,6 +107,23 @@ class BinancePerpetualCandles(CandlesBase):
         }
         return payload
 
+    @property
+    def supports_multiplexed_subscriptions(self) -> bool:
+        return True
+
+    def multiplexed_ws_subscription_payload(self, feeds: List[CandlesBase]):
+        candle_params = [f"{feed._ex_trading_pair.lower()}@kline_{feed.interval}" for feed in feeds]
+        payload = {
+            "method": "SUBSCRIBE",
+            "params": candle_params,
+            "id": 1
+        }
+        return payload
+
+    def multiplexed_ws_message_key(self, data: dict) -> Optional[Tuple[str, str]]:
+        if data is not None and data.get("e") == "kline":
+            return data["s"], data["k"]["i"]
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
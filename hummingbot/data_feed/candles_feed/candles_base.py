@@ -2,7 +2,7 @@ import asyncio
 import os
 import time
 from collections import deque
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -398,6 +398,29 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @property
+    def supports_multiplexed_subscriptions(self) -> bool:
+        """
+        Whether the candles of several trading pairs and intervals can be streamed through a single websocket
+        connection, with multiplexed_ws_subscription_payload and multiplexed_ws_message_key implemented.
+        """
+        return False
+
+    def multiplexed_ws_subscription_payload(self, feeds: List["CandlesBase"]):
+        """
+        This method returns the payload subscribing a single websocket connection to the candles of all the feeds.
+        :param feeds: the candles feeds of the same exchange to subscribe to
+        """
+        raise NotImplementedError
+
+    def multiplexed_ws_message_key(self, data: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        This method returns the exchange trading pair and the interval of the candle in a websocket message, or None if
+        the message is not a candle.
+        :param data: the websocket message data
+        """
+        raise NotImplementedError
+
     async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
         # TODO: Isolate ping pong logic
         async for ws_response in websocket_assistant.iter_messages():
@@ -407,27 +430,36 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
-                    self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                self._process_websocket_candle(parsed_message)
+
+    def _process_websocket_candle(self, parsed_message: Dict[str, Any]):
+        """
+        Adds the candle parsed from a websocket message, or updates the last candle if it is the same one. The first
+        candle received starts the backfill of the historical candles.
+
+        :param parsed_message: the candle, as returned by _parse_websocket_message
+        """
+        candles_row = np.array([parsed_message["timestamp"],
+                                parsed_message["open"],
+                                parsed_message["high"],
+                                parsed_message["low"],
+                                parsed_message["close"],
+                                parsed_message["volume"],
+                                parsed_message["quote_asset_volume"],
+                                parsed_message["n_trades"],
+                                parsed_message["taker_buy_base_volume"],
+                                parsed_message["taker_buy_quote_volume"]]).astype(float)
+        if len(self._candles) == 0:
+            self._candles.append(candles_row)
+            self._ws_candle_available.set()
+            safe_ensure_future(self.fill_historical_candles())
+        else:
+            latest_timestamp = int(self._candles[-1][0])
+            current_timestamp = int(parsed_message["timestamp"])
+            if current_timestamp > latest_timestamp:
+                self._candles.append(candles_row)
+            elif current_timestamp == latest_timestamp:
+                self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
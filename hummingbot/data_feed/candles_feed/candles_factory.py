@@ -55,6 +55,10 @@ class CandlesFactory:
         "hyperliquid_perpetual": HyperliquidPerpetualCandles
     }
 
+    @classmethod
+    def is_supported(cls, connector: str) -> bool:
+        return connector in cls._candles_map
+
     @classmethod
     def get_candle(cls, candles_config: CandlesConfig) -> CandlesBase:
         """
@@ -0,0 +1,372 @@
+import asyncio
+import logging
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+
+class CandlesSourceKey(NamedTuple):
+    connector: str
+    trading_pair: str
+    interval: str
+
+
+def resample_candles(candles: np.ndarray, interval_in_seconds: int) -> np.ndarray:
+    """
+    Aggregates candles, sorted by timestamp, into candles of a longer interval aligned on multiples of the interval.
+    The first aggregated candle is dropped if the candles start after the beginning of its interval.
+
+    :param candles: the candles, in the format of CandlesBase.columns
+    :param interval_in_seconds: the interval of the aggregated candles
+    :return: the aggregated candles, in the same format
+    """
+    if len(candles) == 0:
+        return np.empty((0, len(CandlesBase.columns)))
+    bucket_starts = candles[:, 0] - candles[:, 0] % interval_in_seconds
+    first_rows = np.concatenate(([0], np.flatnonzero(np.diff(bucket_starts)) + 1))
+    last_rows = np.append(first_rows[1:] - 1, len(candles) - 1)
+    resampled = np.empty((len(first_rows), candles.shape[1]))
+    resampled[:, 0] = bucket_starts[first_rows]
+    resampled[:, 1] = candles[first_rows, 1]
+    resampled[:, 2] = np.maximum.reduceat(candles[:, 2], first_rows)
+    resampled[:, 3] = np.minimum.reduceat(candles[:, 3], first_rows)
+    resampled[:, 4] = candles[last_rows, 4]
+    resampled[:, 5:] = np.add.reduceat(candles[:, 5:], first_rows, axis=0)
+    if candles[0, 0] != bucket_starts[0]:
+        resampled = resampled[1:]
+    return resampled
+
+
+class MultiplexedCandles:
+    """
+    Candles feed of a trading pair and interval served by the CandlesManager from a shared source feed. The source
+    feed has the same interval, or the base interval of the manager when the candles are resampled locally.
+
+    It exposes the same candles_df, ready, start and stop interface as the CandlesBase feeds.
+    """
+
+    def __init__(self, manager: "CandlesManager", source_key: CandlesSourceKey, config: CandlesConfig):
+        self._manager = manager
+        self._source_key = source_key
+        self.connector_name = config.connector
+        self.trading_pair = config.trading_pair
+        self.interval = config.interval
+        self.max_records = config.max_records
+
+    @property
+    def name(self) -> str:
+        return f"{self.connector_name}_{self.trading_pair}_{self.interval}"
+
+    @property
+    def source_key(self) -> CandlesSourceKey:
+        return self._source_key
+
+    @property
+    def source_feed(self) -> CandlesBase:
+        return self._manager.get_source_feed(self._source_key)
+
+    @property
+    def interval_in_seconds(self) -> int:
+        return CandlesBase.interval_to_seconds[self.interval]
+
+    @property
+    def is_resampled(self) -> bool:
+        return self._source_key.interval != self.interval
+
+    @property
+    def required_source_records(self) -> int:
+        """
+        The number of candles the source feed needs to provide max_records candles: one more aggregated candle is
+        covered when resampling, since the oldest one is usually incomplete.
+        """
+        if not self.is_resampled:
+            return self.max_records
+        ratio = self.interval_in_seconds // CandlesBase.interval_to_seconds[self._source_key.interval]
+        return (self.max_records + 1) * ratio
+
+    @property
+    def ready(self) -> bool:
+        return self.source_feed.ready
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        source_candles_df = self.source_feed.candles_df
+        if not self.is_resampled:
+            return source_candles_df.iloc[-self.max_records:].reset_index(drop=True)
+        candles = resample_candles(source_candles_df.to_numpy(), self.interval_in_seconds)
+        return pd.DataFrame(candles[-self.max_records:], columns=CandlesBase.columns, dtype=float)
+
+    def start(self):
+        self._manager.start_candles_feed(self)
+
+    def stop(self):
+        self._manager.stop_candles_feed(self)
+
+
+class MultiplexedCandlesStream:
+    """
+    Single websocket connection streaming the candles of all the source feeds of an exchange, for the exchanges
+    accepting several candles subscriptions per connection. The messages are routed to the feeds by trading pair and
+    interval, and each feed keeps its own candles and REST backfill.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector_name: str):
+        self._connector_name = connector_name
+        self._feeds: Dict[Tuple[str, str], CandlesBase] = {}
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def feeds(self) -> List[CandlesBase]:
+        return list(self._feeds.values())
+
+    @property
+    def started(self) -> bool:
+        return self._listen_task is not None
+
+    def add_feed(self, feed: CandlesBase):
+        """
+        Adds a feed to the stream, subscribing to its candles right away if the connection is open.
+        """
+        self._feeds[self._feed_key(feed)] = feed
+        if self._ws is not None:
+            safe_ensure_future(self._subscribe(self._ws, [feed]))
+
+    def remove_feed(self, feed: CandlesBase):
+        key = self._feed_key(feed)
+        if self._feeds.get(key) is feed:
+            del self._feeds[key]
+
+    def start(self):
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self.listen_for_subscriptions())
+
+    def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+
+    async def listen_for_subscriptions(self):
+        ws: Optional[WSAssistant] = None
+        while True:
+            leader = next(iter(self._feeds.values()))
+            try:
+                ws = await leader._connected_websocket_assistant()
+                self._ws = ws
+                await self._subscribe(ws, self.feeds)
+                await self._process_websocket_messages(leader, ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error occurred when listening to {self._connector_name} klines. "
+                    f"Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                self._ws = None
+                if ws is not None:
+                    await ws.disconnect()
+                    ws = None
+                for feed in self.feeds:
+                    await feed._on_order_stream_interruption()
+
+    async def _subscribe(self, ws: WSAssistant, feeds: List[CandlesBase]):
+        if len(feeds) == 0:
+            return
+        for feed in feeds:
+            await feed.initialize_exchange_data()
+        payload = feeds[0].multiplexed_ws_subscription_payload(feeds)
+        await ws.send(WSJSONRequest(payload=payload))
+        self.logger().info(f"Subscribed to {len(feeds)} {self._connector_name} klines streams...")
+
+    async def _process_websocket_messages(self, leader: CandlesBase, ws: WSAssistant):
+        while True:
+            try:
+                await asyncio.wait_for(self._process_websocket_messages_task(leader, ws), timeout=leader._ping_timeout)
+            except asyncio.TimeoutError:
+                if leader._ping_timeout is not None:
+                    await ws.send(WSJSONRequest(payload=leader._ping_payload))
+
+    async def _process_websocket_messages_task(self, leader: CandlesBase, ws: WSAssistant):
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            key = leader.multiplexed_ws_message_key(data)
+            if key is None:
+                # not a candle, it may be a ping to answer
+                parsed_message = leader._parse_websocket_message(data)
+                if isinstance(parsed_message, WSJSONRequest):
+                    await ws.send(request=parsed_message)
+                continue
+            feed = self._feeds.get(key)
+            if feed is not None:
+                parsed_message = feed._parse_websocket_message(data)
+                if isinstance(parsed_message, dict):
+                    feed._process_websocket_candle(parsed_message)
+
+    @staticmethod
+    def _feed_key(feed: CandlesBase) -> Tuple[str, str]:
+        return feed._ex_trading_pair, feed.interval
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
+
+
+class CandlesManager:
+    """
+    Serves the candles feeds of many trading pairs and intervals from as few connections and backfills as possible.
+
+    - The intervals up to 12h are resampled locally from a single source feed per trading pair in the base interval
+      (1m), as long as the source feed doesn't need more than `max_resampled_base_records` candles. The other intervals
+      get a source feed of their own.
+    - The source feeds of the exchanges accepting several subscriptions per websocket connection share a single
+      MultiplexedCandlesStream per exchange. The other source feeds keep their own connection.
+
+    The source feeds are sized for the largest max_records of the candles feeds using them, and are recreated when a
+    new candles feed needs more candles.
+    """
+    BASE_INTERVAL = "1m"
+    MAX_RESAMPLED_INTERVAL_SECONDS = 43200
+    MAX_RESAMPLED_BASE_RECORDS = 5000
+
+    def __init__(self, max_resampled_base_records: int = MAX_RESAMPLED_BASE_RECORDS):
+        self._max_resampled_base_records = max_resampled_base_records
+        self._source_feeds: Dict[CandlesSourceKey, CandlesBase] = {}
+        self._source_candles_feeds: Dict[CandlesSourceKey, List[MultiplexedCandles]] = {}
+        self._started_sources: Set[CandlesSourceKey] = set()
+        self._streams: Dict[str, MultiplexedCandlesStream] = {}
+
+    @property
+    def source_feeds(self) -> Dict[CandlesSourceKey, CandlesBase]:
+        return self._source_feeds.copy()
+
+    @property
+    def streams(self) -> Dict[str, MultiplexedCandlesStream]:
+        return self._streams.copy()
+
+    def source_key(self, config: CandlesConfig) -> CandlesSourceKey:
+        """
+        Returns the key of the source feed serving the candles of the configuration.
+        """
+        interval_in_seconds = CandlesBase.interval_to_seconds[config.interval]
+        base_interval_in_seconds = CandlesBase.interval_to_seconds[self.BASE_INTERVAL]
+        resampled_records = (config.max_records + 1) * (interval_in_seconds // base_interval_in_seconds)
+        if (config.interval != self.BASE_INTERVAL
+                and interval_in_seconds % base_interval_in_seconds == 0
+                and interval_in_seconds <= self.MAX_RESAMPLED_INTERVAL_SECONDS
+                and resampled_records <= self._max_resampled_base_records):
+            return CandlesSourceKey(config.connector, config.trading_pair, self.BASE_INTERVAL)
+        return CandlesSourceKey(config.connector, config.trading_pair, config.interval)
+
+    def get_candles_feed(self, config: CandlesConfig) -> MultiplexedCandles:
+        """
+        Returns a new candles feed for the configuration, creating or enlarging its source feed if needed.
+        :raises UnsupportedConnectorException: If the connector is not supported.
+        """
+        key = self.source_key(config)
+        candles_feed = MultiplexedCandles(self, key, config)
+        self._source_candles_feeds.setdefault(key, []).append(candles_feed)
+        try:
+            self._ensure_source_feed(key)
+        except Exception:
+            self._release(candles_feed)
+            raise
+        return candles_feed
+
+    def get_source_feed(self, key: CandlesSourceKey) -> CandlesBase:
+        return self._source_feeds[key]
+
+    def start_candles_feed(self, candles_feed: MultiplexedCandles):
+        key = candles_feed.source_key
+        if key in self._source_feeds and key not in self._started_sources:
+            self._started_sources.add(key)
+            self._start_source(key, self._source_feeds[key])
+
+    def stop_candles_feed(self, candles_feed: MultiplexedCandles):
+        """
+        Releases the candles feed, stopping its source feed once no other candles feed uses it.
+        """
+        self._release(candles_feed)
+
+    def stop(self):
+        for key, feed in list(self._source_feeds.items()):
+            if key in self._started_sources:
+                self._stop_source(key, feed)
+        self._source_feeds.clear()
+        self._source_candles_feeds.clear()
+        self._started_sources.clear()
+        for stream in self._streams.values():
+            stream.stop()
+        self._streams.clear()
+
+    def _release(self, candles_feed: MultiplexedCandles):
+        key = candles_feed.source_key
+        candles_feeds = self._source_candles_feeds.get(key, [])
+        if candles_feed in candles_feeds:
+            candles_feeds.remove(candles_feed)
+        if len(candles_feeds) == 0:
+            self._source_candles_feeds.pop(key, None)
+            feed = self._source_feeds.pop(key, None)
+            if feed is not None and key in self._started_sources:
+                self._started_sources.discard(key)
+                self._stop_source(key, feed)
+
+    def _ensure_source_feed(self, key: CandlesSourceKey):
+        required_records = max(candles_feed.required_source_records
+                               for candles_feed in self._source_candles_feeds[key])
+        feed = self._source_feeds.get(key)
+        if feed is not None and feed.max_records >= required_records:
+            return
+        new_feed = CandlesFactory.get_candle(CandlesConfig(
+            connector=key.connector,
+            trading_pair=key.trading_pair,
+            interval=key.interval,
+            max_records=required_records,
+        ))
+        self._source_feeds[key] = new_feed
+        if key in self._started_sources:
+            # the new feed is started first, so that it replaces the old one on a shared stream without reconnecting
+            self._start_source(key, new_feed)
+            if feed is not None:
+                self._stop_source(key, feed)
+
+    def _start_source(self, key: CandlesSourceKey, feed: CandlesBase):
+        if feed.supports_multiplexed_subscriptions:
+            stream = self._streams.get(key.connector)
+            if stream is None:
+                stream = MultiplexedCandlesStream(key.connector)
+                self._streams[key.connector] = stream
+            stream.add_feed(feed)
+            stream.start()
+        else:
+            feed.start()
+
+    def _stop_source(self, key: CandlesSourceKey, feed: CandlesBase):
+        if feed.supports_multiplexed_subscriptions:
+            stream = self._streams.get(key.connector)
+            if stream is not None:
+                stream.remove_feed(feed)
+                if len(stream.feeds) == 0:
+                    stream.stop()
+                    del self._streams[key.connector]
+        else:
+            feed.stop()
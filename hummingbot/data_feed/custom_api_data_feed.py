@@ -6,6 +6,7 @@ from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.http_session_registry import HTTPSessionRegistry
 from decimal import Decimal
 
 
@@ -21,7 +22,6 @@ class CustomAPIDataFeed(NetworkBase):
     def __init__(self, api_url, update_interval: float = 5.0):
         super().__init__()
         self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
         self._api_url = api_url
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
@@ -38,9 +38,7 @@ class CustomAPIDataFeed(NetworkBase):
         return self._api_url
 
     def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+        return HTTPSessionRegistry.get_instance().get_session(self._api_url)
 
     async def check_network(self) -> NetworkStatus:
         client = self._http_client()
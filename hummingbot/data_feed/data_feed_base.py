@@ -6,6 +6,7 @@ import aiohttp
 
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.web_assistant.connections.http_session_registry import HTTPSessionRegistry
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,7 +22,6 @@ class DataFeedBase(NetworkBase):
     def __init__(self):
         super().__init__()
         self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
 
     @property
     def name(self):
@@ -43,9 +43,7 @@ class DataFeedBase(NetworkBase):
         raise NotImplementedError
 
     async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+        return HTTPSessionRegistry.get_instance().get_session(self.health_check_endpoint)
 
     async def get_ready(self):
         try:
@@ -65,11 +63,11 @@ class DataFeedBase(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.health_check_endpoint) as resp:
-                    status_text = await resp.text()
-                    if resp.status != 200:
-                        raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
+            session = await self._http_client()
+            async with session.get(self.health_check_endpoint) as resp:
+                status_text = await resp.text()
+                if resp.status != 200:
+                    raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -0,0 +1,42 @@
+import json
+import os
+from typing import Any, Dict
+
+from hummingbot import data_path
+
+DEFAULT_SOCKET_FILE_NAME = "market_data_hub.sock"
+# Limit of the stream readers buffer. Full order book snapshots are sent in a single line
+STREAM_READER_LIMIT = 2 ** 24
+
+ORDER_BOOK_CHANNEL = "order_book"
+CANDLES_CHANNEL = "candles"
+
+# Requests sent by the hub clients
+SUBSCRIBE_REQUEST = "subscribe"
+UNSUBSCRIBE_REQUEST = "unsubscribe"
+SNAPSHOT_REQUEST = "snapshot_request"
+LAST_TRADED_PRICES_REQUEST = "last_traded_prices_request"
+
+# Messages published by the hub
+SNAPSHOT_MESSAGE = "snapshot"
+DIFF_MESSAGE = "diff"
+TRADE_MESSAGE = "trade"
+CANDLES_SNAPSHOT_MESSAGE = "candles_snapshot"
+CANDLES_UPDATE_MESSAGE = "candles_update"
+LAST_TRADED_PRICES_MESSAGE = "last_traded_prices"
+ERROR_MESSAGE = "error"
+
+
+def default_socket_path() -> str:
+    return os.path.join(data_path(), DEFAULT_SOCKET_FILE_NAME)
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """
+    Serializes a hub message. Messages are exchanged as newline delimited JSON documents.
+    """
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> Dict[str, Any]:
+    return json.loads(line)
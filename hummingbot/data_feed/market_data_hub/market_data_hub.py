@@ -0,0 +1,473 @@
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.market_data_hub import hub_protocol
+from hummingbot.logger import HummingbotLogger
+
+
+class _HubClient:
+    """
+    A process connected to the hub. Messages are queued and written by a dedicated task, so that a slow client does
+    not delay the distribution of the updates to the rest of the clients.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, max_pending_messages: int):
+        self.writer = writer
+        self.pending_messages: asyncio.Queue = asyncio.Queue(maxsize=max_pending_messages)
+        self.writer_task: Optional[asyncio.Task] = None
+        self.handler_task: Optional[asyncio.Task] = None
+
+    def send(self, data: bytes) -> bool:
+        try:
+            self.pending_messages.put_nowait(data)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+
+class _HubOrderBook:
+    """
+    The hub copy of an exchange order book and the clients subscribed to it.
+    The sequence number is increased with every published snapshot and diff, and is used as update id by the clients.
+    """
+
+    def __init__(self, max_pending_diffs: int):
+        self.order_book: Optional[OrderBook] = None
+        self.sequence: int = 0
+        self.pending_diffs: Deque[OrderBookMessage] = deque(maxlen=max_pending_diffs)
+        self.subscribers: Set[_HubClient] = set()
+
+
+class _HubCandles:
+
+    def __init__(self, candles: CandlesBase):
+        self.candles = candles
+        self.sequence: int = 0
+        self.subscribers: Set[_HubClient] = set()
+        self.first_timestamp: Optional[float] = None
+        self.last_candle: Optional[List[float]] = None
+
+
+class MarketDataHub:
+    """
+    Local market data hub shared by several bot processes running in the same host.
+
+    The hub keeps a single connection to each exchange (through the connectors order book data sources and the candles
+    feeds) and distributes the data to its clients through a Unix domain socket. New subscribers receive a full
+    snapshot first, followed by sequence numbered order book diffs, trades and candles updates.
+    Clients that can't keep up with the updates are disconnected, and get a fresh snapshot when they reconnect.
+    """
+    MAX_PENDING_MESSAGES_PER_CLIENT = 10000
+    MAX_PENDING_DIFFS_PER_ORDER_BOOK = 1000
+    CANDLES_PUBLISH_INTERVAL = 1.0
+    SNAPSHOT_REQUEST_RETRY_INTERVAL = 5.0
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self._socket_path = socket_path or hub_protocol.default_socket_path()
+        self._data_sources: Dict[str, OrderBookTrackerDataSource] = {}
+        self._order_books: Dict[Tuple[str, str], _HubOrderBook] = {}
+        self._candles: Dict[Tuple[str, str, str], _HubCandles] = {}
+        self._clients: Set[_HubClient] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: List[asyncio.Task] = []
+        self._metrics: Dict[str, int] = {
+            "messages_published": 0,
+            "clients_dropped": 0,
+        }
+
+    @property
+    def socket_path(self) -> str:
+        return self._socket_path
+
+    @property
+    def started(self) -> bool:
+        return self._server is not None
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        metrics = dict(self._metrics)
+        metrics["clients"] = len(self._clients)
+        return metrics
+
+    def order_book(self, connector_name: str, trading_pair: str) -> Optional[OrderBook]:
+        hub_order_book = self._order_books.get((connector_name, trading_pair))
+        return hub_order_book.order_book if hub_order_book is not None else None
+
+    def add_order_book_data_source(self, connector_name: str, data_source: OrderBookTrackerDataSource):
+        """
+        Registers the data source the hub will use to track the order books and trades of a connector.
+        Must be called before starting the hub.
+
+        :param connector_name: the name the clients will use to subscribe to the connector markets
+        :param data_source: the connector order book data source, configured with all the trading pairs to track
+        """
+        self._data_sources[connector_name] = data_source
+        for trading_pair in data_source._trading_pairs:
+            self._order_books[(connector_name, trading_pair)] = _HubOrderBook(
+                max_pending_diffs=self.MAX_PENDING_DIFFS_PER_ORDER_BOOK)
+
+    def add_candles_feed(self, connector_name: str, candles: CandlesBase):
+        """
+        Registers a candles feed to be shared through the hub. Must be called before starting the hub.
+        """
+        self._candles[(connector_name, candles._trading_pair, candles.interval)] = _HubCandles(candles=candles)
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            # Socket file left by a previous execution
+            os.unlink(self._socket_path)
+        self._server = await asyncio.start_unix_server(
+            self._handle_client, path=self._socket_path, limit=hub_protocol.STREAM_READER_LIMIT)
+
+        ev_loop = asyncio.get_event_loop()
+        for connector_name, data_source in self._data_sources.items():
+            diffs_queue = asyncio.Queue()
+            snapshots_queue = asyncio.Queue()
+            trades_queue = asyncio.Queue()
+            self._tasks.extend([
+                safe_ensure_future(data_source.listen_for_subscriptions()),
+                safe_ensure_future(data_source.listen_for_order_book_diffs(ev_loop, diffs_queue)),
+                safe_ensure_future(data_source.listen_for_order_book_snapshots(ev_loop, snapshots_queue)),
+                safe_ensure_future(data_source.listen_for_trades(ev_loop, trades_queue)),
+                safe_ensure_future(self._route_messages(connector_name, diffs_queue)),
+                safe_ensure_future(self._route_messages(connector_name, snapshots_queue)),
+                safe_ensure_future(self._route_messages(connector_name, trades_queue)),
+                safe_ensure_future(self._init_order_books(connector_name, data_source)),
+            ])
+        for hub_candles in self._candles.values():
+            await hub_candles.candles.start_network()
+        if len(self._candles) > 0:
+            self._tasks.append(safe_ensure_future(self._publish_candles_loop()))
+        self.logger().info(f"Market data hub listening on {self._socket_path}.")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        for hub_candles in self._candles.values():
+            await hub_candles.candles.stop_network()
+        handler_tasks = [client.handler_task for client in self._clients if client.handler_task is not None]
+        for client in list(self._clients):
+            self._remove_client(client)
+        await safe_gather(*handler_tasks, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+
+    async def _init_order_books(self, connector_name: str, data_source: OrderBookTrackerDataSource):
+        await safe_gather(*[
+            self._init_order_book(connector_name, trading_pair, data_source)
+            for trading_pair in data_source._trading_pairs
+        ])
+
+    async def _init_order_book(self, connector_name: str, trading_pair: str, data_source: OrderBookTrackerDataSource):
+        hub_order_book = self._order_books[(connector_name, trading_pair)]
+        while hub_order_book.order_book is None:
+            try:
+                order_book = await data_source.get_new_order_book(trading_pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(
+                    f"Error getting the {connector_name} {trading_pair} order book snapshot. "
+                    f"Retrying in {self.SNAPSHOT_REQUEST_RETRY_INTERVAL} seconds.")
+                await self._sleep(self.SNAPSHOT_REQUEST_RETRY_INTERVAL)
+                continue
+
+            # Diffs received while the snapshot was requested are applied before publishing the book
+            while len(hub_order_book.pending_diffs) > 0:
+                diff_message = hub_order_book.pending_diffs.popleft()
+                if diff_message.update_id >= order_book.snapshot_uid:
+                    order_book.apply_diffs(diff_message.bids, diff_message.asks, diff_message.update_id)
+            hub_order_book.order_book = order_book
+            self._publish_order_book_snapshot(connector_name, trading_pair, hub_order_book)
+            self.logger().info(f"Initialized the {connector_name} {trading_pair} order book.")
+
+    async def _route_messages(self, connector_name: str, messages_queue: asyncio.Queue):
+        while True:
+            try:
+                message: OrderBookMessage = await messages_queue.get()
+                self._process_order_book_message(connector_name, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(f"Unexpected error processing {connector_name} order book messages.")
+
+    def _process_order_book_message(self, connector_name: str, message: OrderBookMessage):
+        trading_pair = message.trading_pair
+        hub_order_book = self._order_books.get((connector_name, trading_pair))
+        if hub_order_book is None:
+            return
+        order_book = hub_order_book.order_book
+
+        if message.type is OrderBookMessageType.DIFF:
+            if order_book is None:
+                hub_order_book.pending_diffs.append(message)
+            elif message.update_id >= order_book.snapshot_uid:
+                bids = message.bids
+                asks = message.asks
+                order_book.apply_diffs(bids, asks, message.update_id)
+                hub_order_book.sequence += 1
+                self._publish(hub_order_book.subscribers, {
+                    "type": hub_protocol.DIFF_MESSAGE,
+                    "connector": connector_name,
+                    "trading_pair": trading_pair,
+                    "sequence": hub_order_book.sequence,
+                    "timestamp": message.timestamp,
+                    "bids": [[row.price, row.amount] for row in bids],
+                    "asks": [[row.price, row.amount] for row in asks],
+                })
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            if order_book is not None:
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+                self._publish_order_book_snapshot(connector_name, trading_pair, hub_order_book)
+        elif message.type is OrderBookMessageType.TRADE:
+            price = float(message.content["price"])
+            amount = float(message.content["amount"])
+            trade_type = float(message.content["trade_type"])
+            if order_book is not None:
+                order_book.apply_trade(OrderBookTradeEvent(
+                    trading_pair=trading_pair,
+                    timestamp=message.timestamp,
+                    price=price,
+                    amount=amount,
+                    trade_id=message.trade_id,
+                    type=TradeType.SELL if trade_type == float(TradeType.SELL.value) else TradeType.BUY
+                ))
+            self._publish(hub_order_book.subscribers, {
+                "type": hub_protocol.TRADE_MESSAGE,
+                "connector": connector_name,
+                "trading_pair": trading_pair,
+                "sequence": hub_order_book.sequence,
+                "timestamp": message.timestamp,
+                "trade_id": message.trade_id,
+                "trade_type": trade_type,
+                "price": price,
+                "amount": amount,
+            })
+
+    def _publish_order_book_snapshot(self, connector_name: str, trading_pair: str, hub_order_book: _HubOrderBook):
+        hub_order_book.sequence += 1
+        self._publish(
+            hub_order_book.subscribers,
+            self._order_book_snapshot_message(connector_name, trading_pair, hub_order_book))
+
+    def _order_book_snapshot_message(
+            self, connector_name: str, trading_pair: str, hub_order_book: _HubOrderBook) -> Dict[str, Any]:
+        order_book = hub_order_book.order_book
+        return {
+            "type": hub_protocol.SNAPSHOT_MESSAGE,
+            "connector": connector_name,
+            "trading_pair": trading_pair,
+            "sequence": hub_order_book.sequence,
+            "timestamp": self._time(),
+            "bids": [[row.price, row.amount] for row in order_book.bid_entries()],
+            "asks": [[row.price, row.amount] for row in order_book.ask_entries()],
+        }
+
+    async def _publish_candles_loop(self):
+        while True:
+            try:
+                for (connector_name, trading_pair, interval), hub_candles in self._candles.items():
+                    self._publish_candles_changes(connector_name, trading_pair, interval, hub_candles)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error publishing candles updates.")
+            await self._sleep(self.CANDLES_PUBLISH_INTERVAL)
+
+    def _publish_candles_changes(self, connector_name: str, trading_pair: str, interval: str, hub_candles: _HubCandles):
+        candles = hub_candles.candles._candles
+        if len(candles) == 0:
+            return
+        first_timestamp = float(candles[0][0])
+        last_candle = [float(value) for value in candles[-1]]
+
+        if (hub_candles.last_candle is None
+                or first_timestamp < hub_candles.first_timestamp
+                or last_candle[0] < hub_candles.last_candle[0]):
+            # First candles, historical candles backfilled or the feed was restarted
+            hub_candles.sequence += 1
+            message = self._candles_snapshot_message(connector_name, trading_pair, interval, hub_candles)
+        elif last_candle != hub_candles.last_candle:
+            last_published_timestamp = hub_candles.last_candle[0]
+            hub_candles.sequence += 1
+            message = self._candles_message(
+                hub_protocol.CANDLES_UPDATE_MESSAGE, connector_name, trading_pair, interval, hub_candles,
+                [[float(value) for value in candle] for candle in candles if candle[0] >= last_published_timestamp])
+        else:
+            return
+
+        hub_candles.first_timestamp = first_timestamp
+        hub_candles.last_candle = last_candle
+        self._publish(hub_candles.subscribers, message)
+
+    def _candles_snapshot_message(
+            self, connector_name: str, trading_pair: str, interval: str, hub_candles: _HubCandles) -> Dict[str, Any]:
+        return self._candles_message(
+            hub_protocol.CANDLES_SNAPSHOT_MESSAGE, connector_name, trading_pair, interval, hub_candles,
+            [[float(value) for value in candle] for candle in hub_candles.candles._candles])
+
+    @staticmethod
+    def _candles_message(
+            message_type: str,
+            connector_name: str,
+            trading_pair: str,
+            interval: str,
+            hub_candles: _HubCandles,
+            candles: List[List[float]]) -> Dict[str, Any]:
+        return {
+            "type": message_type,
+            "connector": connector_name,
+            "trading_pair": trading_pair,
+            "interval": interval,
+            "sequence": hub_candles.sequence,
+            "ready": hub_candles.candles.ready,
+            "candles": candles,
+        }
+
+    def _publish(self, subscribers: Set[_HubClient], message: Dict[str, Any]):
+        if len(subscribers) == 0:
+            return
+        data = hub_protocol.encode_message(message)
+        for client in list(subscribers):
+            if not client.send(data):
+                self.logger().warning("Disconnecting a market data hub client that is not consuming its updates.")
+                self._metrics["clients_dropped"] += 1
+                self._remove_client(client)
+        self._metrics["messages_published"] += 1
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = _HubClient(writer=writer, max_pending_messages=self.MAX_PENDING_MESSAGES_PER_CLIENT)
+        client.writer_task = safe_ensure_future(self._write_client_messages(client))
+        client.handler_task = asyncio.current_task()
+        self._clients.add(client)
+        try:
+            while client in self._clients:
+                line = await reader.readline()
+                if not line:
+                    break
+                self._process_client_request(client, hub_protocol.decode_message(line))
+        except asyncio.CancelledError:
+            raise
+        except ConnectionError:
+            pass
+        except Exception:
+            self.logger().exception("Unexpected error processing market data hub client requests.")
+        finally:
+            self._remove_client(client)
+
+    async def _write_client_messages(self, client: _HubClient):
+        try:
+            while True:
+                data = await client.pending_messages.get()
+                client.writer.write(data)
+                if client.pending_messages.empty():
+                    await client.writer.drain()
+        except asyncio.CancelledError:
+            raise
+        except ConnectionError:
+            self._remove_client(client)
+
+    def _remove_client(self, client: _HubClient):
+        if client not in self._clients:
+            return
+        self._clients.discard(client)
+        for hub_order_book in self._order_books.values():
+            hub_order_book.subscribers.discard(client)
+        for hub_candles in self._candles.values():
+            hub_candles.subscribers.discard(client)
+        if client.writer_task is not None:
+            client.writer_task.cancel()
+        client.writer.close()
+
+    def _process_client_request(self, client: _HubClient, request: Dict[str, Any]):
+        request_type = request.get("type")
+        if request_type == hub_protocol.LAST_TRADED_PRICES_REQUEST:
+            self._send_last_traded_prices(client, request)
+            return
+
+        channel = request.get("channel", hub_protocol.ORDER_BOOK_CHANNEL)
+        connector_name = request.get("connector")
+        trading_pair = request.get("trading_pair")
+        if channel == hub_protocol.CANDLES_CHANNEL:
+            interval = request.get("interval")
+            hub_candles = self._candles.get((connector_name, trading_pair, interval))
+            if hub_candles is None:
+                self._send_error(client, f"The hub is not serving {connector_name} {trading_pair} {interval} candles.")
+            elif request_type == hub_protocol.SUBSCRIBE_REQUEST:
+                hub_candles.subscribers.add(client)
+                if hub_candles.last_candle is not None:
+                    client.send(hub_protocol.encode_message(
+                        self._candles_snapshot_message(connector_name, trading_pair, interval, hub_candles)))
+            elif request_type == hub_protocol.UNSUBSCRIBE_REQUEST:
+                hub_candles.subscribers.discard(client)
+            else:
+                self._send_error(client, f"Invalid candles request type ({request_type}).")
+            return
+
+        hub_order_book = self._order_books.get((connector_name, trading_pair))
+        if hub_order_book is None:
+            self._send_error(client, f"The hub is not tracking the {connector_name} {trading_pair} order book.")
+        elif request_type == hub_protocol.SUBSCRIBE_REQUEST:
+            hub_order_book.subscribers.add(client)
+            if hub_order_book.order_book is not None:
+                client.send(hub_protocol.encode_message(
+                    self._order_book_snapshot_message(connector_name, trading_pair, hub_order_book)))
+        elif request_type == hub_protocol.UNSUBSCRIBE_REQUEST:
+            hub_order_book.subscribers.discard(client)
+        elif request_type == hub_protocol.SNAPSHOT_REQUEST:
+            if hub_order_book.order_book is None:
+                self._send_error(client, f"The {connector_name} {trading_pair} order book is not initialized yet.")
+            else:
+                client.send(hub_protocol.encode_message(
+                    self._order_book_snapshot_message(connector_name, trading_pair, hub_order_book)))
+        else:
+            self._send_error(client, f"Invalid order book request type ({request_type}).")
+
+    def _send_last_traded_prices(self, client: _HubClient, request: Dict[str, Any]):
+        connector_name = request.get("connector")
+        prices = {}
+        for trading_pair in request.get("trading_pairs", []):
+            order_book = self.order_book(connector_name, trading_pair)
+            if order_book is not None and not math.isnan(order_book.last_trade_price):
+                prices[trading_pair] = order_book.last_trade_price
+        client.send(hub_protocol.encode_message({
+            "type": hub_protocol.LAST_TRADED_PRICES_MESSAGE,
+            "connector": connector_name,
+            "prices": prices,
+        }))
+
+    @staticmethod
+    def _send_error(client: _HubClient, error_message: str):
+        client.send(hub_protocol.encode_message({"type": hub_protocol.ERROR_MESSAGE, "message": error_message}))
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
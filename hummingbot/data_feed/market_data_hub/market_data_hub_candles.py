@@ -0,0 +1,128 @@
+import asyncio
+from typing import Any, List, Optional
+
+import numpy as np
+
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.market_data_hub import hub_protocol
+
+
+class MarketDataHubCandles(CandlesBase):
+    """
+    Candles feed that receives the candles of another connector feed through a local MarketDataHub, instead of
+    connecting to the exchange. The full candles history is received in the subscription snapshot.
+    """
+
+    def __init__(self,
+                 connector_name: str,
+                 trading_pair: str,
+                 interval: str = "1m",
+                 max_records: int = 150,
+                 socket_path: Optional[str] = None):
+        self._connector_name = connector_name
+        self._socket_path = socket_path or hub_protocol.default_socket_path()
+        self._hub_candles_ready = False
+        self._last_sequence: Optional[int] = None
+        super().__init__(trading_pair, interval, max_records)
+
+    @property
+    def name(self):
+        return f"market_data_hub_{self._connector_name}_{self._trading_pair}"
+
+    @property
+    def rate_limits(self):
+        return []
+
+    @property
+    def intervals(self):
+        return self.interval_to_seconds
+
+    @property
+    def ready(self):
+        """
+        The feed is ready when the candles history of the hub feed has been completely received
+        """
+        return self._hub_candles_ready and len(self._candles) > 0
+
+    def get_exchange_trading_pair(self, trading_pair):
+        return trading_pair
+
+    async def check_network(self) -> NetworkStatus:
+        try:
+            _, writer = await asyncio.open_unix_connection(path=self._socket_path)
+            writer.close()
+        except OSError:
+            return NetworkStatus.NOT_CONNECTED
+        return NetworkStatus.CONNECTED
+
+    async def listen_for_subscriptions(self):
+        """
+        Connects to the market data hub and listens to the candles updates.
+        """
+        writer: Optional[asyncio.StreamWriter] = None
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    path=self._socket_path, limit=hub_protocol.STREAM_READER_LIMIT)
+                await self._subscribe_hub_channel(writer)
+                await self._process_hub_messages(reader=reader, writer=writer)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The market data hub connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to the market data hub. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                writer and writer.close()
+                self._candles.clear()
+                self._hub_candles_ready = False
+                self._last_sequence = None
+
+    async def _subscribe_hub_channel(self, writer: asyncio.StreamWriter):
+        writer.write(hub_protocol.encode_message({
+            "type": hub_protocol.SUBSCRIBE_REQUEST,
+            "channel": hub_protocol.CANDLES_CHANNEL,
+            "connector": self._connector_name,
+            "trading_pair": self._trading_pair,
+            "interval": self.interval,
+        }))
+        await writer.drain()
+
+    async def _process_hub_messages(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("The market data hub closed the connection")
+            message = hub_protocol.decode_message(line)
+            message_type = message.get("type")
+            if message_type == hub_protocol.CANDLES_SNAPSHOT_MESSAGE:
+                self._candles.clear()
+                self._add_candles(message["candles"])
+                self._last_sequence = message["sequence"]
+                self._hub_candles_ready = message["ready"]
+            elif message_type == hub_protocol.CANDLES_UPDATE_MESSAGE:
+                if self._last_sequence is None:
+                    # Waiting for a snapshot
+                    continue
+                if message["sequence"] != self._last_sequence + 1:
+                    # Updates were lost, a new subscription is answered with a snapshot
+                    self._last_sequence = None
+                    await self._subscribe_hub_channel(writer)
+                    continue
+                self._add_candles(message["candles"])
+                self._last_sequence = message["sequence"]
+                self._hub_candles_ready = message["ready"]
+            elif message_type == hub_protocol.ERROR_MESSAGE:
+                self.logger().error(f"Error received from the market data hub: {message['message']}")
+
+    def _add_candles(self, candles: List[List[Any]]):
+        for candle in candles:
+            candle_row = np.array(candle).astype(float)
+            if len(self._candles) == 0 or candle_row[0] > self._candles[-1][0]:
+                self._candles.append(candle_row)
+            elif candle_row[0] == self._candles[-1][0]:
+                self._candles[-1] = candle_row
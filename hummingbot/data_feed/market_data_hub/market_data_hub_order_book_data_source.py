@@ -0,0 +1,157 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.data_feed.market_data_hub import hub_protocol
+
+
+class MarketDataHubOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source that receives the order books and trades from a local MarketDataHub instead of connecting
+    to the exchange. It can replace the data source of any connector order book tracker.
+
+    The hub sequence numbers are used as update ids. If a gap in the sequence is detected a new snapshot is requested.
+    """
+    REQUEST_TIMEOUT = 10.0
+
+    def __init__(self, connector_name: str, trading_pairs: List[str], socket_path: Optional[str] = None):
+        super().__init__(trading_pairs=trading_pairs)
+        self._connector_name = connector_name
+        self._socket_path = socket_path or hub_protocol.default_socket_path()
+        self._last_sequences: Dict[str, int] = {}
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        response = await self._request(
+            request={
+                "type": hub_protocol.LAST_TRADED_PRICES_REQUEST,
+                "connector": self._connector_name,
+                "trading_pairs": trading_pairs,
+            },
+            response_type=hub_protocol.LAST_TRADED_PRICES_MESSAGE)
+        return response["prices"]
+
+    async def listen_for_subscriptions(self):
+        """
+        Connects to the hub, subscribes to the order books of all the trading pairs and stores each message received in
+        its own queue.
+        """
+        writer: Optional[asyncio.StreamWriter] = None
+        while True:
+            try:
+                reader, writer = await self._connect()
+                await self._subscribe_channels(writer)
+                await self._process_hub_messages(reader=reader, writer=writer)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The market data hub connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to the market data hub. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                self._last_sequences.clear()
+                writer and writer.close()
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_unix_connection(path=self._socket_path, limit=hub_protocol.STREAM_READER_LIMIT)
+
+    async def _subscribe_channels(self, writer: asyncio.StreamWriter):
+        for trading_pair in self._trading_pairs:
+            writer.write(hub_protocol.encode_message({
+                "type": hub_protocol.SUBSCRIBE_REQUEST,
+                "channel": hub_protocol.ORDER_BOOK_CHANNEL,
+                "connector": self._connector_name,
+                "trading_pair": trading_pair,
+            }))
+        await writer.drain()
+        self.logger().info(f"Subscribed to the {self._connector_name} order books in the market data hub...")
+
+    async def _process_hub_messages(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("The market data hub closed the connection")
+            message = hub_protocol.decode_message(line)
+            message_type = message.get("type")
+            trading_pair = message.get("trading_pair")
+
+            if message_type == hub_protocol.SNAPSHOT_MESSAGE:
+                self._last_sequences[trading_pair] = message["sequence"]
+                self._message_queue[self._snapshot_messages_queue_key].put_nowait(message)
+            elif message_type == hub_protocol.DIFF_MESSAGE:
+                sequence = message["sequence"]
+                last_sequence = self._last_sequences.get(trading_pair)
+                if last_sequence is not None and sequence <= last_sequence:
+                    continue
+                if last_sequence is not None and sequence > last_sequence + 1:
+                    self.logger().warning(
+                        f"Gap detected in the {trading_pair} order book updates from the market data hub "
+                        f"(expected {last_sequence + 1}, received {sequence}). Requesting a new snapshot.")
+                    writer.write(hub_protocol.encode_message({
+                        "type": hub_protocol.SNAPSHOT_REQUEST,
+                        "channel": hub_protocol.ORDER_BOOK_CHANNEL,
+                        "connector": self._connector_name,
+                        "trading_pair": trading_pair,
+                    }))
+                self._last_sequences[trading_pair] = sequence
+                self._message_queue[self._diff_messages_queue_key].put_nowait(message)
+            elif message_type == hub_protocol.TRADE_MESSAGE:
+                self._message_queue[self._trade_messages_queue_key].put_nowait(message)
+            elif message_type == hub_protocol.ERROR_MESSAGE:
+                self.logger().error(f"Error received from the market data hub: {message['message']}")
+
+    async def _request(self, request: Dict[str, Any], response_type: str) -> Dict[str, Any]:
+        reader, writer = await self._connect()
+        try:
+            writer.write(hub_protocol.encode_message(request))
+            await writer.drain()
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=self.REQUEST_TIMEOUT)
+                if not line:
+                    raise ConnectionError("The market data hub closed the connection")
+                response = hub_protocol.decode_message(line)
+                if response.get("type") == hub_protocol.ERROR_MESSAGE:
+                    raise IOError(f"Error received from the market data hub: {response['message']}")
+                if response.get("type") == response_type:
+                    return response
+        finally:
+            writer.close()
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        snapshot = await self._request(
+            request={
+                "type": hub_protocol.SNAPSHOT_REQUEST,
+                "channel": hub_protocol.ORDER_BOOK_CHANNEL,
+                "connector": self._connector_name,
+                "trading_pair": trading_pair,
+            },
+            response_type=hub_protocol.SNAPSHOT_MESSAGE)
+        return self._order_book_message(OrderBookMessageType.SNAPSHOT, snapshot)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(self._order_book_message(OrderBookMessageType.SNAPSHOT, raw_message))
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(self._order_book_message(OrderBookMessageType.DIFF, raw_message))
+
+    async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": raw_message["trading_pair"],
+            "trade_type": raw_message["trade_type"],
+            "trade_id": raw_message["trade_id"],
+            "update_id": raw_message["sequence"],
+            "price": raw_message["price"],
+            "amount": raw_message["amount"],
+        }, timestamp=raw_message["timestamp"]))
+
+    @staticmethod
+    def _order_book_message(message_type: OrderBookMessageType, raw_message: Dict[str, Any]) -> OrderBookMessage:
+        return OrderBookMessage(message_type, {
+            "trading_pair": raw_message["trading_pair"],
+            "update_id": raw_message["sequence"],
+            "bids": raw_message["bids"],
+            "asks": raw_message["asks"],
+        }, timestamp=raw_message["timestamp"])
@@ -16,6 +16,7 @@ from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_manager import CandlesManager
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -32,6 +33,7 @@ class MarketDataProvider:
 
     def __init__(self, connectors: Dict[str, ConnectorBase], rates_update_interval: int = 60):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.candles_manager = CandlesManager()  # Shares the candle connections and resamples the intervals
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
@@ -44,6 +46,7 @@ class MarketDataProvider:
     def stop(self):
         for candle_feed in self.candles_feeds.values():
             candle_feed.stop()
+        self.candles_manager.stop()
         if self._rates_update_task:
             self._rates_update_task.cancel()
             self._rates_update_task = None
@@ -139,11 +142,17 @@ class MarketDataProvider:
             # Existing feed is sufficient, return it
             return existing_feed
         else:
-            # Create a new feed or restart the existing one with updated max_records
-            candle_feed = CandlesFactory.get_candle(config)
+            # Create a new feed or replace the existing one with updated max_records. The feeds of the supported
+            # connectors share their connections and source candles through the candles manager.
+            if CandlesFactory.is_supported(config.connector):
+                candle_feed = self.candles_manager.get_candles_feed(config)
+            else:
+                candle_feed = CandlesFactory.get_candle(config)
             self.candles_feeds[key] = candle_feed
             if hasattr(candle_feed, 'start'):
                 candle_feed.start()
+            if existing_feed and hasattr(existing_feed, 'stop'):
+                existing_feed.stop()
             return candle_feed
 
     @staticmethod
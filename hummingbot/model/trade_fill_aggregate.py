@@ -0,0 +1,49 @@
+from typing import List
+
+from sqlalchemy import JSON, BigInteger, Column, Integer, Text, UniqueConstraint
+from sqlalchemy.orm import Session
+
+from hummingbot.model import HummingbotBase
+
+
+class TradeFillAggregate(HummingbotBase):
+    """
+    Running sums of the trade fills of a market since a start timestamp, up to the checkpoint timestamp. The sums are
+    stored as decimal strings, SQLite would store Numeric values as floats.
+    """
+    __tablename__ = "TradeFillAggregate"
+    __table_args__ = (
+        UniqueConstraint("config_file_path", "start_timestamp", "market", "symbol"),
+    )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    start_timestamp = Column(BigInteger, nullable=False)
+    checkpoint_timestamp = Column(BigInteger, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    num_fills = Column(Integer, nullable=False)
+    num_buys = Column(Integer, nullable=False)
+    num_sells = Column(Integer, nullable=False)
+    num_position_fills = Column(Integer, nullable=False)
+    b_vol_base = Column(Text, nullable=False)
+    b_vol_quote = Column(Text, nullable=False)
+    s_vol_base = Column(Text, nullable=False)
+    s_vol_quote = Column(Text, nullable=False)
+    percent_fees_quote = Column(Text, nullable=True)
+    flat_fees = Column(JSON, nullable=False)
+    start_price = Column(Text, nullable=False)
+    last_price = Column(Text, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradeFillAggregate(config_file_path='{self.config_file_path}', " \
+               f"start_timestamp={self.start_timestamp}, checkpoint_timestamp={self.checkpoint_timestamp}, " \
+               f"market='{self.market}', symbol='{self.symbol}', num_fills={self.num_fills})"
+
+    @classmethod
+    def get_records(cls, sql_session: Session, config_file_path: str, start_timestamp: int) -> List["TradeFillAggregate"]:
+        return (
+            sql_session.query(cls)
+            .filter(cls.config_file_path == config_file_path, cls.start_timestamp == start_timestamp)
+            .all()
+        )
@@ -34,6 +34,29 @@ class LogMessage(PubSubMessage):
     logger_name: str = ''
 
 
+class InternalEventBatchMessage(PubSubMessage):
+    timestamp: Optional[float] = -1
+    events: Optional[List[Dict[str, Any]]] = []
+
+
+class LogBatchMessage(PubSubMessage):
+    timestamp: Optional[float] = -1
+    logs: Optional[List[Dict[str, Any]]] = []
+
+
+class BatchMetricsMessage(PubSubMessage):
+    timestamp: Optional[float] = -1
+    topic: Optional[str] = ''
+    enqueued: Optional[int] = 0
+    published: Optional[int] = 0
+    dropped: Optional[int] = 0
+    coalesced: Optional[int] = 0
+    batches: Optional[int] = 0
+    queue_depth: Optional[int] = 0
+    max_queue_depth: Optional[int] = 0
+    published_per_second: Optional[float] = 0.0
+
+
 class ExternalEventMessage(PubSubMessage):
     timestamp: Optional[int] = -1
     sequence: Optional[int] = 0
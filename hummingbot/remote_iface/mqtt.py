@@ -9,9 +9,10 @@ from collections import deque
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 from hummingbot import get_logging_conf
+from hummingbot.client.config.client_config_map import MQTTBatchOverflowPolicyEnum
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.connector.connector_base import ConnectorBase
@@ -34,12 +35,15 @@ from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
     BalanceLimitCommandMessage,
     BalancePaperCommandMessage,
+    BatchMetricsMessage,
     CommandShortcutMessage,
     ConfigCommandMessage,
     ExternalEventMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
+    InternalEventBatchMessage,
     InternalEventMessage,
+    LogBatchMessage,
     LogMessage,
     NotifyMessage,
     StartCommandMessage,
@@ -67,7 +71,10 @@ class TopicSpecs:
     PREFIX: str = '{namespace}/{instance_id}'
     COMMANDS: CommandTopicSpecs = CommandTopicSpecs()
     LOGS: str = '/log'
+    LOGS_BATCH: str = '/log/batch'
     INTERNAL_EVENTS: str = '/events'
+    INTERNAL_EVENTS_BATCH: str = '/events/batch'
+    BATCH_METRICS: str = '/bridge/metrics'
     NOTIFICATIONS: str = '/notify'
     STATUS_UPDATES: str = '/status_updates'
     HEARTBEATS: str = '/hb'
@@ -360,7 +367,201 @@ class MQTTCommands:
         return response
 
 
+class MQTTBatchMetrics:
+    def __init__(self):
+        self.enqueued = 0
+        self.published = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+
+
+class MQTTBatchPublisher:
+    """
+    Publishes the messages of a topic in batches from a background thread, so that producers (the trading loop, log
+    handlers) only pay for appending to a bounded queue instead of a broker round-trip per message.
+
+    When the queue is full the oldest pending message is dropped. With the coalesce policy a message is first merged
+    into the pending message with the same coalesce key (keeping the latest content and counting the repetitions).
+    Queue and throughput metrics are published periodically on the bridge metrics topic.
+    """
+    _METRICS_INTERVAL = 10.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mqtts_logger
+        if mqtts_logger is None:  # pragma: no cover
+            mqtts_logger = HummingbotLogger(__name__)
+        return mqtts_logger
+
+    def __init__(self,
+                 node: Node,
+                 topic: str,
+                 metrics_topic: str,
+                 batch_msg_type: type,
+                 batch_field: str,
+                 serializer: Callable[[Any], Dict[str, Any]],
+                 interval: float = 0.5,
+                 max_queue_size: int = 10000,
+                 overflow_policy: MQTTBatchOverflowPolicyEnum = MQTTBatchOverflowPolicyEnum.drop_oldest,
+                 max_batch_size: int = 1000):
+        self._node = node
+        self._topic = topic
+        self._batch_msg_type = batch_msg_type
+        self._batch_field = batch_field
+        self._serializer = serializer
+        self._interval = interval
+        self._max_queue_size = max_queue_size
+        self._coalesce = overflow_policy == MQTTBatchOverflowPolicyEnum.coalesce
+        self._max_batch_size = max_batch_size
+        # Each entry is a list of [coalesce_key, item, repetitions]
+        self._queue: deque = deque()
+        self._pending_by_key: Dict[Hashable, List[Any]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._metrics = MQTTBatchMetrics()
+        self._last_metrics_timestamp = time.time()
+        self._last_metrics_published = 0
+
+        self.batch_pub = self._node.create_publisher(topic=topic, msg_type=batch_msg_type)
+        self.metrics_pub = self._node.create_publisher(topic=metrics_topic, msg_type=BatchMetricsMessage)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "topic": self._topic,
+            "enqueued": self._metrics.enqueued,
+            "published": self._metrics.published,
+            "dropped": self._metrics.dropped,
+            "coalesced": self._metrics.coalesced,
+            "batches": self._metrics.batches,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._metrics.max_queue_depth,
+        }
+
+    def enqueue(self, item: Any, coalesce_key: Optional[Hashable] = None):
+        """
+        Adds a message to the queue. Safe to call from any thread.
+
+        :param item: the message, converted with the serializer when the batch is published
+        :param coalesce_key: identifies the messages that can be merged when the queue overflows
+        """
+        with self._lock:
+            self._metrics.enqueued += 1
+            if len(self._queue) >= self._max_queue_size:
+                if self._coalesce and coalesce_key is not None:
+                    pending_entry = self._pending_by_key.get(coalesce_key)
+                    if pending_entry is not None:
+                        pending_entry[1] = item
+                        pending_entry[2] += 1
+                        self._metrics.coalesced += 1
+                        return
+                dropped_entry = self._queue.popleft()
+                if dropped_entry[0] is not None and self._pending_by_key.get(dropped_entry[0]) is dropped_entry:
+                    del self._pending_by_key[dropped_entry[0]]
+                self._metrics.dropped += dropped_entry[2]
+            entry = [coalesce_key, item, 1]
+            self._queue.append(entry)
+            if self._coalesce and coalesce_key is not None:
+                self._pending_by_key[coalesce_key] = entry
+            self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, len(self._queue))
+
+    def start(self):
+        if self._node.state == NodeState.RUNNING:
+            self.batch_pub.run()
+            self.metrics_pub.run()
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._run, name=f"MQTTBatchPublisher{self._topic}", daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """
+        Stops the worker thread after publishing the messages still in the queue.
+        """
+        self._stop_event.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=self._interval * 10)
+        self._worker = None
+
+    def flush(self):
+        """
+        Publishes all the queued messages, in batches of at most `max_batch_size` messages.
+        """
+        with self._lock:
+            entries = self._queue
+            self._queue = deque()
+            self._pending_by_key = {}
+        if not entries:
+            return
+        payloads = []
+        for _, item, repetitions in entries:
+            payload = self._serializer(item)
+            if repetitions > 1:
+                payload["coalesced"] = repetitions - 1
+            payloads.append(payload)
+        for i in range(0, len(payloads), self._max_batch_size):
+            batch = payloads[i:i + self._max_batch_size]
+            self.batch_pub.publish(self._batch_msg_type(**{"timestamp": time.time(), self._batch_field: batch}))
+            self._metrics.batches += 1
+            self._metrics.published += sum(payload.get("coalesced", 0) + 1 for payload in batch)
+
+    def publish_metrics(self):
+        now = time.time()
+        elapsed = now - self._last_metrics_timestamp
+        published_per_second = ((self._metrics.published - self._last_metrics_published) / elapsed
+                                if elapsed > 0 else 0.0)
+        self._last_metrics_timestamp = now
+        self._last_metrics_published = self._metrics.published
+        self.metrics_pub.publish(BatchMetricsMessage(
+            timestamp=now,
+            published_per_second=published_per_second,
+            **self.metrics,
+        ))
+
+    def _run(self):
+        next_metrics_timestamp = time.time() + self._METRICS_INTERVAL
+        while not self._stop_event.wait(self._interval):
+            self._safe_flush()
+            if time.time() >= next_metrics_timestamp:
+                next_metrics_timestamp = time.time() + self._METRICS_INTERVAL
+                try:
+                    self.publish_metrics()
+                except Exception:
+                    self.logger().error("Error publishing MQTT batch metrics.", exc_info=True)
+        self._safe_flush()
+
+    def _safe_flush(self):
+        try:
+            self.flush()
+        except Exception:
+            self.logger().error(f"Error publishing MQTT batch to {self._topic}.", exc_info=True)
+
+
 class MQTTMarketEventForwarder:
+    EVENT_TYPES: Dict[int, str] = {
+        events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
+        events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
+        events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
+        events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
+        events.MarketEvent.OrderFilled.value: "OrderFilled",
+        events.MarketEvent.OrderCancelled.value: "OrderCancelled",
+        events.MarketEvent.OrderExpired.value: "OrderExpired",
+        events.MarketEvent.OrderFailure.value: "OrderFailure",
+        events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
+        events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
+        events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
+        events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
+        events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
+        events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
+        events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
+    }
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -409,9 +610,38 @@ class MQTTMarketEventForwarder:
         self.event_fw_pub = self._node.create_publisher(
             topic=self._topic, msg_type=InternalEventMessage
         )
+        self.batch_publisher: Optional[MQTTBatchPublisher] = None
+        mqtt_config = self._hb_app.client_config_map.mqtt_bridge
+        if mqtt_config.mqtt_batch_mode:
+            self.batch_publisher = MQTTBatchPublisher(
+                node=self._node,
+                topic=f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS_BATCH}',
+                metrics_topic=f'{topic_prefix}{TopicSpecs.BATCH_METRICS}',
+                batch_msg_type=InternalEventBatchMessage,
+                batch_field="events",
+                serializer=lambda item: self._make_event_message(*item).dict(),
+                interval=mqtt_config.mqtt_batch_interval,
+                max_queue_size=mqtt_config.mqtt_batch_max_queue_size,
+                overflow_policy=mqtt_config.mqtt_batch_overflow_policy,
+            )
         self._start_event_listeners()
 
+    def start(self):
+        if self._node.state == NodeState.RUNNING:
+            self.event_fw_pub.run()
+        if self.batch_publisher is not None:
+            self.batch_publisher.start()
+
+    def stop(self):
+        self._stop_event_listeners()
+        if self.batch_publisher is not None:
+            self.batch_publisher.stop()
+
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
+        if self.batch_publisher is not None:
+            # The conversion to a message is done by the batch publisher worker, out of the trading loop
+            self.batch_publisher.enqueue((event_tag, event), coalesce_key=self._coalesce_key(event_tag, event))
+            return
         if threading.current_thread() != threading.main_thread():  # pragma: no cover
             self._ev_loop.call_soon_threadsafe(
                 self._send_mqtt_event,
@@ -420,27 +650,18 @@ class MQTTMarketEventForwarder:
                 event
             )
             return
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+        self.event_fw_pub.publish(self._make_event_message(event_tag, event))
+
+    @staticmethod
+    def _coalesce_key(event_tag: int, event) -> Optional[Hashable]:
+        # Fills and funding payments are never merged, each one changes the balances
+        if event_tag in (events.MarketEvent.OrderFilled.value, events.MarketEvent.FundingPaymentCompleted.value):
+            return None
+        order_id = getattr(event, "order_id", None)
+        return (event_tag, order_id) if order_id is not None else None
+
+    def _make_event_message(self, event_tag: int, event) -> InternalEventMessage:
+        event_type = self.EVENT_TYPES.get(event_tag, "Unknown")
 
         if is_dataclass(event):
             event_data = asdict(event)
@@ -459,12 +680,10 @@ class MQTTMarketEventForwarder:
 
         event_data = self._make_event_payload(event_data)
 
-        self.event_fw_pub.publish(
-            InternalEventMessage(
-                timestamp=int(timestamp),
-                type=event_type,
-                data=event_data
-            )
+        return InternalEventMessage(
+            timestamp=int(timestamp),
+            type=event_type,
+            data=event_data
         )
 
     def _make_event_payload(self, event_data):
@@ -656,10 +875,13 @@ class MQTTGateway(Node):
                     if log in logger.name:
                         self.remove_log_handler(logger)
 
+        if self._logh is not None:
+            self._logh.close()
         self._logh = None
 
     def _init_logger(self):
         self._logh = MQTTLogHandler(self._hb_app, self)
+        self._logh.start()
         self.patch_loggers()
 
     def patch_loggers(self):  # pragma: no cover
@@ -723,12 +945,20 @@ class MQTTGateway(Node):
         # HummingbotApplication._initialize_markets() must be be called before
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_events:
             self._market_events = MQTTMarketEventForwarder(self._hb_app, self)
-            if self.state == NodeState.RUNNING:
-                self._market_events.event_fw_pub.run()
+            self._market_events.start()
 
     def _remove_market_event_listeners(self):
         if self._market_events is not None:
-            self._market_events._stop_event_listeners()
+            self._market_events.stop()
+
+    @property
+    def batch_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Returns the queue and throughput metrics of the topics published in batch mode
+        """
+        batch_publishers = [component.batch_publisher for component in (self._logh, self._market_events)
+                            if component is not None and component.batch_publisher is not None]
+        return [batch_publisher.metrics for batch_publisher in batch_publishers]
 
     def _init_external_events(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_external_events:
@@ -856,13 +1086,14 @@ class MQTTGateway(Node):
 
     def stop(self, with_health: bool = True):
         self.broadcast_status_update("offline", msg_type="availability")
+        # Removed before stopping the node to publish the pending batches while the publishers are still connected
+        self._remove_log_handlers()
+        self._remove_market_event_listeners()
         super().stop()
         if self._hb_thread:
             self._hb_thread.stop()
         self._remove_status_updates()
         self._remove_notifier()
-        self._remove_log_handlers()
-        self._remove_market_event_listeners()
 
         if with_health:
             self._stop_health_monitoring_loop()
@@ -893,8 +1124,49 @@ class MQTTLogHandler(logging.Handler):
         self.name = self.__class__.__name__
         self.log_pub = self._node.create_publisher(topic=self._topic,
                                                    msg_type=LogMessage)
+        self.batch_publisher: Optional[MQTTBatchPublisher] = None
+        mqtt_config = self._hb_app.client_config_map.mqtt_bridge
+        if mqtt_config.mqtt_batch_mode:
+            self.batch_publisher = MQTTBatchPublisher(
+                node=self._node,
+                topic=f'{topic_prefix}{TopicSpecs.LOGS_BATCH}',
+                metrics_topic=f'{topic_prefix}{TopicSpecs.BATCH_METRICS}',
+                batch_msg_type=LogBatchMessage,
+                batch_field="logs",
+                serializer=self._make_log_payload,
+                interval=mqtt_config.mqtt_batch_interval,
+                max_queue_size=mqtt_config.mqtt_batch_max_queue_size,
+                overflow_policy=mqtt_config.mqtt_batch_overflow_policy,
+            )
+
+    def start(self):
+        if self.batch_publisher is not None:
+            self.batch_publisher.start()
+
+    def close(self):
+        if self.batch_publisher is not None:
+            self.batch_publisher.stop()
+        super().close()
+
+    @staticmethod
+    def _make_log_payload(item: Tuple[float, str, int, str, str]) -> Dict[str, Any]:
+        timestamp, msg_str, level_no, level_name, logger_name = item
+        return {
+            "timestamp": timestamp,
+            "msg": msg_str,
+            "level_no": level_no,
+            "level_name": level_name,
+            "logger_name": logger_name,
+        }
 
     def emit(self, record: logging.LogRecord):
+        if self.batch_publisher is not None:
+            msg_str = self.format(record)
+            self.batch_publisher.enqueue(
+                (time.time(), msg_str, record.levelno, record.levelname, record.name),
+                coalesce_key=(record.name, record.levelno, msg_str),
+            )
+            return
         if threading.current_thread() != threading.main_thread():  # pragma: no cover
             self._ev_loop.call_soon_threadsafe(self.emit, record)
             return
@@ -11,6 +11,7 @@ from hummingbot.client.settings import AllConnectorSettings, GatewayConnectionSe
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.amm.gateway_ethereum_amm import GatewayEthereumAMM
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
@@ -82,6 +83,8 @@ class AmmArbStrategy(StrategyPyBase):
                     status_report_interval: float = 900,
                     gateway_transaction_cancel_interval: int = 600,
                     rate_source: Optional[RateOracle] = RateOracle.get_instance(),
+                    quote_cache_ttl: float = GatewayQuoteCache.DEFAULT_TTL,
+                    quote_cache_amount_bucket_pct: Decimal = Decimal("0"),
                     ):
         """
         Assigns strategy parameters, this function must be called directly after init.
@@ -102,6 +105,10 @@ class AmmArbStrategy(StrategyPyBase):
         :param gateway_transaction_cancel_interval: Amount of seconds to wait before trying to cancel orders that are
         blockchain transactions that have not been included in a block (they are still in the mempool).
         :param rate_source: The rate source to use for conversion rate - (RateOracle or FixedRateSource) - default is FixedRateSource
+        :param quote_cache_ttl: Amount of seconds the gateway quotes are reused for. Longer values mean fewer and faster
+        gateway quote requests, but older prices.
+        :param quote_cache_amount_bucket_pct: The gateway quotes for amounts within this percentage of each other are
+        shared (e.g. 1 for 1%). 0 only shares the quotes for the exact same amount.
         """
         self._market_info_1 = market_info_1
         self._market_info_2 = market_info_2
@@ -129,6 +136,11 @@ class AmmArbStrategy(StrategyPyBase):
 
         self._order_id_side_map: Dict[str, ArbProposalSide] = {}
 
+        self._quote_cache = GatewayQuoteCache.get_instance()
+        self._quote_cache.ttl = quote_cache_ttl
+        self._quote_cache.amount_bucket_pct = quote_cache_amount_bucket_pct
+        self._quote_cache.reset_stats()
+
     @property
     def all_markets_ready(self) -> bool:
         return self._all_markets_ready
@@ -467,6 +479,13 @@ class AmmArbStrategy(StrategyPyBase):
         lines.extend(["", f"  Exchange Rates: ({str(self._rate_source)})"] +
                      ["    " + line for line in str(fixed_rates_df).split("\n")])
 
+        if self.is_gateway_market(self._market_info_1) or self.is_gateway_market(self._market_info_2):
+            quote_cache_stats = self._quote_cache.stats()
+            lines.extend(["", f"  Gateway Quote Cache: (ttl {self._quote_cache.ttl:g}s)",
+                          f"    Hit rate: {quote_cache_stats['hit_rate']:.2%} ({quote_cache_stats['hits']} cached, "
+                          f"{quote_cache_stats['in_flight_hits']} in flight, "
+                          f"{quote_cache_stats['misses']} gateway requests)"])
+
         warning_lines = self.network_warning([self._market_info_1])
         warning_lines.extend(self.network_warning([self._market_info_2]))
         warning_lines.extend(self.balance_warning([self._market_info_1]))
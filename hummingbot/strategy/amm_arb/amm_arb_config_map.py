@@ -169,4 +169,19 @@ amm_arb_config_map = {
         validator=lambda v: validate_decimal(v),
         prompt_on_new=False,
         type_str="decimal"),
+    "quote_cache_ttl": ConfigVar(
+        key="quote_cache_ttl",
+        prompt="For how many seconds should the gateway quotes be reused? (Enter 0 to disable the cache) >>> ",
+        default=Decimal("5"),
+        validator=lambda v: validate_decimal(v, min_value=Decimal("0"), inclusive=True),
+        prompt_on_new=False,
+        type_str="decimal"),
+    "quote_cache_amount_bucket_pct": ConfigVar(
+        key="quote_cache_amount_bucket_pct",
+        prompt="Within what percentage of each other should order amounts share the same gateway quote? "
+               "(Enter 1 for 1%) >>> ",
+        default=Decimal("0"),
+        validator=lambda v: validate_decimal(v, min_value=Decimal("0"), inclusive=True),
+        prompt_on_new=False,
+        type_str="decimal"),
 }
@@ -30,6 +30,8 @@ def start(self):
     quote_conversion_rate = amm_arb_config_map.get("quote_conversion_rate").value
     gas_token = amm_arb_config_map.get("gas_token").value
     gas_price = amm_arb_config_map.get("gas_price").value
+    quote_cache_ttl = amm_arb_config_map.get("quote_cache_ttl").value
+    quote_cache_amount_bucket_pct = amm_arb_config_map.get("quote_cache_amount_bucket_pct").value
 
     self._initialize_markets([(connector_1, [market_1]), (connector_2, [market_2])])
     base_1, quote_1 = market_1.split("-")
@@ -93,4 +95,6 @@ def start(self):
                               concurrent_orders_submission=concurrent_orders_submission,
                               gateway_transaction_cancel_interval=gateway_transaction_cancel_interval,
                               rate_source=rate_source,
+                              quote_cache_ttl=float(quote_cache_ttl),
+                              quote_cache_amount_bucket_pct=quote_cache_amount_bucket_pct,
                               )
@@ -25,21 +25,22 @@ async def create_arb_proposals(
     order_amount = Decimal(str(order_amount))
     results = []
 
+    # All the quotes are requested at once. The gateway connectors share the identical quotes through their quote cache.
     tasks = []
     for trade_direction in TradeDirection:
         is_buy = trade_direction == TradeDirection.BUY
-        tasks.append([
+        tasks.extend([
             market_info_1.market.get_quote_price(market_info_1.trading_pair, is_buy, order_amount),
             market_info_1.market.get_order_price(market_info_1.trading_pair, is_buy, order_amount),
             market_info_2.market.get_quote_price(market_info_2.trading_pair, not is_buy, order_amount),
             market_info_2.market.get_order_price(market_info_2.trading_pair, not is_buy, order_amount)
         ])
 
-    results_raw = await safe_gather(*[safe_gather(*task_group) for task_group in tasks])
+    results_raw = await safe_gather(*tasks)
 
-    for trade_direction, task_group_result in zip(TradeDirection, results_raw):
+    for direction_index, trade_direction in enumerate(TradeDirection):
         is_buy = trade_direction == TradeDirection.BUY
-        m_1_q_price, m_1_o_price, m_2_q_price, m_2_o_price = task_group_result
+        m_1_q_price, m_1_o_price, m_2_q_price, m_2_o_price = results_raw[direction_index * 4:direction_index * 4 + 4]
 
         if any(p is None for p in (m_1_o_price, m_1_q_price, m_2_o_price, m_2_q_price)):
             continue
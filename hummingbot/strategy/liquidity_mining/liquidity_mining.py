@@ -1,7 +1,6 @@
 import asyncio
 import logging
 from decimal import Decimal
-from statistics import mean
 from typing import Dict, List, Set, Union
 
 import numpy as np
@@ -25,6 +24,7 @@ from hummingbot.strategy.utils import order_age
 from ...client.config.client_config_map import ClientConfigMap
 from ...client.config.config_helpers import ClientConfigAdapter
 from .data_types import PriceSize, Proposal
+from .volatility_estimator import RollingVolatilityEstimator
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
@@ -85,8 +85,10 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
+        self._tick_mid_prices: Dict[str, Decimal] = {}
+        self._volatility_estimator = RollingVolatilityEstimator(
+            list(market_infos), volatility_interval, avg_volatility_period)
+        self._volatility = np.full(len(market_infos), np.nan)
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
 
@@ -205,12 +207,13 @@ class LiquidityMiningStrategy(StrategyPyBase):
             best_ask = self._exchange.get_price(market, True)
             best_bid_pct = abs(best_bid - mid_price) / mid_price
             best_ask_pct = (best_ask - mid_price) / mid_price
+            volatility = self.market_volatility(market)
             data.append([
                 market,
                 float(mid_price),
                 f"{best_bid_pct:.2%}",
                 f"{best_ask_pct:.2%}",
-                "" if self._volatility[market].is_nan() else f"{self._volatility[market]:.2%}",
+                "" if volatility.is_nan() else f"{volatility:.2%}",
             ])
         df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
         df.sort_values(by=["Market"], inplace=True)
@@ -306,14 +309,19 @@ class LiquidityMiningStrategy(StrategyPyBase):
         constructor.
         """
         proposals = []
-        for market, market_info in self._market_infos.items():
+        markets = list(self._market_infos)
+        # volatility applies only when it is higher than the spread setting. The comparison is done for all the markets
+        # at once, and only the widened spreads are computed in Decimal.
+        market_indexes = [self._volatility_estimator.market_index(market) for market in markets]
+        adjusted_volatility = self._volatility[market_indexes] * float(self._volatility_to_spread_multiplier)
+        widened = adjusted_volatility > float(self._spread)
+        for market, is_widened in zip(markets, widened):
             spread = self._spread
-            if not self._volatility[market].is_nan():
-                # volatility applies only when it is higher than the spread setting.
-                spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
+            if is_widened:
+                spread = max(spread, self.market_volatility(market) * self._volatility_to_spread_multiplier)
             if self._max_spread > s_decimal_zero:
                 spread = min(spread, self._max_spread)
-            mid_price = market_info.get_mid_price()
+            mid_price = self._mid_price(market)
             buy_price = mid_price * (Decimal("1") - spread)
             buy_price = self._exchange.quantize_order_price(market, buy_price)
             buy_size = self.base_order_size(market, buy_price)
@@ -364,7 +372,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         if self._token == base:
             return self._order_amount
         if price == s_decimal_zero:
-            price = self._market_infos[trading_pair].get_mid_price()
+            price = self._mid_price(trading_pair)
         return self._order_amount / price
 
     def apply_budget_constraint(self, proposals: List[Proposal]):
@@ -404,9 +412,10 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Cancel any orders that have an order age greater than self._max_order_age or if orders are not within tolerance
         """
+        orders_by_market = self._active_orders_by_market()
         for proposal in proposals:
             to_cancel = False
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
+            cur_orders = orders_by_market.get(proposal.market, [])
             if cur_orders and any(order_age(o, self.current_timestamp) > self._max_order_age for o in cur_orders):
                 to_cancel = True
             elif self._refresh_times[proposal.market] <= self.current_timestamp and \
@@ -423,12 +432,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
         Execute a list of proposals if the current timestamp is less than its refresh timestamp.
         Update the refresh timestamp.
         """
+        orders_by_market = self._active_orders_by_market()
+        maker_order_type: OrderType = self._exchange.get_maker_order_type()
         for proposal in proposals:
-            maker_order_type: OrderType = self._exchange.get_maker_order_type()
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
-            if cur_orders or self._refresh_times[proposal.market] > self.current_timestamp:
+            if proposal.market in orders_by_market or self._refresh_times[proposal.market] > self.current_timestamp:
                 continue
-            mid_price = self._market_infos[proposal.market].get_mid_price()
+            mid_price = self._mid_price(proposal.market)
             spread = s_decimal_zero
             if proposal.buy.size > 0:
                 spread = abs(proposal.buy.price - mid_price) / mid_price
@@ -453,8 +462,9 @@ class LiquidityMiningStrategy(StrategyPyBase):
                     price=proposal.sell.price
                 )
             if proposal.buy.size > 0 or proposal.sell.size > 0:
-                if not self._volatility[proposal.market].is_nan() and spread > self._spread:
-                    adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
+                volatility = self.market_volatility(proposal.market)
+                if not volatility.is_nan() and spread > self._spread:
+                    adjusted_vol = volatility * self._volatility_to_spread_multiplier
                     if adjusted_vol > self._spread:
                         self.logger().info(f"({proposal.market}) Spread is widened to {spread:.2%} due to high "
                                            f"market volatility")
@@ -523,7 +533,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         for proposal in proposals:
             buy_budget = self._buy_budgets[proposal.market]
             sell_budget = self._sell_budgets[proposal.market]
-            mid_price = self._market_infos[proposal.market].get_mid_price()
+            mid_price = self._mid_price(proposal.market)
             total_order_size = proposal.sell.size + proposal.buy.size
             bid_ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
                 float(sell_budget),
@@ -559,38 +569,47 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
     def update_mid_prices(self):
         """
-        Query asset markets for mid price
+        Query asset markets for mid price, once per tick, and add them to the volatility estimator
         """
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        self._tick_mid_prices = {market: market_info.get_mid_price()
+                                 for market, market_info in self._market_infos.items()}
+        mid_prices = np.full(len(self._volatility_estimator.markets), np.nan)
+        for market, mid_price in self._tick_mid_prices.items():
+            mid_prices[self._volatility_estimator.market_index(market)] = float(mid_price)
+        self._volatility_estimator.update(mid_prices)
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        self._volatility = self._volatility_estimator.volatility()
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
-            for market, vol in self._volatility.items():
+            for market in self._market_infos:
+                vol = self.market_volatility(market)
                 if not vol.is_nan():
                     self.logger().info(f"{market} volatility: {vol:.2%}")
             self._last_vol_reported = self.current_timestamp
 
+    def market_volatility(self, market: str) -> Decimal:
+        """
+        The volatility of the market at the last update, NaN if it is not known yet
+        """
+        volatility = self._volatility[self._volatility_estimator.market_index(market)]
+        return s_decimal_nan if np.isnan(volatility) else Decimal(str(volatility))
+
+    def _mid_price(self, market: str) -> Decimal:
+        """
+        The mid price of the market for the current tick, queried only once per tick
+        """
+        mid_price = self._tick_mid_prices.get(market)
+        return mid_price if mid_price is not None else self._market_infos[market].get_mid_price()
+
+    def _active_orders_by_market(self) -> Dict[str, List[LimitOrder]]:
+        orders_by_market: Dict[str, List[LimitOrder]] = {}
+        for order in self.active_orders:
+            orders_by_market.setdefault(order.trading_pair, []).append(order)
+        return orders_by_market
+
     def notify_hb_app(self, msg: str):
         """
         Send a message to the hummingbot application
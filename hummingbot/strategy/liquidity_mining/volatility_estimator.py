@@ -0,0 +1,86 @@
+from typing import Dict, List
+
+import numpy as np
+
+
+class RollingVolatilityEstimator:
+    """
+    Volatility estimator of many markets, updated in constant time per market with the mid prices of each tick.
+
+    The mid prices are grouped in bars of `interval` ticks. The volatility of a bar is its price range relative to its
+    lowest price, (high - low) / low, and the volatility of a market is the average volatility of the current bar and
+    of the `period - 1` bars before it. Only the high and low of the current bar, and the volatility of the previous
+    bars, are kept: the state of all the markets is a few fixed-size NumPy arrays, whatever the interval.
+
+    Markets without a price at a tick (NaN) are left unchanged for that tick.
+    """
+
+    def __init__(self, markets: List[str], interval: int, period: int):
+        """
+        :param markets: the markets to estimate the volatility of, in the order of the price arrays
+        :param interval: the number of ticks in a bar
+        :param period: the number of bars the volatility is averaged over
+        """
+        self._markets = list(markets)
+        self._market_indexes: Dict[str, int] = {market: index for index, market in enumerate(self._markets)}
+        self._interval = max(int(interval), 1)
+        self._period = max(int(period), 1)
+        market_count = len(self._markets)
+        self._bar_highs = np.full(market_count, np.nan)
+        self._bar_lows = np.full(market_count, np.nan)
+        self._bar_ticks = 0
+        # Ring buffer of the volatility of the completed bars, with the running sum and count of its valid values
+        self._bar_volatilities = np.full((market_count, self._period - 1), np.nan)
+        self._next_bar_column = 0
+        self._volatility_sums = np.zeros(market_count)
+        self._volatility_counts = np.zeros(market_count)
+
+    @property
+    def markets(self) -> List[str]:
+        return self._markets
+
+    def market_index(self, market: str) -> int:
+        return self._market_indexes[market]
+
+    def update(self, mid_prices: np.ndarray):
+        """
+        Adds the mid prices of a tick.
+
+        :param mid_prices: the mid price of each market, in the order of `markets`
+        """
+        if self._bar_ticks == self._interval:
+            self._close_bar()
+        with np.errstate(invalid="ignore"):
+            self._bar_highs = np.fmax(self._bar_highs, mid_prices)
+            self._bar_lows = np.fmin(self._bar_lows, mid_prices)
+        self._bar_ticks += 1
+
+    def volatility(self) -> np.ndarray:
+        """
+        Returns the volatility of each market, NaN for the markets without any price yet.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            current_volatility = (self._bar_highs - self._bar_lows) / self._bar_lows
+            valid = np.isfinite(current_volatility)
+            sums = self._volatility_sums + np.where(valid, current_volatility, 0.0)
+            counts = self._volatility_counts + valid
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def _close_bar(self):
+        if self._period > 1:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                bar_volatility = (self._bar_highs - self._bar_lows) / self._bar_lows
+            bar_volatility[~np.isfinite(bar_volatility)] = np.nan
+            replaced = self._bar_volatilities[:, self._next_bar_column]
+            replaced_valid = ~np.isnan(replaced)
+            self._volatility_sums -= np.where(replaced_valid, replaced, 0.0)
+            self._volatility_counts -= replaced_valid
+            new_valid = ~np.isnan(bar_volatility)
+            self._volatility_sums += np.where(new_valid, bar_volatility, 0.0)
+            self._volatility_counts += new_valid
+            self._volatility_sums[self._volatility_counts == 0] = 0.0
+            self._bar_volatilities[:, self._next_bar_column] = bar_volatility
+            self._next_bar_column = (self._next_bar_column + 1) % (self._period - 1)
+        self._bar_highs = np.full(len(self._markets), np.nan)
+        self._bar_lows = np.full(len(self._markets), np.nan)
+        self._bar_ticks = 0
@@ -0,0 +1,187 @@
+import math
+from decimal import Decimal
+from typing import Optional
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.l2_matching_engine import AMOUNT_TOLERANCE, L2MatchingEngine, L2SimulatedOrder
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class L2PositionExecutorSimulation:
+    """
+    Simulates a position executor tick by tick, sending its orders to an L2MatchingEngine:
+    - the open order is a limit order at the entry price (post only for LIMIT_MAKER), or a market order
+    - once the open order is filled, a limit take profit order is placed if the take profit order type is a limit type
+    - the market barriers (take profit, stop loss, trailing stop) are controlled on the top of the book price the
+    position would be closed at, and the position is closed with a market order
+    """
+
+    def __init__(self, config: PositionExecutorConfig, matching_engine: L2MatchingEngine):
+        self.config = config
+        self._matching_engine = matching_engine
+        self._is_buy = config.side == TradeType.BUY
+        self._side_multiplier = 1 if self._is_buy else -1
+        triple_barrier_config = config.triple_barrier_config
+        self._take_profit = float(triple_barrier_config.take_profit) if triple_barrier_config.take_profit else None
+        self._is_take_profit_limit = triple_barrier_config.take_profit_order_type.is_limit_type()
+        self._stop_loss = float(triple_barrier_config.stop_loss) if triple_barrier_config.stop_loss else None
+        self._trailing_stop_activation = None
+        self._trailing_stop_delta = None
+        if triple_barrier_config.trailing_stop:
+            self._trailing_stop_activation = float(triple_barrier_config.trailing_stop.activation_price)
+            self._trailing_stop_delta = float(triple_barrier_config.trailing_stop.trailing_delta)
+        self._trailing_stop_trigger: Optional[float] = None
+        self.end_timestamp = (config.timestamp + triple_barrier_config.time_limit
+                              if triple_barrier_config.time_limit else math.inf)
+        self._open_order: Optional[L2SimulatedOrder] = None
+        self._take_profit_order: Optional[L2SimulatedOrder] = None
+        self._order_count = 0
+        self.open_amount = 0.0
+        self.open_quote = 0.0
+        self.close_amount = 0.0
+        self.close_quote = 0.0
+        self.fees_quote = 0.0
+        self.mark_price = math.nan
+        self.close_type: Optional[CloseType] = None
+        self.close_timestamp: Optional[float] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.close_type is None
+
+    @property
+    def position_amount(self) -> float:
+        return self.open_amount - self.close_amount
+
+    @property
+    def average_entry_price(self) -> float:
+        return self.open_quote / self.open_amount if self.open_amount > 0 else math.nan
+
+    @property
+    def net_pnl_quote(self) -> float:
+        if self.open_amount == 0:
+            return 0.0
+        position_value = self.position_amount * self.mark_price if self.position_amount > 0 else 0.0
+        return self._side_multiplier * (self.close_quote + position_value - self.open_quote) - self.fees_quote
+
+    @property
+    def net_pnl_pct(self) -> float:
+        return self.net_pnl_quote / self.open_quote if self.open_quote > 0 else 0.0
+
+    def start(self, timestamp: float, mid_price: float):
+        self.mark_price = mid_price
+        open_order_type = self.config.triple_barrier_config.open_order_type
+        if open_order_type.is_limit_type():
+            entry_price = float(self.config.entry_price) if self.config.entry_price else mid_price
+            self._open_order = self._matching_engine.place_limit_order(
+                order_id=self._next_order_id(), is_buy=self._is_buy, price=entry_price, amount=float(self.config.amount),
+                timestamp=timestamp, post_only=open_order_type == OrderType.LIMIT_MAKER, on_fill=self._on_open_fill)
+            if self._open_order.is_rejected:
+                self._terminate(timestamp, CloseType.FAILED)
+        else:
+            self._open_order = self._matching_engine.place_market_order(
+                order_id=self._next_order_id(), is_buy=self._is_buy, amount=float(self.config.amount),
+                timestamp=timestamp, on_fill=self._on_open_fill)
+            if self.open_amount == 0:
+                self._terminate(timestamp, CloseType.FAILED)
+
+    def process_tick(self, timestamp: float, best_bid: float, best_ask: float):
+        """
+        Controls the barriers on the top of the book, after an event changed it or filled an order.
+        """
+        self.mark_price = (best_bid + best_ask) / 2
+        if self.open_amount <= self.close_amount:
+            if timestamp >= self.end_timestamp:
+                self.stop(timestamp, CloseType.TIME_LIMIT)
+            return
+        close_price = best_bid if self._is_buy else best_ask
+        average_entry_price = self.open_quote / self.open_amount
+        pnl_pct = self._side_multiplier * (close_price - average_entry_price) / average_entry_price
+        if self._stop_loss is not None and pnl_pct <= -self._stop_loss:
+            self.stop(timestamp, CloseType.STOP_LOSS)
+        elif self._take_profit is not None and not self._is_take_profit_limit and pnl_pct >= self._take_profit:
+            self.stop(timestamp, CloseType.TAKE_PROFIT)
+        elif self._trailing_stop_activation is not None and self._is_trailing_stop_triggered(pnl_pct):
+            self.stop(timestamp, CloseType.TRAILING_STOP)
+        elif timestamp >= self.end_timestamp:
+            self.stop(timestamp, CloseType.TIME_LIMIT)
+
+    def stop(self, timestamp: float, close_type: CloseType = CloseType.EARLY_STOP):
+        """
+        Cancels the orders of the executor and closes its position with a market order.
+        """
+        if not self.is_active:
+            return
+        self._cancel_orders()
+        if self.position_amount > self.open_amount * AMOUNT_TOLERANCE:
+            self._matching_engine.place_market_order(
+                order_id=self._next_order_id(), is_buy=not self._is_buy, amount=self.position_amount,
+                timestamp=timestamp, on_fill=self._on_close_fill)
+        self._terminate(timestamp, close_type)
+
+    def executor_info(self) -> ExecutorInfo:
+        return ExecutorInfo(
+            id=self.config.id,
+            timestamp=self.config.timestamp,
+            type=self.config.type,
+            close_timestamp=self.close_timestamp,
+            close_type=self.close_type,
+            status=RunnableStatus.RUNNING if self.is_active else RunnableStatus.TERMINATED,
+            config=self.config,
+            net_pnl_pct=Decimal(self.net_pnl_pct),
+            net_pnl_quote=Decimal(self.net_pnl_quote),
+            cum_fees_quote=Decimal(self.fees_quote),
+            filled_amount_quote=Decimal(self.open_quote + self.close_quote),
+            is_active=self.is_active,
+            is_trading=self.is_active and self.open_amount > 0,
+            custom_info={
+                "close_price": self.mark_price,
+                "level_id": self.config.level_id,
+                "side": self.config.side,
+                "current_position_average_price": self.average_entry_price if self.open_amount > 0 else None,
+            }
+        )
+
+    def _is_trailing_stop_triggered(self, pnl_pct: float) -> bool:
+        if pnl_pct >= self._trailing_stop_activation:
+            trigger = pnl_pct - self._trailing_stop_delta
+            if self._trailing_stop_trigger is None or trigger > self._trailing_stop_trigger:
+                self._trailing_stop_trigger = trigger
+        return self._trailing_stop_trigger is not None and pnl_pct < self._trailing_stop_trigger
+
+    def _on_open_fill(self, order: L2SimulatedOrder, timestamp: float, price: float, amount: float):
+        self.open_amount += amount
+        self.open_quote += price * amount
+        self.fees_quote += price * amount * self._matching_engine.trade_cost
+        if not order.is_open and self._take_profit is not None and self._is_take_profit_limit and self.is_active:
+            take_profit_price = self.average_entry_price * (1 + self._side_multiplier * self._take_profit)
+            self._take_profit_order = self._matching_engine.place_limit_order(
+                order_id=self._next_order_id(), is_buy=not self._is_buy, price=take_profit_price,
+                amount=self.position_amount, timestamp=timestamp, on_fill=self._on_take_profit_fill)
+
+    def _on_take_profit_fill(self, order: L2SimulatedOrder, timestamp: float, price: float, amount: float):
+        self._on_close_fill(order, timestamp, price, amount)
+        if not order.is_open and self.is_active:
+            self._terminate(timestamp, CloseType.TAKE_PROFIT)
+
+    def _on_close_fill(self, order: L2SimulatedOrder, timestamp: float, price: float, amount: float):
+        self.close_amount += amount
+        self.close_quote += price * amount
+        self.fees_quote += price * amount * self._matching_engine.trade_cost
+
+    def _cancel_orders(self):
+        for order in (self._open_order, self._take_profit_order):
+            if order is not None and order.is_open:
+                self._matching_engine.cancel_order(order.order_id)
+
+    def _terminate(self, timestamp: float, close_type: CloseType):
+        self._cancel_orders()
+        self.close_type = close_type
+        self.close_timestamp = timestamp
+
+    def _next_order_id(self) -> str:
+        self._order_count += 1
+        return f"{self.config.id}-{self._order_count}"
@@ -0,0 +1,135 @@
+"""
+Measures the throughput of the L2 backtesting mode on a synthetic recording: the replay of the order book alone, then
+the replay with market making position executors quoting around the mid price.
+
+Usage: python -m hummingbot.strategy_v2.backtesting.l2_backtesting_benchmark [events]
+"""
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from typing import Dict
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookReplaySource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy_v2.backtesting.l2_backtesting_engine import L2MarketSimulator
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+
+TRADING_PAIR = "COINALPHA-HBOT"
+SPREADS = (0.0005, 0.001, 0.002)
+EXECUTOR_REFRESH_TIME = 30
+
+
+def record_synthetic_session(directory: str, events: int, seed: int = 0, events_per_second: int = 100,
+                             trade_ratio: float = 0.2) -> OrderBookReplaySource:
+    """
+    Records a random walk of the mid price, with one level updated on each side per diff, and trades at the touch.
+    """
+    rng = np.random.default_rng(seed)
+    recorder = OrderBookRecorder(directory, segment_max_events=50000, segment_max_age=float("inf"))
+    order_book = OrderBook()
+    mid_price = 100.0
+    tick_size = 0.01
+    bids = [[round(mid_price - (i + 1) * tick_size, 2), 1.0 + i, 1] for i in range(20)]
+    asks = [[round(mid_price + (i + 1) * tick_size, 2), 1.0 + i, 1] for i in range(20)]
+    order_book.apply_numpy_snapshot(np.array(bids, dtype=float), np.array(asks, dtype=float))
+    recorder.record_order_book(TRADING_PAIR, 0.0, order_book)
+    steps = rng.normal(0, tick_size, events)
+    is_trade = rng.random(events) < trade_ratio
+    offsets = rng.integers(1, 20, events)
+    amounts = rng.choice([0.0, 0.5, 1.0, 2.0], events)
+    for event in range(events):
+        timestamp = (event + 1) / events_per_second
+        mid_price += steps[event]
+        best_bid, best_ask = round(mid_price - tick_size / 2, 2), round(mid_price + tick_size / 2, 2)
+        if is_trade[event]:
+            trade_type = TradeType.SELL if steps[event] < 0 else TradeType.BUY
+            trade = OrderBookTradeEvent(trading_pair=TRADING_PAIR, timestamp=timestamp, type=trade_type,
+                                        price=best_bid if trade_type is TradeType.SELL else best_ask,
+                                        amount=float(amounts[event]) + 0.1, trade_id=str(event))
+            recorder.record_trade(trade)
+        else:
+            update_id = event + 2
+            # the new touch removes the levels it crosses, and one deeper level is updated on each side
+            recorder.record_diff(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": TRADING_PAIR,
+                "update_id": update_id,
+                "bids": [[best_bid, 1.0, update_id],
+                         [round(best_bid - offsets[event] * tick_size, 2), float(amounts[event]), update_id]],
+                "asks": [[best_ask, 1.0, update_id],
+                         [round(best_ask + offsets[event] * tick_size, 2), float(amounts[event]), update_id]],
+            }, timestamp=timestamp))
+    recorder.flush()
+    return OrderBookReplaySource(directory)
+
+
+def replay_throughput(replay_source: OrderBookReplaySource) -> Dict[str, float]:
+    start = time.perf_counter()
+    events = replay_source.replay(TRADING_PAIR, OrderBook())
+    elapsed = time.perf_counter() - start
+    return {"events": events, "seconds": elapsed, "events_per_second": events / elapsed}
+
+
+def market_making_throughput(replay_source: OrderBookReplaySource, step_interval: float = 1.0) -> Dict[str, float]:
+    """
+    Replays the recording while position executors quote each spread on both sides, and are refreshed when they are
+    not filled after EXECUTOR_REFRESH_TIME seconds.
+    """
+    market_simulator = L2MarketSimulator(replay_source, TRADING_PAIR, trade_cost=0.0002)
+    triple_barrier_config = TripleBarrierConfig(stop_loss=Decimal("0.01"), take_profit=Decimal("0.002"),
+                                                time_limit=600, open_order_type=OrderType.LIMIT,
+                                                take_profit_order_type=OrderType.LIMIT)
+    levels: Dict[str, str] = {}
+    start = time.perf_counter()
+    for timestamp in market_simulator.iter_steps(0, float("inf"), step_interval):
+        for level_id, executor_id in list(levels.items()):
+            executor = market_simulator.active_executors.get(executor_id)
+            if executor is None:
+                del levels[level_id]
+            elif executor.open_amount == 0 and timestamp - executor.config.timestamp > EXECUTOR_REFRESH_TIME:
+                market_simulator.stop_executor(executor_id)
+                del levels[level_id]
+        for side in (TradeType.BUY, TradeType.SELL):
+            side_multiplier = -1 if side is TradeType.BUY else 1
+            for level, spread in enumerate(SPREADS):
+                level_id = f"{side.name.lower()}_{level}"
+                if level_id in levels:
+                    continue
+                executor = market_simulator.create_executor(PositionExecutorConfig(
+                    timestamp=timestamp, connector_name="benchmark", trading_pair=TRADING_PAIR, side=side,
+                    entry_price=Decimal(market_simulator.mid_price * (1 + side_multiplier * spread)),
+                    amount=Decimal("1"), triple_barrier_config=triple_barrier_config, level_id=level_id))
+                if executor is not None and executor.is_active:
+                    levels[level_id] = executor.config.id
+    elapsed = time.perf_counter() - start
+    executors_info = market_simulator.executors_info()
+    return {
+        "events": market_simulator.processed_events,
+        "seconds": elapsed,
+        "events_per_second": market_simulator.processed_events / elapsed,
+        "executors": len(executors_info),
+        "filled_executors": sum(1 for executor_info in executors_info if executor_info.filled_amount_quote > 0),
+        "net_pnl_quote": float(sum(executor_info.net_pnl_quote for executor_info in executors_info)),
+    }
+
+
+def main(events: int = 500000):
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Recording {events} synthetic events...")
+        replay_source = record_synthetic_session(directory, events)
+        replay = replay_throughput(replay_source)
+        print(f"Order book replay: {replay['events']} events in {replay['seconds']:.2f}s, "
+              f"{replay['events_per_second']:,.0f} events/s")
+        simulation = market_making_throughput(replay_source)
+        print(f"Market making simulation: {simulation['events']} events in {simulation['seconds']:.2f}s, "
+              f"{simulation['events_per_second']:,.0f} events/s, {simulation['executors']} executors "
+              f"({simulation['filled_executors']} filled), net pnl {simulation['net_pnl_quote']:.4f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,201 @@
+import math
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookReplaySource
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executors_simulator.l2_position_executor_simulator import (
+    L2PositionExecutorSimulation,
+)
+from hummingbot.strategy_v2.backtesting.l2_matching_engine import L2MatchingEngine
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class L2MarketSimulator:
+    """
+    Replays the order book and the trades recorded for a trading pair into an OrderBook, and simulates the position
+    executors on it, event by event, through an L2MatchingEngine.
+    """
+
+    def __init__(self, replay_source: OrderBookReplaySource, trading_pair: str, trade_cost: float = 0.0):
+        self._replay_source = replay_source
+        self._trading_pair = trading_pair
+        self.order_book = OrderBook()
+        self.matching_engine = L2MatchingEngine(self.order_book, trade_cost)
+        self.active_executors: Dict[str, L2PositionExecutorSimulation] = {}
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        self.processed_events = 0
+        self.timestamp = math.nan
+        self.best_bid = math.nan
+        self.best_ask = math.nan
+        # the executors with a position, the only ones whose barriers depend on the top of the book
+        self._executors_with_position: List[L2PositionExecutorSimulation] = []
+        self._ticked_state = (math.nan, math.nan, 0)
+        self._next_time_limit_timestamp = math.inf
+
+    @property
+    def mid_price(self) -> float:
+        return (self.best_bid + self.best_ask) / 2
+
+    def iter_steps(self, start: float, end: float, step_interval: float) -> Iterator[float]:
+        """
+        Replays the events between start and end, and yields the timestamp of the first event of each step interval,
+        once applied, for the caller to act on the market (the controller decisions in the L2BacktestingEngine).
+        """
+        next_step_timestamp = start
+        trade_type = OrderBookMessageType.TRADE
+        for timestamp, event_type in self._replay_source.iter_replay(self._trading_pair, self.order_book,
+                                                                     start_timestamp=start, end_timestamp=end):
+            self.processed_events += 1
+            self.timestamp = timestamp
+            if event_type is not trade_type:
+                self.matching_engine.process_order_book(timestamp)
+                try:
+                    self.best_bid = self.order_book.get_price(False)
+                    self.best_ask = self.order_book.get_price(True)
+                except EnvironmentError:
+                    continue
+            if self.active_executors and (
+                    timestamp >= self._next_time_limit_timestamp
+                    or self._ticked_state != (self.best_bid, self.best_ask, self.matching_engine.fills_count)):
+                self._process_executors_tick(timestamp)
+            if timestamp >= next_step_timestamp:
+                yield timestamp
+                next_step_timestamp = timestamp - timestamp % step_interval + step_interval
+
+    def create_executor(self, config: ExecutorConfigBase) -> Optional[L2PositionExecutorSimulation]:
+        if not isinstance(config, PositionExecutorConfig) or math.isnan(self.mid_price):
+            return None
+        executor = L2PositionExecutorSimulation(config, self.matching_engine)
+        executor.start(self.timestamp, self.mid_price)
+        if executor.is_active:
+            self.active_executors[config.id] = executor
+            self._update_executors_state()
+        else:
+            self.stopped_executors_info.append(executor.executor_info())
+        return executor
+
+    def stop_executor(self, executor_id: str):
+        executor = self.active_executors.pop(executor_id, None)
+        if executor is not None:
+            executor.stop(self.timestamp)
+            self.stopped_executors_info.append(executor.executor_info())
+            self._update_executors_state()
+
+    def stop_all_executors(self):
+        for executor_id in list(self.active_executors):
+            self.stop_executor(executor_id)
+
+    def executors_info(self) -> List[ExecutorInfo]:
+        active_executors_info = []
+        for executor in self.active_executors.values():
+            executor.mark_price = self.mid_price
+            active_executors_info.append(executor.executor_info())
+        return active_executors_info + self.stopped_executors_info
+
+    def _process_executors_tick(self, timestamp: float):
+        """
+        Controls the barriers of the executors. Called when the top of the book changed, an order was filled or a time
+        limit is reached, as the barriers can not be reached otherwise. All the executors are controlled after a fill or
+        on a time limit, only the executors with a position on a top of the book change.
+        """
+        best_bid, best_ask = self.best_bid, self.best_ask
+        fills_count = self.matching_engine.fills_count
+        if fills_count != self._ticked_state[2] or timestamp >= self._next_time_limit_timestamp:
+            executors = list(self.active_executors.values())
+        else:
+            executors = self._executors_with_position
+        terminated_executors = []
+        for executor in executors:
+            executor.process_tick(timestamp, best_bid, best_ask)
+            if executor.close_type is not None:
+                terminated_executors.append(executor)
+        for executor in terminated_executors:
+            del self.active_executors[executor.config.id]
+            self.stopped_executors_info.append(executor.executor_info())
+        if terminated_executors or executors is not self._executors_with_position:
+            self._update_executors_state()
+        self._ticked_state = (best_bid, best_ask, fills_count)
+
+    def _update_executors_state(self):
+        self._executors_with_position = [executor for executor in self.active_executors.values()
+                                         if executor.open_amount > 0]
+        self._next_time_limit_timestamp = min(
+            (executor.end_timestamp for executor in self.active_executors.values()), default=math.inf)
+
+
+class L2BacktestingEngine(BacktestingEngineBase):
+    """
+    Event driven backtesting on recorded order books (see the OrderBookRecorder) instead of candles. The controller
+    decides on every step interval with the mid price of the replayed order book as price, and the position executors
+    are simulated on every order book event, their orders being matched against the book and the trades.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.market_simulator: Optional[L2MarketSimulator] = None
+
+    async def run_l2_backtesting(self,
+                                 controller_config: ControllerConfigBase,
+                                 replay_source: OrderBookReplaySource,
+                                 start: int, end: int,
+                                 step_interval: float = 1.0,
+                                 trade_cost: float = 0.0006):
+        controller_class = controller_config.get_controller_class()
+        self.backtesting_data_provider.update_backtesting_time(start, end)
+        await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
+        self.controller = controller_class(config=controller_config, market_data_provider=self.backtesting_data_provider,
+                                           actions_queue=None)
+        self.market_simulator = L2MarketSimulator(replay_source, controller_config.trading_pair, trade_cost)
+        features = await self.initialize_features()
+        for timestamp in self.market_simulator.iter_steps(start, end, step_interval):
+            await self.update_l2_state(timestamp, features)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    self.market_simulator.create_executor(action.executor_config)
+                elif isinstance(action, StopExecutorAction):
+                    self.market_simulator.stop_executor(action.executor_id)
+        # the positions still open are closed on the last order book
+        self.market_simulator.stop_all_executors()
+        self.market_simulator.matching_engine.stop()
+        executors_info = self.market_simulator.executors_info()
+        results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        return {
+            "executors": executors_info,
+            "results": results,
+            "processed_data": self.controller.processed_data,
+            "processed_events": self.market_simulator.processed_events,
+        }
+
+    async def initialize_features(self) -> Optional[pd.DataFrame]:
+        """
+        Computes the features of the controllers using candles once, as the candles backtesting does, so that they can
+        be looked up at each step without looking ahead.
+        """
+        if not self.controller.config.candles_config:
+            return None
+        for config in self.controller.config.candles_config:
+            await self.controller.market_data_provider.initialize_candles_feed(config)
+        await self.controller.update_processed_data()
+        return self.controller.processed_data.get("features")
+
+    async def update_l2_state(self, timestamp: float, features: Optional[pd.DataFrame]):
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        self.controller.market_data_provider.prices = {key: Decimal(self.market_simulator.mid_price)}
+        self.controller.market_data_provider._time = timestamp
+        if features is None:
+            await self.controller.update_processed_data()
+        else:
+            position = np.searchsorted(features["timestamp"].values, timestamp, side="right") - 1
+            if position >= 0:
+                self.controller.processed_data.update(features.iloc[position].to_dict())
+        self.controller.executors_info = self.market_simulator.executors_info()
@@ -0,0 +1,238 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+
+# relative amount under which an order is considered completely filled
+AMOUNT_TOLERANCE = 1e-9
+
+
+@dataclass
+class L2SimulatedOrder:
+    order_id: str
+    is_buy: bool
+    price: float  # NaN for market orders
+    amount: float
+    creation_timestamp: float
+    on_fill: Optional[Callable[["L2SimulatedOrder", float, float, float], None]] = None
+    queue_ahead: float = 0.0
+    executed_amount: float = 0.0
+    executed_quote: float = 0.0
+    fees_quote: float = 0.0
+    is_open: bool = True
+    is_rejected: bool = False
+
+    @property
+    def remaining_amount(self) -> float:
+        return self.amount - self.executed_amount
+
+    @property
+    def average_executed_price(self) -> float:
+        return self.executed_quote / self.executed_amount if self.executed_amount > 0 else math.nan
+
+
+class L2MatchingEngine:
+    """
+    Matches simulated orders against an OrderBook being replayed, following the PaperTradeExchange rules:
+    - a market order, and the crossing part of a limit order, take the liquidity of the opposite side of the book
+    - a resting limit order is completely filled at its price when the opposite side of the book crosses its price,
+    or when a trade goes through its price
+
+    On top of that, a trade at the price of a resting limit order first consumes the amount ahead of the order in the
+    queue (the amount of the price level when the order was placed, reduced when the level shrinks) and fills the order
+    with the rest of its amount.
+
+    The simulated orders have no impact on the replayed order book.
+    """
+
+    def __init__(self, order_book: OrderBook, trade_cost: float = 0.0):
+        self._order_book = order_book
+        self._trade_cost = trade_cost
+        self._bids: Dict[str, L2SimulatedOrder] = {}
+        self._asks: Dict[str, L2SimulatedOrder] = {}
+        self._best_bid_price = -math.inf
+        self._best_ask_price = math.inf
+        self.fills_count = 0
+        self._trade_forwarder = EventForwarder(self.process_trade)
+        self._order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
+
+    @property
+    def order_book(self) -> OrderBook:
+        return self._order_book
+
+    @property
+    def trade_cost(self) -> float:
+        return self._trade_cost
+
+    @property
+    def open_orders(self) -> Dict[str, L2SimulatedOrder]:
+        return {**self._bids, **self._asks}
+
+    def stop(self):
+        self._order_book.remove_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
+
+    def place_limit_order(self,
+                          order_id: str,
+                          is_buy: bool,
+                          price: float,
+                          amount: float,
+                          timestamp: float,
+                          post_only: bool = False,
+                          on_fill: Optional[Callable[[L2SimulatedOrder, float, float, float], None]] = None
+                          ) -> L2SimulatedOrder:
+        """
+        Places a limit order. The part crossing the book is filled right away as taker, unless the order is post only,
+        in which case it is rejected.
+
+        :param on_fill: called with the order, the timestamp, the price and the amount of each fill
+        """
+        order = L2SimulatedOrder(order_id=order_id, is_buy=is_buy, price=price, amount=amount,
+                                 creation_timestamp=timestamp, on_fill=on_fill)
+        if self._crosses_book(is_buy, price):
+            if post_only:
+                order.is_open = False
+                order.is_rejected = True
+                return order
+            self._take_liquidity(order, timestamp, price)
+            if not order.is_open:
+                return order
+        order.queue_ahead = self._level_amount(is_buy, price)
+        orders = self._bids if is_buy else self._asks
+        orders[order_id] = order
+        self._update_best_prices()
+        return order
+
+    def place_market_order(self,
+                           order_id: str,
+                           is_buy: bool,
+                           amount: float,
+                           timestamp: float,
+                           on_fill: Optional[Callable[[L2SimulatedOrder, float, float, float], None]] = None
+                           ) -> L2SimulatedOrder:
+        """
+        Fills the order against the opposite side of the book at once, at the volume weighted average price. The
+        amount the book can not fill is canceled.
+        """
+        order = L2SimulatedOrder(order_id=order_id, is_buy=is_buy, price=math.nan, amount=amount,
+                                 creation_timestamp=timestamp, on_fill=on_fill)
+        self._take_liquidity(order, timestamp, math.inf if is_buy else -math.inf)
+        order.is_open = False
+        return order
+
+    def cancel_order(self, order_id: str) -> Optional[L2SimulatedOrder]:
+        order = self._bids.pop(order_id, None) or self._asks.pop(order_id, None)
+        if order is not None:
+            order.is_open = False
+            self._update_best_prices()
+        return order
+
+    def process_order_book(self, timestamp: float):
+        """
+        Fills the resting orders crossed by the order book. Called after each diff or snapshot applied.
+        """
+        if self._bids:
+            try:
+                best_ask = self._order_book.get_price(True)
+            except EnvironmentError:
+                best_ask = math.inf
+            if self._best_bid_price >= best_ask:
+                for order in [order for order in self._bids.values() if order.price >= best_ask]:
+                    if order.is_open:
+                        self._fill(order, timestamp, order.price, order.remaining_amount)
+                self._update_best_prices()
+        if self._asks:
+            try:
+                best_bid = self._order_book.get_price(False)
+            except EnvironmentError:
+                best_bid = -math.inf
+            if self._best_ask_price <= best_bid:
+                for order in [order for order in self._asks.values() if order.price <= best_bid]:
+                    if order.is_open:
+                        self._fill(order, timestamp, order.price, order.remaining_amount)
+                self._update_best_prices()
+
+    def process_trade(self, trade: OrderBookTradeEvent):
+        """
+        Fills the resting orders of the maker side of a trade. Called by the order book for each trade applied.
+        """
+        is_maker_buy = trade.type is TradeType.SELL
+        trade_price = trade.price
+        if is_maker_buy:
+            if self._best_bid_price < trade_price:
+                return
+            orders = sorted((order for order in self._bids.values() if order.price >= trade_price),
+                            key=lambda order: (-order.price, order.creation_timestamp))
+        else:
+            if self._best_ask_price > trade_price:
+                return
+            orders = sorted((order for order in self._asks.values() if order.price <= trade_price),
+                            key=lambda order: (order.price, order.creation_timestamp))
+        trade_amount_left = trade.amount
+        for order in orders:
+            if not order.is_open:
+                continue
+            if order.price != trade_price:
+                self._fill(order, trade.timestamp, order.price, order.remaining_amount)
+                continue
+            order.queue_ahead = min(order.queue_ahead, self._level_amount(order.is_buy, order.price))
+            consumed_amount = min(order.queue_ahead, trade_amount_left)
+            order.queue_ahead -= consumed_amount
+            trade_amount_left -= consumed_amount
+            fill_amount = min(order.remaining_amount, trade_amount_left)
+            if fill_amount > 0:
+                trade_amount_left -= fill_amount
+                self._fill(order, trade.timestamp, order.price, fill_amount)
+        self._update_best_prices()
+
+    def _crosses_book(self, is_buy: bool, price: float) -> bool:
+        try:
+            return price >= self._order_book.get_price(True) if is_buy else price <= self._order_book.get_price(False)
+        except EnvironmentError:
+            return False
+
+    def _take_liquidity(self, order: L2SimulatedOrder, timestamp: float, limit_price: float):
+        entries = self._order_book.ask_entries() if order.is_buy else self._order_book.bid_entries()
+        amount_left = order.remaining_amount
+        filled_amount = 0.0
+        filled_quote = 0.0
+        for row in entries:
+            if (row.price > limit_price) if order.is_buy else (row.price < limit_price):
+                break
+            level_fill = min(amount_left, row.amount)
+            filled_amount += level_fill
+            filled_quote += level_fill * row.price
+            amount_left -= level_fill
+            if amount_left <= 0:
+                break
+        if filled_amount > 0:
+            self._fill(order, timestamp, filled_quote / filled_amount, filled_amount)
+
+    def _level_amount(self, is_buy: bool, price: float) -> float:
+        entries = self._order_book.bid_entries() if is_buy else self._order_book.ask_entries()
+        for row in entries:
+            if row.price == price:
+                return row.amount
+            if (row.price < price) if is_buy else (row.price > price):
+                break
+        return 0.0
+
+    def _fill(self, order: L2SimulatedOrder, timestamp: float, price: float, amount: float):
+        self.fills_count += 1
+        fill_quote = price * amount
+        order.executed_amount += amount
+        order.executed_quote += fill_quote
+        order.fees_quote += fill_quote * self._trade_cost
+        if order.remaining_amount <= order.amount * AMOUNT_TOLERANCE:
+            order.is_open = False
+            orders = self._bids if order.is_buy else self._asks
+            orders.pop(order.order_id, None)
+        if order.on_fill is not None:
+            order.on_fill(order, timestamp, price, amount)
+
+    def _update_best_prices(self):
+        self._best_bid_price = max((order.price for order in self._bids.values()), default=-math.inf)
+        self._best_ask_price = min((order.price for order in self._asks.values()), default=math.inf)
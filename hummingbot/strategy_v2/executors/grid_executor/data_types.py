@@ -1,8 +1,8 @@
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
@@ -57,10 +57,23 @@ class GridLevel(BaseModel):
     active_open_order: Optional[TrackedOrder] = None
     active_close_order: Optional[TrackedOrder] = None
     state: GridLevelStates = GridLevelStates.NOT_ACTIVE
+    _orders_change_listener: Optional[Callable[["GridLevel"], None]] = PrivateAttr(default=None)
 
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("active_open_order", "active_close_order") and self._orders_change_listener is not None:
+            self._orders_change_listener(self)
+
+    def set_orders_change_listener(self, listener: Optional[Callable[["GridLevel"], None]]):
+        """
+        Registers a function called with the level each time one of its active orders is replaced or reset, so that the
+        owner of the level can track its state changes without scanning all the levels.
+        """
+        self._orders_change_listener = listener
+
     def update_state(self):
         if self.active_open_order is None:
             self.state = GridLevelStates.NOT_ACTIVE
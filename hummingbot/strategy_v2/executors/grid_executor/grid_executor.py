@@ -1,8 +1,9 @@
 import asyncio
 import logging
 import math
+from bisect import bisect_left, bisect_right
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -59,6 +60,7 @@ class GridExecutor(ExecutorBase):
         # Grid levels
         self.grid_levels = self._generate_grid_levels()
         self.levels_by_state = {state: [] for state in GridLevelStates}
+        self._init_levels_index()
         self._close_order: Optional[TrackedOrder] = None
         self._filled_orders = []
         self._failed_orders = []
@@ -203,6 +205,49 @@ class GridExecutor(ExecutorBase):
         )
         return grid_levels
 
+    def _init_levels_index(self):
+        """
+        Indexes the grid levels by price and by state. The levels are kept in a price-sorted array, and the positions
+        of the levels in each state are kept in sets that are only updated for the levels with active orders or with
+        orders replaced since the previous update. This way the control loop scales with the number of active levels
+        instead of the size of the grid.
+        """
+        self._sorted_levels: List[GridLevel] = sorted(self.grid_levels, key=lambda level: level.price)
+        self._sorted_prices: List[Decimal] = [level.price for level in self._sorted_levels]
+        self._level_positions: Dict[str, int] = {level.id: position for position, level in enumerate(self._sorted_levels)}
+        self._level_states: List[GridLevelStates] = [level.state for level in self._sorted_levels]
+        self._level_positions_by_state: Dict[GridLevelStates, Set[int]] = {state: set() for state in GridLevelStates}
+        for position, level in enumerate(self._sorted_levels):
+            self._level_positions_by_state[level.state].add(position)
+            level.set_orders_change_listener(self._on_level_orders_change)
+        self._changed_level_positions: Set[int] = set(range(len(self._sorted_levels)))
+        self._changed_states: Set[GridLevelStates] = set(GridLevelStates)
+        self._levels_by_state_cache: Dict[GridLevelStates, List[GridLevel]] = {state: [] for state in GridLevelStates}
+
+    def _on_level_orders_change(self, level: GridLevel):
+        position = self._level_positions.get(level.id)
+        if position is not None:
+            self._changed_level_positions.add(position)
+
+    def _active_level_positions(self) -> List[int]:
+        """
+        Returns the positions (in the price-sorted array) of the levels with orders, in price order.
+        """
+        active_positions = set()
+        for state, positions in self._level_positions_by_state.items():
+            if state != GridLevelStates.NOT_ACTIVE:
+                active_positions.update(positions)
+        return sorted(active_positions)
+
+    def _set_level_state(self, position: int, state: GridLevelStates):
+        previous_state = self._level_states[position]
+        if previous_state != state:
+            self._level_positions_by_state[previous_state].discard(position)
+            self._level_positions_by_state[state].add(position)
+            self._level_states[position] = state
+            self._changed_states.add(previous_state)
+            self._changed_states.add(state)
+
     @property
     def end_time(self) -> Optional[float]:
         """
@@ -282,21 +327,31 @@ class GridExecutor(ExecutorBase):
         self.close_type = CloseType.POSITION_HOLD if keep_position else CloseType.EARLY_STOP
 
     def update_grid_levels(self):
-        self.levels_by_state = {state: [] for state in GridLevelStates}
-        for level in self.grid_levels:
+        # The state of the levels without orders only changes when an order is assigned to them
+        positions_to_update = self._changed_level_positions
+        positions_to_update.update(self._active_level_positions())
+        self._changed_level_positions = set()
+        for position in sorted(positions_to_update):
+            level = self._sorted_levels[position]
             level.update_state()
-            self.levels_by_state[level.state].append(level)
-        completed = self.levels_by_state[GridLevelStates.COMPLETE]
-        # Get completed orders and store them in the filled orders list
-        for level in completed:
-            if level.active_open_order.order.completely_filled_event.is_set() and level.active_close_order.order.completely_filled_event.is_set():
+            # Get completed orders and store them in the filled orders list
+            if (level.state == GridLevelStates.COMPLETE and
+                    level.active_open_order.order.completely_filled_event.is_set() and
+                    level.active_close_order.order.completely_filled_event.is_set()):
                 open_order = level.active_open_order.order.to_json()
                 close_order = level.active_close_order.order.to_json()
                 self._filled_orders.append(open_order)
                 self._filled_orders.append(close_order)
-                self.levels_by_state[GridLevelStates.COMPLETE].remove(level)
                 level.reset_level()
-                self.levels_by_state[GridLevelStates.NOT_ACTIVE].append(level)
+            self._set_level_state(position, level.state)
+        # The levels were already updated after being reset
+        self._changed_level_positions.difference_update(positions_to_update)
+        for state in self._changed_states:
+            self._levels_by_state_cache[state] = [
+                self._sorted_levels[position] for position in sorted(self._level_positions_by_state[state])
+            ]
+        self._changed_states.clear()
+        self.levels_by_state = dict(self._levels_by_state_cache)
 
     async def control_shutdown_process(self):
         """
@@ -480,9 +535,8 @@ class GridExecutor(ExecutorBase):
         if (self.max_open_creation_timestamp > self._strategy.current_timestamp - self.config.order_frequency or
                 n_open_orders >= self.config.max_open_orders):
             return []
-        levels_allowed = self._filter_levels_by_activation_bounds()
-        sorted_levels_by_proximity = self._sort_levels_by_proximity(levels_allowed)
-        return sorted_levels_by_proximity[:self.config.max_orders_per_batch]
+        start, end = self._activation_bounds_range()
+        return self._get_not_active_levels_by_proximity(start, end, self.config.max_orders_per_batch)
 
     def get_close_orders_to_create(self):
         """
@@ -537,19 +591,40 @@ class GridExecutor(ExecutorBase):
             return close_orders_to_cancel
         return []
 
-    def _filter_levels_by_activation_bounds(self):
-        not_active_levels = self.levels_by_state[GridLevelStates.NOT_ACTIVE]
+    def _activation_bounds_range(self) -> Tuple[int, int]:
+        """
+        Returns the range of positions in the price-sorted levels allowed by the activation bounds.
+        """
         if self.config.activation_bounds:
             if self.config.side == TradeType.BUY:
                 activation_bounds_price = self.mid_price * (1 - self.config.activation_bounds)
-                return [level for level in not_active_levels if level.price >= activation_bounds_price]
+                return bisect_left(self._sorted_prices, activation_bounds_price), len(self._sorted_prices)
             else:
                 activation_bounds_price = self.mid_price * (1 + self.config.activation_bounds)
-                return [level for level in not_active_levels if level.price <= activation_bounds_price]
-        return not_active_levels
-
-    def _sort_levels_by_proximity(self, levels: List[GridLevel]):
-        return sorted(levels, key=lambda level: abs(level.price - self.mid_price))
+                return 0, bisect_right(self._sorted_prices, activation_bounds_price)
+        return 0, len(self._sorted_prices)
+
+    def _get_not_active_levels_by_proximity(self, start: int, end: int, limit: Optional[int]) -> List[GridLevel]:
+        """
+        Returns the not active levels between the positions start and end, sorted by proximity to the mid price.
+        The levels are walked outwards from the mid price, so that only the levels closer than the last one returned are
+        visited.
+        """
+        not_active_positions = self._level_positions_by_state[GridLevelStates.NOT_ACTIVE]
+        right = min(max(bisect_left(self._sorted_prices, self.mid_price, start, end), start), end)
+        left = right - 1
+        levels = []
+        while (left >= start or right < end) and (limit is None or len(levels) < limit):
+            if right >= end or (left >= start and
+                                self.mid_price - self._sorted_prices[left] <= self._sorted_prices[right] - self.mid_price):
+                position = left
+                left -= 1
+            else:
+                position = right
+                right += 1
+            if position in not_active_positions:
+                levels.append(self._sorted_levels[position])
+        return levels
 
     def control_triple_barrier(self):
         """
@@ -731,7 +806,8 @@ class GridExecutor(ExecutorBase):
         self.update_grid_levels()
         in_flight_order = self.get_in_flight_order(self.config.connector_name, order_id)
         if in_flight_order:
-            for level in self.grid_levels:
+            for position in self._active_level_positions():
+                level = self._sorted_levels[position]
                 if level.active_open_order and level.active_open_order.order_id == order_id:
                     level.active_open_order.order = in_flight_order
                 if level.active_close_order and level.active_close_order.order_id == order_id:
@@ -0,0 +1,34 @@
+import os
+from typing import Dict
+
+from hummingbot import data_path
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class RecordOrderBookAndTrades(ScriptStrategyBase):
+    """
+    Records every order book diff, snapshot and trade of the trading pairs in binary columnar segments, under
+    data/order_book_recordings/<exchange>. The recordings can be replayed into an OrderBook with the
+    OrderBookReplaySource.
+    """
+    exchange = os.getenv("EXCHANGE", "binance_paper_trade")
+    trading_pairs = os.getenv("TRADING_PAIRS", "ETH-USDT,BTC-USDT").split(",")
+    markets = {exchange: set(trading_pairs)}
+
+    def __init__(self, connectors: Dict[str, ConnectorBase]):
+        super().__init__(connectors)
+        self.recorder = OrderBookRecorder(os.path.join(data_path(), "order_book_recordings", self.exchange))
+        self.recording = False
+
+    def on_tick(self):
+        if not self.recording:
+            self.connectors[self.exchange].order_book_tracker.set_recorder(self.recorder)
+            self.recording = True
+
+    async def on_stop(self):
+        self.connectors[self.exchange].order_book_tracker.set_recorder(None)
+
+    def format_status(self) -> str:
+        return f"Recording the order books and trades of {', '.join(self.trading_pairs)} in {self.recorder.directory}"
@@ -80,6 +80,10 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ mqtt_events                     | True                 |\n"
                            "    | ∟ mqtt_external_events            | True                 |\n"
                            "    | ∟ mqtt_autostart                  | False                |\n"
+                           "    | ∟ mqtt_batch_mode                 | False                |\n"
+                           "    | ∟ mqtt_batch_interval             | 0.5                  |\n"
+                           "    | ∟ mqtt_batch_max_queue_size       | 10000                |\n"
+                           "    | ∟ mqtt_batch_overflow_policy      | drop_oldest          |\n"
                            "    | send_error_logs                   | True                 |\n"
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
@@ -98,6 +102,14 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ market_data_collection_enabled  | False                |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | order_latency_tracking            |                      |\n"
+                           "    | ∟ order_latency_tracking_enabled  | False                |\n"
+                           "    | ∟ order_latency_metrics_port      | 0                    |\n"
+                           "    | event_loop_monitor                |                      |\n"
+                           "    | ∟ event_loop_monitor_enabled      | False                |\n"
+                           "    | ∟ slow_callback_threshold         | 0.1                  |\n"
+                           "    | ∟ stack_sampling_enabled          | False                |\n"
+                           "    | ∟ stack_sampling_interval         | 0.01                 |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
@@ -5,17 +5,19 @@ import unittest
 from decimal import Decimal
 from pathlib import Path
 from test.mock.mock_cli import CLIMockingAssistant
-from typing import Awaitable, List
+from typing import Awaitable, Dict, List, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import FillAggregates
 from hummingbot.connector.exchange.paper_trade import PaperTradeExchange
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregate import TradeFillAggregate
 
 
 class HistoryCommandTest(unittest.TestCase):
@@ -37,6 +39,7 @@ class HistoryCommandTest(unittest.TestCase):
         self.cli_mock_assistant.stop()
         db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
         db_path.unlink(missing_ok=True)
+        SQLConnectionManager._scm_trade_fills_instance = None
         super().tearDown()
 
     @staticmethod
@@ -172,3 +175,66 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    def add_trade_fills(self, fills: List[Tuple[int, str, int, int]]):
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.01"))
+        with self.app.trade_fill_db.get_new_session() as session:
+            for timestamp, trade_type, price, amount in fills:
+                session.add(TradeFill(
+                    config_file_path=f"{self.mock_strategy_name}.yml",
+                    strategy=self.mock_strategy_name,
+                    market="binance",
+                    symbol="BTC-USDT",
+                    base_asset="BTC",
+                    quote_asset="USDT",
+                    timestamp=timestamp,
+                    order_id=f"someId{timestamp}{trade_type}",
+                    trade_type=trade_type,
+                    order_type="LIMIT",
+                    price=price,
+                    amount=amount,
+                    leverage=1,
+                    trade_fee=trade_fee.to_json(),
+                    exchange_trade_id=f"someExchangeId{timestamp}{trade_type}",
+                ))
+            session.commit()
+
+    def get_market_aggregates(self) -> Dict[Tuple[str, str], FillAggregates]:
+        with self.app.trade_fill_db.get_new_session() as session:
+            market_aggregates, market_trades = self.app._get_market_aggregates_from_session(
+                start_timestamp=1000, session=session, config_file_path=f"{self.mock_strategy_name}.yml")
+            records = TradeFillAggregate.get_records(session, f"{self.mock_strategy_name}.yml", 1000)
+            self.assertEqual(1, len(records))
+            self.assertEqual(market_aggregates[("binance", "BTC-USDT")], FillAggregates.from_record(records[0]))
+        self.assertEqual({}, market_trades)
+        return market_aggregates
+
+    @patch("hummingbot.client.command.history_command.FillAggregates.add_trades", autospec=True,
+           side_effect=FillAggregates.add_trades)
+    def test_market_aggregates_only_aggregate_the_fills_added_since_the_checkpoint(self, add_trades_mock: MagicMock):
+        self.client_config_map.db_mode = DBSqliteMode()
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.add_trade_fills([(999, "BUY", 1, 1), (1000, "BUY", 10, 2), (1001, "SELL", 12, 1)])
+
+        aggregates = self.get_market_aggregates()[("binance", "BTC-USDT")]
+
+        self.assertEqual(2, aggregates.num_fills)
+        self.assertEqual(2, len(add_trades_mock.call_args.args[1]))
+
+        self.add_trade_fills([(1002, "SELL", 11, 1)])
+        aggregates = self.get_market_aggregates()[("binance", "BTC-USDT")]
+
+        self.assertEqual(3, aggregates.num_fills)
+        self.assertEqual(1, len(add_trades_mock.call_args.args[1]))
+        self.assertEqual(Decimal("-20"), aggregates.b_vol_quote)
+        self.assertEqual(Decimal("23"), aggregates.s_vol_quote)
+        self.assertEqual(Decimal("0.43"), aggregates.percent_fees_quote)
+        self.assertEqual(Decimal("11"), aggregates.last_price)
+
+        # a fill recorded before the checkpoint rebuilds the aggregates
+        self.add_trade_fills([(1001, "BUY", 12, 1)])
+        aggregates = self.get_market_aggregates()[("binance", "BTC-USDT")]
+
+        self.assertEqual(4, aggregates.num_fills)
+        self.assertEqual(4, len(add_trades_mock.call_args.args[1]))
+        self.assertEqual(Decimal("-32"), aggregates.b_vol_quote)
@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.utils import order_latency_tracker
+from hummingbot.core.utils.order_latency_tracker import CREATE_REQUEST, OrderLatencyTracker
+
+
+class LatencyCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+
+        self.previous_tracker = OrderLatencyTracker._shared_instance
+        self.tracker = OrderLatencyTracker()
+        OrderLatencyTracker._shared_instance = self.tracker
+
+    def tearDown(self) -> None:
+        OrderLatencyTracker._shared_instance = self.previous_tracker
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_latency_start_and_stop(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.latency("start")
+        self.assertTrue(self.tracker.enabled)
+
+        self.app.latency("stop")
+        self.assertFalse(self.tracker.enabled)
+        self.assertEqual(["\nOrders latency tracking started.", "\nOrders latency tracking stopped."], captures)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_latency_when_disabled(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.latency()
+
+        self.assertEqual(["\nOrders latency tracking is disabled. Enable it with `latency start`."], captures)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_latency(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        self.tracker.start()
+        self.tracker._stage_samples[("binance", CREATE_REQUEST, order_latency_tracker.ACKNOWLEDGED)] = [0.01, 0.03]
+        self.tracker._elapsed_samples[("binance", CREATE_REQUEST, order_latency_tracker.ACKNOWLEDGED)] = [0.1, 0.3]
+
+        self.app.latency()
+
+        self.assertEqual(1, len(captures))
+        self.assertIn("| binance    | create    | acknowledged |       2 |         20 |", captures[0])
+        self.assertIn("200 |", captures[0])
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import FillAggregates, PerformanceMetrics
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -230,6 +230,53 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         self.assertEqual(metrics.trade_pnl, Decimal("1000"))
         self.assertEqual(metrics.total_pnl, Decimal("650"))
 
+    def test_fill_aggregates_extended_with_new_fills(self):
+        trades = [
+            self.mock_trade(id=f"order{i}", amount=Decimal(i + 1), price=Decimal(100 + i), position="NIL",
+                            type="BUY" if i % 3 else "SELL",
+                            fee=(DeductedFromReturnsTradeFee(percent=Decimal("0.01"))
+                                 if i % 2 else AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.1"))])))
+            for i in range(10)
+        ]
+
+        aggregates = FillAggregates.from_trades(trades[:4])
+        aggregates.add_trades(trades[4:])
+
+        self.assertEqual(FillAggregates.from_trades(trades), aggregates)
+        self.assertEqual(10, aggregates.num_fills)
+        self.assertEqual(6, aggregates.num_buys)
+        self.assertEqual(4, aggregates.num_sells)
+        self.assertEqual(0, aggregates.num_position_fills)
+        self.assertEqual(Decimal("33"), aggregates.b_vol_base)
+        self.assertEqual(Decimal("-3486"), aggregates.b_vol_quote)
+        self.assertEqual(Decimal("-22"), aggregates.s_vol_base)
+        deducted_fees = sum((i + 1) * (100 + i) for i in range(1, 10, 2)) * Decimal("0.01")
+        self.assertEqual(Decimal("2344") - deducted_fees, aggregates.s_vol_quote)
+        self.assertEqual(deducted_fees, aggregates.percent_fees_quote)
+        self.assertEqual({"BNB": Decimal("0.5")}, aggregates.flat_fees)
+        self.assertEqual(Decimal("100"), aggregates.start_price)
+        self.assertEqual(Decimal("109"), aggregates.last_price)
+
+    def test_performance_metrics_from_aggregates(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["HBOT-USDT"] = Decimal("110")
+        RateOracle._shared_instance = rate_oracle
+
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.001"))
+        trades = [self.mock_trade(id=f"order{i}", amount=Decimal("2"), price=Decimal(100 + i), position="NIL",
+                                  type="BUY" if i % 2 else "SELL", fee=trade_fee)
+                  for i in range(6)]
+        cur_bals = {base: Decimal("10"), quote: Decimal("1000")}
+
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        metrics_from_aggregates = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_aggregates(trading_pair, FillAggregates.from_trades(trades), cur_bals))
+
+        self.assertEqual(metrics, metrics_from_aggregates)
+        self.assertEqual({quote: Decimal("1.23")}, metrics_from_aggregates.fees)
+        self.assertEqual(Decimal("-6"), metrics_from_aggregates.trade_pnl)
+        self.assertEqual(Decimal("-7.23"), metrics_from_aggregates.total_pnl)
+
     def test_smart_round(self):
         value = PerformanceMetrics.smart_round(None)
         self.assertIsNone(value)
@@ -248,6 +248,48 @@ class BinancePerpetualAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTest
         self.assertEqual(result.next_funding_utc_timestamp, int(mock_response["nextFundingTime"] * 1e-3))
         self.assertEqual(result.rate, Decimal(mock_response["lastFundingRate"]))
 
+    @aioresponses()
+    async def test_get_funding_infos_requests_all_markets_at_once(self, mock_api):
+        url = web_utils.public_rest_url(CONSTANTS.MARK_PRICE_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        mock_response = [
+            {
+                "symbol": self.ex_trading_pair,
+                "markPrice": "46382.32704603",
+                "indexPrice": "46385.80064948",
+                "estimatedSettlePrice": "46510.13598963",
+                "lastFundingRate": "0.00010000",
+                "interestRate": "0.00010000",
+                "nextFundingTime": 1641312000000,
+                "time": 1641288825000,
+            },
+            {
+                "symbol": "OTHERSYMBOL",
+                "markPrice": "1.1",
+                "indexPrice": "1.2",
+                "estimatedSettlePrice": "1.3",
+                "lastFundingRate": "0.00020000",
+                "interestRate": "0.00010000",
+                "nextFundingTime": 1641312000000,
+                "time": 1641288825000,
+            },
+        ]
+        mock_api.get(regex_url, body=json.dumps(mock_response))
+
+        result = await self.data_source.get_funding_infos([self.trading_pair])
+
+        self.assertEqual([self.trading_pair], list(result.keys()))
+        funding_info = result[self.trading_pair]
+        self.assertEqual(Decimal(mock_response[0]["indexPrice"]), funding_info.index_price)
+        self.assertEqual(Decimal(mock_response[0]["markPrice"]), funding_info.mark_price)
+        self.assertEqual(int(mock_response[0]["nextFundingTime"] * 1e-3), funding_info.next_funding_utc_timestamp)
+        self.assertEqual(Decimal(mock_response[0]["lastFundingRate"]), funding_info.rate)
+        mark_price_requests = [request_key for request_key in mock_api.requests
+                               if request_key[1].path.endswith(CONSTANTS.MARK_PRICE_URL)]
+        self.assertEqual(1, len(mark_price_requests))
+        self.assertEqual(1, len(mock_api.requests[mark_price_requests[0]]))
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     async def test_listen_for_subscriptions_cancelled_when_connecting(self, _, mock_ws):
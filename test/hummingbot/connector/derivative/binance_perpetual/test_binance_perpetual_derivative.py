@@ -1486,6 +1486,67 @@ class BinancePerpetualDerivativeUnitTest(IsolatedAsyncioWrapperTestCase):
             f"Unexpected error while fetching last fee payment for {self.trading_pair}.",
         ))
 
+    @aioresponses()
+    async def test_update_all_funding_payments_with_bulk_endpoints(self, req_mock):
+        self._simulate_trading_rules_initialized()
+        url = web_utils.private_rest_url(CONSTANTS.GET_INCOME_HISTORY_URL, domain=self.domain)
+        regex_url_income_history = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        income_history = [
+            {"income": "0.5", "symbol": self.symbol, "time": 1640779000000},
+            {"income": "-1.5", "symbol": self.symbol, "time": 1640779600000},
+            {"income": "2", "symbol": "UNKNOWNSYMBOL", "time": 1640779600000},
+        ]
+        req_mock.get(regex_url_income_history, body=json.dumps(income_history))
+
+        url = web_utils.public_rest_url(CONSTANTS.MARK_PRICE_URL, domain=self.domain)
+        regex_url_funding_info = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        funding_infos = [
+            {**self._get_funding_info_dict(), "symbol": self.symbol, "lastFundingRate": "0.0001"},
+            {**self._get_funding_info_dict(), "symbol": "UNKNOWNSYMBOL", "lastFundingRate": "0.0002"},
+        ]
+        req_mock.get(regex_url_funding_info, body=json.dumps(funding_infos))
+
+        await self.exchange._update_all_funding_payments(fire_event_on_new=True)
+
+        self.assertEqual(1, len(self.funding_payment_completed_logger.event_log))
+        funding_payment = self.funding_payment_completed_logger.event_log[0]
+        self.assertEqual(self.trading_pair, funding_payment.trading_pair)
+        self.assertEqual(1640779600000, funding_payment.timestamp)
+        self.assertEqual(Decimal("0.0001"), funding_payment.funding_rate)
+        self.assertEqual(Decimal("-1.5"), funding_payment.amount)
+
+        income_request = next(key for key in req_mock.requests if key[1].path.endswith(CONSTANTS.GET_INCOME_HISTORY_URL))
+        request_params = req_mock.requests[income_request][0].kwargs["params"]
+        self.assertNotIn("symbol", request_params)
+        self.assertEqual("FUNDING_FEE", request_params["incomeType"])
+
+    async def test_bulk_funding_payments_polling_window_follows_the_previous_poll(self):
+        fetch_mock = AsyncMock(return_value={})
+        self.exchange._fetch_funding_payments_since = fetch_mock
+
+        with patch.object(self.exchange, "_time", side_effect=[1640780000, 1640780600]):
+            await self.exchange._update_all_funding_payments(fire_event_on_new=False)
+            await self.exchange._update_all_funding_payments(fire_event_on_new=True)
+
+        poll_interval = self.exchange.funding_fee_poll_interval
+        self.assertEqual(1640780000 - poll_interval, fetch_mock.call_args_list[0].kwargs["start_time"])
+        self.assertEqual(1640780000 - poll_interval, fetch_mock.call_args_list[1].kwargs["start_time"])
+        self.assertEqual(1640780600, self.exchange._last_funding_payments_poll_time)
+        self.assertEqual(0, self.exchange._last_funding_fee_payment_ts[self.trading_pair])
+        self.assertEqual(0, len(self.funding_payment_completed_logger.event_log))
+
+    @aioresponses()
+    async def test_update_all_funding_payments_with_bulk_endpoints_failed(self, req_mock):
+        self._simulate_trading_rules_initialized()
+        url = web_utils.private_rest_url(CONSTANTS.GET_INCOME_HISTORY_URL, domain=self.domain)
+        regex_url_income_history = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        req_mock.get(regex_url_income_history, exception=Exception)
+
+        await self.exchange._update_all_funding_payments(fire_event_on_new=True)
+
+        self.assertTrue(self._is_logged("NETWORK", "Unexpected error while fetching funding payments."))
+        self.assertIsNone(self.exchange._last_funding_payments_poll_time)
+
     @aioresponses()
     async def test_cancel_all_successful(self, mocked_api):
         url = web_utils.private_rest_url(
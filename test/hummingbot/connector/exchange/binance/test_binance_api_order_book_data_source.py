@@ -205,6 +205,27 @@ class BinanceAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_listen_for_subscriptions_routes_raw_messages_by_event_type(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        for message in [{"result": None, "id": 1}, self._trade_update_event(), self._order_diff_event()]:
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value,
+                message=json.dumps(message))
+
+        self.listening_task = self.local_event_loop.create_task(self.data_source.listen_for_subscriptions())
+
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertTrue(ws_connect_mock.called)
+        trades_queue = self.data_source._message_queue[CONSTANTS.TRADE_EVENT_TYPE]
+        diffs_queue = self.data_source._message_queue[CONSTANTS.DIFF_EVENT_TYPE]
+        self.assertEqual(self._trade_update_event(), trades_queue.get_nowait())
+        self.assertEqual(self._order_diff_event(), diffs_queue.get_nowait())
+        self.assertTrue(trades_queue.empty())
+        self.assertTrue(diffs_queue.empty())
+        self.assertEqual(1, self.data_source._raw_message_router.dropped_messages)
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     async def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -17,6 +17,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -1227,6 +1228,96 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
 
         self.assertEqual(result[0].min_notional_size, Decimal("10"))
 
+    def _create_lost_orders(self, orders_count: int) -> List[InFlightOrder]:
+        orders = []
+        for index in range(orders_count):
+            order_id = f"{self.client_order_id_prefix}{index}"
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"{self.exchange_order_id_prefix}{index}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+            order = self.exchange.in_flight_orders[order_id]
+            for _ in range(self.exchange._order_tracker._lost_order_count_limit + 1):
+                self.async_run_with_timeout(
+                    self.exchange._order_tracker.process_order_not_found(client_order_id=order_id))
+            orders.append(order)
+        return orders
+
+    def test_cancel_lost_orders_runs_cancelations_with_bounded_concurrency(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.LOST_ORDERS_RECOVERY_CONCURRENCY = 3
+        lost_orders = self._create_lost_orders(orders_count=7)
+        running_cancelations = []
+        max_running_cancelations = []
+
+        async def place_cancel(order_id: str, tracked_order: InFlightOrder):
+            running_cancelations.append(order_id)
+            max_running_cancelations.append(len(running_cancelations))
+            await asyncio.sleep(0.01)
+            running_cancelations.remove(order_id)
+            return True
+
+        self.exchange._place_cancel = place_cancel
+
+        self.async_run_with_timeout(self.exchange._cancel_lost_orders())
+
+        self.assertEqual(3, max(max_running_cancelations))
+        self.assertEqual(len(lost_orders), len(max_running_cancelations))
+        self.assertEqual(0, len(self.exchange._order_tracker.lost_orders))
+        self.assertTrue(all(order.is_failure for order in lost_orders))
+
+    def test_cancel_lost_orders_uses_batch_cancel_when_supported(self):
+        self.exchange._set_current_timestamp(1640780000)
+        lost_orders = self._create_lost_orders(orders_count=2)
+        self.exchange._place_cancel = AsyncMock()
+        self.exchange._is_batch_order_cancel_supported = lambda: True
+        self.exchange._execute_batch_cancel = AsyncMock(return_value=[])
+
+        self.async_run_with_timeout(self.exchange._cancel_lost_orders())
+
+        self.exchange._place_cancel.assert_not_called()
+        orders_to_cancel = self.exchange._execute_batch_cancel.call_args.kwargs["orders_to_cancel"]
+        self.assertEqual(
+            [order.client_order_id for order in lost_orders],
+            [order.client_order_id for order in orders_to_cancel])
+
+    def test_execute_batch_cancel_returns_result_for_each_order(self):
+        self.exchange._set_current_timestamp(1640780000)
+        lost_orders = self._create_lost_orders(orders_count=2)
+        self.exchange._place_cancel = AsyncMock(side_effect=[True, False])
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+            orders_to_cancel=[order.to_limit_order() for order in lost_orders] + [
+                LimitOrder("unknown", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("1"), Decimal("1"))
+            ]
+        ))
+
+        self.assertEqual(
+            {lost_orders[0].client_order_id: True, lost_orders[1].client_order_id: False, "unknown": False},
+            {result.order_id: result.success for result in results})
+
+    def test_lost_orders_recovery_metrics(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self._create_lost_orders(orders_count=2)
+
+        with patch.object(self.exchange, "_time", side_effect=[1000.0, 1012.5]):
+            self.exchange._register_lost_orders_recovery_progress()
+            self.assertEqual(2, self.exchange.lost_orders_recovery_metrics["orders_in_recovery"])
+            self.exchange._order_tracker._lost_orders.clear()
+            self.exchange._register_lost_orders_recovery_progress()
+
+        metrics = self.exchange.lost_orders_recovery_metrics
+        self.assertEqual(1, metrics["recoveries"])
+        self.assertEqual(2, metrics["recovered_orders"])
+        self.assertEqual(12.5, metrics["last_recovery_duration"])
+        self.assertEqual(0, metrics["orders_in_recovery"])
+        self.assertTrue(self.is_logged("INFO", "Recovered 2 lost orders in 12.50 seconds."))
+
     def _validate_auth_credentials_taking_parameters_from_argument(self,
                                                                    request_call_tuple: RequestCall,
                                                                    params: Dict[str, Any]):
@@ -3,7 +3,7 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
@@ -16,6 +16,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
 
@@ -488,6 +489,9 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
 
     def validate_order_cancelation_request(self, order: InFlightOrder, request_call: RequestCall):
         request_data = json.loads(request_call.kwargs["data"])
+        if isinstance(request_data, list):
+            # Batch cancelation request
+            request_data = request_data[0]
         self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
                          request_data["instId"])
         self.assertEqual(order.client_order_id, request_data["clOrdId"])
@@ -511,7 +515,7 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             mock_api: aioresponses,
             response_scode: int = 0,
             callback: Optional[Callable] = lambda *args, **kwargs: None) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_ORDER_CANCEL_PATH)
+        url = self._order_cancelation_url(order=order)
         response = self._order_cancelation_request_successful_mock_response(response_scode=response_scode, order=order)
         mock_api.post(url, body=json.dumps(response), callback=callback)
         return url
@@ -521,7 +525,7 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             order: InFlightOrder,
             mock_api: aioresponses,
             callback: Optional[Callable] = lambda *args, **kwargs: None) -> str:
-        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_ORDER_CANCEL_PATH)
+        url = self._order_cancelation_url(order=order)
         response = {
             "code": "0",
             "msg": "",
@@ -545,12 +549,35 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # cancel_all sends all the cancelations in a single batch request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": successful_order.client_order_id,
+                    "ordId": successful_order.exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                },
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
+
+    def _order_cancelation_url(self, order: InFlightOrder) -> str:
+        # Lost orders are canceled through the batch cancelation endpoint
+        path_url = (CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH
+                    if order.client_order_id in self.exchange._order_tracker.lost_orders
+                    else CONSTANTS.OKX_ORDER_CANCEL_PATH)
+        return web_utils.private_rest_url(path_url=path_url)
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1283,3 +1310,97 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 f"{Decimal('100.000000')} {self.trading_pair} at {Decimal('10000')}."
             )
         )
+
+    def test_batch_order_create_places_orders_in_a_single_request(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        request_sent_event = asyncio.Event()
+        responses = []
+
+        async def api_request(*args, **kwargs):
+            request_sent_event.set()
+            orders_data = kwargs["data"]
+            responses.append(kwargs)
+            return {
+                "code": "2",
+                "msg": "",
+                "data": [
+                    {"clOrdId": orders_data[0]["clOrdId"], "ordId": "1", "tag": "", "sCode": "0", "sMsg": ""},
+                    {"clOrdId": orders_data[1]["clOrdId"], "ordId": "", "tag": "", "sCode": "51008",
+                     "sMsg": "Insufficient balance"},
+                ]
+            }
+
+        self.exchange._api_request = AsyncMock(side_effect=api_request)
+        orders = self.exchange.batch_order_create(orders_to_create=[
+            LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("10000"), Decimal("1")),
+            LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("11000"), Decimal("1")),
+        ])
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(1, len(responses))
+        self.assertEqual(CONSTANTS.OKX_BATCH_ORDERS_PATH, responses[0]["path_url"])
+        self.assertEqual(
+            [order.client_order_id for order in orders],
+            [order_data["clOrdId"] for order_data in responses[0]["data"]])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in responses[0]["data"]])
+
+        created_order = self.exchange.in_flight_orders[orders[0].client_order_id]
+        self.assertEqual("1", created_order.exchange_order_id)
+        self.assertTrue(created_order.is_open)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(orders[1].client_order_id, self.order_failure_logger.event_log[0].order_id)
+
+    def test_batch_order_cancel_cancels_orders_in_a_single_request(self):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ("11", "12"):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"exchange{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [self.exchange.in_flight_orders[order_id] for order_id in ("11", "12")]
+        self.exchange._api_request = AsyncMock(return_value={
+            "code": "0",
+            "msg": "",
+            "data": [
+                {"clOrdId": "11", "ordId": "exchange11", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "12", "ordId": "exchange12", "sCode": "51401", "sMsg": "Order already canceled"},
+            ]
+        })
+
+        results = self.async_run_with_timeout(
+            self.exchange._execute_batch_cancel(orders_to_cancel=[order.to_limit_order() for order in orders]))
+
+        self.exchange._api_request.assert_awaited_once()
+        request_kwargs = self.exchange._api_request.call_args.kwargs
+        self.assertEqual(CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH, request_kwargs["path_url"])
+        self.assertEqual(["11", "12"], [order_data["clOrdId"] for order_data in request_kwargs["data"]])
+        self.assertTrue(all(result.success for result in results))
+        self.assertTrue(all(order.is_pending_cancel_confirmation for order in orders))
+
+    def test_split_orders_in_batches_groups_by_trading_pair_and_max_size(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=str(index),
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1"),
+                creation_timestamp=1640780000,
+                price=Decimal("1"),
+            )
+            for index, trading_pair in enumerate(["A-B", "C-D", "A-B", "A-B"])
+        ]
+
+        batches = self.exchange._split_orders_in_batches(orders=orders, max_batch_size=2)
+
+        self.assertEqual(
+            [["0", "2"], ["3"], ["1"]],
+            [[order.client_order_id for order in batch] for batch in batches])
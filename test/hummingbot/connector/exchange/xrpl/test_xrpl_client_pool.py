@@ -0,0 +1,184 @@
+import asyncio
+import json
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict, List, Optional
+
+import websockets
+from xrpl.models import AccountInfo, ServerInfo
+from xrpl.models.response import ResponseStatus
+
+from hummingbot.connector.exchange.xrpl.xrpl_client_pool import XRPLClientPool
+
+ACCOUNT = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
+
+
+class MockXRPLNode:
+    """
+    Local websocket server answering the requests concurrently, each one after the delay configured for its command.
+    """
+
+    def __init__(self):
+        self.delays: Dict[str, float] = {}
+        self.error: Optional[str] = None
+        self.drop_connections = False
+        self.requests: List[Dict[str, Any]] = []
+        self.connection_count = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}"
+
+    async def start(self):
+        self._server = await websockets.serve(self._handle_connection, "127.0.0.1", 0)
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle_connection(self, websocket, *_):
+        self.connection_count += 1
+        tasks = []
+        async for message in websocket:
+            request = json.loads(message)
+            self.requests.append(request)
+            if self.drop_connections:
+                await websocket.close()
+                return
+            tasks.append(asyncio.ensure_future(self._respond(websocket, request)))
+
+    async def _respond(self, websocket, request: Dict[str, Any]):
+        await asyncio.sleep(self.delays.get(request["command"], 0))
+        if self.error is not None:
+            response = {"id": request["id"], "error": self.error, "status": "error", "type": "response"}
+        else:
+            response = {"id": request["id"], "result": {"command": request["command"], "node": self.url},
+                        "status": "success", "type": "response"}
+        await websocket.send(json.dumps({"type": "ledgerClosed"}))  # stream message nobody waits for
+        await websocket.send(json.dumps(response))
+
+
+class XRPLClientPoolTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.nodes = [MockXRPLNode(), MockXRPLNode()]
+        for node in self.nodes:
+            await node.start()
+        self.pool = XRPLClientPool([node.url for node in self.nodes], request_timeout=1)
+
+    async def asyncTearDown(self) -> None:
+        await self.pool.close()
+        for node in self.nodes:
+            await node.stop()
+        await super().asyncTearDown()
+
+    async def test_concurrent_requests_are_multiplexed_on_persistent_connections(self):
+        pool = XRPLClientPool([self.nodes[0].url], request_timeout=5)
+        self.nodes[0].delays = {"account_info": 0.3}
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *[pool.request(AccountInfo(account=ACCOUNT)) for _ in range(5)],
+            pool.request(ServerInfo()),
+        )
+        duration = time.perf_counter() - start
+        await pool.request(ServerInfo())
+        await pool.close()
+
+        self.assertEqual(["account_info"] * 5 + ["server_info"], [response.result["command"] for response in responses])
+        self.assertLess(duration, 1.0)
+        self.assertEqual(1, self.nodes[0].connection_count)
+        self.assertEqual(7, len(self.nodes[0].requests))
+        self.assertEqual(7, len({request["id"] for request in self.nodes[0].requests}))
+
+    async def test_requests_are_spread_over_the_nodes(self):
+        self.nodes[0].delays = {"account_info": 0.2}
+        self.nodes[1].delays = {"account_info": 0.2}
+
+        await asyncio.gather(*[self.pool.request(AccountInfo(account=ACCOUNT)) for _ in range(4)])
+
+        self.assertEqual(2, len(self.nodes[0].requests))
+        self.assertEqual(2, len(self.nodes[1].requests))
+
+    async def test_requests_prefer_the_fastest_node(self):
+        self.nodes[0].delays = {"server_info": 0.1}
+        await asyncio.gather(self.pool.request(ServerInfo()), self.pool.request(ServerInfo()))
+
+        for _ in range(3):
+            response = await self.pool.request(ServerInfo())
+            self.assertEqual(self.nodes[1].url, response.result["node"])
+
+    async def test_failover_when_a_node_is_unreachable(self):
+        await self.nodes[0].stop()
+
+        response = await self.pool.request(ServerInfo())
+
+        self.assertEqual(self.nodes[1].url, response.result["node"])
+        unreachable_connection = self.pool.connections[0]
+        self.assertEqual(1, unreachable_connection.consecutive_failures)
+        self.assertTrue(unreachable_connection.is_cooling_down())
+
+        await self.pool.request(ServerInfo())
+        self.assertEqual(1, unreachable_connection.failure_count)
+
+    async def test_failover_when_a_node_is_busy_or_drops_the_connection(self):
+        self.nodes[0].error = "tooBusy"
+        response = await self.pool.request(ServerInfo())
+        self.assertEqual(self.nodes[1].url, response.result["node"])
+
+        self.nodes[0].error = None
+        self.nodes[1].drop_connections = True
+        self.pool.connections[0].consecutive_failures = 0
+        self.pool.connections[0].latency = 10.0
+        response = await self.pool.request(ServerInfo())
+        self.assertEqual(self.nodes[0].url, response.result["node"])
+        self.assertEqual(1, self.pool.connections[1].consecutive_failures)
+
+    async def test_failover_on_timeout(self):
+        self.nodes[0].delays = {"server_info": 2}
+
+        response = await self.pool.request(ServerInfo())
+
+        self.assertEqual(self.nodes[1].url, response.result["node"])
+        self.assertEqual(0, self.pool.connections[0].in_flight_requests)
+
+    async def test_request_error_responses_are_returned(self):
+        self.nodes[0].error = "actNotFound"
+
+        response = await self.pool.request(AccountInfo(account=ACCOUNT))
+
+        self.assertEqual(ResponseStatus.ERROR, response.status)
+        self.assertEqual("actNotFound", response.result["error"])
+        self.assertEqual(1, len(self.nodes[0].requests))
+        self.assertEqual(0, len(self.nodes[1].requests))
+
+    async def test_request_fails_when_all_nodes_fail(self):
+        for node in self.nodes:
+            node.error = "noNetwork"
+
+        with self.assertRaises(ConnectionError):
+            await self.pool.request(ServerInfo())
+
+    async def test_open_fails_only_if_no_node_is_reachable(self):
+        await self.nodes[0].stop()
+        await self.pool.open()
+        self.assertTrue(self.pool.is_open())
+        self.assertEqual([False, True], [status["open"] for status in self.pool.health_status()])
+
+        await self.pool.close()
+        await self.nodes[1].stop()
+        with self.assertRaises(ConnectionError):
+            await self.pool.open()
+        await self.nodes[1].start()
+
+    async def test_pool_without_node_fails_on_use(self):
+        pool = XRPLClientPool(["", ""])
+
+        self.assertEqual([], pool.connections)
+        with self.assertRaises(ConnectionError):
+            await pool.open()
+        with self.assertRaises(ConnectionError):
+            await pool.request(ServerInfo())
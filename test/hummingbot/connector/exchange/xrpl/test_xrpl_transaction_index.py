@@ -0,0 +1,257 @@
+import asyncio
+import json
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import websockets
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
+from hummingbot.connector.exchange.xrpl.xrpl_exchange import XrplExchange
+from hummingbot.connector.exchange.xrpl.xrpl_transaction_index import XRPLAccountTransactionIndex
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+
+ACCOUNT = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
+OTHER_ACCOUNT = "rHxTJLqdVUxjJuZEZvajXYYQJ7q8p4DhHy"  # noqa: mock
+
+
+def offer_create(tx_hash: str, ledger_index: int, account: str, sequence: int, crossed_sequences: List[int] = ()):
+    """
+    Account transaction in the format of the AccountTx responses, crossing the account offers with the given
+    sequences.
+    """
+    affected_nodes = [
+        {
+            "ModifiedNode": {
+                "LedgerEntryType": "Offer",
+                "LedgerIndex": f"OFFER{crossed_sequence}",
+                "FinalFields": {
+                    "Account": ACCOUNT,
+                    "Sequence": crossed_sequence,
+                    "TakerGets": "1000000",
+                    "TakerPays": {"currency": "USD", "issuer": OTHER_ACCOUNT, "value": "1"},
+                    "Flags": 0,
+                    "BookDirectory": "00",
+                    "OwnerNode": "0",
+                },
+                "PreviousFields": {
+                    "TakerGets": "2000000",
+                    "TakerPays": {"currency": "USD", "issuer": OTHER_ACCOUNT, "value": "2"},
+                },
+            }
+        }
+        for crossed_sequence in crossed_sequences
+    ]
+    return {
+        "ledger_index": ledger_index,
+        "meta": {"AffectedNodes": affected_nodes, "TransactionResult": "tesSUCCESS"},
+        "tx": {
+            "Account": account,
+            "Sequence": sequence,
+            "TransactionType": "OfferCreate",
+            "hash": tx_hash,
+            "ledger_index": ledger_index,
+        },
+        "validated": True,
+    }
+
+
+class MockXRPLNode:
+    """
+    Local websocket server answering the `account_tx` requests with the transactions of its ledgers.
+    """
+
+    def __init__(self):
+        self.transactions: List[Dict[str, Any]] = []
+        self.account_tx_requests: List[Dict[str, Any]] = []
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}"
+
+    async def start(self):
+        self._server = await websockets.serve(self._handle_connection, "127.0.0.1", 0)
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle_connection(self, websocket, *_):
+        async for message in websocket:
+            request = json.loads(message)
+            if request.get("command") == "account_tx":
+                self.account_tx_requests.append(request)
+                ledger_index_min = request.get("ledger_index_min", -1)
+                transactions = [tx for tx in self.transactions if tx["ledger_index"] >= ledger_index_min]
+                result = {
+                    "account": request["account"],
+                    "ledger_index_min": ledger_index_min,
+                    "ledger_index_max": max([tx["ledger_index"] for tx in self.transactions], default=0),
+                    "transactions": transactions,
+                    "validated": True,
+                }
+            else:
+                result = {}
+            await websocket.send(
+                json.dumps({"id": request["id"], "result": result, "status": "success", "type": "response"})
+            )
+
+
+class XRPLAccountTransactionIndexTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.fetch_mock = AsyncMock(return_value=[])
+        self.index = XRPLAccountTransactionIndex(fetch_transactions=self.fetch_mock, get_account=lambda: ACCOUNT)
+
+    def test_transactions_are_indexed_by_sequence_and_hash(self):
+        own_tx = offer_create("HASH1", 100, ACCOUNT, sequence=10)
+        taker_tx = offer_create("HASH2", 101, OTHER_ACCOUNT, sequence=55, crossed_sequences=[10, 11])
+
+        self.index.add_transactions([own_tx, taker_tx])
+
+        self.assertEqual([own_tx, taker_tx], self.index.transactions_for_sequence(10))
+        self.assertEqual([taker_tx], self.index.transactions_for_sequence(11))
+        self.assertEqual([], self.index.transactions_for_sequence(12))
+        self.assertIs(taker_tx, self.index.transaction_by_hash("HASH2"))
+        self.assertEqual(101, self.index.last_ledger_index)
+
+    def test_added_transaction_replaces_the_indexed_version(self):
+        self.index.add_transactions([offer_create("HASH1", 100, OTHER_ACCOUNT, sequence=55, crossed_sequences=[10])])
+        new_version = offer_create("HASH1", 100, OTHER_ACCOUNT, sequence=55, crossed_sequences=[11])
+
+        self.index.add_transactions([new_version])
+
+        self.assertEqual([], self.index.transactions_for_sequence(10))
+        self.assertEqual([new_version], self.index.transactions_for_sequence(11))
+
+    async def test_refresh_only_fetches_the_new_ledgers(self):
+        self.fetch_mock.return_value = [offer_create("HASH1", 100, ACCOUNT, sequence=10)]
+        await self.index.refresh(90)
+        self.fetch_mock.return_value = [offer_create("HASH2", 105, ACCOUNT, sequence=11)]
+        await self.index.refresh(95)
+        await self.index.refresh(80)
+
+        self.assertEqual([((90,),), ((100,),), ((80,),)], [(c.args,) for c in self.fetch_mock.call_args_list])
+        self.assertEqual(80, self.index.first_ledger_index)
+        self.assertEqual(105, self.index.last_ledger_index)
+        self.assertEqual(1, len(self.index.transactions_for_sequence(10)))
+
+    async def test_concurrent_refreshes_are_merged(self):
+        fetch_started = asyncio.Event()
+        release_fetch = asyncio.Event()
+
+        async def fetch(ledger_index_min: int):
+            fetch_started.set()
+            await release_fetch.wait()
+            return [offer_create("HASH1", 100, ACCOUNT, sequence=10)]
+
+        self.index._fetch_transactions = MagicMock(side_effect=fetch)
+        first_refresh = asyncio.ensure_future(self.index.refresh(90))
+        await fetch_started.wait()
+        other_refreshes = [asyncio.ensure_future(self.index.refresh(95)) for _ in range(5)]
+        release_fetch.set()
+        await asyncio.gather(first_refresh, *other_refreshes)
+
+        self.assertEqual(1, self.index._fetch_transactions.call_count)
+
+    def test_prune_drops_old_ledgers(self):
+        self.index.add_transactions([
+            offer_create("HASH1", 100, ACCOUNT, sequence=10),
+            offer_create("HASH2", 110, ACCOUNT, sequence=11),
+        ])
+
+        self.index.prune(105)
+
+        self.assertIsNone(self.index.transaction_by_hash("HASH1"))
+        self.assertEqual([], self.index.transactions_for_sequence(10))
+        self.assertEqual(1, len(self.index.transactions_for_sequence(11)))
+
+
+class XrplExchangeTransactionIndexTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.node = MockXRPLNode()
+        await self.node.start()
+        self.connector = XrplExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            xrpl_secret_key="",
+            wss_node_url=self.node.url,
+            wss_second_node_url=self.node.url,
+            wss_third_node_url=self.node.url,
+            trading_pairs=["SOLO-XRP"],
+            trading_required=False,
+        )
+        self.connector._sleep = AsyncMock()
+        self.auth_patch = patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account",
+                                return_value=ACCOUNT)
+        self.auth_patch.start()
+
+    async def asyncTearDown(self) -> None:
+        self.auth_patch.stop()
+        await self.node.stop()
+        await super().asyncTearDown()
+
+    def _track_order(self, sequence: int, ledger_index: int) -> InFlightOrder:
+        order = InFlightOrder(
+            client_order_id=f"hbot-{sequence}",
+            exchange_order_id=f"{sequence}-{ledger_index}",
+            trading_pair="SOLO-XRP",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("0.2"),
+            amount=Decimal("10"),
+            creation_timestamp=1,
+            initial_state=OrderState.OPEN,
+        )
+        self.connector._order_tracker.start_tracking_order(order)
+        return order
+
+    async def test_orders_fills_update_fetches_the_account_transactions_once(self):
+        ledger_base = CONSTANTS.LEDGER_OFFSET + 1000
+        orders = [self._track_order(sequence=10 + i, ledger_index=ledger_base + i) for i in range(5)]
+        self.node.transactions = [
+            offer_create("HASH1", ledger_base, ACCOUNT, sequence=10),
+            offer_create("HASH2", ledger_base + 2, OTHER_ACCOUNT, sequence=99, crossed_sequences=[10, 12]),
+        ]
+        process_trade_fills_mock = AsyncMock(return_value=None)
+        self.connector.process_trade_fills = process_trade_fills_mock
+
+        await self.connector._update_orders_fills(orders)
+
+        # One request to each of the two nodes the connector queries, whatever the number of orders
+        self.assertEqual(2, len(self.node.account_tx_requests))
+        self.assertEqual(1000, self.node.account_tx_requests[0]["ledger_index_min"])
+        processed = [(call.args[1].client_order_id, call.args[0]["tx"]["hash"])
+                     for call in process_trade_fills_mock.call_args_list]
+        self.assertEqual([("hbot-10", "HASH1"), ("hbot-10", "HASH2"), ("hbot-12", "HASH2")], processed)
+
+        self.node.transactions.append(
+            offer_create("HASH3", ledger_base + 7, OTHER_ACCOUNT, sequence=100, crossed_sequences=[14]))
+        process_trade_fills_mock.reset_mock()
+
+        await self.connector._update_orders_fills(orders)
+
+        self.assertEqual(4, len(self.node.account_tx_requests))
+        self.assertEqual(ledger_base + 2, self.node.account_tx_requests[2]["ledger_index_min"])
+        processed = [(call.args[1].client_order_id, call.args[0]["tx"]["hash"])
+                     for call in process_trade_fills_mock.call_args_list]
+        self.assertIn(("hbot-14", "HASH3"), processed)
+
+    async def test_single_order_lookup_refreshes_the_index(self):
+        ledger_base = CONSTANTS.LEDGER_OFFSET + 1000
+        order = self._track_order(sequence=10, ledger_index=ledger_base)
+        self.node.transactions = [offer_create("HASH1", ledger_base, ACCOUNT, sequence=10)]
+        self.connector.process_trade_fills = AsyncMock(return_value=None)
+
+        await self.connector._all_trade_updates_for_order(order)
+
+        self.assertEqual(2, len(self.node.account_tx_requests))
+        self.connector.process_trade_fills.assert_awaited_once()
@@ -0,0 +1,115 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
+
+QUOTE_KEY = ("uniswap", "ethereum", "mainnet", "WETH-USDC")
+
+
+class GatewayQuoteCacheTest(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.now = 1000.0
+        time_patch = patch.object(GatewayQuoteCache, "_time", side_effect=lambda: self.now)
+        time_patch.start()
+        self.addCleanup(time_patch.stop)
+        self.cache = GatewayQuoteCache(ttl=5)
+        self.fetch_quote = AsyncMock(return_value=Decimal("2000"))
+
+    async def get_quote(self, is_buy: bool = True, amount: Decimal = Decimal("1")):
+        return await self.cache.get_quote(*QUOTE_KEY, is_buy, amount, self.fetch_quote)
+
+    async def test_quotes_are_reused_until_they_expire(self):
+        self.assertEqual(Decimal("2000"), await self.get_quote())
+        self.now += 4
+        self.assertEqual(Decimal("2000"), await self.get_quote())
+        self.assertEqual(1, self.fetch_quote.call_count)
+
+        self.now += 2
+        self.fetch_quote.return_value = Decimal("2100")
+        self.assertEqual(Decimal("2100"), await self.get_quote())
+        self.assertEqual(2, self.fetch_quote.call_count)
+        self.assertEqual({"hits": 1, "in_flight_hits": 0, "misses": 2, "hit_rate": 1 / 3, "entries": 1},
+                         self.cache.stats())
+
+    async def test_quotes_are_keyed_by_side_and_amount(self):
+        await self.get_quote(is_buy=True)
+        await self.get_quote(is_buy=False)
+        await self.get_quote(is_buy=True, amount=Decimal("1.01"))
+        await self.get_quote(is_buy=True, amount=Decimal("1.00"))
+
+        self.assertEqual(3, self.fetch_quote.call_count)
+
+    async def test_amounts_in_the_same_bucket_share_the_quote(self):
+        self.cache.amount_bucket_pct = Decimal("1")
+
+        await self.get_quote(amount=Decimal("100"))
+        await self.get_quote(amount=Decimal("99.5"))
+        await self.get_quote(amount=Decimal("103"))
+
+        self.assertEqual(2, self.fetch_quote.call_count)
+        self.assertEqual(self.cache.amount_bucket(Decimal("100")), self.cache.amount_bucket(Decimal("99.5")))
+
+    async def test_concurrent_requests_share_the_quote_in_flight(self):
+        release_quote = asyncio.Event()
+
+        async def fetch_quote():
+            await release_quote.wait()
+            return Decimal("2000")
+
+        self.fetch_quote.side_effect = fetch_quote
+        requests = [asyncio.ensure_future(self.get_quote()) for _ in range(4)]
+        await asyncio.sleep(0)
+        release_quote.set()
+
+        self.assertEqual([Decimal("2000")] * 4, await asyncio.gather(*requests))
+        self.assertEqual(1, self.fetch_quote.call_count)
+        self.assertEqual(3, self.cache.in_flight_hits)
+        self.assertEqual(0.75, self.cache.hit_rate)
+
+    async def test_cancelled_caller_does_not_cancel_the_shared_quote(self):
+        release_quote = asyncio.Event()
+
+        async def fetch_quote():
+            await release_quote.wait()
+            return Decimal("2000")
+
+        self.fetch_quote.side_effect = fetch_quote
+        first_request = asyncio.ensure_future(self.get_quote())
+        second_request = asyncio.ensure_future(self.get_quote())
+        await asyncio.sleep(0)
+        first_request.cancel()
+        release_quote.set()
+
+        self.assertEqual(Decimal("2000"), await second_request)
+        self.assertEqual(Decimal("2000"), await self.get_quote())
+        self.assertEqual(1, self.fetch_quote.call_count)
+
+    async def test_failed_quotes_are_not_cached(self):
+        self.fetch_quote.return_value = None
+
+        self.assertIsNone(await self.get_quote())
+        self.assertIsNone(await self.get_quote())
+
+        self.assertEqual(2, self.fetch_quote.call_count)
+
+    async def test_zero_ttl_disables_the_cache(self):
+        self.cache.ttl = 0
+
+        await self.get_quote()
+        await self.get_quote()
+
+        self.assertEqual(2, self.fetch_quote.call_count)
+
+    async def test_oldest_entries_are_evicted(self):
+        with patch.object(GatewayQuoteCache, "MAX_ENTRIES", 2):
+            for amount in (Decimal("1"), Decimal("2"), Decimal("3")):
+                await self.get_quote(amount=amount)
+                self.now += 1
+            await self.get_quote(amount=Decimal("1"))
+
+        self.assertEqual(4, self.fetch_quote.call_count)
+        self.assertEqual(2, self.cache.stats()["entries"])
@@ -1,5 +1,6 @@
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,6 +11,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+from hummingbot.core.utils.estimate_fee import build_trade_fee
 
 
 class BudgetCheckerTest(unittest.TestCase):
@@ -580,3 +582,75 @@ class BudgetCheckerTest(unittest.TestCase):
 
         self.assertEqual(Decimal("7"), first_adjusted_candidate.amount)
         self.assertEqual(Decimal("5"), second_adjusted_candidate.amount)
+
+    def test_adjust_candidates_with_sufficient_funds_for_all_candidates(self):
+        self.exchange.set_balance(self.base_asset, Decimal("20"))
+        order_candidates = [
+            OrderCandidate(
+                trading_pair=self.trading_pair,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=TradeType.SELL,
+                amount=Decimal("5"),
+                price=Decimal(str(2 + level)),
+            )
+            for level in range(4)
+        ]
+
+        adjusted_candidates = self.budget_checker.adjust_candidates(order_candidates, all_or_none=True)
+
+        self.assertEqual([Decimal("5")] * 4, [candidate.amount for candidate in adjusted_candidates])
+        self.assertTrue(all(not candidate.resized for candidate in adjusted_candidates))
+        self.assertEqual(Decimal("5"), adjusted_candidates[3].order_collateral.amount)
+        self.assertEqual(Decimal("24.75"), adjusted_candidates[3].potential_returns.amount)  # 5 * 5 * 0.99
+        self.assertEqual(0, len(self.budget_checker._locked_collateral))
+
+    def test_adjust_candidates_fetches_the_exchange_data_once(self):
+        q_params = QuantizationParams(
+            trading_pair=self.trading_pair,
+            price_precision=8,
+            price_decimals=2,
+            order_size_precision=8,
+            order_size_decimals=2,
+        )
+        self.exchange.set_quantization_param(q_params)
+        self.exchange.set_balance(self.quote_asset, Decimal("100"))
+        order_candidates = [
+            OrderCandidate(
+                trading_pair=self.trading_pair,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=TradeType.BUY,
+                amount=Decimal("10"),
+                price=Decimal(str(2 + level)),
+            )
+            for level in range(5)
+        ]
+        context = self.budget_checker.evaluation_context()
+
+        with patch("hummingbot.core.data_type.order_candidate.build_trade_fee",
+                   wraps=build_trade_fee) as build_fee_mock:
+            adjusted_candidates = self.budget_checker.adjust_candidates(
+                order_candidates, all_or_none=False, context=context
+            )
+
+        self.assertEqual(1, build_fee_mock.call_count)
+        self.assertEqual([(self.quote_asset, False)], list(context._balances))
+        # 10 * (2 + 3 + 4) * 1.01 = 90.9, the fourth candidate only gets 9.1 / (5 * 1.01) = 1.80 COINALPHA
+        self.assertEqual(
+            [Decimal("10"), Decimal("10"), Decimal("10"), Decimal("1.8"), Decimal("0")],
+            [candidate.amount for candidate in adjusted_candidates],
+        )
+
+    def test_evaluation_context_delegates_to_the_exchange(self):
+        self.exchange.set_balance(self.quote_asset, Decimal("10"))
+        context = self.budget_checker.evaluation_context()
+
+        self.assertEqual(Decimal("10"), context.get_available_balance(self.quote_asset))
+        self.assertEqual(self.exchange.name, context.name)
+        self.assertEqual(self.exchange.ready, context.ready)
+
+        # The context keeps the snapshot taken on the first call
+        self.exchange.set_balance(self.quote_asset, Decimal("20"))
+        self.assertEqual(Decimal("10"), context.get_available_balance(self.quote_asset))
+        self.assertEqual(Decimal("20"), context.get_balance(self.quote_asset))
@@ -21,6 +21,8 @@ from hummingbot.core.event.events import (
     OrderCancelledEvent,
     OrderFilledEvent,
 )
+from hummingbot.core.utils import order_latency_tracker
+from hummingbot.core.utils.order_latency_tracker import OrderLatencyTracker
 
 
 class MockExchange(ExchangeBase):
@@ -1132,3 +1134,233 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def test_fetch_fillable_and_updatable_orders(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+
+        active_order: InFlightOrder = InFlightOrder(
+            client_order_id="activeOrderId",
+            exchange_order_id="activeExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        cached_order: InFlightOrder = InFlightOrder(
+            client_order_id="cachedOrderId",
+            exchange_order_id="cachedExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        lost_order: InFlightOrder = InFlightOrder(
+            client_order_id="lostOrderId",
+            exchange_order_id="lostExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        for order in [active_order, cached_order, lost_order]:
+            self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(cached_order.client_order_id)
+        self.async_run_with_timeout(self.tracker.process_order_not_found(lost_order.client_order_id))
+
+        self.assertIs(active_order, self.tracker.fetch_fillable_order("activeOrderId"))
+        self.assertIs(cached_order, self.tracker.fetch_fillable_order("cachedOrderId"))
+        self.assertIs(lost_order, self.tracker.fetch_fillable_order("lostOrderId"))
+        self.assertIsNone(self.tracker.fetch_fillable_order("unknownOrderId"))
+
+        self.assertIs(active_order, self.tracker.fetch_updatable_order("activeOrderId"))
+        self.assertIsNone(self.tracker.fetch_updatable_order("cachedOrderId"))
+        self.assertIs(lost_order, self.tracker.fetch_updatable_order("lostOrderId"))
+
+        self.assertIs(active_order, self.tracker.fetch_fillable_order_by_exchange_order_id("activeExchangeOrderId"))
+        self.assertIs(cached_order, self.tracker.fetch_fillable_order_by_exchange_order_id("cachedExchangeOrderId"))
+        self.assertIs(lost_order, self.tracker.fetch_fillable_order_by_exchange_order_id("lostExchangeOrderId"))
+        self.assertIsNone(self.tracker.fetch_updatable_order_by_exchange_order_id("cachedExchangeOrderId"))
+        self.assertIs(lost_order, self.tracker.fetch_updatable_order_by_exchange_order_id("lostExchangeOrderId"))
+
+        self.assertEqual(
+            {order.client_order_id: order for order in self.tracker.iter_fillable_orders()},
+            self.tracker.all_fillable_orders)
+        self.assertEqual(
+            {order.client_order_id: order for order in self.tracker.iter_updatable_orders()},
+            self.tracker.all_updatable_orders)
+
+    def test_exchange_order_id_index_is_updated_with_order_updates(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertIsNone(self.tracker.fetch_fillable_order_by_exchange_order_id("someExchangeOrderId"))
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=update))
+
+        self.assertIs(order, self.tracker.fetch_fillable_order_by_exchange_order_id("someExchangeOrderId"))
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_exchange_order_id_assigned_outside_the_tracker_is_found(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_fillable_order_by_exchange_order_id("someExchangeOrderId"))
+
+    def test_exchange_order_id_index_drops_orders_no_longer_tracked(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        self.tracker.start_tracking_order(order)
+        self.async_run_with_timeout(self.tracker.process_order_not_found(order.client_order_id))
+
+        self.assertIn(order.client_order_id, self.tracker.lost_orders)
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=update))
+
+        self.assertIsNone(self.tracker.fetch_fillable_order_by_exchange_order_id("someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", self.tracker._fillable_orders_by_exchange_order_id)
+
+    def test_active_orders_indexed_by_trading_pair_and_state(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertEqual({order.client_order_id: order},
+                         dict(self.tracker.active_orders_by_trading_pair(self.trading_pair)))
+        self.assertEqual(0, len(self.tracker.active_orders_by_trading_pair("OTHER-PAIR")))
+        self.assertIn(order.client_order_id, self.tracker.active_orders_by_state(OrderState.PENDING_CREATE))
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=update))
+
+        self.assertNotIn(order.client_order_id, self.tracker.active_orders_by_state(OrderState.PENDING_CREATE))
+        self.assertIn(order.client_order_id, self.tracker.active_orders_by_state(OrderState.OPEN))
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=update))
+
+        self.assertEqual(0, len(self.tracker.active_orders_by_trading_pair(self.trading_pair)))
+        self.assertEqual(0, len(self.tracker.active_orders_by_state(OrderState.OPEN)))
+        self.assertEqual(0, len(self.tracker.active_orders_by_state(OrderState.CANCELED)))
+
+    @patch("hummingbot.core.utils.order_latency_tracker.OrderLatencyTracker.get_instance")
+    def test_order_lifecycle_stages_recorded_in_latency_tracker(self, get_instance_mock):
+        latency_tracker = OrderLatencyTracker()
+        latency_tracker.start()
+        get_instance_mock.return_value = latency_tracker
+
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        latency_tracker.start_trace(self.connector.name, order_latency_tracker.CREATE_REQUEST, order.client_order_id)
+        self.tracker.start_tracking_order(order)
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=update))
+
+        trade_update: TradeUpdate = TradeUpdate(
+            trade_id="1",
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=order.trading_pair,
+            fill_price=order.price,
+            fill_base_amount=order.amount,
+            fill_quote_amount=order.price * order.amount,
+            fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("1"))]),
+            fill_timestamp=2,
+        )
+        self.tracker.process_trade_update(trade_update)
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=3,
+            new_state=OrderState.FILLED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=update))
+
+        recorded_stages = [stats.stage for stats in latency_tracker.stats()]
+        self.assertEqual(
+            [order_latency_tracker.ACKNOWLEDGED, order_latency_tracker.FIRST_FILL, order_latency_tracker.FILLED],
+            recorded_stages)
+        # The trace is released when the order is done
+        self.assertEqual(0, len(latency_tracker._traces))
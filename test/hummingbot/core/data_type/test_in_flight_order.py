@@ -727,3 +727,106 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         self.assertTrue(order.update_with_trade_update(trade_update))
         self.assertIsNone(order.exchange_order_id)
         self.assertFalse(order.exchange_order_id_update_event.is_set())
+
+    def test_in_flight_order_has_no_instance_dict(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        self.assertFalse(hasattr(order, "__dict__"))
+        with self.assertRaises(AttributeError):
+            order.unknown_attribute = 1
+
+    def test_events_are_created_lazily_with_current_order_status(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+
+        self.assertIsNone(order._exchange_order_id_update_event)
+        self.assertIsNone(order._completely_filled_event)
+        self.assertIsNone(order._processed_by_exchange_event)
+
+        trade_update: TradeUpdate = TradeUpdate(
+            trade_id="someTradeId",
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            fill_price=Decimal("1.0"),
+            fill_base_amount=Decimal("1000.0"),
+            fill_quote_amount=Decimal("1000.0"),
+            fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("1"))]),
+            fill_timestamp=1,
+        )
+        order.update_with_trade_update(trade_update)
+
+        self.assertIsNone(order._completely_filled_event)
+        self.assertTrue(order.exchange_order_id_update_event.is_set())
+        self.assertTrue(order.completely_filled_event.is_set())
+        self.assertTrue(order.processed_by_exchange_event.is_set())
+
+    def test_event_created_before_update_is_set_by_update(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        exchange_order_id_event = order.exchange_order_id_update_event
+        processed_event = order.processed_by_exchange_event
+
+        self.assertFalse(exchange_order_id_event.is_set())
+        self.assertFalse(processed_event.is_set())
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        order.update_with_order_update(order_update)
+
+        self.assertTrue(exchange_order_id_event.is_set())
+        self.assertTrue(processed_event.is_set())
+
+    def test_revision_increases_only_when_the_order_is_updated(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+
+        order.update_with_order_update(order_update)
+        revision = order.revision
+        order.update_with_order_update(order_update)
+
+        self.assertEqual(revision, order.revision)
+        self.assertGreater(revision, 0)
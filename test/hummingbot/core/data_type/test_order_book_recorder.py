@@ -0,0 +1,136 @@
+import json
+import os
+import tempfile
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import INDEX_FILE_NAME, OrderBookRecorder, OrderBookReplaySource
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def diff_message(update_id: int, timestamp: float, bids: List, asks: List) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": TRADING_PAIR, "update_id": update_id, "bids": bids, "asks": asks}, timestamp=timestamp)
+
+
+def trade_event(trade_id: int, timestamp: float, price: float) -> OrderBookTradeEvent:
+    return OrderBookTradeEvent(trading_pair=TRADING_PAIR, timestamp=timestamp, type=TradeType.SELL, price=price,
+                               amount=0.5, trade_id=str(trade_id))
+
+
+class OrderBookRecorderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.rng = np.random.default_rng(7)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    def record_random_session(self, recorder: OrderBookRecorder, events: int, snapshot_every: int = 0) -> OrderBook:
+        """
+        Applies random diffs and trades to an order book, recording them as the OrderBookTracker does.
+        """
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 0)
+        bids = [[99 - i, 1.0 + i, 1] for i in range(10)]
+        asks = [[101 + i, 1.0 + i, 1] for i in range(10)]
+        initial_levels = diff_message(1, 1.0, bids, asks)
+        order_book.apply_diffs(initial_levels.bids, initial_levels.asks, initial_levels.update_id)
+        recorder.record_order_book(TRADING_PAIR, 1.0, order_book)
+        for event in range(events):
+            timestamp = 2.0 + event
+            if snapshot_every and event % snapshot_every == snapshot_every - 1:
+                recorder.record_order_book(TRADING_PAIR, timestamp, order_book)
+            elif event % 5 == 0:
+                trade = trade_event(event, timestamp, float(self.rng.uniform(99, 101)))
+                order_book.apply_trade(trade)
+                recorder.record_trade(trade)
+            else:
+                update_id = event + 2
+                message = diff_message(
+                    update_id, timestamp,
+                    bids=[[round(float(self.rng.uniform(90, 100)), 1), float(self.rng.choice([0, 1, 2])), update_id]],
+                    asks=[[round(float(self.rng.uniform(100, 110)), 1), float(self.rng.choice([0, 1, 2])), update_id]])
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                recorder.record_diff(message)
+        recorder.flush()
+        return order_book
+
+    def assert_same_book(self, expected: OrderBook, actual: OrderBook):
+        for expected_side, actual_side in zip(expected.snapshot, actual.snapshot):
+            self.assertTrue(np.array_equal(expected_side[["price", "amount"]].values,
+                                           actual_side[["price", "amount"]].values))
+
+    def test_replay_rebuilds_the_recorded_order_book(self):
+        recorder = OrderBookRecorder(self.directory)
+        order_book = self.record_random_session(recorder, events=500)
+
+        replayed_book = OrderBook()
+        trades = []
+        applied_events = OrderBookReplaySource(self.directory).replay(
+            TRADING_PAIR, replayed_book,
+            on_event=lambda timestamp, event_type: trades.append(timestamp) if event_type is OrderBookMessageType.TRADE
+            else None)
+
+        self.assertEqual(501, applied_events)
+        self.assertEqual(100, len(trades))
+        self.assert_same_book(order_book, replayed_book)
+        self.assertEqual(order_book.last_trade_price, replayed_book.last_trade_price)
+
+    def test_segments_are_rolled_and_indexed(self):
+        recorder = OrderBookRecorder(self.directory, segment_max_events=100)
+        self.record_random_session(recorder, events=250, snapshot_every=120)
+
+        with open(os.path.join(self.directory, INDEX_FILE_NAME)) as index_file:
+            index = [json.loads(line) for line in index_file]
+        self.assertEqual([100, 100, 51], [entry["events"] for entry in index])
+        self.assertEqual([1, 1, 1], [entry["snapshots"] for entry in index])
+        self.assertEqual(251, sum(len(segment) for segment in OrderBookReplaySource(self.directory).iter_segments(
+            TRADING_PAIR)))
+        for entry in index:
+            self.assertTrue(os.path.exists(os.path.join(self.directory, entry["file"])))
+
+        source = OrderBookReplaySource(self.directory)
+        self.assertEqual([TRADING_PAIR], source.trading_pairs)
+        segments = list(source.iter_segments(TRADING_PAIR, start_timestamp=150, end_timestamp=160))
+        self.assertEqual(1, len(segments))
+        self.assertTrue(np.all(segments[0].bid_offsets[-1] == len(segments[0].bids)))
+
+    def test_replay_starts_from_the_last_snapshot_before_the_start(self):
+        recorder = OrderBookRecorder(self.directory, segment_max_events=100)
+        self.record_random_session(recorder, events=250, snapshot_every=120)
+        source = OrderBookReplaySource(self.directory)
+
+        # the snapshots are recorded at 1, 121 and 241
+        full_replay, partial_replay = OrderBook(), OrderBook()
+        source.replay(TRADING_PAIR, full_replay, end_timestamp=200)
+        applied_events = source.replay(TRADING_PAIR, partial_replay, start_timestamp=150, end_timestamp=200)
+
+        self.assertEqual(80, applied_events)
+        self.assert_same_book(full_replay, partial_replay)
+
+    def test_segments_are_written_when_they_get_old(self):
+        recorder = OrderBookRecorder(self.directory, segment_max_age=10)
+        recorder._time = lambda: 1000.0
+        recorder.record_trade(trade_event(1, 1.0, 100.0))
+        self.assertEqual(0, len(OrderBookReplaySource(self.directory).segments_info(TRADING_PAIR)))
+
+        recorder._time = lambda: 1010.0
+        recorder.record_trade(trade_event(2, 2.0, 100.0))
+
+        segments_info = OrderBookReplaySource(self.directory).segments_info(TRADING_PAIR)
+        self.assertEqual(1, len(segments_info))
+        self.assertEqual(2, segments_info[0]["trades"])
+        self.assertIsNone(segments_info[0]["first_snapshot_timestamp"])
+        self.assertEqual(0, OrderBookReplaySource(self.directory).replay(TRADING_PAIR, OrderBook()))
@@ -0,0 +1,160 @@
+import asyncio
+import tempfile
+from typing import Dict, List
+
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookReplaySource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class ControlledSnapshotsDataSource(OrderBookTrackerDataSource):
+    """
+    Data source whose order book snapshots are only returned once the test releases them
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshot_released: Dict[str, asyncio.Event] = {pair: asyncio.Event() for pair in trading_pairs}
+        self.snapshot_failures: Dict[str, int] = {pair: 0 for pair in trading_pairs}
+        self.requested_snapshots: List[str] = []
+        self.max_concurrent_requests = 0
+        self._concurrent_requests = 0
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requested_snapshots.append(trading_pair)
+        self._concurrent_requests += 1
+        self.max_concurrent_requests = max(self.max_concurrent_requests, self._concurrent_requests)
+        try:
+            await self.snapshot_released[trading_pair].wait()
+            if self.snapshot_failures[trading_pair] > 0:
+                self.snapshot_failures[trading_pair] -= 1
+                raise IOError("Snapshot request failed")
+        finally:
+            self._concurrent_requests -= 1
+        return OrderBook()
+
+    async def _connected_websocket_assistant(self):
+        raise NotImplementedError
+
+    async def _subscribe_channels(self, ws):
+        raise NotImplementedError
+
+    async def _order_book_snapshot(self, trading_pair: str):
+        raise NotImplementedError
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.data_source = ControlledSnapshotsDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+
+    async def asyncTearDown(self) -> None:
+        self.tracker.stop()
+        await super().asyncTearDown()
+
+    @staticmethod
+    async def _run_pending_tasks():
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def test_order_book_snapshots_are_requested_concurrently(self):
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await self._run_pending_tasks()
+
+        self.assertEqual(self.trading_pairs, self.data_source.requested_snapshots)
+        self.assertEqual(len(self.trading_pairs), self.data_source.max_concurrent_requests)
+
+        for released in self.data_source.snapshot_released.values():
+            released.set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+    async def test_concurrent_snapshot_requests_are_bounded(self):
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await self._run_pending_tasks()
+
+        self.assertEqual(2, len(self.data_source.requested_snapshots))
+
+        for released in self.data_source.snapshot_released.values():
+            released.set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertEqual(2, self.data_source.max_concurrent_requests)
+        self.assertEqual(self.trading_pairs, self.data_source.requested_snapshots)
+
+    async def test_order_book_is_tracked_as_soon_as_its_snapshot_arrives(self):
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        self.data_source.snapshot_released["COINBETA-HBOT"].set()
+        await asyncio.wait_for(self.tracker.wait_order_book_ready("COINBETA-HBOT"), timeout=1)
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual(["COINBETA-HBOT"], self.tracker.ready_trading_pairs)
+        self.assertTrue(self.tracker.is_order_book_ready("COINBETA-HBOT"))
+        self.assertFalse(self.tracker.is_order_book_ready("COINALPHA-HBOT"))
+        self.assertIn("COINBETA-HBOT", self.tracker.order_books)
+        self.assertIn("COINBETA-HBOT", self.tracker._tracking_tasks)
+        self.assertNotIn("COINALPHA-HBOT", self.tracker.order_books)
+
+        init_task.cancel()
+
+    async def test_failed_snapshot_request_is_retried(self):
+        self.tracker.SNAPSHOT_REQUEST_RETRY_INTERVAL = 0
+        self.data_source.snapshot_failures["COINALPHA-HBOT"] = 1
+        for released in self.data_source.snapshot_released.values():
+            released.set()
+
+        await asyncio.wait_for(self.tracker._init_order_books(), timeout=1)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(2, self.data_source.requested_snapshots.count("COINALPHA-HBOT"))
+
+    async def test_stop_clears_order_book_readiness(self):
+        for released in self.data_source.snapshot_released.values():
+            released.set()
+        await asyncio.wait_for(self.tracker._init_order_books(), timeout=1)
+
+        self.tracker.stop()
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    async def test_recorder_records_the_tracked_order_books(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = OrderBookRecorder(directory)
+            self.tracker.set_recorder(recorder)
+            for released in self.data_source.snapshot_released.values():
+                released.set()
+            self.tracker.start()
+            await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+
+            trading_pair = self.trading_pairs[0]
+            self.tracker._order_book_diff_stream.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": trading_pair, "update_id": 2, "bids": [[99.0, 1.0]], "asks": [[101.0, 2.0]]},
+                timestamp=2.0))
+            self.tracker._order_book_trade_stream.put_nowait(OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": trading_pair, "trade_id": 7, "price": 100.0, "amount": 0.5,
+                "trade_type": float(TradeType.BUY.value)}, timestamp=3.0))
+            await self._run_pending_tasks()
+            self.tracker.stop()
+
+            replayed_book = OrderBook()
+            applied_events = OrderBookReplaySource(directory).replay(trading_pair, replayed_book)
+
+        self.assertEqual(3, applied_events)
+        self.assertEqual(99.0, replayed_book.get_price(False))
+        self.assertEqual(101.0, replayed_book.get_price(True))
+        self.assertEqual(100.0, replayed_book.last_trade_price)
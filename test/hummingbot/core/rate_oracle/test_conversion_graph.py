@@ -0,0 +1,89 @@
+import time
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.rate_oracle.conversion_graph import ConversionGraph
+from hummingbot.core.rate_oracle.utils import find_rate
+
+
+class ConversionGraphTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+
+    def test_rates_match_find_rate(self):
+        graph = ConversionGraph(self.prices)
+
+        for pair in ("HBOT-USDT", "ZBOT-USDT", "USDT-HBOT", "HBOT-AAVE", "AAVE-HBOT", "HBOT-GBP", "HBOT-HBOT"):
+            self.assertEqual(find_rate(self.prices, pair), graph.rate(pair), pair)
+
+    def test_wrapped_tokens_are_unwrapped(self):
+        graph = ConversionGraph({"ETH-USDT": Decimal("2000")})
+
+        self.assertEqual(Decimal("2000"), graph.rate("WETH-USDT"))
+        self.assertEqual(Decimal("1"), graph.rate("WETH-ETH"))
+
+    def test_price_updates_reuse_the_cached_route(self):
+        graph = ConversionGraph(self.prices)
+        self.assertEqual(Decimal("2"), graph.rate("HBOT-AAVE"))
+        route = graph.route("HBOT-AAVE")
+
+        graph.update({"HBOT-USDT": Decimal("150")})
+        graph["AAVE-USDT"] = Decimal("30")
+
+        self.assertIs(route, graph.route("HBOT-AAVE"))
+        self.assertEqual(Decimal("5"), graph.rate("HBOT-AAVE"))
+
+    def test_new_pairs_update_the_routes(self):
+        graph = ConversionGraph(self.prices)
+        self.assertIsNone(graph.rate("HBOT-EUR"))
+
+        graph["GBP-EUR"] = Decimal("1.2")
+        self.assertIsNone(graph.rate("HBOT-EUR"))  # three conversions away with the default max hops
+        graph.max_hops = 3
+        self.assertEqual(Decimal("90"), graph.rate("HBOT-EUR"))
+
+        graph["HBOT-EUR"] = Decimal("91")
+        self.assertEqual(Decimal("91"), graph.rate("HBOT-EUR"))
+        self.assertEqual(Decimal("1") / Decimal("91"), graph.rate("EUR-HBOT"))
+
+    def test_removed_pairs_update_the_routes(self):
+        graph = ConversionGraph(self.prices)
+        self.assertEqual(Decimal("75"), graph.rate("HBOT-GBP"))
+
+        del graph["USDT-GBP"]
+
+        self.assertIsNone(graph.rate("HBOT-GBP"))
+        graph.clear()
+        self.assertIsNone(graph.rate("HBOT-USDT"))
+
+    def test_invalid_price_keys_are_not_part_of_the_graph(self):
+        graph = ConversionGraph({"HBOTUSDT": Decimal("100"), "AAVE-USDT": Decimal("50")})
+
+        self.assertEqual(Decimal("100"), graph.rate("HBOTUSDT"))
+        self.assertEqual(Decimal("0.02"), graph.rate("USDT-AAVE"))
+
+    def test_lookups_are_faster_than_scanning_the_prices(self):
+        """
+        Benchmark of the cross rates lookups for a source with thousands of pairs, against the scan of find_rate.
+        """
+        tokens = [f"TOKEN{i}" for i in range(3000)]
+        prices = {f"{token}-USDT": Decimal(i + 1) for i, token in enumerate(tokens)}
+        prices["USDT-GBP"] = Decimal("0.75")
+        pairs = [f"{token}-GBP" for token in tokens[::30]] + [f"GBP-{token}" for token in tokens[::30]]
+        graph = ConversionGraph(prices)
+
+        start = time.perf_counter()
+        expected_rates = [find_rate(prices, pair) for pair in pairs]
+        scan_duration = time.perf_counter() - start
+
+        graph_rates = [graph.rate(pair) for pair in pairs]  # finds and caches the routes
+        start = time.perf_counter()
+        for _ in range(10):
+            graph_rates = [graph.rate(pair) for pair in pairs]
+        graph_duration = (time.perf_counter() - start) / 10
+
+        self.assertEqual(expected_rates[:100], graph_rates[:100])
+        # find_rate only finds the routes starting with a price of the base token
+        self.assertEqual(Decimal("1") / Decimal("0.75"), graph_rates[100])
+        self.assertLess(graph_duration * 10, scan_duration)
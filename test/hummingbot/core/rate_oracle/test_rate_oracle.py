@@ -101,3 +101,18 @@ class RateOracleTest(unittest.TestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_get_pair_rate_uses_the_prices_merged_by_the_fetch_loop(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={"HBOT-USDT": Decimal("100")}), max_hops=3)
+        rate_oracle.set_price("USDT-GBP", Decimal("0.75"))
+        rate_oracle._prices["GBP-EUR"] = Decimal("1.2")
+
+        rate_oracle.start()
+        self.async_run_with_timeout(rate_oracle.get_ready())
+        self.async_run_with_timeout(rate_oracle.stop_network())
+
+        self.assertEqual(3, rate_oracle.max_hops)
+        self.assertEqual(Decimal("75"), rate_oracle.get_pair_rate("HBOT-GBP"))
+        self.assertEqual(Decimal("90"), rate_oracle.get_pair_rate("HBOT-EUR"))
+        rate_oracle.max_hops = 2
+        self.assertIsNone(rate_oracle.get_pair_rate("HBOT-EUR"))
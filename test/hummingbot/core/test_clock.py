@@ -6,6 +6,7 @@ import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 
 
 class ClockUnitTest(unittest.TestCase):
@@ -110,6 +111,20 @@ class ClockUnitTest(unittest.TestCase):
 
         self.assertGreaterEqual(self.clock_realtime.current_timestamp, self.realtime_end_timestamp)
 
+    def test_run_til_reports_ticks_to_the_event_loop_monitor(self):
+        previous_monitor = EventLoopMonitor._shared_instance
+        monitor = EventLoopMonitor()
+        monitor.enabled = True
+        EventLoopMonitor._shared_instance = monitor
+        try:
+            with self.clock_realtime:
+                self.ev_loop.run_until_complete(self.clock_realtime.run_til(self.realtime_end_timestamp))
+        finally:
+            EventLoopMonitor._shared_instance = previous_monitor
+
+        self.assertGreater(monitor.tick_lag.count, 0)
+        self.assertEqual(monitor.tick_lag.count, monitor.tick_duration.count)
+
     def test_backtest(self):
         # Note: Technically you do not execute `backtest()` when in REALTIME mode
 
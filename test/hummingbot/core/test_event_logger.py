@@ -0,0 +1,101 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeType,
+)
+
+
+class EventLoggerTests(TestCase):
+
+    @staticmethod
+    def fill_event(timestamp: float, trade_type: TradeType = TradeType.BUY, price: str = "10", amount: str = "2",
+                   trading_pair: str = "COINALPHA-HBOT") -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01"),
+                                          flat_fees=[TokenAmount(token="BNB", amount=Decimal("0.1"))]),
+        )
+
+    def test_default_logger_keeps_all_fills_and_the_latest_events(self):
+        event_logger = EventLogger()
+
+        for i in range(100):
+            event_logger(OrderCancelledEvent(timestamp=i, order_id=f"OID{i}"))
+            event_logger(self.fill_event(i))
+
+        self.assertEqual(100, len(event_logger.get_events(OrderFilledEvent)))
+        cancelled_events = event_logger.get_events(OrderCancelledEvent)
+        self.assertEqual(50, len(cancelled_events))
+        self.assertEqual(50, cancelled_events[0].timestamp)
+        self.assertEqual([], event_logger.get_events(BuyOrderCreatedEvent))
+        self.assertEqual(150, len(event_logger.event_log))
+
+    def test_bounded_logger_keeps_a_capacity_per_event_class(self):
+        event_logger = EventLogger(capacity=3)
+
+        for i in range(10):
+            event_logger(OrderCancelledEvent(timestamp=i, order_id=f"OID{i}"))
+            if i < 2:
+                event_logger(self.fill_event(i))
+
+        self.assertEqual([7, 8, 9], [event.timestamp for event in event_logger.get_events(OrderCancelledEvent)])
+        self.assertEqual([0, 1], [event.timestamp for event in event_logger.get_events(OrderFilledEvent)])
+        self.assertEqual(5, len(event_logger.event_log))
+
+    def test_bounded_logger_keeps_the_events_within_the_time_window(self):
+        event_logger = EventLogger(time_window=10)
+
+        event_logger(self.fill_event(100))
+        event_logger(OrderCancelledEvent(timestamp=101, order_id="OID1"))
+        event_logger(self.fill_event(105))
+        event_logger(OrderCancelledEvent(timestamp=112, order_id="OID2"))
+
+        # the window follows the most recent event timestamp, whatever the class of the event
+        self.assertEqual([105], [event.timestamp for event in event_logger.get_events(OrderFilledEvent)])
+        self.assertEqual([112], [event.timestamp for event in event_logger.get_events(OrderCancelledEvent)])
+        self.assertEqual(2, len(event_logger.event_log))
+
+        with self.assertRaises(ValueError):
+            EventLogger(time_window=0)
+
+    def test_aggregates_cover_the_events_no_longer_kept(self):
+        event_logger = EventLogger(capacity=1, track_aggregates=True)
+
+        event_logger(self.fill_event(1, TradeType.BUY, price="10", amount="2"))
+        event_logger(self.fill_event(2, TradeType.BUY, price="12", amount="1"))
+        event_logger(self.fill_event(3, TradeType.SELL, price="11", amount="1"))
+        event_logger(OrderCancelledEvent(timestamp=4, order_id="OID4"))
+
+        self.assertEqual(1, len(event_logger.get_events(OrderFilledEvent)))
+        self.assertEqual(3, event_logger.event_count(OrderFilledEvent))
+        self.assertEqual(1, event_logger.event_count(OrderCancelledEvent))
+        self.assertEqual(0, event_logger.event_count(BuyOrderCreatedEvent))
+        self.assertEqual((Decimal("3"), Decimal("32")), event_logger.filled_volume("COINALPHA-HBOT", TradeType.BUY))
+        self.assertEqual((Decimal("1"), Decimal("11")), event_logger.filled_volume("COINALPHA-HBOT", TradeType.SELL))
+        self.assertEqual((Decimal("0"), Decimal("0")), event_logger.filled_volume("HBOT-USDT", TradeType.SELL))
+        self.assertEqual({"HBOT": Decimal("0.43"), "BNB": Decimal("0.3")}, event_logger.fee_totals)
+
+        event_logger.clear()
+
+        self.assertEqual(0, event_logger.event_count(OrderFilledEvent))
+        self.assertEqual({}, event_logger.fee_totals)
+
+    def test_aggregates_require_tracking(self):
+        event_logger = EventLogger()
+        event_logger(self.fill_event(1))
+
+        with self.assertRaises(RuntimeError):
+            event_logger.event_count(OrderFilledEvent)
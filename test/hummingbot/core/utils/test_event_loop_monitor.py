@@ -0,0 +1,107 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor, LatencyHistogram
+
+
+class LatencyHistogramTests(IsolatedAsyncioWrapperTestCase):
+
+    def test_samples_are_counted_in_their_bucket(self):
+        histogram = LatencyHistogram(buckets=(0.01, 0.1, float("inf")))
+
+        for value in (0.005, 0.01, 0.05, 2.0):
+            histogram.add(value)
+
+        self.assertEqual([2, 1, 1], histogram.counts)
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(2.0, histogram.max)
+        self.assertAlmostEqual(2.065, histogram.total)
+        self.assertAlmostEqual(0.03, histogram.percentiles((50,))[0])
+
+
+class EventLoopMonitorTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.monitor = EventLoopMonitor(slow_callback_threshold=0.05, probe_interval=0.01)
+        self.log_records = []
+        self.level = 0
+        self.monitor.logger().setLevel(1)
+        self.monitor.logger().addHandler(self)
+
+    async def asyncTearDown(self) -> None:
+        self.monitor.stop()
+        self.monitor.logger().removeHandler(self)
+        await super().asyncTearDown()
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and message in record.getMessage() for record in self.log_records)
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    async def test_slow_callbacks_are_reported_with_their_coroutine(self):
+        self.monitor.start()
+
+        async def blocking_coroutine():
+            time.sleep(0.1)
+
+        async def fast_coroutine():
+            pass
+
+        await asyncio.gather(asyncio.ensure_future(blocking_coroutine()), asyncio.ensure_future(fast_coroutine()))
+
+        self.assertEqual(1, len(self.monitor.slow_callbacks))
+        slow_callback = self.monitor.slow_callbacks[0]
+        self.assertGreaterEqual(slow_callback.duration, 0.1)
+        self.assertIn("blocking_coroutine", slow_callback.description)
+        self.assertTrue(self._is_logged("WARNING", "Event loop blocked for"))
+        self.assertGreater(self.monitor.callback_duration.count, 1)
+
+    async def test_stop_restores_the_callbacks_handler(self):
+        original_run = asyncio.events.Handle._run
+        self.monitor.start()
+        self.assertIsNot(original_run, asyncio.events.Handle._run)
+
+        self.monitor.stop()
+
+        self.assertIs(original_run, asyncio.events.Handle._run)
+        self.assertFalse(self.monitor.enabled)
+
+    async def test_probe_measures_the_loop_lag(self):
+        self.monitor.start()
+
+        await asyncio.sleep(0.005)
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+
+        self.assertGreater(self.monitor.loop_lag.count, 0)
+        self.assertGreaterEqual(self.monitor.loop_lag.max, 0.03)
+
+    async def test_stack_sampling_attributes_blocking_time_to_modules(self):
+        self.monitor.stack_sampling_enabled = True
+        self.monitor.stack_sampling_interval = 0.005
+        self.monitor.start()
+
+        async def blocking_coroutine():
+            time.sleep(0.2)
+
+        await asyncio.ensure_future(blocking_coroutine())
+
+        self.assertIn(__name__, self.monitor.blocking_time_by_module)
+        slow_callback = self.monitor.slow_callbacks[-1]
+        self.assertIsNotNone(slow_callback.stack)
+        self.assertIn("blocking_coroutine", slow_callback.stack)
+
+    async def test_record_tick_and_format_status(self):
+        self.monitor.record_tick(lag=0.002, duration=0.004)
+        self.monitor.record_tick(lag=-0.001, duration=0.2)
+        self.monitor.blocking_time_by_module["hummingbot.strategy.slow_strategy"] = 1.5
+
+        status = self.monitor.format_status()
+
+        self.assertEqual(0.0, min(self.monitor.tick_lag._samples))
+        self.assertIn("Clock tick lag: p50 1.00 ms, p99 1.98 ms, max 2.00 ms (2 samples)", status)
+        self.assertIn("ms - Clock tick", status)
+        self.assertIn("hummingbot.strategy.slow_strategy: 1.50 s", status)
@@ -0,0 +1,119 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+import aiohttp
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils import order_latency_tracker
+from hummingbot.core.utils.order_latency_tracker import CANCEL_REQUEST, CREATE_REQUEST, OrderLatencyTracker
+
+
+class OrderLatencyTrackerTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.previous_instance = OrderLatencyTracker._shared_instance
+        self.tracker = OrderLatencyTracker()
+        OrderLatencyTracker._shared_instance = self.tracker
+
+    async def asyncTearDown(self) -> None:
+        await self.tracker.stop_metrics_server()
+        OrderLatencyTracker._shared_instance = self.previous_instance
+        await super().asyncTearDown()
+
+    def _recorded_stages(self):
+        return [(stats.connector_name, stats.request_type, stats.stage, stats.count) for stats in self.tracker.stats()]
+
+    async def test_disabled_tracker_is_not_used_by_the_throttler(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=1)])
+        self.tracker.start_trace("binance", CREATE_REQUEST, "OID1")
+        self.tracker.activate_trace(CREATE_REQUEST, "OID1")
+        self.tracker.stop()
+
+        async with throttler.execute_task(limit_id="test"):
+            pass
+
+        self.assertEqual([("binance", CREATE_REQUEST, order_latency_tracker.TASK_STARTED, 1)],
+                         self._recorded_stages())
+
+    async def test_stages_are_attributed_to_the_order_of_the_task(self):
+        self.tracker.start()
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=1)])
+
+        async def create_order(order_id: str):
+            token = self.tracker.activate_trace(CREATE_REQUEST, order_id)
+            async with throttler.execute_task(limit_id="test"):
+                self.tracker.record_stage(order_latency_tracker.RESPONSE_RECEIVED)
+            self.tracker.deactivate_trace(token)
+
+        async def untraced_request():
+            async with throttler.execute_task(limit_id="test"):
+                pass
+
+        self.tracker.start_trace("binance", CREATE_REQUEST, "OID1")
+        await asyncio.gather(create_order("OID1"), untraced_request())
+
+        self.assertEqual(
+            [("binance", CREATE_REQUEST, order_latency_tracker.TASK_STARTED, 1),
+             ("binance", CREATE_REQUEST, order_latency_tracker.RATE_LIMIT_ACQUIRED, 1),
+             ("binance", CREATE_REQUEST, order_latency_tracker.RESPONSE_RECEIVED, 1)],
+            self._recorded_stages())
+
+    async def test_create_and_cancel_requests_are_traced_separately(self):
+        self.tracker.start()
+        self.tracker.start_trace("binance", CREATE_REQUEST, "OID1")
+        self.tracker.start_trace("binance", CANCEL_REQUEST, "OID1")
+
+        self.tracker.record_order_stage(CREATE_REQUEST, "OID1", order_latency_tracker.ACKNOWLEDGED)
+        self.tracker.record_order_stage(CANCEL_REQUEST, "OID1", order_latency_tracker.CANCEL_CONFIRMED)
+        # The terminal stage releases the cancel trace
+        self.tracker.record_order_stage(CANCEL_REQUEST, "OID1", order_latency_tracker.CANCEL_CONFIRMED)
+
+        self.assertEqual(
+            [("binance", CREATE_REQUEST, order_latency_tracker.ACKNOWLEDGED, 1),
+             ("binance", CANCEL_REQUEST, order_latency_tracker.CANCEL_CONFIRMED, 1)],
+            self._recorded_stages())
+
+    async def test_active_traces_are_bounded(self):
+        self.tracker = OrderLatencyTracker(max_active_traces=2)
+        self.tracker.start()
+        for order_id in ("OID1", "OID2", "OID3"):
+            self.tracker.start_trace("binance", CREATE_REQUEST, order_id)
+
+        self.tracker.record_order_stage(CREATE_REQUEST, "OID1", order_latency_tracker.ACKNOWLEDGED)
+        self.tracker.record_order_stage(CREATE_REQUEST, "OID3", order_latency_tracker.ACKNOWLEDGED)
+
+        self.assertEqual([("binance", CREATE_REQUEST, order_latency_tracker.ACKNOWLEDGED, 1)],
+                         self._recorded_stages())
+
+    async def test_stats_percentiles(self):
+        self.tracker.start()
+        stage_key = ("binance", CREATE_REQUEST, order_latency_tracker.ACKNOWLEDGED)
+        self.tracker._stage_samples[stage_key] = [i / 1000 for i in range(1, 101)]
+        self.tracker._elapsed_samples[stage_key] = [i / 100 for i in range(1, 101)]
+
+        stats = self.tracker.stats()[0]
+
+        self.assertEqual(100, stats.count)
+        self.assertAlmostEqual(0.0505, stats.stage_p50)
+        self.assertAlmostEqual(0.0901, stats.stage_p90)
+        self.assertAlmostEqual(0.09901, stats.stage_p99)
+        self.assertAlmostEqual(0.1, stats.stage_max)
+        self.assertAlmostEqual(0.505, stats.elapsed_p50)
+
+    async def test_metrics_server_serves_prometheus_text(self):
+        self.tracker.start()
+        self.tracker.start_trace("binance", CREATE_REQUEST, "OID1")
+        self.tracker.record_order_stage(CREATE_REQUEST, "OID1", order_latency_tracker.ACKNOWLEDGED)
+        await self.tracker.start_metrics_server(port=0)
+        port = self.tracker._metrics_runner.addresses[0][1]
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{port}/metrics") as response:
+                text = await response.text()
+
+        labels = 'connector="binance",request="create",stage="acknowledged"'
+        self.assertIn("# TYPE hummingbot_order_stage_latency_seconds summary", text)
+        self.assertIn(f'hummingbot_order_stage_latency_seconds{{{labels},quantile="0.99"}}', text)
+        self.assertIn(f"hummingbot_order_stage_latency_seconds_count{{{labels}}} 1", text)
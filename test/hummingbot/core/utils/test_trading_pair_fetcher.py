@@ -1,7 +1,10 @@
 import asyncio
 import json
+import tempfile
+import time
 import unittest
 from decimal import Decimal
+from pathlib import Path
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -36,9 +39,12 @@ class TestTradingPairFetcher(unittest.TestCase):
         self._original_async_loop = asyncio.get_event_loop()
         self.async_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.async_loop)
+        self._catalog_dir = tempfile.TemporaryDirectory()
+        self.catalog_path = Path(self._catalog_dir.name) / "trading_pairs_catalog.json"
 
     def tearDown(self) -> None:
         super().tearDown()
+        self._catalog_dir.cleanup()
         self.async_loop.stop()
         self.async_loop.close()
         asyncio.set_event_loop(self._original_async_loop)
@@ -258,3 +264,136 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertIn("ETH-BTC", binance_pairs)
         self.assertIn("LTC-BTC", binance_pairs)
         self.assertNotIn("BNB-BTC", binance_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_fetched_trading_pairs_are_saved_to_catalog(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, catalog_path=self.catalog_path)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+
+        with open(self.catalog_path) as catalog_file:
+            catalog = json.load(catalog_file)
+        self.assertEqual(["mockConnector"], list(catalog.keys()))
+        self.assertEqual(["MOCK-HBOT"], catalog["mockConnector"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_fresh_catalog_entries_are_not_fetched_again(self, _, mock_connector_settings):
+        with open(self.catalog_path, "w") as catalog_file:
+            json.dump({"mockConnector": {"timestamp": time.time(), "trading_pairs": ["CACHED-HBOT"]}}, catalog_file)
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, catalog_path=self.catalog_path)
+
+        # The catalog is available before the background refresh runs
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_expired_catalog_entries_are_refreshed(self, _, mock_connector_settings):
+        expired_timestamp = time.time() - TradingPairFetcher.CATALOG_TTL - 1
+        with open(self.catalog_path, "w") as catalog_file:
+            json.dump({"mockConnector": {"timestamp": expired_timestamp, "trading_pairs": ["CACHED-HBOT"]}},
+                      catalog_file)
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, catalog_path=self.catalog_path)
+
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_failed_refresh_keeps_cataloged_pairs(self, _, mock_connector_settings):
+        expired_timestamp = time.time() - TradingPairFetcher.CATALOG_TTL - 1
+        with open(self.catalog_path, "w") as catalog_file:
+            json.dump({"mockConnector": {"timestamp": expired_timestamp, "trading_pairs": ["CACHED-HBOT"]}},
+                      catalog_file)
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = Exception("Test error")
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, catalog_path=self.catalog_path)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_catalog_entries_of_not_connected_connectors_are_not_loaded(self, _, mock_connector_settings):
+        with open(self.catalog_path, "w") as catalog_file:
+            json.dump({"mockConnector": {"timestamp": time.time(), "trading_pairs": ["CACHED-HBOT"]}}, catalog_file)
+        connector_setting = self.MockConnectorSetting(name="mockConnector", connector=AsyncMock())
+        connector_setting.connector_connected = MagicMock(return_value=False)
+        mock_connector_settings.return_value = {"mock_exchange_1": connector_setting}
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = False
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, catalog_path=self.catalog_path)
+
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_no_catalog_is_written_when_catalog_path_not_configured(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertIsNone(trading_pair_fetcher._catalog_path)
+        self.assertFalse(self.catalog_path.exists())
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_concurrent_fetch_all_calls_are_serialized(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, catalog_path=self.catalog_path)
+        self.async_run_with_timeout(asyncio.gather(
+            trading_pair_fetcher._fetch_task, trading_pair_fetcher.fetch_all(client_config_map)))
+
+        # The second call finds the entry refreshed by the first one and does not fetch it again
+        connector.all_trading_pairs.assert_called_once()
+        self.assertEqual([self.catalog_path], list(Path(self._catalog_dir.name).iterdir()))
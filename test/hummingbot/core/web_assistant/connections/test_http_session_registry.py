@@ -0,0 +1,104 @@
+import asyncio
+import ssl
+
+from aiohttp import web
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.connections.http_session_registry import (
+    DEFAULT_SESSION_KEY,
+    HTTPSessionConfig,
+    HTTPSessionRegistry,
+)
+
+
+class HTTPSessionRegistryTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.registry = HTTPSessionRegistry()
+
+    async def asyncTearDown(self) -> None:
+        await self.registry.close()
+        await super().asyncTearDown()
+
+    async def _start_server(self) -> str:
+        async def handler(_):
+            return web.json_response({"result": "ok"})
+
+        app = web.Application()
+        app.router.add_get("/test", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.addAsyncCleanup(runner.cleanup)
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/test"
+
+    async def test_hosts_without_configuration_share_the_default_session(self):
+        first_session = self.registry.get_session("https://api.exchange-one.com/api/v1/time")
+        second_session = self.registry.get_session("https://api.exchange-two.com/time")
+
+        self.assertIs(first_session, second_session)
+        self.assertIs(first_session, self.registry.get_session())
+
+    async def test_configured_host_uses_its_own_session(self):
+        self.registry.configure_host(
+            "api.exchange-one.com", HTTPSessionConfig(limit=10, limit_per_host=5, keepalive_timeout=30.0))
+
+        host_session = self.registry.get_session("https://api.exchange-one.com/api/v1/order")
+        default_session = self.registry.get_session("https://api.exchange-two.com/time")
+
+        self.assertIsNot(host_session, default_session)
+        self.assertIs(host_session, self.registry.get_session("https://api.exchange-one.com/api/v1/time"))
+        self.assertEqual(10, host_session.connector.limit)
+        self.assertEqual(5, host_session.connector.limit_per_host)
+        self.assertEqual(100, default_session.connector.limit_per_host)
+
+    async def test_ssl_context_creates_dedicated_session(self):
+        default_session = self.registry.get_session()
+        gateway_session = self.registry.get_session("localhost:15888", ssl_context=ssl.create_default_context())
+
+        self.assertIsNot(default_session, gateway_session)
+        self.assertTrue(self.registry.has_session("localhost:15888"))
+        self.assertIs(gateway_session, self.registry.get_session("https://localhost:15888/chain/status"))
+
+        recreated_session = self.registry.get_session(
+            "localhost:15888", ssl_context=ssl.create_default_context(), recreate=True)
+        await asyncio.sleep(0)
+
+        self.assertIsNot(gateway_session, recreated_session)
+        self.assertTrue(gateway_session.closed)
+
+    async def test_closed_session_is_replaced(self):
+        session = self.registry.get_session()
+        await session.close()
+
+        self.assertFalse(self.registry.has_session())
+        self.assertIsNot(session, self.registry.get_session())
+
+    async def test_connections_are_reused_between_requests(self):
+        url = await self._start_server()
+        connection = await ConnectionsFactory(session_registry=self.registry).get_rest_connection()
+
+        for _ in range(3):
+            response = await connection.call(RESTRequest(method=RESTMethod.GET, url=url))
+            self.assertEqual({"result": "ok"}, await response.json())
+
+        metrics = self.registry.metrics[DEFAULT_SESSION_KEY]
+        self.assertEqual(3, metrics["requests"])
+        self.assertEqual(1, metrics["connections_created"])
+        self.assertEqual(2, metrics["connections_reused"])
+        self.assertAlmostEqual(2 / 3, metrics["connections_reuse_ratio"])
+
+    async def test_factories_share_the_registry_sessions(self):
+        first_factory = ConnectionsFactory(session_registry=self.registry)
+        second_factory = ConnectionsFactory(session_registry=self.registry)
+
+        first_ws_session = await first_factory._get_shared_client()
+        second_ws_session = await second_factory._get_shared_client()
+
+        self.assertIs(first_ws_session, second_ws_session)
+        self.assertIsNot(self.registry.get_session(), first_ws_session)
@@ -0,0 +1,80 @@
+import json
+from unittest import TestCase
+
+from hummingbot.core.web_assistant.connections import json_decoder
+from hummingbot.core.web_assistant.connections.json_decoder import (
+    DEFAULT_JSON_DECODER,
+    RawMessageRouter,
+    get_json_decoder,
+    json_loads,
+    set_json_decoder,
+)
+
+
+class JSONDecoderTests(TestCase):
+
+    def tearDown(self) -> None:
+        set_json_decoder(None)
+        super().tearDown()
+
+    def test_json_loads_decodes_text_and_bytes(self):
+        message = {"e": "trade", "p": "0.001", "q": 100, "m": True}
+
+        self.assertEqual(message, json_loads(json.dumps(message)))
+        self.assertEqual(message, json_loads(json.dumps(message).encode()))
+
+    def test_json_loads_decodes_documents_not_supported_by_the_fast_decoder(self):
+        self.assertEqual({"id": 2 ** 70}, json_loads(json.dumps({"id": 2 ** 70})))
+
+    def test_json_loads_raises_value_error_for_invalid_documents(self):
+        with self.assertRaises(ValueError):
+            json_loads("pong")
+
+    def test_fast_decoder_used_by_default_when_installed(self):
+        if json_decoder.orjson is None:
+            self.assertIs(json.loads, DEFAULT_JSON_DECODER)
+        else:
+            self.assertIsNot(json.loads, DEFAULT_JSON_DECODER)
+        self.assertIs(DEFAULT_JSON_DECODER, get_json_decoder())
+
+    def test_set_json_decoder(self):
+        decoded_documents = []
+
+        def decoder(data):
+            decoded_documents.append(data)
+            return json.loads(data)
+
+        set_json_decoder(decoder)
+        json_loads('{"one": 1}')
+        set_json_decoder(None)
+        json_loads('{"two": 2}')
+
+        self.assertEqual(['{"one": 1}'], decoded_documents)
+        self.assertIs(DEFAULT_JSON_DECODER, get_json_decoder())
+
+
+class RawMessageRouterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.router = RawMessageRouter(channel_field="e", routes={"depthUpdate": "diffs", "trade": "trades"})
+
+    def test_route_text_and_bytes_messages(self):
+        self.assertEqual("diffs", self.router.route('{"e":"depthUpdate","E":123456789,"s":"BNBBTC"}'))
+        self.assertEqual("trades", self.router.route(b'{"e":"trade","E":123456789,"s":"BNBBTC"}'))
+        self.assertEqual("trades", self.router.route('{"e": "trade", "E": 123456789, "s": "BNBBTC"}'))
+
+    def test_messages_of_other_channels_are_dropped(self):
+        self.assertIsNone(self.router.route('{"e":"trades_summary","E":123456789}'))
+        self.assertIsNone(self.router.route('{"result":null,"id":1}'))
+        self.assertEqual(2, self.router.dropped_messages)
+
+    def test_channel_field_is_searched_only_at_the_start_of_the_message(self):
+        router = RawMessageRouter(channel_field="e", routes={"trade": "trades"}, scan_length=16)
+        message = '{"data":"' + "x" * 20 + '","e":"trade"}'
+
+        self.assertIsNone(router.route(message))
+
+    def test_decode_only_routed_messages(self):
+        self.assertEqual(("trades", {"e": "trade", "p": "1"}), self.router.decode('{"e":"trade","p":"1"}'))
+        self.assertEqual((None, None), self.router.decode('{"e":"kline","k":{'))
@@ -118,6 +118,31 @@ class WSConnectionTest(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_raw_messages(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await self.ws_connection.connect(self.ws_url, raw_messages=True)
+        raw_message = json.dumps({"one": 1})
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=raw_message
+        )
+
+        response = await self.ws_connection.receive()
+
+        self.assertEqual(raw_message, response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_non_json_text_message(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await self.ws_connection.connect(self.ws_url)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message="pong"
+        )
+
+        response = await self.ws_connection.receive()
+
+        self.assertEqual("pong", response.data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     async def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
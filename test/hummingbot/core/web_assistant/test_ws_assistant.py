@@ -47,7 +47,8 @@ class WSAssistantTest(unittest.TestCase):
                                         ws_headers={},
                                         ping_timeout=ping_timeout,
                                         message_timeout=message_timeout,
-                                        max_msg_size=max_msg_size)
+                                        max_msg_size=max_msg_size,
+                                        raw_messages=False)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.disconnect")
     def test_disconnect(self, disconnect_mock):
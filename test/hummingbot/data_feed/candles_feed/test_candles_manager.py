@@ -0,0 +1,221 @@
+import json
+import unittest
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_manager import (
+    CandlesManager,
+    CandlesSourceKey,
+    MultiplexedCandlesStream,
+    resample_candles,
+)
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.kraken_spot_candles.kraken_spot_candles import KrakenSpotCandles
+
+
+def one_minute_candles(start: int, count: int) -> np.ndarray:
+    timestamps = start + 60 * np.arange(count)
+    opens = 100 + np.arange(count, dtype=float)
+    return np.column_stack([timestamps, opens, opens + 2, opens - 1, opens + 1,
+                            np.ones(count), np.full(count, 100.0), np.full(count, 3.0),
+                            np.full(count, 0.5), np.full(count, 50.0)])
+
+
+def kline_message(symbol: str, interval: str, timestamp: int, close: str) -> dict:
+    return {
+        "e": "kline",
+        "E": timestamp * 1000,
+        "s": symbol,
+        "k": {"t": timestamp * 1000, "T": timestamp * 1000 + 59999, "s": symbol, "i": interval,
+              "o": "100", "c": close, "h": "110", "l": "90", "v": "1", "n": 3, "x": False,
+              "q": "100", "V": "0.5", "Q": "50", "B": "0"},
+    }
+
+
+class ResampleCandlesTest(unittest.TestCase):
+
+    def test_resample_aggregates_the_candles_of_each_interval(self):
+        candles = one_minute_candles(start=1_700_000_160, count=13)  # starts 1 minute after a 5m boundary
+
+        resampled = resample_candles(candles, 300)
+
+        # the first 5m candle is incomplete and dropped, the last one is in progress
+        self.assertEqual([1_700_000_400, 1_700_000_700], list(resampled[:, 0]))
+        first = candles[4:9]
+        self.assertEqual(first[0, 1], resampled[0, 1])
+        self.assertEqual(first[:, 2].max(), resampled[0, 2])
+        self.assertEqual(first[:, 3].min(), resampled[0, 3])
+        self.assertEqual(first[-1, 4], resampled[0, 4])
+        self.assertTrue(np.allclose(first[:, 5:].sum(axis=0), resampled[0, 5:]))
+        self.assertTrue(np.allclose(candles[9:, 5:].sum(axis=0), resampled[1, 5:]))
+
+    def test_resample_aligned_candles_keeps_the_first_interval(self):
+        candles = one_minute_candles(start=1_700_000_100, count=10)
+
+        resampled = resample_candles(candles, 300)
+
+        self.assertEqual(2, len(resampled))
+        self.assertEqual(0, len(resample_candles(np.empty((0, 10)), 300)))
+
+
+class CandlesManagerTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = CandlesManager()
+
+    def tearDown(self) -> None:
+        self.manager.stop()
+        super().tearDown()
+
+    def test_source_key_resamples_the_intervals_up_to_12h(self):
+        def source_interval(interval: str, max_records: int = 100):
+            config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval=interval,
+                                   max_records=max_records)
+            return self.manager.source_key(config).interval
+
+        self.assertEqual("1m", source_interval("1m"))
+        self.assertEqual("1m", source_interval("5m"))
+        self.assertEqual("1m", source_interval("15m"))
+        self.assertEqual("1s", source_interval("1s"))
+        self.assertEqual("1d", source_interval("1d", max_records=2))
+        self.assertEqual("1h", source_interval("1h", max_records=500))
+
+    def test_candles_feeds_of_a_trading_pair_share_the_source_feed(self):
+        feed_1m = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="BTC-USDT",
+                                                              interval="1m", max_records=100))
+        feed_5m = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="BTC-USDT",
+                                                              interval="5m", max_records=100))
+        feed_eth = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="ETH-USDT",
+                                                               interval="15m", max_records=10))
+
+        self.assertIs(feed_1m.source_feed, feed_5m.source_feed)
+        self.assertEqual(505, feed_5m.source_feed.max_records)
+        self.assertEqual(165, feed_eth.source_feed.max_records)
+        self.assertEqual({CandlesSourceKey("binance", "BTC-USDT", "1m"), CandlesSourceKey("binance", "ETH-USDT", "1m")},
+                         set(self.manager.source_feeds))
+
+        feed_5m.source_feed._candles.extend(one_minute_candles(start=1_700_000_100, count=505))
+        self.assertTrue(feed_5m.ready)
+        self.assertEqual(100, len(feed_5m.candles_df))
+        self.assertEqual(100, len(feed_1m.candles_df))
+        self.assertEqual(300, feed_5m.candles_df["timestamp"].diff().iloc[-1])
+
+    def test_source_feed_is_stopped_when_its_last_candles_feed_is_stopped(self):
+        feed_5m = self.manager.get_candles_feed(CandlesConfig(connector="kraken", trading_pair="BTC-USDT",
+                                                              interval="5m", max_records=10))
+        feed_15m = self.manager.get_candles_feed(CandlesConfig(connector="kraken", trading_pair="BTC-USDT",
+                                                               interval="15m", max_records=10))
+        source_feed = feed_5m.source_feed
+        self.assertIsInstance(source_feed, KrakenSpotCandles)
+        self.assertFalse(source_feed.supports_multiplexed_subscriptions)
+
+        with patch.object(KrakenSpotCandles, "start") as start_mock, \
+                patch.object(KrakenSpotCandles, "stop") as stop_mock:
+            feed_5m.start()
+            feed_15m.start()
+            feed_5m.stop()
+            stop_mock.assert_not_called()
+            feed_15m.stop()
+
+        start_mock.assert_called_once()
+        stop_mock.assert_called_once()
+        self.assertEqual({}, self.manager.source_feeds)
+
+    def test_source_feed_is_replaced_when_more_records_are_needed(self):
+        with patch.object(MultiplexedCandlesStream, "start"):
+            small_feed = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="BTC-USDT",
+                                                                     interval="1m", max_records=10))
+            small_feed.start()
+            first_source = small_feed.source_feed
+            large_feed = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="BTC-USDT",
+                                                                     interval="1h", max_records=20))
+            large_feed.start()
+
+        self.assertIsNot(first_source, small_feed.source_feed)
+        self.assertEqual(21 * 60, small_feed.source_feed.max_records)
+        self.assertEqual([small_feed.source_feed], self.manager.streams["binance"].feeds)
+
+    def test_unsupported_connector_raises(self):
+        with self.assertRaises(Exception):
+            self.manager.get_candles_feed(CandlesConfig(connector="hbot", trading_pair="BTC-USDT", interval="1m"))
+        self.assertEqual({}, self.manager.source_feeds)
+
+
+class MultiplexedCandlesStreamTest(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.manager = CandlesManager()
+
+    async def asyncTearDown(self) -> None:
+        self.manager.stop()
+        await super().asyncTearDown()
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_trading_pairs_and_intervals_share_one_websocket(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        configs = [CandlesConfig(connector="binance", trading_pair=trading_pair, interval=interval, max_records=10)
+                   for trading_pair in ("BTC-USDT", "ETH-USDT") for interval in ("1m", "5m", "15m")]
+        feeds = [self.manager.get_candles_feed(config) for config in configs]
+        for feed in feeds:
+            feed.start()
+        for symbol, close in (("BTCUSDT", "101"), ("ETHUSDT", "202"), ("SOLUSDT", "303")):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value,
+                message=json.dumps(kline_message(symbol, "1m", 1_700_000_040, close)))
+
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual(1, len(sent_messages))
+        self.assertEqual(["btcusdt@kline_1m", "ethusdt@kline_1m"], sent_messages[0]["params"])
+        btc_source, eth_source = feeds[0].source_feed, feeds[3].source_feed
+        self.assertIsInstance(btc_source, BinanceSpotCandles)
+        self.assertEqual([101.0], list(btc_source.candles_df["close"]))
+        self.assertEqual([202.0], list(eth_source.candles_df["close"]))
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_feeds_added_to_an_open_connection_are_subscribed(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        btc_feed = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="BTC-USDT",
+                                                               interval="1m", max_records=10))
+        btc_feed.start()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        eth_feed = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="ETH-USDT",
+                                                               interval="1h", max_records=500))
+        eth_feed.start()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(kline_message("ETHUSDT", "1h", 1_699_999_200, "202")))
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([["btcusdt@kline_1m"], ["ethusdt@kline_1h"]], [message["params"] for message in sent_messages])
+        self.assertFalse(eth_feed.is_resampled)
+        self.assertEqual([202.0], list(eth_feed.candles_df["close"]))
+
+    async def test_stream_is_stopped_with_its_last_feed(self):
+        feed = self.manager.get_candles_feed(CandlesConfig(connector="binance", trading_pair="BTC-USDT",
+                                                           interval="1m", max_records=10))
+        with patch.object(MultiplexedCandlesStream, "listen_for_subscriptions", new_callable=AsyncMock):
+            feed.start()
+            stream = self.manager.streams["binance"]
+            self.assertTrue(stream.started)
+
+            feed.stop()
+
+        self.assertFalse(stream.started)
+        self.assertEqual({}, self.manager.streams)
@@ -0,0 +1,268 @@
+import asyncio
+import os
+import tempfile
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.market_data_hub import hub_protocol
+from hummingbot.data_feed.market_data_hub.market_data_hub import MarketDataHub, _HubClient
+from hummingbot.data_feed.market_data_hub.market_data_hub_candles import MarketDataHubCandles
+from hummingbot.data_feed.market_data_hub.market_data_hub_order_book_data_source import (
+    MarketDataHubOrderBookDataSource,
+)
+
+
+class UpstreamDataSource(OrderBookTrackerDataSource):
+    """
+    Exchange data source whose messages are injected by the tests
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(101.0, 1.0, 1)], 1)
+        return order_book
+
+    async def listen_for_subscriptions(self):
+        await asyncio.Event().wait()
+
+    def add_message(self, message: OrderBookMessage):
+        queue_key = {
+            OrderBookMessageType.SNAPSHOT: self._snapshot_messages_queue_key,
+            OrderBookMessageType.DIFF: self._diff_messages_queue_key,
+            OrderBookMessageType.TRADE: self._trade_messages_queue_key,
+        }[message.type]
+        self._message_queue[queue_key].put_nowait(message)
+
+    async def _parse_trade_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: Any, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+
+class StaticCandles(CandlesBase):
+
+    @property
+    def rate_limits(self):
+        return []
+
+    @property
+    def intervals(self):
+        return self.interval_to_seconds
+
+    def get_exchange_trading_pair(self, trading_pair):
+        return trading_pair
+
+    async def start_network(self):
+        pass
+
+    async def stop_network(self):
+        pass
+
+
+class MarketDataHubTests(IsolatedAsyncioWrapperTestCase):
+    connector_name = "exchange"
+    trading_pair = "COINALPHA-HBOT"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "hub.sock")
+        self.upstream = UpstreamDataSource(trading_pairs=[self.trading_pair])
+        self.candles = StaticCandles(trading_pair=self.trading_pair, interval="1m", max_records=3)
+        self.hub = MarketDataHub(socket_path=self.socket_path)
+        self.hub.CANDLES_PUBLISH_INTERVAL = 0.01
+        self.hub.add_order_book_data_source(self.connector_name, self.upstream)
+        self.hub.add_candles_feed(self.connector_name, self.candles)
+        await self.hub.start()
+        self.tracker = None
+
+    async def asyncTearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+        await self.hub.stop()
+        self.temp_dir.cleanup()
+        await super().asyncTearDown()
+
+    @staticmethod
+    async def _wait_for(condition: Callable[[], bool], timeout: float = 2):
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(wait(), timeout=timeout)
+
+    def _diff_message(self, update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=1640001112.0)
+
+    async def _hub_connection(self, request: Dict[str, Any]):
+        reader, writer = await asyncio.open_unix_connection(path=self.socket_path)
+        writer.write(hub_protocol.encode_message(request))
+        await writer.drain()
+        return reader, writer
+
+    @staticmethod
+    async def _read_message(reader: asyncio.StreamReader) -> Dict[str, Any]:
+        return hub_protocol.decode_message(await asyncio.wait_for(reader.readline(), timeout=2))
+
+    async def test_subscriber_receives_snapshot_followed_by_sequenced_diffs(self):
+        await self._wait_for(lambda: self.hub.order_book(self.connector_name, self.trading_pair) is not None)
+        reader, writer = await self._hub_connection({
+            "type": hub_protocol.SUBSCRIBE_REQUEST,
+            "channel": hub_protocol.ORDER_BOOK_CHANNEL,
+            "connector": self.connector_name,
+            "trading_pair": self.trading_pair,
+        })
+
+        snapshot = await self._read_message(reader)
+        self.assertEqual(hub_protocol.SNAPSHOT_MESSAGE, snapshot["type"])
+        self.assertEqual([[99.0, 1.0]], snapshot["bids"])
+        self.assertEqual([[101.0, 1.0]], snapshot["asks"])
+
+        self.upstream.add_message(self._diff_message(2, bids=[["99.5", "2"]], asks=[]))
+        self.upstream.add_message(self._diff_message(3, bids=[], asks=[["101", "0"]]))
+        first_diff = await self._read_message(reader)
+        second_diff = await self._read_message(reader)
+
+        self.assertEqual(snapshot["sequence"] + 1, first_diff["sequence"])
+        self.assertEqual([[99.5, 2.0]], first_diff["bids"])
+        self.assertEqual(snapshot["sequence"] + 2, second_diff["sequence"])
+        self.assertEqual([[101.0, 0.0]], second_diff["asks"])
+        writer.close()
+
+    async def test_stale_upstream_diffs_are_not_published(self):
+        await self._wait_for(lambda: self.hub.order_book(self.connector_name, self.trading_pair) is not None)
+        reader, writer = await self._hub_connection({
+            "type": hub_protocol.SUBSCRIBE_REQUEST,
+            "connector": self.connector_name,
+            "trading_pair": self.trading_pair,
+        })
+        snapshot = await self._read_message(reader)
+
+        self.upstream.add_message(self._diff_message(0, bids=[["98", "1"]], asks=[]))
+        self.upstream.add_message(self._diff_message(2, bids=[["97", "1"]], asks=[]))
+        diff = await self._read_message(reader)
+
+        self.assertEqual(snapshot["sequence"] + 1, diff["sequence"])
+        self.assertEqual([[97.0, 1.0]], diff["bids"])
+        writer.close()
+
+    async def test_unknown_market_subscription_returns_error(self):
+        reader, writer = await self._hub_connection({
+            "type": hub_protocol.SUBSCRIBE_REQUEST,
+            "connector": self.connector_name,
+            "trading_pair": "WRONG-PAIR",
+        })
+
+        message = await self._read_message(reader)
+
+        self.assertEqual(hub_protocol.ERROR_MESSAGE, message["type"])
+        self.assertIn("WRONG-PAIR", message["message"])
+        writer.close()
+
+    async def test_order_book_tracker_uses_hub_data_source(self):
+        data_source = MarketDataHubOrderBookDataSource(
+            connector_name=self.connector_name, trading_pairs=[self.trading_pair], socket_path=self.socket_path)
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+        self.tracker.start()
+        await asyncio.wait_for(self.tracker.wait_order_book_ready(self.trading_pair), timeout=2)
+        await self._wait_for(lambda: len(self.hub._order_books[(self.connector_name, self.trading_pair)].subscribers) > 0)
+
+        self.upstream.add_message(self._diff_message(2, bids=[["100", "3"]], asks=[]))
+        self.upstream.add_message(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": 10,
+            "update_id": 2,
+            "price": "100",
+            "amount": "0.5",
+        }, timestamp=1640001113.0))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        await self._wait_for(lambda: order_book.get_price(False) == 100.0 and order_book.last_trade_price == 100.0)
+        self.assertEqual(101.0, order_book.get_price(True))
+
+        prices = await data_source.get_last_traded_prices([self.trading_pair])
+        self.assertEqual({self.trading_pair: 100.0}, prices)
+
+    async def test_hub_data_source_requests_snapshot_when_sequence_gap_detected(self):
+        await self._wait_for(lambda: self.hub.order_book(self.connector_name, self.trading_pair) is not None)
+        data_source = MarketDataHubOrderBookDataSource(
+            connector_name=self.connector_name, trading_pairs=[self.trading_pair], socket_path=self.socket_path)
+        listening_task = asyncio.create_task(data_source.listen_for_subscriptions())
+        snapshots_queue = data_source._message_queue[data_source._snapshot_messages_queue_key]
+        diffs_queue = data_source._message_queue[data_source._diff_messages_queue_key]
+        first_snapshot = await asyncio.wait_for(snapshots_queue.get(), timeout=2)
+
+        # Simulates updates that were never delivered to the client
+        self.hub._order_books[(self.connector_name, self.trading_pair)].sequence += 5
+        self.upstream.add_message(self._diff_message(2, bids=[["100", "3"]], asks=[]))
+
+        diff = await asyncio.wait_for(diffs_queue.get(), timeout=2)
+        second_snapshot = await asyncio.wait_for(snapshots_queue.get(), timeout=2)
+
+        self.assertEqual(first_snapshot["sequence"] + 6, diff["sequence"])
+        self.assertEqual(diff["sequence"], second_snapshot["sequence"])
+        self.assertIn([100.0, 3.0], second_snapshot["bids"])
+        listening_task.cancel()
+
+    async def test_client_not_consuming_updates_is_disconnected(self):
+        await self._wait_for(lambda: self.hub.order_book(self.connector_name, self.trading_pair) is not None)
+        _, writer = await asyncio.open_unix_connection(path=self.socket_path)
+        await self._wait_for(lambda: len(self.hub._clients) == 1)
+        client: _HubClient = next(iter(self.hub._clients))
+        client.writer_task.cancel()
+        client.pending_messages = asyncio.Queue(maxsize=1)
+        self.hub._order_books[(self.connector_name, self.trading_pair)].subscribers.add(client)
+
+        self.upstream.add_message(self._diff_message(2, bids=[["100", "3"]], asks=[]))
+        self.upstream.add_message(self._diff_message(3, bids=[["100", "4"]], asks=[]))
+        await self._wait_for(lambda: len(self.hub._clients) == 0)
+
+        self.assertEqual(1, self.hub.metrics["clients_dropped"])
+        writer.close()
+
+    async def test_candles_feed_through_hub(self):
+        self.candles._candles.extend([
+            np.array([60.0, 1, 2, 0.5, 1.5, 10, 15, 3, 5, 7.5]),
+            np.array([120.0, 1.5, 2, 1, 1.8, 11, 18, 4, 6, 9]),
+            np.array([180.0, 1.8, 2.2, 1.7, 2, 12, 23, 5, 6, 12]),
+        ])
+        hub_candles = MarketDataHubCandles(
+            connector_name=self.connector_name,
+            trading_pair=self.trading_pair,
+            interval="1m",
+            max_records=3,
+            socket_path=self.socket_path)
+        await hub_candles.start_network()
+        await self._wait_for(lambda: hub_candles.ready)
+
+        self.assertEqual([60.0, 120.0, 180.0], list(hub_candles.candles_df["timestamp"]))
+
+        self.candles._candles[-1] = np.array([180.0, 1.8, 2.5, 1.7, 2.4, 14, 30, 6, 7, 15])
+        await self._wait_for(lambda: hub_candles.candles_df["close"].iloc[-1] == 2.4)
+        self.candles._candles.append(np.array([240.0, 2.4, 2.6, 2.3, 2.5, 5, 12, 2, 3, 7]))
+        await self._wait_for(lambda: hub_candles.candles_df["timestamp"].iloc[-1] == 240.0)
+
+        self.assertEqual([120.0, 180.0, 240.0], list(hub_candles.candles_df["timestamp"]))
+        self.assertEqual(2.5, hub_candles.candles_df["high"].iloc[1])
+        await hub_candles.stop_network()
@@ -8,6 +8,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_manager import MultiplexedCandlesStream
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -55,6 +56,7 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         price = self.provider.get_price_by_type("mock_connector", "BTC-USDT", PriceType.MidPrice)
         self.assertEqual(price, 10000)
 
+    @patch.object(MultiplexedCandlesStream, "start", MagicMock())
     @patch.object(CandlesBase, "start", MagicMock())
     def test_get_candles_df(self):
         self.provider.initialize_candles_feed(
@@ -7,7 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from async_timeout import timeout
 
-from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.client_config_map import ClientConfigMap, MQTTBatchOverflowPolicyEnum
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.hummingbot_application import HummingbotApplication
@@ -17,7 +17,8 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
-from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder
+from hummingbot.remote_iface.messages import LogBatchMessage
+from hummingbot.remote_iface.mqtt import MQTTBatchPublisher, MQTTGateway, MQTTMarketEventForwarder
 
 
 @patch("hummingbot.remote_iface.mqtt.MQTTGateway._INTERVAL_HEALTH_CHECK", 0.0)
@@ -604,6 +605,52 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(events_topic, evt_type, msg_key = 'type'), timeout=10)
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
 
+    def test_mqtt_event_batch_mode(self):
+        self.client_config_map.mqtt_bridge.mqtt_batch_mode = True
+        self.client_config_map.mqtt_bridge.mqtt_batch_interval = 0.01
+        self.start_mqtt()
+
+        order = LimitOrder(client_order_id="HBOT_1",
+                           trading_pair="HBOT-USDT",
+                           is_buy=True,
+                           base_currency="HBOT",
+                           quote_currency="USDT",
+                           price=Decimal("100"),
+                           quantity=Decimal("1.5")
+                           )
+
+        self.emit_order_created_event(self.test_market, order)
+        self.emit_order_expired_event(self.test_market)
+
+        batch_topic = f"hbot/{self.instance_id}/events/batch"
+        self.async_run_with_timeout(self.wait_for_rcv(batch_topic), timeout=10)
+        self.assertFalse(self.is_msg_received(f"hbot/{self.instance_id}/events"))
+
+        batch_events = [event for msg in self.fake_mqtt_broker.received_msgs[batch_topic] for event in msg["events"]]
+        self.assertEqual(["BuyOrderCreated", "OrderExpired"], [event["type"] for event in batch_events])
+        self.assertEqual(100.0, batch_events[0]["data"]["price"])
+        self.assertEqual(2, self.gateway.batch_metrics[1]["published"])
+
+    def test_mqtt_log_handler_batch_mode(self):
+        import logging
+
+        from hummingbot.remote_iface.mqtt import MQTTLogHandler
+        self.client_config_map.mqtt_bridge.mqtt_batch_mode = True
+        self.client_config_map.mqtt_bridge.mqtt_batch_interval = 0.01
+        self.start_mqtt()
+
+        handler = MQTTLogHandler(self.hbapp, self.gateway)
+        handler.start()
+        handler.emit(logging.LogRecord('testlogger', logging.INFO, '', 0, 'Test log', None, None))
+
+        batch_topic = f"hbot/{self.instance_id}/log/batch"
+        self.async_run_with_timeout(self.wait_for_rcv(batch_topic), timeout=10)
+        handler.close()
+
+        logs = self.fake_mqtt_broker.received_msgs[batch_topic][0]["logs"]
+        self.assertEqual("Test log", logs[0]["msg"])
+        self.assertEqual("testlogger", logs[0]["logger_name"])
+
     def test_mqtt_subscribed_topics(self):
         self.start_mqtt()
         self.assertTrue(self.gateway is not None)
@@ -950,3 +997,89 @@ class RemoteIfaceMQTTTests(TestCase):
         pub2.send("test/a/b", test_msg)
         pub2.send("test/c/d", test_msg)
         self.assertTrue(1)
+
+
+class MQTTBatchPublisherTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.node = MagicMock()
+        self.published_batches = []
+        self.batch_pub = MagicMock()
+        self.batch_pub.publish.side_effect = lambda msg: self.published_batches.append(msg.logs)
+        self.node.create_publisher.side_effect = [self.batch_pub, MagicMock()]
+
+    def _create_publisher(self, policy: MQTTBatchOverflowPolicyEnum, max_batch_size: int = 1000):
+        return MQTTBatchPublisher(
+            node=self.node,
+            topic="hbot/TEST_ID/log/batch",
+            metrics_topic="hbot/TEST_ID/bridge/metrics",
+            batch_msg_type=LogBatchMessage,
+            batch_field="logs",
+            serializer=lambda item: {"msg": item},
+            max_queue_size=3,
+            overflow_policy=policy,
+            max_batch_size=max_batch_size,
+        )
+
+    def test_flush_publishes_in_batches(self):
+        publisher = self._create_publisher(MQTTBatchOverflowPolicyEnum.drop_oldest, max_batch_size=2)
+        for msg in ("a", "b", "c"):
+            publisher.enqueue(msg)
+
+        publisher.flush()
+
+        self.assertEqual([[{"msg": "a"}, {"msg": "b"}], [{"msg": "c"}]], self.published_batches)
+        self.assertEqual(0, publisher.queue_depth)
+        self.assertEqual(2, publisher.metrics["batches"])
+        self.assertEqual(3, publisher.metrics["published"])
+
+    def test_drop_oldest_when_queue_is_full(self):
+        publisher = self._create_publisher(MQTTBatchOverflowPolicyEnum.drop_oldest)
+        for msg in ("a", "b", "c", "d"):
+            publisher.enqueue(msg, coalesce_key=msg)
+
+        publisher.flush()
+
+        self.assertEqual([[{"msg": "b"}, {"msg": "c"}, {"msg": "d"}]], self.published_batches)
+        self.assertEqual(1, publisher.metrics["dropped"])
+        self.assertEqual(3, publisher.metrics["max_queue_depth"])
+
+    def test_coalesce_when_queue_is_full(self):
+        publisher = self._create_publisher(MQTTBatchOverflowPolicyEnum.coalesce)
+        publisher.enqueue("a", coalesce_key="repeated")
+        publisher.enqueue("b")
+        publisher.enqueue("c")
+        publisher.enqueue("a2", coalesce_key="repeated")
+        publisher.enqueue("d")
+
+        publisher.flush()
+
+        self.assertEqual([[{"msg": "b"}, {"msg": "c"}, {"msg": "d"}]], self.published_batches)
+        self.assertEqual(1, publisher.metrics["coalesced"])
+        # The coalesced message counts as the two messages it contained when dropped
+        self.assertEqual(2, publisher.metrics["dropped"])
+
+    def test_coalesced_message_keeps_latest_content(self):
+        publisher = self._create_publisher(MQTTBatchOverflowPolicyEnum.coalesce)
+        publisher.enqueue("a", coalesce_key="repeated")
+        publisher.enqueue("b")
+        publisher.enqueue("c")
+        publisher.enqueue("a2", coalesce_key="repeated")
+        publisher.enqueue("a3", coalesce_key="repeated")
+
+        publisher.flush()
+
+        self.assertEqual([[{"msg": "a3", "coalesced": 2}, {"msg": "b"}, {"msg": "c"}]], self.published_batches)
+        self.assertEqual(5, publisher.metrics["published"])
+        self.assertEqual(0, publisher.metrics["dropped"])
+
+    def test_worker_publishes_pending_messages_when_stopped(self):
+        publisher = self._create_publisher(MQTTBatchOverflowPolicyEnum.drop_oldest)
+        publisher._interval = 10
+        publisher.start()
+        publisher.enqueue("a")
+
+        publisher.stop()
+
+        self.assertEqual([[{"msg": "a"}]], self.published_batches)
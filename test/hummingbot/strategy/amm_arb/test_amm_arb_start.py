@@ -45,3 +45,5 @@ class AMMArbStartTest(unittest.TestCase):
         amm_arb_start.start(self)
         self.assertEqual(self.strategy._order_amount, Decimal(1))
         self.assertEqual(self.strategy._min_profitability, Decimal("10") / Decimal("100"))
+        self.assertEqual(5, self.strategy._quote_cache.ttl)
+        self.assertEqual(Decimal("0"), self.strategy._quote_cache.amount_bucket_pct)
@@ -519,6 +519,11 @@ class LiquidityMiningTest(unittest.TestCase):
         # assert that volatility is none zero
         self.assertAlmostEqual(float(strategy.market_status_df().loc[0, 'Volatility'].strip('%')), 10.00, delta=0.1)
 
+        # the spread of the proposals is widened to the volatility
+        proposal = strategy.create_base_proposals()[0]
+        self.assertAlmostEqual(Decimal("99"), proposal.buy.price, delta=Decimal("0.01"))
+        self.assertAlmostEqual(Decimal("121"), proposal.sell.price, delta=Decimal("0.01"))
+
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotApplication.main_application')
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotCLI')
     def test_strategy_with_default_cfg_does_not_send_in_app_notifications(self, cli_class_mock,
@@ -0,0 +1,76 @@
+import time
+import unittest
+from statistics import mean
+
+import numpy as np
+
+from hummingbot.strategy.liquidity_mining.volatility_estimator import RollingVolatilityEstimator
+
+
+class RollingVolatilityEstimatorTest(unittest.TestCase):
+
+    @staticmethod
+    def bars_volatility(prices, interval, period):
+        """
+        Reference implementation: average relative range of the current bar and of the previous period - 1 bars.
+        """
+        bars = [prices[i:i + interval] for i in range(0, len(prices), interval)][-period:]
+        return mean((max(bar) - min(bar)) / min(bar) for bar in bars)
+
+    def test_no_volatility_before_the_first_price(self):
+        estimator = RollingVolatilityEstimator(["ETH-USDT"], interval=3, period=2)
+
+        self.assertTrue(np.isnan(estimator.volatility()[0]))
+
+    def test_volatility_of_the_current_bar(self):
+        estimator = RollingVolatilityEstimator(["ETH-USDT"], interval=300, period=10)
+        for price in (100.0, 105.0, 110.0):
+            estimator.update(np.array([price]))
+
+        self.assertAlmostEqual(0.1, estimator.volatility()[0])
+
+    def test_volatility_matches_the_bars_average(self):
+        rng = np.random.default_rng(42)
+        markets = ["ETH-USDT", "BTC-USDT", "SOL-USDT"]
+        prices = 100 + np.cumsum(rng.normal(size=(200, len(markets))), axis=0)
+        interval, period = 7, 4
+        estimator = RollingVolatilityEstimator(markets, interval=interval, period=period)
+
+        for tick, tick_prices in enumerate(prices):
+            estimator.update(tick_prices)
+            if tick % 13 == 0 or tick == len(prices) - 1:
+                for index in range(len(markets)):
+                    expected = self.bars_volatility(list(prices[:tick + 1, index]), interval, period)
+                    self.assertAlmostEqual(expected, estimator.volatility()[index])
+
+    def test_single_bar_period(self):
+        estimator = RollingVolatilityEstimator(["ETH-USDT"], interval=2, period=1)
+        for price in (100.0, 120.0, 100.0, 101.0):
+            estimator.update(np.array([price]))
+
+        self.assertAlmostEqual(0.01, estimator.volatility()[0])
+
+    def test_missing_prices_are_skipped(self):
+        estimator = RollingVolatilityEstimator(["ETH-USDT", "BTC-USDT"], interval=2, period=2)
+        estimator.update(np.array([100.0, np.nan]))
+        estimator.update(np.array([110.0, np.nan]))
+        estimator.update(np.array([np.nan, 50.0]))
+
+        volatility = estimator.volatility()
+        self.assertAlmostEqual(0.1, volatility[0])
+        self.assertAlmostEqual(0.0, volatility[1])
+        self.assertEqual(1, estimator.market_index("BTC-USDT"))
+
+    def test_update_cost_does_not_depend_on_the_interval(self):
+        markets = [f"TOKEN{i}-USDT" for i in range(500)]
+        prices = np.linspace(1, 2, len(markets))
+        durations = []
+        for interval in (10, 10000):
+            estimator = RollingVolatilityEstimator(markets, interval=interval, period=10)
+            start = time.perf_counter()
+            for _ in range(200):
+                estimator.update(prices)
+                estimator.volatility()
+            durations.append(time.perf_counter() - start)
+
+        self.assertLess(durations[1], durations[0] * 5)
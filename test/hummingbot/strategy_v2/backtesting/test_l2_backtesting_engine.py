@@ -0,0 +1,160 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from controllers.market_making.pmm_simple import PMMSimpleConfig
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookReplaySource
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.l2_backtesting_benchmark import (
+    market_making_throughput,
+    record_synthetic_session,
+)
+from hummingbot.strategy_v2.backtesting.l2_backtesting_engine import L2BacktestingEngine, L2MarketSimulator
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def record_touch_moves(directory: str, touches: List[Tuple[float, float, float]]) -> OrderBookReplaySource:
+    """
+    Records an order book with 5 levels of 1.0 on each side, then one diff per (timestamp, best bid, best ask).
+    """
+    recorder = OrderBookRecorder(directory)
+    order_book = OrderBook()
+    order_book.apply_snapshot([], [], 0)
+    message = OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": TRADING_PAIR, "update_id": 1,
+        "bids": [[99.0 - i, 1.0, 1] for i in range(5)], "asks": [[101.0 + i, 1.0, 1] for i in range(5)]}, timestamp=0)
+    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    recorder.record_order_book(TRADING_PAIR, 0.0, order_book)
+    for update_id, (timestamp, best_bid, best_ask) in enumerate(touches, start=2):
+        recorder.record_diff(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": TRADING_PAIR, "update_id": update_id,
+            "bids": [[best_bid, 1.0, update_id]], "asks": [[best_ask, 1.0, update_id]]}, timestamp=timestamp))
+    recorder.flush()
+    return OrderBookReplaySource(directory)
+
+
+class L2MarketSimulatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def executor_config(side: TradeType, entry_price: str, **triple_barrier) -> PositionExecutorConfig:
+        return PositionExecutorConfig(id=f"{side.name}-{entry_price}", timestamp=1.0, connector_name="binance",
+                                      trading_pair=TRADING_PAIR, side=side, entry_price=Decimal(entry_price),
+                                      amount=Decimal("1"), triple_barrier_config=TripleBarrierConfig(**triple_barrier))
+
+    def run_simulation(self, touches: List[Tuple[float, float, float]], *configs: PositionExecutorConfig):
+        market_simulator = L2MarketSimulator(record_touch_moves(self.directory, touches), TRADING_PAIR)
+        for timestamp in market_simulator.iter_steps(0, 100, step_interval=1000):
+            for config in configs:
+                market_simulator.create_executor(config)
+        return {executor_info.id: executor_info for executor_info in market_simulator.executors_info()}
+
+    def test_maker_entry_and_limit_take_profit(self):
+        config = self.executor_config(TradeType.BUY, "98", stop_loss=Decimal("0.05"), take_profit=Decimal("0.03"),
+                                      take_profit_order_type=OrderType.LIMIT)
+
+        executors_info = self.run_simulation(
+            [(1.0, 99.0, 101.0), (2.0, 97.0, 97.5), (3.0, 99.0, 100.0), (4.0, 101.0, 102.0)], config)
+
+        executor_info = executors_info[config.id]
+        # bought at 98 when the asks crossed it, sold at 98 * 1.03 when the bids crossed the take profit order
+        self.assertEqual(CloseType.TAKE_PROFIT, executor_info.close_type)
+        self.assertEqual(4.0, executor_info.close_timestamp)
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertAlmostEqual(98 * 0.03, float(executor_info.net_pnl_quote))
+        self.assertAlmostEqual(98 * 2.03, float(executor_info.filled_amount_quote))
+
+    def test_stop_loss_closes_the_position_with_a_market_order(self):
+        config = self.executor_config(TradeType.SELL, "102", stop_loss=Decimal("0.02"), take_profit=Decimal("0.05"),
+                                      open_order_type=OrderType.LIMIT_MAKER)
+
+        executors_info = self.run_simulation(
+            [(1.0, 99.0, 101.0), (2.0, 102.5, 103.0), (3.0, 104.5, 105.5)], config)
+
+        executor_info = executors_info[config.id]
+        self.assertEqual(CloseType.STOP_LOSS, executor_info.close_type)
+        self.assertEqual(3.0, executor_info.close_timestamp)
+        # sold at 102 when the bids crossed it, bought back at 105 when the stop loss of 2% was reached
+        self.assertAlmostEqual(102 - 105, float(executor_info.net_pnl_quote))
+
+    def test_time_limit_and_rejected_post_only_orders(self):
+        resting_config = self.executor_config(TradeType.BUY, "95", stop_loss=Decimal("0.02"),
+                                              take_profit=Decimal("0.02"), time_limit=2)
+        crossing_config = self.executor_config(TradeType.BUY, "101", stop_loss=Decimal("0.02"),
+                                               take_profit=Decimal("0.02"), open_order_type=OrderType.LIMIT_MAKER)
+
+        executors_info = self.run_simulation(
+            [(1.0, 99.0, 101.0), (2.0, 98.0, 100.0), (3.0, 98.0, 100.0), (3.5, 98.5, 100.0)],
+            resting_config, crossing_config)
+
+        self.assertEqual(CloseType.TIME_LIMIT, executors_info[resting_config.id].close_type)
+        self.assertEqual(3.0, executors_info[resting_config.id].close_timestamp)
+        self.assertEqual(Decimal(0), executors_info[resting_config.id].filled_amount_quote)
+        self.assertEqual(CloseType.FAILED, executors_info[crossing_config.id].close_type)
+
+    def test_benchmark_simulates_executors_on_every_event(self):
+        replay_source = record_synthetic_session(self.directory, events=5000)
+
+        results = market_making_throughput(replay_source)
+
+        self.assertEqual(5001, results["events"])
+        self.assertGreater(results["filled_executors"], 0)
+        self.assertGreater(results["events_per_second"], 0)
+
+
+class L2BacktestingEngineTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    @patch("hummingbot.data_feed.market_data_provider.GatewayHttpClient")
+    @patch.object(BacktestingDataProvider, "initialize_trading_rules", new_callable=AsyncMock)
+    @patch.object(BacktestingDataProvider, "get_connector", return_value=MagicMock())
+    async def test_market_making_controller_on_tick_data(self, *_):
+        replay_source = record_touch_moves(self.directory, [(1.0, 99.0, 101.0), (2.0, 98.5, 101.0),
+                                                            (3.5, 97.0, 98.0), (4.2, 99.0, 101.0),
+                                                            (6.1, 102.5, 103.0), (7.0, 99.5, 100.5)])
+        controller_config = PMMSimpleConfig(
+            id="pmm", connector_name="binance", trading_pair=TRADING_PAIR, total_amount_quote=Decimal("200"),
+            buy_spreads=[0.01], sell_spreads=[0.02], buy_amounts_pct=[Decimal(50)], sell_amounts_pct=[Decimal(50)],
+            executor_refresh_time=60, take_profit=Decimal("0.05"), stop_loss=Decimal("0.5"), time_limit=3600,
+            trailing_stop=None)
+        engine = L2BacktestingEngine()
+
+        backtesting_result = await engine.run_l2_backtesting(controller_config, replay_source, start=1, end=10)
+
+        self.assertEqual(7, backtesting_result["processed_events"])
+        executors = {executor_info.custom_info["level_id"]: executor_info
+                     for executor_info in backtesting_result["executors"] if executor_info.filled_amount_quote > 0}
+        # the buy order at 99 is filled when the asks cross it at 3.5, the sell order at 102 when the bids cross it at 6.1
+        self.assertEqual({"buy_0", "sell_0"}, set(executors))
+        self.assertAlmostEqual(99.0, executors["buy_0"].custom_info["current_position_average_price"])
+        self.assertAlmostEqual(102.0, executors["sell_0"].custom_info["current_position_average_price"])
+        # the positions still open are closed at the end of the backtest
+        self.assertEqual({CloseType.EARLY_STOP}, {executor_info.close_type for executor_info in executors.values()})
+        self.assertEqual(2, backtesting_result["results"]["total_executors_with_position"])
+        self.assertEqual(Decimal("100"), backtesting_result["processed_data"]["reference_price"])
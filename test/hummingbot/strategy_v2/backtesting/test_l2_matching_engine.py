@@ -0,0 +1,97 @@
+import unittest
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy_v2.backtesting.l2_matching_engine import L2MatchingEngine, L2SimulatedOrder
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class L2MatchingEngineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = OrderBook()
+        self.order_book.apply_numpy_snapshot(
+            np.array([[99.0, 2.0, 1], [98.0, 3.0, 1]]),
+            np.array([[101.0, 1.0, 1], [102.0, 2.0, 1], [103.0, 5.0, 1]]))
+        self.matching_engine = L2MatchingEngine(self.order_book, trade_cost=0.001)
+        self.fills: List[Tuple[str, float, float, float]] = []
+
+    def tearDown(self) -> None:
+        self.matching_engine.stop()
+        super().tearDown()
+
+    def on_fill(self, order: L2SimulatedOrder, timestamp: float, price: float, amount: float):
+        self.fills.append((order.order_id, timestamp, price, amount))
+
+    def apply_trade(self, timestamp: float, trade_type: TradeType, price: float, amount: float):
+        self.order_book.apply_trade(OrderBookTradeEvent(trading_pair=TRADING_PAIR, timestamp=timestamp,
+                                                        type=trade_type, price=price, amount=amount))
+
+    def test_resting_order_is_filled_when_the_book_crosses_it(self):
+        order = self.matching_engine.place_limit_order("bid", True, 100.0, 1.0, 1.0, on_fill=self.on_fill)
+        self.matching_engine.process_order_book(2.0)
+        self.assertEqual([], self.fills)
+
+        self.order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[99.5, 1.0, 2]]))
+        self.matching_engine.process_order_book(3.0)
+
+        self.assertEqual([("bid", 3.0, 100.0, 1.0)], self.fills)
+        self.assertFalse(order.is_open)
+        self.assertAlmostEqual(0.1, order.fees_quote)
+        self.assertEqual({}, self.matching_engine.open_orders)
+
+    def test_trade_at_the_order_price_fills_after_the_queue_ahead(self):
+        order = self.matching_engine.place_limit_order("bid", True, 99.0, 1.0, 1.0, on_fill=self.on_fill)
+        self.assertEqual(2.0, order.queue_ahead)
+
+        self.apply_trade(2.0, TradeType.SELL, 99.0, 1.5)
+        self.assertEqual([], self.fills)
+        self.assertEqual(0.5, order.queue_ahead)
+
+        self.apply_trade(3.0, TradeType.SELL, 99.0, 0.75)
+        self.assertEqual([("bid", 3.0, 99.0, 0.25)], self.fills)
+        self.assertTrue(order.is_open)
+
+        # the level shrinks below the amount ahead of the order, with cancelations
+        self.matching_engine.cancel_order("bid")
+        order = self.matching_engine.place_limit_order("bid_2", True, 98.0, 1.0, 4.0, on_fill=self.on_fill)
+        self.order_book.apply_numpy_diffs(np.array([[98.0, 0.5, 2]]), np.empty((0, 3)))
+        self.apply_trade(5.0, TradeType.SELL, 98.0, 1.0)
+        self.assertEqual(("bid_2", 5.0, 98.0, 0.5), self.fills[-1])
+
+    def test_trade_through_the_order_price_fills_the_order(self):
+        self.matching_engine.place_limit_order("ask", False, 101.5, 2.0, 1.0, on_fill=self.on_fill)
+        self.apply_trade(2.0, TradeType.SELL, 99.0, 10.0)  # the maker side is the bids
+        self.assertEqual([], self.fills)
+
+        self.apply_trade(3.0, TradeType.BUY, 102.0, 0.1)
+
+        self.assertEqual([("ask", 3.0, 101.5, 2.0)], self.fills)
+
+    def test_crossing_limit_order_takes_liquidity_up_to_its_price(self):
+        order = self.matching_engine.place_limit_order("bid", True, 102.0, 4.0, 1.0, on_fill=self.on_fill)
+
+        self.assertEqual([("bid", 1.0, (101.0 + 2 * 102.0) / 3, 3.0)], self.fills)
+        self.assertTrue(order.is_open)
+        self.assertAlmostEqual(1.0, order.remaining_amount)
+        self.assertIn("bid", self.matching_engine.open_orders)
+
+        post_only_order = self.matching_engine.place_limit_order("post_only", True, 101.0, 1.0, 2.0, post_only=True)
+        self.assertTrue(post_only_order.is_rejected)
+        self.assertNotIn("post_only", self.matching_engine.open_orders)
+
+    def test_market_order_walks_the_book(self):
+        order = self.matching_engine.place_market_order("sell", False, 4.0, 1.0, on_fill=self.on_fill)
+        self.assertEqual([("sell", 1.0, (2 * 99.0 + 2 * 98.0) / 4, 4.0)], self.fills)
+        self.assertFalse(order.is_open)
+
+        # the amount the book can not fill is canceled
+        order = self.matching_engine.place_market_order("buy", True, 10.0, 2.0)
+        self.assertEqual(8.0, order.executed_amount)
+        self.assertFalse(order.is_open)
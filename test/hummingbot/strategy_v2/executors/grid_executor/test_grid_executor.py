@@ -1189,3 +1189,71 @@ class TestGridExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         await executor.control_task()
         self.assertEqual(executor._status, RunnableStatus.TERMINATED)
         self.assertEqual(executor.close_type, CloseType.POSITION_HOLD)
+
+    @patch.object(GridExecutor, "get_price", MagicMock(return_value=Decimal("110")))
+    async def test_open_orders_to_create_sorted_by_proximity_within_activation_bounds(self):
+        config = GridExecutorConfig(
+            id="test",
+            timestamp=123,
+            side=TradeType.BUY,
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            start_price=Decimal("100"),
+            end_price=Decimal("120"),
+            total_amount_quote=Decimal("100"),
+            min_spread_between_orders=Decimal("0.01"),
+            min_order_amount_quote=Decimal("9"),
+            max_open_orders=10,
+            activation_bounds=Decimal("0.05"),
+            limit_price=Decimal("90"),
+            triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.001")),
+        )
+        executor = self.get_grid_executor_from_config(config)
+        executor.update_metrics()
+        closest_level = min(executor.grid_levels, key=lambda level: abs(level.price - executor.mid_price))
+        closest_level.active_open_order = TrackedOrder("OID-BUY-1")
+        executor.update_grid_levels()
+
+        levels = executor.get_open_orders_to_create()
+
+        activation_bounds_price = executor.mid_price * (1 - config.activation_bounds)
+        expected_levels = sorted(
+            [level for level in executor.grid_levels
+             if level.state == GridLevelStates.NOT_ACTIVE and level.price >= activation_bounds_price],
+            key=lambda level: abs(level.price - executor.mid_price))
+        self.assertEqual([level.id for level in expected_levels], [level.id for level in levels])
+        self.assertNotIn(closest_level, levels)
+
+    @patch.object(GridExecutor, "get_price", MagicMock(return_value=Decimal("110")))
+    async def test_update_grid_levels_only_updates_changed_and_active_levels(self):
+        config = GridExecutorConfig(
+            id="test",
+            timestamp=123,
+            side=TradeType.BUY,
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            start_price=Decimal("100"),
+            end_price=Decimal("120"),
+            total_amount_quote=Decimal("100"),
+            min_spread_between_orders=Decimal("0.01"),
+            min_order_amount_quote=Decimal("9"),
+            limit_price=Decimal("90"),
+            triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.001")),
+        )
+        executor = self.get_grid_executor_from_config(config)
+        executor.update_grid_levels()
+        executor.grid_levels[3].active_open_order = TrackedOrder("OID-BUY-1")
+
+        with patch("hummingbot.strategy_v2.executors.grid_executor.data_types.GridLevel.update_state",
+                   autospec=True) as update_state_mock:
+            update_state_mock.side_effect = lambda level: setattr(level, "state", GridLevelStates.OPEN_ORDER_PLACED)
+            executor.update_grid_levels()
+            self.assertEqual([executor.grid_levels[3]], [call.args[0] for call in update_state_mock.call_args_list])
+
+        self.assertEqual([executor.grid_levels[3]], executor.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED])
+        self.assertEqual(len(executor.grid_levels) - 1, len(executor.levels_by_state[GridLevelStates.NOT_ACTIVE]))
+
+        executor.grid_levels[3].reset_level()
+        executor.update_grid_levels()
+        self.assertEqual([], executor.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED])
+        self.assertEqual(executor.grid_levels, executor.levels_by_state[GridLevelStates.NOT_ACTIVE])